@@ -96,29 +96,28 @@ def test_connection(args):
     print("🧪 Testing MetricFlow connection...")
 
     # Import here to avoid import errors if server dependencies aren't available
-    from mcp_metricflow.server import list_metrics
+    from mcp_metricflow.server import get_session
 
     try:
-        # Test basic MetricFlow command
-        from mcp_metricflow.server import _run_mf_command
+        session = get_session()
 
-        health_result = _run_mf_command(["mf", "health-checks"])
-        if health_result["success"]:
+        health_results = session.sql_client.health_checks(session.system_schema)
+        failed_checks = {name: result for name, result in health_results.items() if result["status"] != "SUCCESS"}
+        if not failed_checks:
             print("✅ Health check passed")
         else:
-            print(f"❌ Health check failed: {health_result.get('stderr', 'Unknown error')}")
+            for check_name, result in failed_checks.items():
+                print(f"❌ Health check {check_name} failed: {result.get('error_message', 'Unknown error')}")
             return False
 
         # Test listing metrics
         try:
-            metrics_output = list_metrics()
+            metrics = session.engine.list_metrics()
             print("✅ Metrics listed successfully")
-            if args.verbose and metrics_output:
+            if args.verbose and metrics:
                 print("   Metrics output preview:")
-                lines = metrics_output.split("\n")[:5]
-                for line in lines:
-                    if line.strip():
-                        print(f"     {line.strip()}")
+                for metric in metrics[:5]:
+                    print(f"     {metric.name}")
         except Exception as e:
             print(f"⚠️  Could not list metrics: {e}")
 
@@ -5,15 +5,28 @@ A Model Context Protocol server that wraps MetricFlow functionality
 and exposes it via tools and resources with SSE support.
 """
 
+import asyncio
 import logging
 import os
-import subprocess
-from typing import Any, Dict, List
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Tuple
 
 from mcp.server import Server
 from mcp import types
 from pydantic import BaseModel, Field
 
+from mcp_metricflow.session import MetricFlowSession
+from metricflow.cli.constants import DEFAULT_RESULT_DECIMAL_PLACES
+from metricflow.engine.metricflow_engine import AsyncMetricFlowEngine, MetricFlowQueryRequest
+from metricflow.engine.utils import convert_to_datetime, model_build_result_from_config
+from metricflow.model.data_warehouse_model_validator import DataWarehouseModelValidator
+from metricflow.model.model_validator import ModelValidator
+from metricflow.model.parsing.config_linter import ConfigLinter
+from metricflow.model.semantics.linkable_element_properties import LinkableElementProperties
+from metricflow.model.validations.validator_helpers import ModelValidationResults
+from metricflow.references import MetricReference
+
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -23,8 +36,8 @@ logger = logging.getLogger(__name__)
 class MetricFlowConfig(BaseModel):
     """MetricFlow configuration model.
 
-    Note: Only model_path is actually used by MetricFlow via MF_MODEL_PATH env var.
-    Other configs are kept for reference but not passed to MetricFlow commands.
+    Note: These are only used to check the setup before starting the server. The engine itself is built from the
+    MetricFlow config file (see MetricFlowSession).
     """
 
     model_path: str = Field(default_factory=lambda: os.path.expanduser("~/.metricflow/semantic_models"))
@@ -38,28 +51,21 @@ class MetricFlowConfig(BaseModel):
 server = Server("MetricFlow MCP Server")
 
 
-def _run_mf_command(command: List[str]) -> Dict[str, Any]:
-    """Run a MetricFlow command and return the result"""
-    try:
-        # Set environment variables
-        env = os.environ.copy()
-        config = MetricFlowConfig()
+_session: Optional[MetricFlowSession] = None
+_session_lock = threading.Lock()
 
-        env.update({"MF_MODEL_PATH": config.model_path})
 
-        # Run the command
-        result = subprocess.run(command, capture_output=True, text=True, env=env, timeout=300)  # 5 minute timeout
+def get_session() -> MetricFlowSession:
+    """Return the session shared by all tool calls, creating it on first use.
 
-        return {
-            "success": result.returncode == 0,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "returncode": result.returncode,
-        }
-    except subprocess.TimeoutExpired:
-        return {"success": False, "stdout": "", "stderr": "Command timed out after 5 minutes", "returncode": -1}
-    except Exception as e:
-        return {"success": False, "stdout": "", "stderr": str(e), "returncode": -1}
+    The session keeps the engine (parsed model, source nodes, and warehouse connection) in memory across calls and
+    only rebuilds it when the model files or the config file change.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = MetricFlowSession()
+        return _session
 
 
 # Resources removed - not needed
@@ -159,89 +165,205 @@ async def handle_list_tools():
     ]
 
 
+def _format_metrics(session: MetricFlowSession) -> str:
+    """List the metrics in the format of "metric_name: list of available dimensions"."""
+    metrics = session.engine.list_metrics()
+    lines = [f"Found {len(metrics)} metrics:"]
+    for metric in metrics:
+        # Local dimensions first, then the ones that are linked through identifiers.
+        dimension_names = sorted(d.name for d in metric.dimensions if "/" not in d.name) + sorted(
+            d.name for d in metric.dimensions if "/" in d.name
+        )
+        lines.append(f"• {metric.name}: {', '.join(dimension_names)}")
+    return "\n".join(lines)
+
+
+def _format_dimensions(session: MetricFlowSession, metrics: Optional[List[str]]) -> str:
+    """List the dimensions common to the given metrics, or all dimensions if no metrics are given."""
+    engine = session.engine
+    if metrics:
+        dimensions = engine.simple_dimensions_for_metrics(metric_names=metrics)
+        lines = [f"Found {len(dimensions)} common dimensions for metrics {metrics}:"]
+    else:
+        dimensions_by_name = {}
+        for metric in engine.list_metrics():
+            for dimension in metric.dimensions:
+                dimensions_by_name.setdefault(dimension.name, dimension)
+        dimensions = [dimensions_by_name[name] for name in sorted(dimensions_by_name)]
+        lines = [f"Found {len(dimensions)} dimensions:"]
+    for dimension in dimensions:
+        lines.append(f"• {dimension.name}" + (f": {dimension.description}" if dimension.description else ""))
+    return "\n".join(lines)
+
+
+def _format_entities(session: MetricFlowSession, metrics: Optional[List[str]]) -> str:
+    """List the entities (identifiers) that can be used with the given metrics, or all of them."""
+    semantic_model = session.engine.semantic_model
+    if metrics:
+        identifier_names = sorted(
+            {
+                spec.qualified_name
+                for spec in semantic_model.metric_semantics.element_specs_for_metrics(
+                    metric_references=[MetricReference(element_name=name) for name in metrics],
+                    with_any_property=frozenset({LinkableElementProperties.IDENTIFIER}),
+                )
+            }
+        )
+        lines = [f"Found {len(identifier_names)} entities for metrics {metrics}:"]
+    else:
+        identifier_names = sorted(
+            {ref.element_name for ref in semantic_model.data_source_semantics.get_identifier_references()}
+        )
+        lines = [f"Found {len(identifier_names)} entities:"]
+    lines.extend(f"• {name}" for name in identifier_names)
+    return "\n".join(lines)
+
+
+async def _async_engine(session: MetricFlowSession) -> AsyncMetricFlowEngine:
+    """Return an async interface to the session's engine. Checking whether the engine is up to date reads files."""
+    return AsyncMetricFlowEngine(await asyncio.to_thread(lambda: session.engine))
+
+
+async def _run_query(session: MetricFlowSession, arguments: Dict[str, Any]) -> str:
+    """Run or explain a query, returning the result as a markdown table or the SQL."""
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=arguments["metrics"],
+        group_by_names=arguments.get("dimensions") or [],
+        limit=arguments.get("limit"),
+        time_constraint_start=convert_to_datetime(arguments.get("start_time")),
+        time_constraint_end=convert_to_datetime(arguments.get("end_time")),
+        where_constraint=arguments.get("where"),
+        order_by_names=arguments.get("order_by"),
+    )
+    async_engine = await _async_engine(session)
+    if arguments.get("explain"):
+        return (await async_engine.explain(mf_request)).rendered_sql_without_descriptions.sql_query
+
+    df = (await async_engine.query(mf_request)).result_df
+    if df is None or df.empty:
+        return "Successful query returned an empty result set."
+    return df.to_markdown(index=False, floatfmt=f".{DEFAULT_RESULT_DECIMAL_PLACES}f")
+
+
+def _format_issues(issues: ModelValidationResults) -> List[str]:
+    """Format each issue on its own line, like the CLI does."""
+    return [f"• {issue.as_cli_formatted_str()}" for issue in issues.all_issues]
+
+
+def _validate_configs(session: MetricFlowSession) -> Tuple[bool, str]:
+    """Lint, parse, and validate the model files, then validate the model against the data warehouse.
+
+    Returns whether there were no blocking issues, along with a description of the results.
+    """
+    model_path = session.model_path
+    lint_results = ConfigLinter().lint_dir(model_path)
+    if lint_results.has_blocking_issues:
+        return False, "\n".join(
+            [f"Breaking issues found in config YAML files ({lint_results.summary()})"] + _format_issues(lint_results)
+        )
+
+    parsing_result = model_build_result_from_config(handler=session.handler, raise_issues_as_exceptions=False)
+    if parsing_result.issues.has_blocking_issues:
+        return False, "\n".join(
+            [f"Breaking issues found when building model from configs ({parsing_result.issues.summary()})"]
+            + _format_issues(parsing_result.issues)
+        )
+
+    semantic_result = ModelValidator().validate_model(parsing_result.model)
+    if semantic_result.issues.has_blocking_issues:
+        return False, "\n".join(
+            [f"Breaking issues found when checking semantics of built model ({semantic_result.issues.summary()})"]
+            + _format_issues(semantic_result.issues)
+        )
+
+    dw_validator = DataWarehouseModelValidator(sql_client=session.sql_client, system_schema=session.system_schema)
+    model = parsing_result.model
+    dw_results = ModelValidationResults.merge(
+        [
+            dw_validator.validate_data_sources(model),
+            dw_validator.validate_dimensions(model),
+            dw_validator.validate_identifiers(model),
+            dw_validator.validate_measures(model),
+            dw_validator.validate_metrics(model),
+        ]
+    )
+    merged_results = ModelValidationResults.merge(
+        [lint_results, parsing_result.issues, semantic_result.issues, dw_results]
+    )
+    success = not merged_results.has_blocking_issues
+    summary = "Successfully validated" if success else "Breaking issues found when validating"
+    return success, "\n".join(
+        [f"{summary} the model against the data warehouse ({merged_results.summary()})"]
+        + _format_issues(merged_results)
+    )
+
+
+async def _format_dimension_values(
+    session: MetricFlowSession, dimension_name: str, metrics: Optional[List[str]]
+) -> str:
+    """List the values of a dimension, as seen through the first of the given metrics."""
+    if not metrics:
+        raise ValueError("A metric is required to get dimension values. Pass it in `metrics`.")
+    async_engine = await _async_engine(session)
+    values = await async_engine.get_dimension_values(metric_name=metrics[0], get_group_by_values=dimension_name)
+    lines = [f"Found {len(values)} values for dimension {dimension_name} of metric {metrics[0]}:"]
+    lines.extend(f"• {value}" for value in values)
+    return "\n".join(lines)
+
+
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent]:
-    """Handle tool execution requests"""
+    """Handle tool execution requests
+
+    Queries are awaited through the async engine, and the other tools are run in a worker thread against the shared
+    session, so that slow requests don't block the event loop.
+    """
+    session = get_session()
     try:
         if name == "list_metrics":
-            result = _run_mf_command(["mf", "list-metrics"])
-            if not result["success"]:
-                return [types.TextContent(type="text", text=f"Failed to list metrics: {result['stderr']}")]
-            return [types.TextContent(type="text", text=result["stdout"])]
+            try:
+                text = await asyncio.to_thread(_format_metrics, session)
+            except Exception as e:
+                text = f"Failed to list metrics: {e}"
 
         elif name == "get_dimensions":
-            metrics = arguments.get("metrics")
-            if metrics:
-                command = ["mf", "list-dimensions", "--metrics"] + metrics
-            else:
-                command = ["mf", "list-dimensions"]
-
-            result = _run_mf_command(command)
-            if not result["success"]:
-                return [types.TextContent(type="text", text=f"Failed to get dimensions: {result['stderr']}")]
-            return [types.TextContent(type="text", text=result["stdout"])]
+            try:
+                text = await asyncio.to_thread(_format_dimensions, session, arguments.get("metrics"))
+            except Exception as e:
+                text = f"Failed to get dimensions: {e}"
 
         elif name == "get_entities":
-            metrics = arguments.get("metrics")
-            if metrics:
-                command = ["mf", "list-entities", "--metrics"] + metrics
-            else:
-                command = ["mf", "list-entities"]
-
-            result = _run_mf_command(command)
-            if not result["success"]:
-                return [types.TextContent(type="text", text=f"Failed to get entities: {result['stderr']}")]
-            return [types.TextContent(type="text", text=result["stdout"])]
+            try:
+                text = await asyncio.to_thread(_format_entities, session, arguments.get("metrics"))
+            except Exception as e:
+                text = f"Failed to get entities: {e}"
 
         elif name == "query_metrics":
-            metrics = arguments["metrics"]
-            command = ["mf", "query", "--metrics"] + metrics
-
-            if arguments.get("dimensions"):
-                command.extend(["--dimensions"] + arguments["dimensions"])
-            if arguments.get("order_by"):
-                command.extend(["--order-by"] + arguments["order_by"])
-            if arguments.get("where"):
-                command.extend(["--where", arguments["where"]])
-            if arguments.get("limit"):
-                command.extend(["--limit", str(arguments["limit"])])
-            if arguments.get("start_time"):
-                command.extend(["--start-time", arguments["start_time"]])
-            if arguments.get("end_time"):
-                command.extend(["--end-time", arguments["end_time"]])
-            if arguments.get("explain"):
-                command.append("--explain")
-
-            result = _run_mf_command(command)
-            if not result["success"]:
-                return [types.TextContent(type="text", text=f"Query failed: {result['stderr']}")]
-            return [types.TextContent(type="text", text=result["stdout"])]
+            try:
+                text = await _run_query(session, arguments)
+            except Exception as e:
+                text = f"Query failed: {e}"
 
         elif name == "validate_configs":
-            result = _run_mf_command(["mf", "validate-configs"])
-            if not result["success"]:
-                return [types.TextContent(type="text", text=f"Validation failed: {result['stderr']}")]
-            return [types.TextContent(type="text", text=result["stdout"])]
+            try:
+                success, text = await asyncio.to_thread(_validate_configs, session)
+                if not success:
+                    text = f"Validation failed: {text}"
+            except Exception as e:
+                text = f"Validation failed: {e}"
 
         elif name == "get_dimension_values":
             dimension_name = arguments["dimension_name"]
-            command = ["mf", "list-dimension-values", "--dimension", dimension_name]
-
-            if arguments.get("metrics"):
-                command.extend(["--metrics"] + arguments["metrics"])
-
-            result = _run_mf_command(command)
-            if not result["success"]:
-                return [
-                    types.TextContent(
-                        type="text", text=f"Failed to get dimension values for '{dimension_name}': {result['stderr']}"
-                    )
-                ]
-            return [types.TextContent(type="text", text=result["stdout"])]
+            try:
+                text = await _format_dimension_values(session, dimension_name, arguments.get("metrics"))
+            except Exception as e:
+                text = f"Failed to get dimension values for '{dimension_name}': {e}"
 
         else:
             raise ValueError(f"Unknown tool: {name}")
 
+        return [types.TextContent(type="text", text=text)]
+
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
@@ -253,8 +375,17 @@ def create_app():
     """Create the FastAPI application with MCP JSON-RPC support"""
     from fastapi import FastAPI
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Build the engine up front so that the first tool call doesn't pay for it.
+        try:
+            await asyncio.to_thread(lambda: get_session().engine)
+        except Exception:
+            logger.exception("Unable to build the MetricFlow engine at startup - it will be retried on the first call")
+        yield
+
     # Create basic FastAPI app for MCP support
-    app = FastAPI(title="MetricFlow MCP Server")
+    app = FastAPI(title="MetricFlow MCP Server", lifespan=lifespan)
 
     @app.get("/")
     async def root():
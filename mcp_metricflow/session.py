@@ -0,0 +1,106 @@
+"""
+MetricFlow session for the MCP server
+
+Keeps a single MetricFlowEngine alive for the lifetime of the server process so that tool calls
+don't pay for re-parsing the model, rebuilding the semantic model, and reconnecting to the warehouse.
+The model is reloaded when the model files change on disk, and the engine is rebuilt when the config file changes.
+"""
+
+import logging
+import os
+import threading
+from typing import Optional, Tuple
+
+from metricflow.configuration.config_handler import ConfigHandler
+from metricflow.configuration.constants import CONFIG_DWH_SCHEMA
+from metricflow.configuration.yaml_handler import YamlFileHandler
+from metricflow.engine.metricflow_engine import MetricFlowEngine
+from metricflow.engine.utils import path_to_models
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.sql_clients.common_client import not_empty
+
+logger = logging.getLogger(__name__)
+
+# (path, modification time in ns, size) for each watched file.
+FileSnapshot = Tuple[Tuple[str, int, int], ...]
+
+
+def _snapshot_files(*paths: str) -> FileSnapshot:
+    """Return the modification times and sizes of the given files, and of the files under the given directories."""
+    entries = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dir_path, dir_names, file_names in os.walk(path):
+                dir_names.sort()
+                for file_name in sorted(file_names):
+                    file_path = os.path.join(dir_path, file_name)
+                    try:
+                        stat = os.stat(file_path)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((file_path, stat.st_mtime_ns, stat.st_size))
+        elif os.path.exists(path):
+            stat = os.stat(path)
+            entries.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
+
+
+class MetricFlowSession:
+    """Holds a long-lived MetricFlowEngine, updating it only when the files it was built from have changed.
+
+    When only the model files change, the model is reloaded into the existing engine, which keeps its SQL client (and
+    its connection) and the options from the config. A change to the config file rebuilds everything, as it may point
+    to a different warehouse.
+    """
+
+    def __init__(self, handler: Optional[YamlFileHandler] = None) -> None:
+        """Initializer for MetricFlowSession.
+
+        Args:
+            handler: Handler for the MetricFlow config. Defaults to the config in ~/.metricflow.
+        """
+        self._handler = handler or ConfigHandler()
+        self._lock = threading.Lock()
+        self._engine: Optional[MetricFlowEngine] = None
+        self._config_snapshot: FileSnapshot = ()
+        self._model_snapshot: FileSnapshot = ()
+
+    @property
+    def handler(self) -> YamlFileHandler:
+        """The handler for the MetricFlow config."""
+        return self._handler
+
+    @property
+    def model_path(self) -> str:
+        """The path to the model files, as set in the config."""
+        return path_to_models(handler=self._handler)
+
+    @property
+    def engine(self) -> MetricFlowEngine:
+        """Return the engine, building or rebuilding it first if it's missing or out of date."""
+        with self._lock:
+            config_snapshot = _snapshot_files(self._handler.yaml_file_path)
+            model_snapshot = _snapshot_files(self.model_path)
+
+            if self._engine is None or config_snapshot != self._config_snapshot:
+                if self._engine is not None:
+                    logger.info(f"Config file {self._handler.yaml_file_path} changed - rebuilding the engine")
+                self._engine = MetricFlowEngine.from_config(self._handler)
+            elif model_snapshot != self._model_snapshot:
+                logger.info(f"Model files in {self.model_path} changed - reloading the model")
+                # Keeps the options that the engine was created with, and only rebuilds the changed data sources.
+                self._engine.reload_model()
+
+            self._config_snapshot = config_snapshot
+            self._model_snapshot = model_snapshot
+            return self._engine
+
+    @property
+    def sql_client(self) -> AsyncSqlClient:
+        """The SQL client used by the engine."""
+        return self.engine.sql_client
+
+    @property
+    def system_schema(self) -> str:
+        """The schema where MetricFlow system tables are stored."""
+        return not_empty(self._handler.get_value(CONFIG_DWH_SCHEMA), CONFIG_DWH_SCHEMA, self._handler.url)
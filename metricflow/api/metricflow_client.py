@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
 
 from metricflow.configuration.config_handler import ConfigHandler
 from metricflow.configuration.constants import CONFIG_DWH_SCHEMA
@@ -19,7 +21,7 @@ from metricflow.model.model_validator import ModelValidator
 from metricflow.model.objects.user_configured_model import UserConfiguredModel
 from metricflow.model.semantic_model import SemanticModel
 from metricflow.model.validations.validator_helpers import ModelValidationResults
-from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.protocols.async_sql_client import AsyncSqlClient, DEFAULT_QUERY_CHUNK_SIZE
 from metricflow.sql.optimizer.optimization_levels import SqlQueryOptimizationLevel
 from metricflow.sql_clients.common_client import not_empty
 from metricflow.sql_clients.sql_utils import make_sql_client_from_config
@@ -125,7 +127,7 @@ class MetricFlowClient:
             where: A SQL string using group by names that can be used like a where clause on the output data.
             order: metric and group by names to order by. A "-" can be used to specify reverse order e.g. "-ds"
             as_table: If specified, output the result data to this table instead of a result dataframe.
-            sql_optimization_level: The level of optimization for the generated SQL. Pass integer from 0-4.
+            sql_optimization_level: The level of optimization for the generated SQL. Pass integer from 0-5.
 
         Returns:
             MetricFlowQueryResult that contains the result and context of the query.
@@ -143,6 +145,46 @@ class MetricFlowClient:
         )
         return self.engine.query(mf_request=mf_request)
 
+    def query_chunks(
+        self,
+        metrics: List[str],
+        dimensions: List[str] = [],
+        limit: Optional[int] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        where: Optional[str] = None,
+        order: Optional[List[str]] = None,
+        sql_optimization_level: int = 4,
+        chunk_size: int = DEFAULT_QUERY_CHUNK_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        """Makes a query for a metric, returning the result in chunks so that it doesn't have to fit in memory.
+
+        Args:
+            metrics: Names of the metrics to query.
+            dimensions: Names of the dimensions and identifiers to query.
+            limit: Limit the result to this many rows.
+            start_time: Get data for the start of this time range.
+            end_time: Get data for the end of this time range.
+            where: A SQL string using group by names that can be used like a where clause on the output data.
+            order: metric and group by names to order by. A "-" can be used to specify reverse order e.g. "-ds"
+            sql_optimization_level: The level of optimization for the generated SQL. Pass integer from 0-5.
+            chunk_size: The maximum number of rows in each chunk.
+
+        Returns:
+            An iterator of DataFrames that together contain the result of the query.
+        """
+        mf_request = self._create_mf_request(
+            metrics=metrics,
+            dimensions=dimensions,
+            limit=limit,
+            start_time=start_time,
+            end_time=end_time,
+            where=where,
+            order=order,
+            sql_optimization_level=sql_optimization_level,
+        )
+        return self.engine.query_chunks(mf_request=mf_request, chunk_size=chunk_size)
+
     def explain(
         self,
         metrics: List[str],
@@ -166,7 +208,7 @@ class MetricFlowClient:
             where: A SQL string using group by names that can be used like a where clause on the output data.
             order: metric and group by names to order by. A "-" can be used to specify reverse order e.g. "-ds"
             as_table: If specified, output the result data to this table instead of a result dataframe.
-            sql_optimization_level: The level of optimization for the generated SQL. Pass integer from 0-4.
+            sql_optimization_level: The level of optimization for the generated SQL. Pass integer from 0-5.
 
         Returns:
             MetricFlowExplainResult that contains the context of the query.
@@ -215,7 +257,13 @@ class MetricFlowClient:
         return self.engine.list_materializations()
 
     def get_dimension_values(
-        self, metric_name: str, dimension_name: str, start_time: Optional[str] = None, end_time: Optional[str] = None
+        self,
+        metric_name: str,
+        dimension_name: str,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefix: Optional[str] = None,
     ) -> List[str]:
         """Retrieves a list of dimension values given a [metric_name, dimension_name].
 
@@ -224,6 +272,8 @@ class MetricFlowClient:
             dimension_name: Name of group_by to get values from.
             start_time: Get data for the start of this time range.
             end_time: Get data for the end of this time range.
+            limit: The maximum number of values to return.
+            prefix: Only return values that start with this string.
 
         Returns:
             A list of dimension values as string.
@@ -235,10 +285,16 @@ class MetricFlowClient:
             get_group_by_values=dimension_name,
             time_constraint_start=parsed_start_time,
             time_constraint_end=parsed_end_time,
+            limit=limit,
+            prefix=prefix,
         )
 
     def materialize(
-        self, materialization_name: str, start_time: Optional[str] = None, end_time: Optional[str] = None
+        self,
+        materialization_name: str,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        incremental: bool = False,
     ) -> SqlTable:
         """Builds a table containing metrics and dimensions from a materialization definition.
 
@@ -248,6 +304,7 @@ class MetricFlowClient:
             materialization_name: Name of materialization
             start_time: Materialized for the start of this time range.
             end_time: Materialized for the end of this time range.
+            incremental: Only replace the rows from the latest time in the table onwards, if it was built before.
 
         Returns:
             SqlTable object of the materialized table.
@@ -258,6 +315,7 @@ class MetricFlowClient:
             materialization_name=materialization_name,
             time_constraint_start=parsed_start_time,
             time_constraint_end=parsed_end_time,
+            incremental=incremental,
         )
 
     def drop_materialization(self, materialization_name: str) -> bool:
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters describing the usage of a cache."""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were hits, or 0 if there haven't been any lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+class LruCache(Generic[KeyT, ValueT]):
+    """A thread-safe, size-bounded cache that evicts the least recently used entry when full.
+
+    A max_size of 0 disables the cache - lookups always miss and nothing is stored. If ttl_seconds is set, entries
+    expire that many seconds after they were added, as measured by time_function.
+    """
+
+    def __init__(  # noqa: D
+        self,
+        max_size: int,
+        ttl_seconds: Optional[float] = None,
+        time_function: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 0:
+            raise ValueError(f"max_size should be >= 0, but got {max_size}")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds should be > 0, but got {ttl_seconds}")
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._time_function = time_function
+        # The value and the time when it expires, if there is a TTL.
+        self._entries: OrderedDict[KeyT, Tuple[ValueT, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _pop_if_expired(self, key: KeyT) -> None:
+        """Removes the entry for the key if it has expired. Must be called with the lock held."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= self._time_function():
+            del self._entries[key]
+
+    def get(self, key: KeyT) -> Optional[ValueT]:
+        """Return the value for the key, or None if it's not in the cache."""
+        with self._lock:
+            self._pop_if_expired(key)
+            if key not in self._entries:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self, key: KeyT, value: ValueT) -> None:
+        """Add the value to the cache, evicting the least recently used entries if needed."""
+        if self._max_size == 0:
+            return
+        with self._lock:
+            expiration_time = self._time_function() + self._ttl_seconds if self._ttl_seconds is not None else None
+            self._entries[key] = (value, expiration_time)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_create(self, key: KeyT, create_function: Callable[[], ValueT]) -> ValueT:
+        """Return the value for the key, calling create_function and storing the result if it's not in the cache.
+
+        create_function is called outside of the lock, so concurrent misses for the same key may each call it.
+        """
+        value = self.get(key)
+        if value is None:
+            value = create_function()
+            self.put(key, value)
+        return value
+
+    def remove(self, key: KeyT) -> None:
+        """Remove the entry for the key, if there is one."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache. The hit / miss counters are not reset."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:  # noqa: D
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, size=len(self._entries), max_size=self._max_size)
+
+    def __len__(self) -> int:  # noqa: D
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: KeyT) -> bool:  # noqa: D
+        with self._lock:
+            self._pop_if_expired(key)
+            return key in self._entries
@@ -400,6 +400,23 @@ def query(
         output_table=as_table,
     )
 
+    if csv is not None and not explain and not display_plans and as_table is None:
+        # Write the result to the file as it's fetched, so that large results don't have to fit in memory.
+        num_rows = 0
+        for chunk_df in cfg.mf.query_chunks(mf_request=mf_request):
+            # As with the non-streaming output, nothing is written (and the file isn't created) for an empty result.
+            if chunk_df.empty:
+                continue
+            # csv is a LazyFile that is file-like that works in this case.
+            chunk_df.to_csv(csv, index=False, header=num_rows == 0)  # type: ignore
+            num_rows += chunk_df.shape[0]
+        spinner.succeed(f"Success 🦄 - query completed after {time.time() - start:.2f} seconds")
+        if num_rows == 0:
+            click.echo("🕳 Successful MQL query returned an empty result set.")
+        else:
+            click.echo(f"🖨 Successfully written query output to {csv.name}")
+        return
+
     explain_result: Optional[MetricFlowExplainResult] = None
     query_result: Optional[MetricFlowQueryResult] = None
 
@@ -667,6 +684,18 @@ def list_materializations(cfg: CLIContext, search: Optional[str] = None) -> None
     help="Name of materialization to materialize",
 )
 @start_end_time_options
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Only replace the rows from the latest time in the materialized table onwards, if it was built before",
+)
+@click.option(
+    "--lookback",
+    type=click.IntRange(min=0),
+    default=None,
+    help="With --incremental, also replace the rows from this many days before the latest time, for late data",
+)
 @pass_config
 @exception_handler
 @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
@@ -675,9 +704,15 @@ def materialize(
     materialization_name: str,
     start_time: Optional[dt.datetime] = None,
     end_time: Optional[dt.datetime] = None,
+    incremental: bool = False,
+    lookback: Optional[int] = None,
 ) -> None:
     """Create a new materialization query and returns materialized table"""
-    if start_time is None and not click.confirm(
+    if lookback is not None and not incremental:
+        raise click.BadParameter("--lookback can only be used with --incremental")
+    # An incremental build builds the whole table when there's no watermark, e.g. when it's the first build.
+    full_build = not incremental or cfg.mf.materialization_watermark(materialization_name) is None
+    if start_time is None and full_build and not click.confirm(
         "You haven't provided a start_time. This means we will materialize from the beginning of time. This may be expensive. Are you sure you want to continue?"
     ):
         click.echo("Exiting")
@@ -691,6 +726,8 @@ def materialize(
         materialization_name,
         time_constraint_start=start_time,
         time_constraint_end=end_time,
+        incremental=incremental,
+        lookback=dt.timedelta(days=lookback) if lookback is not None else None,
     )
 
     spinner.succeed(f"Success 🦄 - materialize query completed after {time.time() - start:.2f} seconds.")
@@ -802,6 +839,13 @@ def _data_warehouse_validations_runner(
     default=1,
     help="Optional. Uses the number of workers specified to run the semantic validations. Should only be used for exceptionally large configs",
 )
+@click.option(
+    "--dw-validation-workers",
+    required=False,
+    type=int,
+    default=DataWarehouseModelValidator.DEFAULT_MAX_WORKERS,
+    help="Optional. The maximum number of data warehouse validation queries to run concurrently.",
+)
 @pass_config
 @exception_handler
 @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
@@ -812,6 +856,7 @@ def validate_configs(
     show_all: bool = False,
     verbose_issues: bool = False,
     semantic_validation_workers: int = 1,
+    dw_validation_workers: int = DataWarehouseModelValidator.DEFAULT_MAX_WORKERS,
 ) -> None:
     """Perform validations against the defined model configurations."""
     cfg.verbose = True
@@ -874,7 +919,9 @@ def validate_configs(
 
     dw_results = ModelValidationResults()
     if not skip_dw:
-        dw_validator = DataWarehouseModelValidator(sql_client=cfg.sql_client, system_schema=cfg.mf_system_schema)
+        dw_validator = DataWarehouseModelValidator(
+            sql_client=cfg.sql_client, system_schema=cfg.mf_system_schema, max_workers=dw_validation_workers
+        )
         dw_results = _data_warehouse_validations_runner(dw_validator=dw_validator, model=user_model, timeout=dw_timeout)
 
     merged_results = ModelValidationResults.merge(
@@ -21,8 +21,13 @@ CONFIG_EMAIL = "email"
 CONFIG_MODEL_PATH = "model_path"
 CONFIG_DWH_HTTP_PATH = "dwh_http_path"
 CONFIG_DWH_ACCESS_TOKEN = "dwh_access_token"
+CONFIG_DWH_ARROW_RESULTS = "dwh_arrow_results"
 CONFIG_DBT_REPO = "dbt_repo"
 CONFIG_DBT_PROFILE = "dbt_profile"
 CONFIG_DBT_TARGET = "dbt_target"
 CONFIG_DBT_CLOUD_JOB_ID = "dbt_cloud_job_id"
 CONFIG_DBT_CLOUD_SERVICE_TOKEN = "dbt_cloud_service_token"
+CONFIG_TIME_SPINE_START = "time_spine_start"
+CONFIG_TIME_SPINE_END = "time_spine_end"
+CONFIG_MODEL_CACHE_DIR = "model_cache_dir"
+CONFIG_MODEL_SNAPSHOT_PATH = "model_snapshot_path"
@@ -41,10 +41,12 @@ SQL_EXPR_GENERATE_UUID_PREFIX = "uuid"
 
 SQL_PLAN_SELECT_STATEMENT_ID_PREFIX = "ss"
 SQL_PLAN_TABLE_FROM_CLAUSE_ID_PREFIX = "tfc"
+SQL_PLAN_CTE_REFERENCE_ID_PREFIX = "cter"
 
 EXEC_NODE_READ_SQL_QUERY = "rsq"
 EXEC_NODE_NOOP = "noop"
 EXEC_NODE_WRITE_TO_TABLE = "wtt"
+EXEC_NODE_COMBINE_DATAFRAMES = "cdf"
 
 DATAFLOW_PLAN_PREFIX = "dfp"
 OPTIMIZED_DATAFLOW_PLAN_PREFIX = "dfpo"
@@ -70,6 +72,16 @@ class IdGenerator:
             self._next_id += 1
             return new_id
 
+    @property
+    def next_id(self) -> int:
+        """The number that will be used for the next ID."""
+        return self._next_id
+
+    def advance_to(self, next_id: int) -> None:
+        """Ensures that IDs created from now on use numbers of at least next_id."""
+        with self._lock:
+            self._next_id = max(self._next_id, next_id)
+
 
 class IdGeneratorRegistry:
     """Enumerate all IdGenerators used so that they can be patched appropriately in testing.
@@ -92,3 +104,25 @@ class IdGeneratorRegistry:
                     start_value=IdGeneratorRegistry.DEFAULT_START_VALUE
                 )
             return cls._class_name_to_id_generator[class_name]
+
+    @classmethod
+    def next_ids(cls) -> Dict[str, int]:
+        """Return the next number used by the ID generator for each class."""
+        with cls._state_lock:
+            return {
+                class_name: id_generator.next_id for class_name, id_generator in cls._class_name_to_id_generator.items()
+            }
+
+    @classmethod
+    def advance_to(cls, next_ids: Dict[str, int]) -> None:
+        """Advance the ID generators so that new IDs don't collide with IDs created when next_ids() was called.
+
+        This is needed when objects with IDs are loaded from another process e.g. via a snapshot.
+        """
+        with cls._state_lock:
+            for class_name, next_id in next_ids.items():
+                if class_name not in cls._class_name_to_id_generator:
+                    cls._class_name_to_id_generator[class_name] = IdGenerator(
+                        start_value=IdGeneratorRegistry.DEFAULT_START_VALUE
+                    )
+                cls._class_name_to_id_generator[class_name].advance_to(next_id)
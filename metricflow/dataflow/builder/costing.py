@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Sequence, Generic
+from typing import Any, Optional, Sequence, Generic
 
 from metricflow.dataflow.dataflow_plan import (
     DataflowPlanNode,
@@ -33,6 +33,9 @@ from metricflow.dataflow.dataflow_plan import (
     MetricTimeDimensionTransformNode,
     JoinToTimeSpineNode,
 )
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.plan_conversion.sql_dataset import SqlDataSet
+from metricflow.sql.sql_plan import SqlTableFromClauseNode
 
 
 class DataflowPlanNodeCost(ABC):
@@ -164,3 +167,150 @@ class DefaultCostFunction(
 
     def visit_join_to_time_spine_node(self, node: JoinToTimeSpineNode[SourceDataSetT]) -> DefaultCost:  # noqa: D
         return DefaultCost.sum([x.accept(self) for x in node.parent_nodes] + [DefaultCost(num_joins=1)])
+
+
+@dataclass(frozen=True)
+class StatisticsCost(DataflowPlanNodeCost):
+    """Cost model where the cost is the estimated number of rows that are processed to compute the node.
+
+    num_output_rows is the estimated number of rows in the output of the node, which is used to compute the cost of the
+    nodes that use it.
+    """
+
+    num_rows_processed: int = 0
+    num_output_rows: int = 0
+
+    @property
+    def as_int(self) -> int:  # noqa: D
+        return self.num_rows_processed
+
+
+class TableRowCountSource(ABC):
+    """Provides the number of rows in tables in the data warehouse."""
+
+    @abstractmethod
+    def get_row_count(self, sql_table: SqlTable) -> Optional[int]:
+        """Return the number of rows in the table, or None if it's not known."""
+        pass
+
+
+class StatisticsCostFunction(
+    Generic[SourceDataSetT],
+    DataflowPlanNodeCostFunction[SourceDataSetT],
+    DataflowPlanNodeVisitor[SourceDataSetT, StatisticsCost],
+):
+    """Cost function that estimates the number of rows processed using the row counts of the source tables.
+
+    Each node processes all rows in the output of its parents, except for nodes that only filter or transform the rows
+    of their parent, which are assumed to be computed together with the parent. Constraints are assumed to not filter
+    any rows, and aggregations are assumed to not reduce the number of rows, since the selectivity isn't known. Joins
+    output the rows of the left node.
+    """
+
+    # The number of rows to assume for sources where the row count isn't known, e.g. ones defined by an SQL query.
+    DEFAULT_ROW_COUNT = 1_000_000
+
+    def __init__(self, row_count_source: TableRowCountSource, default_row_count: int = DEFAULT_ROW_COUNT) -> None:
+        """Constructor.
+
+        Args:
+            row_count_source: Provides the number of rows in the tables of the source nodes.
+            default_row_count: The number of rows to assume for sources where the row count isn't known.
+        """
+        self._row_count_source = row_count_source
+        self._default_row_count = default_row_count
+
+    def calculate_cost(self, node: DataflowPlanNode[SourceDataSetT]) -> DataflowPlanNodeCost:  # noqa: D
+        return node.accept(self)
+
+    def _pass_through_cost(self, node: DataflowPlanNode[SourceDataSetT]) -> StatisticsCost:
+        """Return the cost of a node that outputs the rows of its parents without processing them separately."""
+        parent_costs = [x.accept(self) for x in node.parent_nodes]
+        return StatisticsCost(
+            num_rows_processed=sum(x.num_rows_processed for x in parent_costs),
+            num_output_rows=max(x.num_output_rows for x in parent_costs),
+        )
+
+    def _processing_cost(
+        self, node: DataflowPlanNode[SourceDataSetT], outputs_rows_of_first_parent: bool = True
+    ) -> StatisticsCost:
+        """Return the cost of a node that processes all rows in the output of its parents.
+
+        The node outputs as many rows as its first parent (e.g. the left node of a join), or as many rows as the parent
+        with the most rows if outputs_rows_of_first_parent is not set.
+        """
+        parent_costs = [x.accept(self) for x in node.parent_nodes]
+        return StatisticsCost(
+            num_rows_processed=sum(x.num_rows_processed + x.num_output_rows for x in parent_costs),
+            num_output_rows=(
+                parent_costs[0].num_output_rows
+                if outputs_rows_of_first_parent
+                else max(x.num_output_rows for x in parent_costs)
+            ),
+        )
+
+    def visit_source_node(self, node: ReadSqlSourceNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        row_count: Optional[int] = None
+        data_set = node.data_set
+        if isinstance(data_set, SqlDataSet):
+            from_source = data_set.sql_select_node.from_source
+            if isinstance(from_source, SqlTableFromClauseNode):
+                row_count = self._row_count_source.get_row_count(from_source.sql_table)
+        if row_count is None:
+            row_count = self._default_row_count
+        return StatisticsCost(num_rows_processed=row_count, num_output_rows=row_count)
+
+    def visit_join_to_base_output_node(self, node: JoinToBaseOutputNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._processing_cost(node)
+
+    def visit_join_aggregated_measures_by_groupby_columns_node(  # noqa: D
+        self, node: JoinAggregatedMeasuresByGroupByColumnsNode[SourceDataSetT]
+    ) -> StatisticsCost:
+        return self._processing_cost(node, outputs_rows_of_first_parent=False)
+
+    def visit_aggregate_measures_node(self, node: AggregateMeasuresNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._processing_cost(node)
+
+    def visit_compute_metrics_node(self, node: ComputeMetricsNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._pass_through_cost(node)
+
+    def visit_order_by_limit_node(self, node: OrderByLimitNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._pass_through_cost(node)
+
+    def visit_where_constraint_node(self, node: WhereConstraintNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._pass_through_cost(node)
+
+    def visit_write_to_result_dataframe_node(  # noqa: D
+        self, node: WriteToResultDataframeNode[SourceDataSetT]
+    ) -> StatisticsCost:
+        return self._pass_through_cost(node)
+
+    def visit_write_to_result_table_node(  # noqa: D
+        self, node: WriteToResultTableNode[SourceDataSetT]
+    ) -> StatisticsCost:
+        return self._pass_through_cost(node)
+
+    def visit_pass_elements_filter_node(self, node: FilterElementsNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._pass_through_cost(node)
+
+    def visit_combine_metrics_node(self, node: CombineMetricsNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._processing_cost(node, outputs_rows_of_first_parent=False)
+
+    def visit_constrain_time_range_node(  # noqa: D
+        self, node: ConstrainTimeRangeNode[SourceDataSetT]
+    ) -> StatisticsCost:
+        return self._pass_through_cost(node)
+
+    def visit_join_over_time_range_node(self, node: JoinOverTimeRangeNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._processing_cost(node)
+
+    def visit_metric_time_dimension_transform_node(  # noqa: D
+        self, node: MetricTimeDimensionTransformNode[SourceDataSetT]
+    ) -> StatisticsCost:
+        return self._pass_through_cost(node)
+
+    def visit_semi_additive_join_node(self, node: SemiAdditiveJoinNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._processing_cost(node)
+
+    def visit_join_to_time_spine_node(self, node: JoinToTimeSpineNode[SourceDataSetT]) -> StatisticsCost:  # noqa: D
+        return self._processing_cost(node)
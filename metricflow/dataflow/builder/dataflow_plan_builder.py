@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import collections
 import logging
+import threading
 import time
 from dataclasses import dataclass
 from typing import DefaultDict, List, TypeVar, Optional, Generic, Dict, Tuple, Sequence, Set, Union
 
+from metricflow.caching import LruCache
 from metricflow.constraints.time_constraint import TimeRangeConstraint
 from metricflow.dag.id_generation import IdGeneratorRegistry, DATAFLOW_PLAN_PREFIX
 from metricflow.dataflow.builder.costing import DefaultCostFunction, DataflowPlanNodeCostFunction
 from metricflow.dataflow.builder.measure_additiveness import group_measure_specs_by_additiveness
 from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
+from metricflow.dataflow.builder.source_node_index import SourceNodeIndex
 from metricflow.dataflow.builder.node_evaluator import (
     NodeEvaluatorForLinkableInstances,
     JoinLinkableInstancesRecipe,
@@ -41,11 +44,16 @@ from metricflow.dataflow.optimizer.dataflow_plan_optimizer import DataflowPlanOp
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.dataset.dataset import DataSet
 from metricflow.errors.errors import UnableToSatisfyQueryError
+from metricflow.model.objects.elements.identifier import IdentifierType
 from metricflow.model.objects.metric import MetricType, MetricTimeWindow
 from metricflow.model.semantic_model import SemanticModel
 from metricflow.object_utils import pformat_big_objects, assert_exactly_one_arg_set
 from metricflow.plan_conversion.column_resolver import DefaultColumnAssociationResolver
-from metricflow.plan_conversion.node_processor import PreDimensionJoinNodeProcessor
+from metricflow.plan_conversion.node_processor import (
+    MultiHopJoinCandidate,
+    MultiHopJoinCandidateCacheKey,
+    PreDimensionJoinNodeProcessor,
+)
 from metricflow.plan_conversion.sql_dataset import SqlDataSet
 from metricflow.plan_conversion.time_spine import TimeSpineSource
 from metricflow.references import TimeDimensionReference
@@ -102,6 +110,9 @@ class MeasureSpecProperties:
 class DataflowPlanBuilder(Generic[SqlDataSetT]):
     """Builds a dataflow plan to satisfy a given query."""
 
+    # The number of (identifier path -> multi-hop join candidates) entries to keep between queries.
+    MULTI_HOP_CANDIDATE_CACHE_SIZE = 256
+
     def __init__(  # noqa: D
         self,
         source_nodes: Sequence[BaseOutput[SqlDataSetT]],
@@ -116,6 +127,13 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
         self._metric_time_dimension_reference = DataSet.metric_time_dimension_reference()
         self._cost_function = cost_function
         self._source_nodes = source_nodes
+        self._spec_registry = semantic_model.spec_registry
+        # Built on first use as it requires resolving the output data sets of all source nodes.
+        self._source_node_index: Optional[SourceNodeIndex[SqlDataSetT]] = None
+        self._source_node_index_lock = threading.Lock()
+        self._multi_hop_candidate_cache: LruCache[
+            MultiHopJoinCandidateCacheKey, Sequence[MultiHopJoinCandidate[SqlDataSetT]]
+        ] = LruCache(max_size=DataflowPlanBuilder.MULTI_HOP_CANDIDATE_CACHE_SIZE)
         self._node_data_set_resolver = (
             DataflowPlanNodeOutputDataSetResolver[SqlDataSetT](
                 column_association_resolver=(
@@ -312,6 +330,103 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
             sink_output_nodes=[sink_node],
         )
 
+    def build_plan_for_linkable_values(
+        self,
+        linkable_spec: LinkableInstanceSpec,
+        measure_specs: Sequence[MeasureSpec],
+        where_constraint: Optional[SpecWhereClauseConstraint] = None,
+        limit: Optional[int] = None,
+    ) -> DataflowPlan[SqlDataSetT]:
+        """Generate a plan that gets the distinct values of a linkable instance from the data source that defines it.
+
+        Unlike build_plan_for_distinct_values(), measures are not aggregated, so only the data source containing the
+        linkable instance is read. The values are ordered, and the where constraint is applied to the rows of that
+        data source.
+
+        e.g. for listing__country_latest, the distinct values of listing__country_latest in the data source where
+        listing is the primary identifier.
+
+        Args:
+            linkable_spec: The dimension or identifier to get values for. Only one identifier link is supported.
+            measure_specs: The measures that the values are for. If linkable_spec doesn't have any identifier links,
+            the values are read from the data source of one of these measures.
+            where_constraint: Constraint on the rows that the values are read from.
+            limit: The maximum number of values to return.
+        """
+        if len(linkable_spec.identifier_links) > 1:
+            raise UnableToSatisfyQueryError(f"Values for multi-hop linkable specs are not supported: {linkable_spec}")
+
+        source_node_index = self._get_source_node_index()
+        candidate_nodes = source_node_index.nodes_with_linkable_spec(linkable_spec)
+        if len(linkable_spec.identifier_links) == 0:
+            # The linkable instance is local to the data source of the measures.
+            measure_node_ids = {
+                node.node_id
+                for node in source_node_index.nodes_with_any_element(
+                    measure_spec.element_name for measure_spec in measure_specs
+                )
+            }
+            candidate_nodes = [node for node in candidate_nodes if node.node_id in measure_node_ids]
+        else:
+            # The linkable instance is from a data source that can be joined to using the identifier.
+            candidate_nodes = [
+                node
+                for node in candidate_nodes
+                if self._contains_joinable_identifier(node, linkable_spec.identifier_links[0].element_name)
+            ]
+
+        if len(candidate_nodes) == 0:
+            raise UnableToSatisfyQueryError(f"No source node contains the values for {linkable_spec}")
+        source_node = self._sort_by_suitability(candidate_nodes)[0]
+        logger.info(f"Reading values for {linkable_spec} from:\n{pformat_big_objects(source_node)}")
+
+        filtered_node: BaseOutput[SqlDataSetT] = source_node
+        if where_constraint is not None:
+            filtered_node = WhereConstraintNode[SqlDataSetT](parent_node=source_node, where_constraint=where_constraint)
+
+        distinct_values_node = FilterElementsNode[SqlDataSetT](
+            parent_node=filtered_node,
+            include_specs=InstanceSpecSet.create_from_linkable_specs((linkable_spec,)),
+            distinct=True,
+        )
+
+        sink_node = self.build_sink_node_from_metrics_output_node(
+            computed_metrics_output=distinct_values_node,
+            order_by_specs=(
+                OrderBySpec(
+                    dimension_spec=linkable_spec if isinstance(linkable_spec, DimensionSpec) else None,
+                    time_dimension_spec=linkable_spec if isinstance(linkable_spec, TimeDimensionSpec) else None,
+                    identifier_spec=linkable_spec if isinstance(linkable_spec, IdentifierSpec) else None,
+                    descending=False,
+                ),
+            ),
+            limit=limit,
+        )
+
+        plan_id = IdGeneratorRegistry.for_class(DataflowPlanBuilder).create_id(DATAFLOW_PLAN_PREFIX)
+
+        return DataflowPlan(
+            plan_id=plan_id,
+            sink_output_nodes=[sink_node],
+        )
+
+    def _contains_joinable_identifier(self, node: BaseOutput[SqlDataSetT], identifier_name: str) -> bool:
+        """Returns true if the node contains the identifier, and other data sources can join to the node using it.
+
+        Joins on a foreign identifier are not allowed as they would fan out.
+        """
+        identifier_spec = LinklessIdentifierSpec.from_element_name(identifier_name)
+        for identifier_instance in self._node_data_set_resolver.get_output_data_set(
+            node
+        ).instance_set.identifier_instances:
+            if identifier_instance.spec != identifier_spec:
+                continue
+            identifier = self._data_source_semantics.get_identifier_in_data_source(
+                identifier_instance.origin_data_source_reference
+            )
+            return identifier is not None and identifier.type != IdentifierType.FOREIGN
+        return False
+
     @staticmethod
     def build_sink_node_from_metrics_output_node(
         computed_metrics_output: BaseOutput[SqlDataSetT],
@@ -359,31 +474,28 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
             )
         return data_source_names
 
+    def _get_source_node_index(self) -> SourceNodeIndex[SqlDataSetT]:
+        """Returns the index of the source nodes, building it if necessary."""
+        if self._source_node_index is None:
+            with self._source_node_index_lock:
+                if self._source_node_index is None:
+                    self._source_node_index = SourceNodeIndex[SqlDataSetT](
+                        source_nodes=self._source_nodes,
+                        node_data_set_resolver=self._node_data_set_resolver,
+                        cost_function=self._cost_function,
+                    )
+        return self._source_node_index
+
     def _sort_by_suitability(self, nodes: Sequence[BaseOutput[SqlDataSetT]]) -> Sequence[BaseOutput[SqlDataSetT]]:
         """Sort nodes by the cost, then by the number of linkable specs.
 
         Lower cost nodes will result in faster queries, and the lower the number of linkable specs means less
         aggregation required.
         """
+        return sorted(nodes, key=self._get_source_node_index().suitability_key)
 
-        def sort_function(node: BaseOutput[SqlDataSetT]) -> Tuple[int, int]:
-            data_set = self._node_data_set_resolver.get_output_data_set(node)
-            return self._cost_function.calculate_cost(node).as_int, len(data_set.instance_set.spec_set.linkable_specs)
-
-        return sorted(nodes, key=sort_function)
-
-    def _select_source_nodes_with_measures(
-        self, measure_specs: Set[MeasureSpec], source_nodes: Sequence[BaseOutput[SqlDataSetT]]
-    ) -> Sequence[BaseOutput[SqlDataSetT]]:
-        nodes = []
-        measure_specs_set = set(measure_specs)
-        for source_node in source_nodes:
-            measure_specs_in_node = self._node_data_set_resolver.get_output_data_set(
-                source_node
-            ).instance_set.spec_set.measure_specs
-            if measure_specs_set.intersection(set(measure_specs_in_node)) == measure_specs_set:
-                nodes.append(source_node)
-        return nodes
+    def _select_source_nodes_with_measures(self, measure_specs: Set[MeasureSpec]) -> Sequence[BaseOutput[SqlDataSetT]]:
+        return self._get_source_node_index().nodes_with_measures(measure_specs)
 
     def _find_non_additive_dimension_in_linkable_specs(
         self,
@@ -449,16 +561,19 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
         the same base data source, otherwise the internal conditions here will be impossible to satisfy
         """
         measure_specs = measure_spec_properties.measure_specs
+        source_node_index = self._get_source_node_index()
         node_processor = PreDimensionJoinNodeProcessor(
             data_source_semantics=self._data_source_semantics,
             node_data_set_resolver=self._node_data_set_resolver,
+            source_node_index=source_node_index,
+            multi_hop_candidate_cache=self._multi_hop_candidate_cache,
         )
 
         source_nodes: Sequence[BaseOutput[SqlDataSetT]] = self._source_nodes
 
         # We only care about nodes that have all required measures
         potential_measure_nodes: Sequence[BaseOutput[SqlDataSetT]] = self._select_source_nodes_with_measures(
-            measure_specs=set(measure_specs), source_nodes=source_nodes
+            measure_specs=set(measure_specs)
         )
 
         logger.info(f"There are {len(potential_measure_nodes)} potential measure source nodes")
@@ -474,10 +589,12 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
                 time_range_constraint=time_range_constraint,
             )
 
-        nodes_available_for_joins = node_processor.remove_unnecessary_nodes(
-            desired_linkable_specs=linkable_specs,
-            nodes=source_nodes,
-            metric_time_dimension_reference=self._metric_time_dimension_reference,
+        # Equivalent to node_processor.remove_unnecessary_nodes(), but uses the index instead of checking each node.
+        nodes_available_for_joins = source_node_index.nodes_with_any_element(
+            node_processor.relevant_element_names(
+                desired_linkable_specs=linkable_specs,
+                metric_time_dimension_reference=self._metric_time_dimension_reference,
+            )
         )
         logger.info(
             f"After removing unnecessary nodes, there are {len(nodes_available_for_joins)} nodes available for joins"
@@ -495,6 +612,7 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
             data_source_semantics=self._data_source_semantics,
             nodes_available_for_joins=self._sort_by_suitability(nodes_available_for_joins),
             node_data_set_resolver=self._node_data_set_resolver,
+            spec_registry=self._spec_registry,
         )
 
         # Dict from the node that contains the measure spec to the evaluation results.
@@ -546,7 +664,7 @@ class DataflowPlanBuilder(Generic[SqlDataSetT]):
 
         if len(node_to_evaluation) > 0:
 
-            cost_function = DefaultCostFunction[SqlDataSetT]()
+            cost_function = self._cost_function
 
             node_with_lowest_cost = min(node_to_evaluation, key=cost_function.calculate_cost)
             evaluation = node_to_evaluation[node_with_lowest_cost]
@@ -17,7 +17,7 @@ from __future__ import annotations
 import itertools
 import logging
 from dataclasses import dataclass
-from typing import Generic, List, Optional, Sequence, TypeVar, Tuple
+from typing import Dict, Generic, List, Optional, Sequence, TypeVar, Tuple
 
 from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
 from metricflow.dataflow.builder.partitions import PartitionJoinResolver
@@ -35,6 +35,7 @@ from metricflow.plan_conversion.sql_dataset import SqlDataSet
 from metricflow.plan_conversion.instance_converters import CreateValidityWindowJoinDescription
 
 from metricflow.protocols.semantics import DataSourceSemanticsAccessor
+from metricflow.spec_registry import SpecBitSet, SpecRegistry
 from metricflow.specs import (
     LinkableInstanceSpec,
     LinklessIdentifierSpec,
@@ -115,6 +116,7 @@ class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
         data_source_semantics: DataSourceSemanticsAccessor,
         nodes_available_for_joins: Sequence[BaseOutput[SourceDataSetT]],
         node_data_set_resolver: DataflowPlanNodeOutputDataSetResolver[SourceDataSetT],
+        spec_registry: Optional[SpecRegistry] = None,
     ) -> None:
         """Constructor
 
@@ -123,12 +125,27 @@ class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
             nodes_available_for_joins: Nodes that contain linkable instances and may be joined with the "start_node"
             (e.g. the node containing a desired measure) to retrieve the needed linkable instances.
             node_data_set_resolver: Figures out what data set is output by a node.
+            spec_registry: Used to represent the linkable specs in nodes as bitsets. Sharing the registry of the
+            semantic model allows IDs to be reused between evaluators.
         """
         self._data_source_semantics = data_source_semantics
         self._nodes_available_for_joins = nodes_available_for_joins
         self._node_data_set_resolver = node_data_set_resolver
         self._partition_resolver = PartitionJoinResolver(self._data_source_semantics)
         self._join_evaluator = DataSourceJoinEvaluator(self._data_source_semantics)
+        self._spec_registry = spec_registry if spec_registry is not None else SpecRegistry()
+        # Node ID -> the linkable specs in the output of the node.
+        self._node_to_linkable_spec_bitset: Dict[str, SpecBitSet] = {}
+
+    def _linkable_spec_bitset(self, node: BaseOutput[SourceDataSetT]) -> SpecBitSet:
+        """Returns the linkable specs in the output of the node as a bitset."""
+        bitset = self._node_to_linkable_spec_bitset.get(node.node_id)
+        if bitset is None:
+            bitset = self._spec_registry.bitset(
+                self._node_data_set_resolver.get_output_data_set(node).instance_set.spec_set.linkable_specs
+            )
+            self._node_to_linkable_spec_bitset[node.node_id] = bitset
+        return bitset
 
     def _find_joinable_candidate_nodes_that_can_satisfy_linkable_specs(
         self,
@@ -141,9 +158,27 @@ class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
         """
         candidates_for_join: List[JoinLinkableInstancesRecipe] = []
         start_node_spec_set = start_node_instance_set.spec_set
+
+        # The IDs of the specs that are checked for each node / identifier are looked up once here.
+        # Tuple of (needed spec, ID of the identifier in the first link, ID of the spec without the first link).
+        needed_spec_ids: List[Tuple[LinkableInstanceSpec, int, int]] = []
+        for needed_linkable_spec in needed_linkable_specs:
+            assert (
+                len(needed_linkable_spec.identifier_links) != 0
+            ), f"Invalid needed linkable spec passed in {needed_linkable_spec}"
+            needed_spec_ids.append(
+                (
+                    needed_linkable_spec,
+                    self._spec_registry.id_of(
+                        LinklessIdentifierSpec.from_reference(needed_linkable_spec.identifier_links[0])
+                    ),
+                    self._spec_registry.id_of(needed_linkable_spec.without_first_identifier_link),
+                )
+            )
+
         for right_node in self._nodes_available_for_joins:
             data_set_in_right_node: SqlDataSet = self._node_data_set_resolver.get_output_data_set(right_node)
-            linkable_specs_in_right_node = data_set_in_right_node.instance_set.spec_set.linkable_specs
+            linkable_specs_in_right_node = self._linkable_spec_bitset(right_node)
             identifier_specs_in_right_node = data_set_in_right_node.instance_set.spec_set.identifier_specs
 
             # For each unlinked identifier in the data set, create a candidate for joining.
@@ -203,13 +238,10 @@ class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
                 linkless_identifier_spec_in_node = LinklessIdentifierSpec.from_element_name(
                     identifier_spec_in_right_node.element_name
                 )
+                linkless_identifier_id_in_node = self._spec_registry.id_of(linkless_identifier_spec_in_node)
 
                 satisfiable_linkable_specs = []
-                for needed_linkable_spec in needed_linkable_specs:
-                    assert (
-                        len(needed_linkable_spec.identifier_links) != 0
-                    ), f"Invalid needed linkable spec passed in {needed_linkable_spec}"
-
+                for needed_linkable_spec, first_link_id, without_first_link_id in needed_spec_ids:
                     # If the identifier in the data set matches the link, then it can be used for joins. For example,
                     # if the node has the identifier "user_id", and dimension "country" then it can be used for
                     # satisfying "user_id__country".
@@ -225,13 +257,8 @@ class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
                     # We might also need to check the identifier type and see if it's the type of join we're allowing,
                     # but since we're doing all left joins now, it's been left out.
 
-                    required_identifier_matches_data_set_identifier = (
-                        LinklessIdentifierSpec.from_reference(needed_linkable_spec.identifier_links[0])
-                        == linkless_identifier_spec_in_node
-                    )
-                    needed_linkable_spec_in_node = (
-                        needed_linkable_spec.without_first_identifier_link in linkable_specs_in_right_node
-                    )
+                    required_identifier_matches_data_set_identifier = first_link_id == linkless_identifier_id_in_node
+                    needed_linkable_spec_in_node = linkable_specs_in_right_node.contains_id(without_first_link_id)
                     if required_identifier_matches_data_set_identifier and needed_linkable_spec_in_node:
                         satisfiable_linkable_specs.append(needed_linkable_spec)
 
@@ -268,8 +295,8 @@ class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
             reverse=True,
         )
 
-    @staticmethod
     def _update_candidates_that_can_satisfy_linkable_specs(
+        self,
         candidates_for_join: List[JoinLinkableInstancesRecipe],
         already_satisfisfied_linkable_specs: List[LinkableInstanceSpec],
     ) -> List[JoinLinkableInstancesRecipe]:
@@ -281,10 +308,13 @@ class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
         that can help satisfy the query, it is removed.
         """
         updated_candidate_data_sets: List[JoinLinkableInstancesRecipe] = []
+        already_satisfied_bitset = self._spec_registry.bitset(already_satisfisfied_linkable_specs)
         for candidate_for_join in candidates_for_join:
-            updated_satisfiable_linkable_specs = list(
-                set(candidate_for_join.satisfiable_linkable_specs) - set(already_satisfisfied_linkable_specs)
-            )
+            updated_satisfiable_linkable_specs = [
+                x
+                for x in candidate_for_join.satisfiable_linkable_specs
+                if not already_satisfied_bitset.contains_id(self._spec_registry.id_of(x))
+            ]
 
             if len(updated_satisfiable_linkable_specs) > 0:
                 updated_candidate_data_sets.append(
@@ -321,7 +351,7 @@ class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
 
         logger.debug(f"Candidate spec set is:\n{pformat_big_objects(candidate_spec_set)}")
 
-        data_set_linkable_specs = candidate_spec_set.linkable_specs
+        data_set_linkable_specs = self._linkable_spec_bitset(start_node)
 
         # These are linkable specs in the same data set as the measure. Those are considered "local".
         local_linkable_specs = []
@@ -332,12 +362,13 @@ class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
         # Group required_linkable_specs into local / un-joinable / or possibly joinable.
         unjoinable_linkable_specs = []
         for required_linkable_spec in required_linkable_specs:
-            is_local = required_linkable_spec in data_set_linkable_specs
-            is_unjoinable = (
-                len(required_linkable_spec.identifier_links) == 0
-                or LinklessIdentifierSpec.from_reference(required_linkable_spec.identifier_links[0])
-                not in data_set_linkable_specs
-            )
+            is_local = data_set_linkable_specs.contains_id(self._spec_registry.id_of(required_linkable_spec))
+            is_unjoinable = len(required_linkable_spec.identifier_links) == 0
+            if not is_unjoinable:
+                first_link_id = self._spec_registry.id_of(
+                    LinklessIdentifierSpec.from_reference(required_linkable_spec.identifier_links[0])
+                )
+                is_unjoinable = not data_set_linkable_specs.contains_id(first_link_id)
             if is_local:
                 local_linkable_specs.append(required_linkable_spec)
             elif is_unjoinable:
@@ -383,8 +414,11 @@ class NodeEvaluatorForLinkableInstances(Generic[SourceDataSetT]):
 
             # The once possibly joinable specs are definitely joinable and no longer need to be searched for.
             # Remove from "possibly_joinable_linkable_specs"
+            satisfied_bitset = self._spec_registry.bitset(next_candidate.satisfiable_linkable_specs)
             possibly_joinable_linkable_specs = [
-                x for x in possibly_joinable_linkable_specs if x not in next_candidate.satisfiable_linkable_specs
+                x
+                for x in possibly_joinable_linkable_specs
+                if not satisfied_bitset.contains_id(self._spec_registry.id_of(x))
             ]
 
         logger.info("Done evaluating possible joins")
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from typing import DefaultDict, Dict, FrozenSet, Generic, Iterable, Sequence, Tuple, TypeVar
+
+from metricflow.dataflow.builder.costing import DataflowPlanNodeCostFunction
+from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
+from metricflow.dataflow.dataflow_plan import BaseOutput
+from metricflow.plan_conversion.sql_dataset import SqlDataSet
+from metricflow.references import IdentifierReference
+from metricflow.spec_set_transforms import ToElementNameSet
+from metricflow.specs import LinkableInstanceSpec, MeasureSpec
+
+SqlDataSetT = TypeVar("SqlDataSetT", bound=SqlDataSet)
+
+logger = logging.getLogger(__name__)
+
+
+class SourceNodeIndex(Generic[SqlDataSetT]):
+    """Indexes the contents of the source nodes so that planning doesn't need to scan all nodes for each query.
+
+    The sets of nodes are stored as bitmasks over the positions of the source nodes, so lookups return the nodes in the
+    same order as the source nodes that were passed in. Nodes that aren't source nodes (e.g. nodes created during
+    planning) are supported by the per-node lookups, but those values are computed on each call. Costs aren't indexed
+    since they can depend on statistics that change over time, so they're calculated when nodes are sorted.
+    """
+
+    def __init__(  # noqa: D
+        self,
+        source_nodes: Sequence[BaseOutput[SqlDataSetT]],
+        node_data_set_resolver: DataflowPlanNodeOutputDataSetResolver[SqlDataSetT],
+        cost_function: DataflowPlanNodeCostFunction,
+    ) -> None:
+        self._source_nodes = tuple(source_nodes)
+        self._node_data_set_resolver = node_data_set_resolver
+        self._cost_function = cost_function
+
+        self._node_id_to_position: Dict[str, int] = {}
+        self._node_id_to_element_names: Dict[str, FrozenSet[str]] = {}
+        self._node_id_to_identifier_names: Dict[str, FrozenSet[str]] = {}
+        self._node_id_to_num_linkable_specs: Dict[str, int] = {}
+
+        measure_spec_to_mask: DefaultDict[MeasureSpec, int] = defaultdict(int)
+        element_name_to_mask: DefaultDict[str, int] = defaultdict(int)
+        identifier_name_to_mask: DefaultDict[str, int] = defaultdict(int)
+        linkable_spec_to_mask: DefaultDict[LinkableInstanceSpec, int] = defaultdict(int)
+
+        start_time = time.time()
+        for position, node in enumerate(self._source_nodes):
+            node_id = node.node_id
+            node_bit = 1 << position
+            spec_set = self._node_data_set_resolver.get_output_data_set(node).instance_set.spec_set
+
+            self._node_id_to_position[node_id] = position
+            element_names = self._compute_element_names(node)
+            identifier_names = self._compute_identifier_names(node)
+            self._node_id_to_element_names[node_id] = element_names
+            self._node_id_to_identifier_names[node_id] = identifier_names
+            self._node_id_to_num_linkable_specs[node_id] = len(spec_set.linkable_specs)
+
+            for measure_spec in spec_set.measure_specs:
+                measure_spec_to_mask[measure_spec] |= node_bit
+            for element_name in element_names:
+                element_name_to_mask[element_name] |= node_bit
+            for identifier_name in identifier_names:
+                identifier_name_to_mask[identifier_name] |= node_bit
+            for linkable_spec in spec_set.linkable_specs:
+                linkable_spec_to_mask[linkable_spec] |= node_bit
+
+        self._measure_spec_to_mask = dict(measure_spec_to_mask)
+        self._element_name_to_mask = dict(element_name_to_mask)
+        self._identifier_name_to_mask = dict(identifier_name_to_mask)
+        self._linkable_spec_to_mask = dict(linkable_spec_to_mask)
+        logger.info(f"Indexing {len(self._source_nodes)} source nodes took: {time.time() - start_time:.2f}s")
+
+    @property
+    def source_nodes(self) -> Sequence[BaseOutput[SqlDataSetT]]:  # noqa: D
+        return self._source_nodes
+
+    def _nodes_in_mask(self, mask: int) -> Sequence[BaseOutput[SqlDataSetT]]:
+        nodes = []
+        while mask:
+            lowest_bit = mask & -mask
+            nodes.append(self._source_nodes[lowest_bit.bit_length() - 1])
+            mask ^= lowest_bit
+        return nodes
+
+    def nodes_with_measures(self, measure_specs: Iterable[MeasureSpec]) -> Sequence[BaseOutput[SqlDataSetT]]:
+        """Returns the source nodes that contain all the given measures."""
+        mask = (1 << len(self._source_nodes)) - 1
+        for measure_spec in measure_specs:
+            mask &= self._measure_spec_to_mask.get(measure_spec, 0)
+        return self._nodes_in_mask(mask)
+
+    def nodes_with_any_element(self, element_names: Iterable[str]) -> Sequence[BaseOutput[SqlDataSetT]]:
+        """Returns the source nodes that contain an element (of any type) with one of the given names."""
+        mask = 0
+        for element_name in element_names:
+            mask |= self._element_name_to_mask.get(element_name, 0)
+        return self._nodes_in_mask(mask)
+
+    def nodes_with_identifier(self, identifier_reference: IdentifierReference) -> Sequence[BaseOutput[SqlDataSetT]]:
+        """Returns the source nodes that contain the identifier without any identifier links."""
+        return self._nodes_in_mask(self._identifier_name_to_mask.get(identifier_reference.element_name, 0))
+
+    def nodes_with_linkable_spec(self, linkable_spec: LinkableInstanceSpec) -> Sequence[BaseOutput[SqlDataSetT]]:
+        """Returns the source nodes that output the given linkable spec."""
+        return self._nodes_in_mask(self._linkable_spec_to_mask.get(linkable_spec, 0))
+
+    def element_names(self, node: BaseOutput[SqlDataSetT]) -> FrozenSet[str]:
+        """Returns the names of the elements in the output of the node."""
+        element_names = self._node_id_to_element_names.get(node.node_id)
+        return element_names if element_names is not None else self._compute_element_names(node)
+
+    def contains_identifier(self, node: BaseOutput[SqlDataSetT], identifier_reference: IdentifierReference) -> bool:
+        """Returns true if the output of the node contains the identifier without any identifier links."""
+        identifier_names = self._node_id_to_identifier_names.get(node.node_id)
+        if identifier_names is None:
+            identifier_names = self._compute_identifier_names(node)
+        return identifier_reference.element_name in identifier_names
+
+    def suitability_key(self, node: BaseOutput[SqlDataSetT]) -> Tuple[int, int]:
+        """Returns the key for sorting nodes by suitability - the cost, then by the number of linkable specs."""
+        num_linkable_specs = self._node_id_to_num_linkable_specs.get(node.node_id)
+        if num_linkable_specs is None:
+            data_set = self._node_data_set_resolver.get_output_data_set(node)
+            num_linkable_specs = len(data_set.instance_set.spec_set.linkable_specs)
+        return self._cost_function.calculate_cost(node).as_int, num_linkable_specs
+
+    def _compute_element_names(self, node: BaseOutput[SqlDataSetT]) -> FrozenSet[str]:
+        data_set = self._node_data_set_resolver.get_output_data_set(node)
+        return frozenset(ToElementNameSet().transform(data_set.instance_set.spec_set))
+
+    def _compute_identifier_names(self, node: BaseOutput[SqlDataSetT]) -> FrozenSet[str]:
+        data_set = self._node_data_set_resolver.get_output_data_set(node)
+        return frozenset(
+            identifier_instance.spec.element_name
+            for identifier_instance in data_set.instance_set.identifier_instances
+            if len(identifier_instance.spec.identifier_links) == 0
+        )
@@ -1122,16 +1122,21 @@ class WriteToResultTableNode(Generic[SourceDataSetT], SinkOutput[SourceDataSetT]
 
 
 class FilterElementsNode(Generic[SourceDataSetT], BaseOutput[SourceDataSetT]):
-    """Only passes the listed elements."""
+    """Only passes the listed elements.
+
+    If distinct is set, duplicate rows are removed from the output.
+    """
 
     def __init__(  # noqa: D
         self,
         parent_node: BaseOutput[SourceDataSetT],
         include_specs: InstanceSpecSet,
         replace_description: Optional[str] = None,
+        distinct: bool = False,
     ) -> None:
         self._include_specs = include_specs
         self._replace_description = replace_description
+        self._distinct = distinct
         self._parent_node = parent_node
         super().__init__(node_id=self.create_unique_id(), parent_nodes=[parent_node])
 
@@ -1144,6 +1149,11 @@ class FilterElementsNode(Generic[SourceDataSetT], BaseOutput[SourceDataSetT]):
         """Returns the specs for the elements that it should pass."""
         return self._include_specs
 
+    @property
+    def distinct(self) -> bool:
+        """Returns true if duplicate rows should be removed from the output."""
+        return self._distinct
+
     def accept(self, visitor: DataflowPlanNodeVisitor[SourceDataSetT, VisitorOutputT]) -> VisitorOutputT:  # noqa: D
         return visitor.visit_pass_elements_filter_node(self)
 
@@ -1155,6 +1165,8 @@ class FilterElementsNode(Generic[SourceDataSetT], BaseOutput[SourceDataSetT]):
         formatted_str = textwrap.indent(
             pformat_big_objects([x.qualified_name for x in self._include_specs.all_specs]), prefix="  "
         )
+        if self._distinct:
+            return f"Pass Only Distinct Elements:\n{formatted_str}"
         return f"Pass Only Elements:\n{formatted_str}"
 
     @property
@@ -1164,6 +1176,8 @@ class FilterElementsNode(Generic[SourceDataSetT], BaseOutput[SourceDataSetT]):
             additional_properties = [
                 DisplayedProperty("include_spec", include_spec) for include_spec in self._include_specs.all_specs
             ]
+        if self._distinct:
+            additional_properties.append(DisplayedProperty("distinct", self._distinct))
         return super().displayed_properties + additional_properties
 
     @property
@@ -1171,7 +1185,11 @@ class FilterElementsNode(Generic[SourceDataSetT], BaseOutput[SourceDataSetT]):
         return self._parent_node
 
     def functionally_identical(self, other_node: DataflowPlanNode[SourceDataSetT]) -> bool:  # noqa: D
-        return isinstance(other_node, self.__class__) and other_node.include_specs == self.include_specs
+        return (
+            isinstance(other_node, self.__class__)
+            and other_node.include_specs == self.include_specs
+            and other_node.distinct == self.distinct
+        )
 
     def with_new_parents(  # noqa: D
         self, new_parent_nodes: Sequence[BaseOutput[SourceDataSetT]]
@@ -1181,6 +1199,7 @@ class FilterElementsNode(Generic[SourceDataSetT], BaseOutput[SourceDataSetT]):
             parent_node=new_parent_nodes[0],
             include_specs=self.include_specs,
             replace_description=self._replace_description,
+            distinct=self.distinct,
         )
 
 
@@ -1275,7 +1294,7 @@ class CombineMetricsNode(Generic[SourceDataSetT], ComputedMetricsOutput[SourceDa
     def with_new_parents(  # noqa: D
         self, new_parent_nodes: Sequence[BaseOutput[SourceDataSetT]]
     ) -> CombineMetricsNode[SourceDataSetT]:
-        assert len(new_parent_nodes) == 1
+        assert len(new_parent_nodes) == len(self.parent_nodes)
         return CombineMetricsNode(
             parent_nodes=new_parent_nodes,
             join_type=self.join_type,
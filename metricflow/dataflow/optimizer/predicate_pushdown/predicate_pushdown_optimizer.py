@@ -0,0 +1,574 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple
+
+from mo_sql_parsing import parse as mo_parse
+
+from metricflow.dag.id_generation import IdGeneratorRegistry, OPTIMIZED_DATAFLOW_PLAN_PREFIX
+from metricflow.dataflow.dataflow_plan import (
+    AggregateMeasuresNode,
+    BaseOutput,
+    CombineMetricsNode,
+    ComputeMetricsNode,
+    ConstrainTimeRangeNode,
+    DataflowPlan,
+    DataflowPlanNode,
+    DataflowPlanNodeVisitor,
+    FilterElementsNode,
+    JoinAggregatedMeasuresByGroupByColumnsNode,
+    JoinDescription,
+    JoinOverTimeRangeNode,
+    JoinToBaseOutputNode,
+    JoinToTimeSpineNode,
+    MetricTimeDimensionTransformNode,
+    OrderByLimitNode,
+    ReadSqlSourceNode,
+    SemiAdditiveJoinNode,
+    SinkOutput,
+    SourceDataSetT,
+    WhereConstraintNode,
+    WriteToResultDataframeNode,
+    WriteToResultTableNode,
+)
+from metricflow.dataflow.dataflow_plan_to_text import dataflow_dag_as_text
+from metricflow.dataflow.optimizer.dataflow_plan_optimizer import DataflowPlanOptimizer
+from metricflow.model.objects.constraints.where import WhereClauseConstraint
+from metricflow.naming.linkable_spec_name import StructuredLinkableSpecName
+from metricflow.specs import InstanceSpecSet, LinkableInstanceSpec, LinkableSpecSet, SpecWhereClauseConstraint
+
+logger = logging.getLogger(__name__)
+
+# Quoted strings / identifiers, words, whitespace, and any other single character.
+_SQL_TOKEN_PATTERN = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`|\w+|\s+|.", re.DOTALL)
+
+# Comparisons that evaluate to NULL (i.e. not true) when any of the operands is NULL.
+_NULL_REJECTING_COMPARISONS = frozenset(
+    ("eq", "neq", "lt", "gt", "lte", "gte", "in", "nin", "like", "not_like", "ilike", "not_ilike", "between")
+)
+# Operators that return NULL when any of the operands is NULL.
+_NULL_PROPAGATING_OPERATORS = frozenset(("add", "sub", "mul", "div", "lower", "upper", "literal"))
+
+
+@dataclass(frozen=True)
+class WhereConjunct:
+    """A conjunct of a where constraint, e.g. "user__country = 'US'" in "user__country = 'US' AND is_instant".
+
+    Attributes:
+        where_constraint: The constraint that only contains the conjunct.
+        null_rejecting: Whether the conjunct is known to not be true when any of the referenced columns is NULL.
+    """
+
+    where_constraint: SpecWhereClauseConstraint
+    null_rejecting: bool
+
+    @property
+    def linkable_specs(self) -> Sequence[LinkableInstanceSpec]:  # noqa: D
+        return self.where_constraint.linkable_spec_set.as_tuple
+
+    def without_first_identifier_link(self) -> Optional[WhereConjunct]:
+        """Return the conjunct as it should be applied before joining via the first identifier link of the specs.
+
+        e.g. "user__country = 'US'" -> "country = 'US'". Returns None if the names can't be replaced in the condition
+        (e.g. quoted identifiers).
+        """
+        renamed_linkable_names: Dict[str, str] = {}
+        for linkable_name in self.where_constraint.linkable_names:
+            structured_name = StructuredLinkableSpecName.from_name(linkable_name)
+            assert len(structured_name.identifier_link_names) > 0, f"{linkable_name} does not have an identifier link"
+            renamed_linkable_names[linkable_name.lower()] = StructuredLinkableSpecName(
+                identifier_link_names=structured_name.identifier_link_names[1:],
+                element_name=structured_name.element_name,
+                time_granularity=structured_name.time_granularity,
+            ).qualified_name
+
+        replaced_linkable_names = set()
+        renamed_tokens = []
+        for token in _SQL_TOKEN_PATTERN.findall(self.where_constraint.where_condition):
+            if token.lower() in renamed_linkable_names:
+                replaced_linkable_names.add(token.lower())
+                token = renamed_linkable_names[token.lower()]
+            renamed_tokens.append(token)
+        if replaced_linkable_names != set(renamed_linkable_names):
+            return None
+
+        linkable_spec_set = self.where_constraint.linkable_spec_set
+        return WhereConjunct(
+            where_constraint=SpecWhereClauseConstraint(
+                where_condition="".join(renamed_tokens),
+                linkable_names=tuple(
+                    renamed_linkable_names[x.lower()] for x in self.where_constraint.linkable_names
+                ),
+                linkable_spec_set=LinkableSpecSet(
+                    dimension_specs=tuple(x.without_first_identifier_link for x in linkable_spec_set.dimension_specs),
+                    time_dimension_specs=tuple(
+                        x.without_first_identifier_link for x in linkable_spec_set.time_dimension_specs
+                    ),
+                    identifier_specs=tuple(
+                        x.without_first_identifier_link for x in linkable_spec_set.identifier_specs
+                    ),
+                ),
+                execution_parameters=self.where_constraint.execution_parameters,
+            ),
+            null_rejecting=self.null_rejecting,
+        )
+
+
+def _split_top_level_conjunctions(where_condition: str) -> List[str]:
+    """Split the condition on the ANDs that are not nested in parentheses, strings, CASE, or BETWEEN.
+
+    Conjuncts that are enclosed in parentheses are split recursively, so "a AND (b AND c)" results in [a, b, c].
+    """
+    conjuncts: List[str] = []
+    current_tokens: List[str] = []
+    paren_depth = 0
+    case_depth = 0
+    in_between = False
+    for token in _SQL_TOKEN_PATTERN.findall(where_condition):
+        upper_token = token.upper()
+        if token == "(":
+            paren_depth += 1
+        elif token == ")":
+            paren_depth -= 1
+        elif paren_depth == 0 and upper_token == "CASE":
+            case_depth += 1
+        elif paren_depth == 0 and upper_token == "END" and case_depth > 0:
+            case_depth -= 1
+        elif paren_depth == 0 and case_depth == 0 and upper_token == "BETWEEN":
+            in_between = True
+        elif paren_depth == 0 and case_depth == 0 and upper_token == "AND":
+            if in_between:
+                in_between = False
+            else:
+                conjuncts.append("".join(current_tokens).strip())
+                current_tokens = []
+                continue
+        current_tokens.append(token)
+    conjuncts.append("".join(current_tokens).strip())
+
+    split_conjuncts: List[str] = []
+    for conjunct in conjuncts:
+        inner_conjunct = _strip_enclosing_parentheses(conjunct)
+        if inner_conjunct is not None:
+            split_conjuncts.extend(_split_top_level_conjunctions(inner_conjunct))
+        else:
+            split_conjuncts.append(conjunct)
+    return split_conjuncts
+
+
+def _strip_enclosing_parentheses(expr: str) -> Optional[str]:
+    """If the expression is enclosed in a pair of matching parentheses, return the expression inside."""
+    tokens = _SQL_TOKEN_PATTERN.findall(expr)
+    if len(tokens) < 2 or tokens[0] != "(" or tokens[-1] != ")":
+        return None
+    paren_depth = 0
+    for i, token in enumerate(tokens):
+        if token == "(":
+            paren_depth += 1
+        elif token == ")":
+            paren_depth -= 1
+            # The first parenthesis was closed before the end.
+            if paren_depth == 0 and i < len(tokens) - 1:
+                return None
+    return "".join(tokens[1:-1]).strip()
+
+
+def _is_null_propagating_operand(operand: Any) -> bool:  # type: ignore[misc]
+    if isinstance(operand, (str, int, float)):
+        return True
+    if isinstance(operand, list):
+        return all(_is_null_propagating_operand(x) for x in operand)
+    if isinstance(operand, dict) and len(operand) == 1:
+        operator, operator_operands = next(iter(operand.items()))
+        return operator == "literal" or (
+            operator in _NULL_PROPAGATING_OPERATORS and _is_null_propagating_operand(operator_operands)
+        )
+    return False
+
+
+def _is_null_rejecting(parsed_condition: Any) -> bool:  # type: ignore[misc]
+    """Returns true if the condition parsed by mo_sql_parsing is not true when any referenced column is NULL."""
+    # A boolean column e.g. "is_instant".
+    if isinstance(parsed_condition, str):
+        return True
+    if isinstance(parsed_condition, dict) and len(parsed_condition) == 1:
+        operator, operands = next(iter(parsed_condition.items()))
+        return operator in _NULL_REJECTING_COMPARISONS and _is_null_propagating_operand(operands)
+    return False
+
+
+def split_where_constraint(where_constraint: SpecWhereClauseConstraint) -> Tuple[WhereConjunct, ...]:
+    """Split the where constraint into conjuncts that can be applied separately.
+
+    If the condition can't be parsed (e.g. it has bind parameters), the whole condition is returned as a single conjunct
+    that is not null rejecting.
+    """
+    try:
+        parsed_where = mo_parse(f"select _ from _ WHERE {where_constraint.where_condition}")["where"]
+    except Exception:
+        logger.debug(f"Unable to parse where condition: {where_constraint.where_condition}")
+        return (WhereConjunct(where_constraint=where_constraint, null_rejecting=False),)
+
+    parsed_conjuncts = [parsed_where]
+    if isinstance(parsed_where, dict) and "and" in parsed_where:
+        parsed_conjuncts = parsed_where["and"]
+    conjunct_conditions = _split_top_level_conjunctions(where_constraint.where_condition)
+    if len(conjunct_conditions) != len(parsed_conjuncts):
+        logger.debug(f"Unable to split where condition: {where_constraint.where_condition}")
+        return (WhereConjunct(where_constraint=where_constraint, null_rejecting=_is_null_rejecting(parsed_where)),)
+
+    conjuncts = []
+    for conjunct_condition, parsed_conjunct in zip(conjunct_conditions, parsed_conjuncts):
+        # Check that the split matches the parsed conjuncts.
+        if mo_parse(f"select _ from _ WHERE {conjunct_condition}")["where"] != parsed_conjunct:
+            logger.debug(f"Unable to split where condition: {where_constraint.where_condition}")
+            return (WhereConjunct(where_constraint=where_constraint, null_rejecting=_is_null_rejecting(parsed_where)),)
+        linkable_names = WhereClauseConstraint.parse(conjunct_condition).linkable_names
+        # Match the specs by the element name and the identifier links since the granularity is optional in the name.
+        linkable_name_keys = set()
+        for linkable_name in linkable_names:
+            structured_name = StructuredLinkableSpecName.from_name(linkable_name)
+            linkable_name_keys.add((structured_name.identifier_link_names, structured_name.element_name))
+        linkable_spec_set = where_constraint.linkable_spec_set
+        conjuncts.append(
+            WhereConjunct(
+                where_constraint=SpecWhereClauseConstraint(
+                    where_condition=conjunct_condition,
+                    linkable_names=tuple(linkable_names),
+                    linkable_spec_set=LinkableSpecSet(
+                        dimension_specs=tuple(
+                            x for x in linkable_spec_set.dimension_specs if _spec_key(x) in linkable_name_keys
+                        ),
+                        time_dimension_specs=tuple(
+                            x for x in linkable_spec_set.time_dimension_specs if _spec_key(x) in linkable_name_keys
+                        ),
+                        identifier_specs=tuple(
+                            x for x in linkable_spec_set.identifier_specs if _spec_key(x) in linkable_name_keys
+                        ),
+                    ),
+                    execution_parameters=where_constraint.execution_parameters,
+                ),
+                null_rejecting=_is_null_rejecting(parsed_conjunct),
+            )
+        )
+    return tuple(conjuncts)
+
+
+def _spec_key(spec: LinkableInstanceSpec) -> Tuple[Tuple[str, ...], str]:
+    return tuple(x.element_name for x in spec.identifier_links), spec.element_name
+
+
+def combine_conjuncts(conjuncts: Sequence[WhereConjunct]) -> SpecWhereClauseConstraint:
+    """Combine the conjuncts into a single where constraint."""
+    assert len(conjuncts) > 0
+    if len(conjuncts) == 1:
+        return conjuncts[0].where_constraint
+
+    execution_parameters = conjuncts[0].where_constraint.execution_parameters
+    for conjunct in conjuncts[1:]:
+        execution_parameters = execution_parameters.combine(conjunct.where_constraint.execution_parameters)
+
+    linkable_names: List[str] = []
+    for conjunct in conjuncts:
+        linkable_names.extend(x for x in conjunct.where_constraint.linkable_names if x not in linkable_names)
+
+    return SpecWhereClauseConstraint(
+        where_condition=" AND ".join(f"({x.where_constraint.where_condition})" for x in conjuncts),
+        linkable_names=tuple(linkable_names),
+        linkable_spec_set=LinkableSpecSet.merge(tuple(x.where_constraint.linkable_spec_set for x in conjuncts)),
+        execution_parameters=execution_parameters,
+    )
+
+
+class PredicatePushdownOptimizer(
+    Generic[SourceDataSetT],
+    DataflowPlanNodeVisitor[SourceDataSetT, DataflowPlanNode[SourceDataSetT]],
+    DataflowPlanOptimizer[SourceDataSetT],
+):
+    """Moves the conjuncts of where constraints to the lowest node in the plan that provides the referenced specs.
+
+    Where constraints are applied after the measure source is joined with the dimension sources, and warehouses don't
+    always push the filter through the sub-queries. For a plan like
+
+        <WhereConstraintNode where="user__country = 'US' AND is_instant">
+            <FilterElementsNode>
+                <JoinToBaseOutputNode>
+                    <FilterElementsNode include_specs="[bookings, is_instant, user]">
+                        <MeasureSourceNode/>
+                    </FilterElementsNode>
+                    <FilterElementsNode include_specs="[user, country]">
+                        <DimensionSourceNode/>
+                    </FilterElementsNode>
+                </JoinToBaseOutputNode>
+            </FilterElementsNode>
+        </WhereConstraintNode>
+
+    "is_instant" is applied to the measure source and "country = 'US'" is applied to the dimension source before the
+    join. Since the join is a LEFT OUTER join, filtering the dimension source results in rows with NULL dimension
+    values instead of removing them, so conjuncts are only pushed to the dimension source if they are null-rejecting
+    (e.g. comparisons), and they are also kept after the join to remove those rows.
+
+    Conjuncts are only moved through the nodes where filtering before or after the node is equivalent:
+    FilterElementsNode (if it passes the specs), ConstrainTimeRangeNode, and JoinToBaseOutputNode. Nodes like
+    JoinOverTimeRangeNode change the rows for a given metric_time, so conjuncts are not moved through them.
+
+    Nodes that are shared by multiple branches of the plan are only visited once, and nodes where nothing changed in
+    their branch are returned as is, so shared nodes stay shared in the optimized plan.
+    """
+
+    def __init__(self) -> None:  # noqa: D
+        self._log_level = logging.DEBUG
+        # Node ID -> the optimized node, for the plan that is being optimized.
+        self._node_id_to_optimized_node: Dict[str, DataflowPlanNode[SourceDataSetT]] = {}
+
+    def _optimize_node(self, node: DataflowPlanNode[SourceDataSetT]) -> DataflowPlanNode[SourceDataSetT]:
+        """Returns the optimized version of the node, visiting the node only if it hasn't been visited before."""
+        optimized_node = self._node_id_to_optimized_node.get(node.node_id)
+        if optimized_node is None:
+            optimized_node = node.accept(self)
+            self._node_id_to_optimized_node[node.node_id] = optimized_node
+        return optimized_node
+
+    def _default_handler(self, node: DataflowPlanNode[SourceDataSetT]) -> DataflowPlanNode[SourceDataSetT]:
+        optimized_parents: List[BaseOutput[SourceDataSetT]] = []
+        for parent_node in node.parent_nodes:
+            optimized_parent = self._optimize_node(parent_node)
+            assert isinstance(optimized_parent, BaseOutput)
+            optimized_parents.append(optimized_parent)
+        if all(x is y for x, y in zip(optimized_parents, node.parent_nodes)):
+            return node
+        return node.with_new_parents(optimized_parents)
+
+    @staticmethod
+    def _provided_specs(node: DataflowPlanNode[SourceDataSetT]) -> Optional[InstanceSpecSet]:
+        """Returns the specs that are known to be in the output of the node, or None if it's not known."""
+        if isinstance(node, FilterElementsNode):
+            return node.include_specs
+        if isinstance(node, (ConstrainTimeRangeNode, JoinOverTimeRangeNode, WhereConstraintNode)):
+            return PredicatePushdownOptimizer._provided_specs(node.parent_node)
+        return None
+
+    @staticmethod
+    def _provides_specs(node: DataflowPlanNode[SourceDataSetT], specs: Sequence[LinkableInstanceSpec]) -> bool:
+        provided_specs = PredicatePushdownOptimizer._provided_specs(node)
+        return provided_specs is not None and all(x in provided_specs.all_specs for x in specs)
+
+    @staticmethod
+    def _apply_conjuncts(
+        node: BaseOutput[SourceDataSetT], conjuncts: Sequence[WhereConjunct]
+    ) -> BaseOutput[SourceDataSetT]:
+        if len(conjuncts) == 0:
+            return node
+        return WhereConstraintNode(parent_node=node, where_constraint=combine_conjuncts(conjuncts))
+
+    def _push_down(
+        self, node: BaseOutput[SourceDataSetT], conjuncts: Sequence[WhereConjunct]
+    ) -> Tuple[BaseOutput[SourceDataSetT], Sequence[WhereConjunct]]:
+        """Apply the conjuncts as low as possible in the branch of the node.
+
+        Conjuncts are only applied directly on top of a FilterElementsNode since the columns in the output of other
+        nodes (e.g. JoinToBaseOutputNode) may not be named according to the specs.
+
+        Returns:
+            The node with the conjuncts applied, and the conjuncts that could not be applied within the branch.
+        """
+        if len(conjuncts) == 0:
+            return node, ()
+
+        if isinstance(node, FilterElementsNode):
+            pushed_conjuncts = [x for x in conjuncts if self._provides_specs(node, x.linkable_specs)]
+            if len(pushed_conjuncts) == 0:
+                return node, conjuncts
+            optimized_parent, remaining_conjuncts = self._push_down(node.parent_node, pushed_conjuncts)
+            if optimized_parent is not node.parent_node:
+                node = node.with_new_parents((optimized_parent,))
+            return (
+                self._apply_conjuncts(node, remaining_conjuncts),
+                [x for x in conjuncts if x not in pushed_conjuncts],
+            )
+
+        if isinstance(node, ConstrainTimeRangeNode):
+            parent_node = node.parent_node
+            assert isinstance(parent_node, BaseOutput)
+            optimized_parent, remaining_conjuncts = self._push_down(parent_node, conjuncts)
+            if optimized_parent is parent_node:
+                return node, remaining_conjuncts
+            return node.with_new_parents((optimized_parent,)), remaining_conjuncts
+
+        if isinstance(node, JoinToBaseOutputNode):
+            return self._push_down_through_join(node, conjuncts)
+
+        return node, conjuncts
+
+    def _push_down_through_join(
+        self, node: JoinToBaseOutputNode[SourceDataSetT], conjuncts: Sequence[WhereConjunct]
+    ) -> Tuple[BaseOutput[SourceDataSetT], Sequence[WhereConjunct]]:
+        left_node_conjuncts: List[WhereConjunct] = []
+        join_target_conjuncts: List[List[WhereConjunct]] = [[] for _ in node.join_targets]
+        remaining_conjuncts: List[WhereConjunct] = []
+
+        for conjunct in conjuncts:
+            if self._provides_specs(node.left_node, conjunct.linkable_specs):
+                left_node_conjuncts.append(conjunct)
+                continue
+
+            # Filtering the node to join would produce NULLs instead of removing rows, so the conjunct is still
+            # applied after the join.
+            remaining_conjuncts.append(conjunct)
+            first_identifier_links = set(
+                x.identifier_links[0] if len(x.identifier_links) > 0 else None for x in conjunct.linkable_specs
+            )
+            if not conjunct.null_rejecting or len(first_identifier_links) != 1 or None in first_identifier_links:
+                continue
+            (first_identifier_link,) = first_identifier_links
+            renamed_conjunct = conjunct.without_first_identifier_link()
+            if renamed_conjunct is None:
+                continue
+            for i, join_target in enumerate(node.join_targets):
+                if join_target.join_on_identifier.element_name == first_identifier_link.element_name and (
+                    self._provides_specs(join_target.join_node, renamed_conjunct.linkable_specs)
+                ):
+                    join_target_conjuncts[i].append(renamed_conjunct)
+                    break
+
+        optimized_left_node, remaining_left_node_conjuncts = self._push_down(node.left_node, left_node_conjuncts)
+        remaining_conjuncts.extend(remaining_left_node_conjuncts)
+
+        optimized_join_targets: List[JoinDescription[SourceDataSetT]] = []
+        for join_target, target_conjuncts in zip(node.join_targets, join_target_conjuncts):
+            # The conjuncts are kept after the join, so the ones that couldn't be applied to the target can be ignored.
+            optimized_join_node, _ = self._push_down(join_target.join_node, target_conjuncts)
+            optimized_join_targets.append(dataclasses.replace(join_target, join_node=optimized_join_node))
+
+        if optimized_left_node is node.left_node and all(
+            x.join_node is y.join_node for x, y in zip(optimized_join_targets, node.join_targets)
+        ):
+            return node, remaining_conjuncts
+
+        return (
+            JoinToBaseOutputNode[SourceDataSetT](left_node=optimized_left_node, join_targets=optimized_join_targets),
+            remaining_conjuncts,
+        )
+
+    def visit_where_constraint_node(  # noqa: D
+        self, node: WhereConstraintNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        optimized_parent = self._optimize_node(node.parent_node)
+        assert isinstance(optimized_parent, BaseOutput)
+
+        pushed_down_parent, remaining_conjuncts = self._push_down(optimized_parent, split_where_constraint(node.where))
+        # If nothing could be moved, keep the node as it was.
+        if pushed_down_parent is optimized_parent:
+            if optimized_parent is node.parent_node:
+                return node
+            return node.with_new_parents((optimized_parent,))
+        logger.log(level=self._log_level, msg=f"Pushed down the conjuncts of {node}")
+        return self._apply_conjuncts(pushed_down_parent, remaining_conjuncts)
+
+    def visit_source_node(self, node: ReadSqlSourceNode[SourceDataSetT]) -> DataflowPlanNode[SourceDataSetT]:  # noqa: D
+        return self._default_handler(node)
+
+    def visit_join_to_base_output_node(  # noqa: D
+        self, node: JoinToBaseOutputNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        optimized_left_node = self._optimize_node(node.left_node)
+        assert isinstance(optimized_left_node, BaseOutput)
+        optimized_join_targets: List[JoinDescription[SourceDataSetT]] = []
+        for join_target in node.join_targets:
+            optimized_join_node = self._optimize_node(join_target.join_node)
+            assert isinstance(optimized_join_node, BaseOutput)
+            optimized_join_targets.append(dataclasses.replace(join_target, join_node=optimized_join_node))
+        if optimized_left_node is node.left_node and all(
+            x.join_node is y.join_node for x, y in zip(optimized_join_targets, node.join_targets)
+        ):
+            return node
+        return JoinToBaseOutputNode[SourceDataSetT](left_node=optimized_left_node, join_targets=optimized_join_targets)
+
+    def visit_join_aggregated_measures_by_groupby_columns_node(  # noqa: D
+        self, node: JoinAggregatedMeasuresByGroupByColumnsNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        return self._default_handler(node)
+
+    def visit_aggregate_measures_node(  # noqa: D
+        self, node: AggregateMeasuresNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        return self._default_handler(node)
+
+    def visit_compute_metrics_node(  # noqa: D
+        self, node: ComputeMetricsNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        return self._default_handler(node)
+
+    def visit_order_by_limit_node(  # noqa: D
+        self, node: OrderByLimitNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        return self._default_handler(node)
+
+    def visit_write_to_result_dataframe_node(  # noqa: D
+        self, node: WriteToResultDataframeNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        return self._default_handler(node)
+
+    def visit_write_to_result_table_node(  # noqa: D
+        self, node: WriteToResultTableNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        return self._default_handler(node)
+
+    def visit_pass_elements_filter_node(  # noqa: D
+        self, node: FilterElementsNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        return self._default_handler(node)
+
+    def visit_combine_metrics_node(  # noqa: D
+        self, node: CombineMetricsNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        return self._default_handler(node)
+
+    def visit_constrain_time_range_node(  # noqa: D
+        self, node: ConstrainTimeRangeNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        return self._default_handler(node)
+
+    def visit_join_over_time_range_node(  # noqa: D
+        self, node: JoinOverTimeRangeNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        return self._default_handler(node)
+
+    def visit_semi_additive_join_node(  # noqa: D
+        self, node: SemiAdditiveJoinNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        return self._default_handler(node)
+
+    def visit_metric_time_dimension_transform_node(  # noqa: D
+        self, node: MetricTimeDimensionTransformNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        return self._default_handler(node)
+
+    def visit_join_to_time_spine_node(  # noqa: D
+        self, node: JoinToTimeSpineNode[SourceDataSetT]
+    ) -> DataflowPlanNode[SourceDataSetT]:
+        return self._default_handler(node)
+
+    def optimize(self, dataflow_plan: DataflowPlan[SourceDataSetT]) -> DataflowPlan[SourceDataSetT]:  # noqa: D
+        self._node_id_to_optimized_node = {}
+        try:
+            optimized_sink_node = self._optimize_node(dataflow_plan.sink_output_node)
+        finally:
+            self._node_id_to_optimized_node = {}
+        assert isinstance(optimized_sink_node, SinkOutput)
+
+        logger.log(
+            level=self._log_level,
+            msg=f"Optimized:\n\n"
+            f"{dataflow_dag_as_text(dataflow_plan.sink_output_node)}\n\n"
+            f"to:\n\n"
+            f"{dataflow_dag_as_text(optimized_sink_node)}",
+        )
+
+        return DataflowPlan[SourceDataSetT](
+            plan_id=IdGeneratorRegistry.for_class(self.__class__).create_id(OPTIMIZED_DATAFLOW_PLAN_PREFIX),
+            sink_output_nodes=[optimized_sink_node],
+        )
@@ -367,6 +367,14 @@ class ComputeMetricsBranchCombiner(
         combined_parent_node = results_of_visiting_parent_nodes[0]
         assert combined_parent_node is not None
 
+        if self._current_left_node.distinct != current_right_node.distinct:
+            self._log_combine_failure(
+                left_node=self._current_left_node,
+                right_node=current_right_node,
+                combine_failure_reason="only one of the filters removes duplicate rows",
+            )
+            return ComputeMetricsBranchCombinerResult()
+
         # For the FilterElementsNode to be combined, the linkable specs have to be the same for the left and right.
         if not MatchingLinkableSpecsTransform(self._current_left_node.include_specs).transform(
             current_right_node.include_specs
@@ -385,6 +393,7 @@ class ComputeMetricsBranchCombiner(
             include_specs=InstanceSpecSet.merge(
                 (self._current_left_node.include_specs, current_right_node.include_specs)
             ).dedupe(),
+            distinct=current_right_node.distinct,
         )
         self._log_combine_success(
             left_node=self._current_left_node,
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import datetime
+import logging
+from typing import Optional
+
+import pandas as pd
+
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.protocols.sql_client import SqlClient
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+
+logger = logging.getLogger(__name__)
+
+
+class MaterializationStateStore:
+    """Stores the high-watermark of metric_time for each materialization, for building materializations incrementally.
+
+    The watermarks are stored in a table in the system schema, with a row for each materialization. The table is
+    created when the first watermark is stored.
+    """
+
+    TABLE_NAME = "mf_materialization_state"
+    NAME_COLUMN_NAME = "materialization_name"
+    WATERMARK_COLUMN_NAME = "watermark"
+
+    def __init__(self, sql_client: SqlClient, schema_name: str) -> None:  # noqa: D
+        self._sql_client = sql_client
+        self._state_table = SqlTable(schema_name=schema_name, table_name=MaterializationStateStore.TABLE_NAME)
+
+    @property
+    def state_table(self) -> SqlTable:  # noqa: D
+        return self._state_table
+
+    def _name_condition(self) -> str:
+        name_key = self._sql_client.render_execution_param_key(MaterializationStateStore.NAME_COLUMN_NAME)
+        return f"{MaterializationStateStore.NAME_COLUMN_NAME} = {name_key}"
+
+    def get_watermark(self, materialization_name: str) -> Optional[datetime.datetime]:
+        """Returns the latest value of metric_time in the materialized table, or None if it's not known."""
+        if not self._sql_client.table_exists(self._state_table):
+            return None
+        df = self._sql_client.query(
+            f"SELECT {MaterializationStateStore.WATERMARK_COLUMN_NAME} FROM {self._state_table.sql} "
+            f"WHERE {self._name_condition()}",
+            sql_bind_parameters=SqlBindParameters.create_from_dict(
+                {MaterializationStateStore.NAME_COLUMN_NAME: materialization_name}
+            ),
+        )
+        watermarks = df[MaterializationStateStore.WATERMARK_COLUMN_NAME].dropna()
+        if len(watermarks) == 0:
+            return None
+        return pd.Timestamp(watermarks.max()).to_pydatetime()
+
+    def set_watermark(self, materialization_name: str, watermark: datetime.datetime) -> None:
+        """Stores the latest value of metric_time in the materialized table."""
+        if not self._sql_client.table_exists(self._state_table):
+            self._sql_client.create_table_from_dataframe(
+                sql_table=self._state_table,
+                df=pd.DataFrame(
+                    {
+                        MaterializationStateStore.NAME_COLUMN_NAME: [materialization_name],
+                        MaterializationStateStore.WATERMARK_COLUMN_NAME: [pd.Timestamp(watermark)],
+                    }
+                ),
+            )
+            return
+
+        self.remove_watermark(materialization_name)
+        watermark_key = self._sql_client.render_execution_param_key(MaterializationStateStore.WATERMARK_COLUMN_NAME)
+        name_key = self._sql_client.render_execution_param_key(MaterializationStateStore.NAME_COLUMN_NAME)
+        self._sql_client.execute(
+            f"INSERT INTO {self._state_table.sql} "
+            f"({MaterializationStateStore.NAME_COLUMN_NAME}, {MaterializationStateStore.WATERMARK_COLUMN_NAME}) "
+            f"VALUES ({name_key}, {watermark_key})",
+            sql_bind_parameters=SqlBindParameters.create_from_dict(
+                {
+                    MaterializationStateStore.NAME_COLUMN_NAME: materialization_name,
+                    MaterializationStateStore.WATERMARK_COLUMN_NAME: watermark,
+                }
+            ),
+        )
+        logger.info(f"Set the watermark for materialization '{materialization_name}' to {watermark.isoformat()}")
+
+    def remove_watermark(self, materialization_name: str) -> None:
+        """Removes the stored watermark, so the next incremental build rebuilds the whole table."""
+        if not self._sql_client.table_exists(self._state_table):
+            return
+        self._sql_client.execute(
+            f"DELETE FROM {self._state_table.sql} WHERE {self._name_condition()}",
+            sql_bind_parameters=SqlBindParameters.create_from_dict(
+                {MaterializationStateStore.NAME_COLUMN_NAME: materialization_name}
+            ),
+        )
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import datetime
+import functools
 import logging
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from typing import Optional, List, Sequence
+from typing import Callable, Dict, Iterator, Optional, List, Sequence, Tuple
 
 import pandas as pd
 
+from metricflow.caching import CacheStats, LruCache
 from metricflow.configuration.constants import (
     CONFIG_DBT_CLOUD_JOB_ID,
     CONFIG_DBT_CLOUD_SERVICE_TOKEN,
@@ -15,36 +23,66 @@ from metricflow.configuration.constants import (
     CONFIG_DBT_REPO,
     CONFIG_DBT_TARGET,
     CONFIG_DWH_SCHEMA,
+    CONFIG_MODEL_SNAPSHOT_PATH,
+    CONFIG_TIME_SPINE_END,
+    CONFIG_TIME_SPINE_START,
 )
 from metricflow.configuration.yaml_handler import YamlFileHandler
+from metricflow.dag.id_generation import EXEC_PLAN_PREFIX, IdGeneratorRegistry
+from metricflow.dag.mf_dag import DagNode
+from metricflow.dataflow.builder.costing import (
+    DataflowPlanNodeCostFunction,
+    DefaultCostFunction,
+    StatisticsCostFunction,
+)
 from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
 from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
 from metricflow.dataflow.builder.source_node import SourceNodeBuilder
-from metricflow.dataflow.dataflow_plan import DataflowPlan
+from metricflow.dataflow.dataflow_plan import BaseOutput, CombineMetricsNode, DataflowPlan
+from metricflow.dataflow.optimizer.predicate_pushdown.predicate_pushdown_optimizer import PredicatePushdownOptimizer
 from metricflow.dataflow.optimizer.source_scan.source_scan_optimizer import SourceScanOptimizer
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.dataset.convert_data_source import DataSourceToDataSetConverter
 from metricflow.dataset.data_source_adapter import DataSourceDataSet
+from metricflow.dataset.dataset import DataSet
+from metricflow.engine.materialization_state import MaterializationStateStore
+from metricflow.engine.model_snapshot import ModelSnapshot, read_model_snapshot, write_model_snapshot
 from metricflow.engine.models import Dimension, Materialization, Metric
+from metricflow.engine.result_cache import ResultCache, result_cache_scope
+from metricflow.engine.table_statistics import TableStatisticsStore
 from metricflow.engine.time_source import ServerTimeSource
 from metricflow.engine.utils import build_user_configured_model_from_config, build_user_configured_model_from_dbt_cloud
-from metricflow.errors.errors import ExecutionException, MaterializationNotFoundError
-from metricflow.execution.execution_plan import ExecutionPlan, SqlQuery
+from metricflow.errors.errors import ExecutionException, MaterializationNotFoundError, UnableToSatisfyQueryError
+from metricflow.execution.execution_plan import ExecutionPlan, ExecutionPlanTask, SqlQuery
 from metricflow.execution.execution_plan_to_text import execution_plan_to_text
-from metricflow.execution.executor import SequentialPlanExecutor
+from metricflow.execution.executor import AsyncPlanExecutor, ExecutionResults, ParallelPlanExecutor
 from metricflow.logging.formatting import indent_log_line
+from metricflow.model.objects.data_source import DataSource
+from metricflow.model.objects.elements.identifier import CompositeSubIdentifier
+from metricflow.model.objects.user_configured_model import UserConfiguredModel
 from metricflow.model.semantic_model import SemanticModel
 from metricflow.model.semantics.linkable_element_properties import LinkableElementProperties
 from metricflow.object_utils import pformat_big_objects, random_id
 from metricflow.plan_conversion.column_resolver import DefaultColumnAssociationResolver
-from metricflow.plan_conversion.dataflow_to_execution import DataflowToExecutionPlanConverter
+from metricflow.plan_conversion.dataflow_to_execution import (
+    CombineMetricsExecutionMode,
+    DataflowToExecutionPlanConverter,
+)
 from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
 from metricflow.plan_conversion.time_spine import TimeSpineSource, TimeSpineTableBuilder
-from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.protocols.async_sql_client import AsyncSqlClient, DEFAULT_QUERY_CHUNK_SIZE
 from metricflow.query.query_parser import MetricFlowQueryParser
 from metricflow.references import DimensionReference, MetricReference
-from metricflow.specs import ColumnAssociationResolver, MetricFlowQuerySpec
+from metricflow.specs import (
+    ColumnAssociationResolver,
+    LinkableInstanceSpec,
+    LinkableSpecSet,
+    MetricFlowQuerySpec,
+    SpecWhereClauseConstraint,
+)
 from metricflow.sql.optimizer.optimization_levels import SqlQueryOptimizationLevel
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.sql.sql_plan import SqlTableFromClauseNode
 from metricflow.sql_clients.common_client import not_empty
 from metricflow.sql_clients.sql_utils import make_sql_client_from_config
 from metricflow.telemetry.models import TelemetryLevel
@@ -76,6 +114,7 @@ class MetricFlowQueryRequest:
     order_by_names: metric and group by names to order by. A "-" can be used to specify reverse order e.g. "-ds"
     output_table: If specified, output the result data to this table instead of a result dataframe.
     sql_optimization_level: The level of optimization for the generated SQL.
+    combine_metrics_mode: If specified, how to execute the step that combines multiple metrics for the output.
     """
 
     request_id: MetricFlowRequestId
@@ -88,6 +127,7 @@ class MetricFlowQueryRequest:
     order_by_names: Optional[Sequence[str]] = None
     output_table: Optional[str] = None
     sql_optimization_level: SqlQueryOptimizationLevel = SqlQueryOptimizationLevel.O4
+    combine_metrics_mode: Optional[CombineMetricsExecutionMode] = None
 
     @staticmethod
     def create_with_random_request_id(  # noqa: D
@@ -100,6 +140,7 @@ class MetricFlowQueryRequest:
         order_by_names: Optional[Sequence[str]] = None,
         output_table: Optional[str] = None,
         sql_optimization_level: SqlQueryOptimizationLevel = SqlQueryOptimizationLevel.O4,
+        combine_metrics_mode: Optional[CombineMetricsExecutionMode] = None,
     ) -> MetricFlowQueryRequest:
         return MetricFlowQueryRequest(
             request_id=MetricFlowRequestId(mf_rid=f"{random_id()}"),
@@ -112,9 +153,60 @@ class MetricFlowQueryRequest:
             order_by_names=order_by_names,
             output_table=output_table,
             sql_optimization_level=sql_optimization_level,
+            combine_metrics_mode=combine_metrics_mode,
         )
 
 
+@dataclass(frozen=True)
+class QueryPlanCacheKey:
+    """A normalized form of a MetricFlowQueryRequest, for identifying requests that result in the same plan.
+
+    The request ID is excluded, and metric / group by names are lower-cased as the query parser does.
+    """
+
+    metric_names: Tuple[str, ...]
+    group_by_names: Tuple[str, ...]
+    limit: Optional[int]
+    time_constraint_start: Optional[datetime.datetime]
+    time_constraint_end: Optional[datetime.datetime]
+    where_constraint: Optional[str]
+    order_by_names: Optional[Tuple[str, ...]]
+    output_table: Optional[str]
+    sql_optimization_level: SqlQueryOptimizationLevel
+    combine_metrics_mode: Optional[CombineMetricsExecutionMode]
+
+    @staticmethod
+    def create_from_request(mf_request: MetricFlowQueryRequest) -> QueryPlanCacheKey:  # noqa: D
+        return QueryPlanCacheKey(
+            metric_names=tuple(name.strip().lower() for name in mf_request.metric_names),
+            group_by_names=tuple(name.strip().lower() for name in mf_request.group_by_names),
+            limit=mf_request.limit,
+            time_constraint_start=mf_request.time_constraint_start,
+            time_constraint_end=mf_request.time_constraint_end,
+            where_constraint=mf_request.where_constraint.strip() if mf_request.where_constraint else None,
+            order_by_names=(
+                tuple(name.strip() for name in mf_request.order_by_names)
+                if mf_request.order_by_names is not None
+                else None
+            ),
+            output_table=mf_request.output_table,
+            sql_optimization_level=mf_request.sql_optimization_level,
+            combine_metrics_mode=mf_request.combine_metrics_mode,
+        )
+
+
+@dataclass(frozen=True)
+class _DimensionValuesCacheKey:
+    """Identifies the arguments of a call to MetricFlowEngine.get_dimension_values() for caching the values."""
+
+    metric_name: str
+    group_by_name: str
+    time_constraint_start: Optional[datetime.datetime]
+    time_constraint_end: Optional[datetime.datetime]
+    limit: Optional[int]
+    prefix: Optional[str]
+
+
 @dataclass(frozen=True)
 class MetricFlowQueryResult:  # noqa: D
     """The result of a query and context on how it was generated."""
@@ -137,19 +229,28 @@ class MetricFlowExplainResult:
 
     @property
     def rendered_sql(self) -> SqlQuery:
-        """Return the SQL query that would be run for the given query."""
-        if len(self.execution_plan.tasks) != 1:
-            raise NotImplementedError(
-                f"Multiple tasks in the execution plan not yet supported. Got tasks: {self.execution_plan.tasks}"
-            )
+        """Return the SQL query that would be run for the given query.
 
-        sql_query = self.execution_plan.tasks[0].sql_query
-        if not sql_query:
+        If the plan runs multiple queries, they are returned as a single ';'-separated string.
+        """
+        sql_queries: List[SqlQuery] = []
+        for task in self.execution_plan.tasks:
+            if task.sql_query is not None:
+                sql_queries.append(task.sql_query)
+        if len(sql_queries) == 0:
             raise NotImplementedError(
                 f"Execution plan tasks without a SQL query not yet supported. Got tasks: {self.execution_plan.tasks}"
             )
+        elif len(sql_queries) == 1:
+            return sql_queries[0]
 
-        return sql_query
+        bind_parameters = SqlBindParameters()
+        for sql_query in sql_queries:
+            bind_parameters = bind_parameters.combine(sql_query.bind_parameters)
+        return SqlQuery(
+            sql_query=";\n\n".join(sql_query.sql_query for sql_query in sql_queries),
+            bind_parameters=bind_parameters,
+        )
 
     @property
     def rendered_sql_without_descriptions(self) -> SqlQuery:
@@ -163,6 +264,149 @@ class MetricFlowExplainResult:
         )
 
 
+@dataclass(frozen=True)
+class ModelReloadResult:
+    """Describes the changes between the previous and the new model after a reload."""
+
+    added_data_sources: Tuple[str, ...]
+    removed_data_sources: Tuple[str, ...]
+    # Data sources that were modified, or that need to be rebuilt because of changes to other data sources.
+    rebuilt_data_sources: Tuple[str, ...]
+    reused_data_sources: Tuple[str, ...]
+    added_metrics: Tuple[str, ...]
+    removed_metrics: Tuple[str, ...]
+    changed_metrics: Tuple[str, ...]
+
+    @property
+    def has_changes(self) -> bool:  # noqa: D
+        return (
+            len(self.added_data_sources) > 0
+            or len(self.removed_data_sources) > 0
+            or len(self.rebuilt_data_sources) > 0
+            or len(self.added_metrics) > 0
+            or len(self.removed_metrics) > 0
+            or len(self.changed_metrics) > 0
+        )
+
+
+@dataclass(frozen=True)
+class _ModelState:
+    """The objects derived from a model that are used for handling requests.
+
+    These are replaced as a whole when the model is reloaded, so a request that reads the state once at the start is
+    not affected by a concurrent reload.
+    """
+
+    semantic_model: SemanticModel
+    column_association_resolver: ColumnAssociationResolver
+    # Keyed by the name of the data source, in the order of the data sources in the model.
+    data_source_to_data_set: Dict[str, DataSourceDataSet]
+    data_source_to_source_nodes: Dict[str, Sequence[BaseOutput[DataSourceDataSet]]]
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet]
+    to_execution_plan_converter: DataflowToExecutionPlanConverter[DataSourceDataSet]
+    query_parser: MetricFlowQueryParser
+    plan_cache: LruCache[QueryPlanCacheKey, MetricFlowExplainResult]
+    dimension_values_cache: LruCache[_DimensionValuesCacheKey, Tuple[str, ...]]
+
+    def to_snapshot(self) -> ModelSnapshot:
+        """Returns a snapshot of the derived objects that can be used to create the state for the same model."""
+        return ModelSnapshot(
+            user_configured_model=self.semantic_model.user_configured_model,
+            data_source_to_data_set=self.data_source_to_data_set,
+            data_source_to_source_nodes=self.data_source_to_source_nodes,
+            linkable_element_sets=self.semantic_model.linkable_spec_resolver.indexed_element_sets,
+            next_ids=IdGeneratorRegistry.next_ids(),
+        )
+
+
+@dataclass(frozen=True)
+class _QueryBatch:
+    """Requests from MetricFlowEngine.query_batch() that are answered by a single query.
+
+    request_indexes: The positions of the requests in the batch.
+    mf_request: The request for the query, which contains the metrics for all requests.
+    explain_result: The plans for the query.
+    metric_column_names: The names of the columns in the result for the metrics in the query.
+    """
+
+    request_indexes: Tuple[int, ...]
+    mf_request: MetricFlowQueryRequest
+    explain_result: MetricFlowExplainResult
+    metric_column_names: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class _DimensionValuesQuery:
+    """A query for the values of a dimension that reads the data source of the dimension instead of computing a metric.
+
+    linkable_spec: The spec for the dimension or identifier.
+    execution_plan: The plan for running the query.
+    column_name: The name of the column containing the values in the result.
+    prefix: If set, only values starting with this should be returned. This is only set when the predicate in the query
+    may match more values than this, so the values need to be filtered again after the query.
+    limit: The maximum number of values to return.
+    """
+
+    linkable_spec: LinkableInstanceSpec
+    execution_plan: ExecutionPlan
+    column_name: str
+    prefix: Optional[str]
+    limit: Optional[int]
+
+
+@dataclass(frozen=True)
+class DimensionValuesPlan:
+    """Describes how to get the values for a call to get_dimension_values(), from plan_dimension_values().
+
+    If the values were cached, they're in cached_values. Otherwise, either execution_plan or metric_request is set. The
+    values are then extracted from the results of running it with dimension_values_from_execution_results() or
+    dimension_values_from_query_result(), respectively.
+    """
+
+    model_state: _ModelState
+    cache_key: _DimensionValuesCacheKey
+    cached_values: Optional[Tuple[str, ...]] = None
+    values_query: Optional[_DimensionValuesQuery] = None
+
+    @property
+    def execution_plan(self) -> Optional[ExecutionPlan]:
+        """The plan for reading the values from the data source of the dimension, without computing the metric."""
+        if self.cached_values is not None or self.values_query is None:
+            return None
+        return self.values_query.execution_plan
+
+    @property
+    def metric_request(self) -> Optional[MetricFlowQueryRequest]:
+        """The metric query to read the values from, if they can't be read from the data source of the dimension."""
+        if self.cached_values is not None or self.values_query is not None:
+            return None
+        return MetricFlowEngine._dimension_values_request(self.cache_key)
+
+
+def _contains_combine_metrics_node(dataflow_plan: DataflowPlan[DataSourceDataSet]) -> bool:
+    """Returns true if the plan combines metrics that are computed in different branches."""
+    nodes_to_visit: List[DagNode] = list(dataflow_plan.sink_output_nodes)
+    while nodes_to_visit:
+        node = nodes_to_visit.pop()
+        if isinstance(node, CombineMetricsNode):
+            return True
+        nodes_to_visit.extend(node.parent_nodes)
+    return False
+
+
+def _composite_identifier_definitions(
+    user_configured_model: UserConfiguredModel,
+) -> Dict[str, Tuple[CompositeSubIdentifier, ...]]:
+    """Returns the sub-identifiers for each identifier name that are used when resolving column names."""
+    identifier_to_sub_identifiers: Dict[str, Tuple[CompositeSubIdentifier, ...]] = {}
+    for data_source in user_configured_model.data_sources:
+        for identifier in data_source.identifiers:
+            # DefaultColumnAssociationResolver uses the first definition of the identifier in the model.
+            if identifier.reference.element_name not in identifier_to_sub_identifiers:
+                identifier_to_sub_identifiers[identifier.reference.element_name] = tuple(identifier.identifiers)
+    return identifier_to_sub_identifiers
+
+
 class AbstractMetricFlowEngine(ABC):
     """Query interface for clients"""
 
@@ -174,6 +418,40 @@ class AbstractMetricFlowEngine(ABC):
         """Query for metrics."""
         pass
 
+    @abstractmethod
+    def query_chunks(
+        self,
+        mf_request: MetricFlowQueryRequest,
+        chunk_size: int = DEFAULT_QUERY_CHUNK_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        """Query for metrics, returning the result as a series of dataframes with up to chunk_size rows each.
+
+        Rows are fetched from the data warehouse as the chunks are consumed, so large results don't have to fit in
+        memory. The request is planned when this is called, but the query doesn't run until the first chunk is
+        requested.
+        """
+        pass
+
+    @abstractmethod
+    def query_batch(self, mf_requests: Sequence[MetricFlowQueryRequest]) -> List[MetricFlowQueryResult]:
+        """Query for the metrics in several requests at once, returning the results in the same order as the requests.
+
+        Requests that only differ in the metrics are computed with shared queries where the results are the same as
+        running the requests separately, and the remaining queries are run concurrently.
+        """
+        pass
+
+    @abstractmethod
+    def reload_model(self, user_configured_model: Optional[UserConfiguredModel] = None) -> ModelReloadResult:
+        """Switch to a new version of the model, rebuilding only what's affected by the changes.
+
+        Queries that are running when this is called finish using the previous version of the model.
+
+        Args:
+            user_configured_model: the new model. If not specified, the model is read again from where it was loaded.
+        """
+        pass
+
     @abstractmethod
     def explain(
         self,
@@ -213,6 +491,8 @@ class AbstractMetricFlowEngine(ABC):
         get_group_by_values: str,
         time_constraint_start: Optional[datetime.datetime] = None,
         time_constraint_end: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+        prefix: Optional[str] = None,
     ) -> List[str]:
         """Retrieves a list of dimension values given a [metric_name, get_group_by_values].
 
@@ -221,6 +501,8 @@ class AbstractMetricFlowEngine(ABC):
             get_group_by_values: Name of group_by to get values from.
             time_constraint_start: Get data for the start of this time range.
             time_constraint_end: Get data for the end of this time range.
+            limit: The maximum number of values to return.
+            prefix: Only return values that start with this string.
 
         Returns:
             A list of dimension values as string.
@@ -242,6 +524,8 @@ class AbstractMetricFlowEngine(ABC):
         materialization_name: str,
         time_constraint_start: Optional[datetime.datetime] = None,
         time_constraint_end: Optional[datetime.datetime] = None,
+        incremental: bool = False,
+        lookback: Optional[datetime.timedelta] = None,
     ) -> SqlTable:
         """Builds a table containing metrics and dimensions from a materialization definition.
 
@@ -251,12 +535,29 @@ class AbstractMetricFlowEngine(ABC):
             materialization_name: Name of materialization
             time_constraint_start: Materialized for the start of this time range.
             time_constraint_end: Materialized for the end of this time range.
+            incremental: If the table was built before, only replace the rows from the latest value of metric_time in
+            the table onwards, instead of rebuilding the whole table. Requires metric_time in the dimensions.
+            lookback: For incremental builds, how much earlier to start replacing rows, to include data that arrived
+            late.
 
         Returns:
             SqlTable object of the materialized table.
         """
         pass
 
+    @abstractmethod
+    def materialization_watermark(self, materialization_name: str) -> Optional[datetime.datetime]:
+        """Returns the time that an incremental build of the materialization would replace rows from.
+
+        Args:
+            materialization_name: Name of materialization
+
+        Returns:
+            The latest value of metric_time in the materialized table, or None if an incremental build would build the
+            whole table (e.g. as the table doesn't exist yet).
+        """
+        pass
+
     @abstractmethod
     def drop_materialization(self, materialization_name: str) -> bool:
         """Drops the table associated with a materialization definition.
@@ -273,6 +574,16 @@ class AbstractMetricFlowEngine(ABC):
 class MetricFlowEngine(AbstractMetricFlowEngine):
     """Main entry point for queries."""
 
+    # The number of query plans to keep in the plan cache.
+    DEFAULT_PLAN_CACHE_SIZE = 512
+    # The number of dimension value lists to keep, and for how long, as values can change when data is loaded.
+    DEFAULT_DIMENSION_VALUES_CACHE_SIZE = 256
+    DEFAULT_DIMENSION_VALUES_CACHE_TTL_SECONDS = 300.0
+    # The key of the bind parameter for the pattern used to search for values with a prefix.
+    DIMENSION_VALUE_PATTERN_PARAMETER_KEY = "dimension_value_pattern"
+    # Added to the name of a materialized table for the table with the rows from an incremental build.
+    MATERIALIZATION_STAGING_TABLE_SUFFIX = "__mf_increment"
+
     @staticmethod
     def from_config(handler: YamlFileHandler) -> MetricFlowEngine:
         """Initialize MetricFlowEngine via yaml config file."""
@@ -292,25 +603,43 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             dbt_profile = handler.get_value(CONFIG_DBT_PROFILE)
             dbt_target = handler.get_value(CONFIG_DBT_TARGET)
 
-            semantic_model = SemanticModel(
-                build_user_configured_model_from_dbt_config(handler=handler, profile=dbt_profile, target=dbt_target)
-            )
+            def load_model() -> UserConfiguredModel:
+                return build_user_configured_model_from_dbt_config(
+                    handler=handler, profile=dbt_profile, target=dbt_target
+                )
+
         elif dbt_cloud_job_id != "":
             dbt_cloud_service_token = handler.get_value(CONFIG_DBT_CLOUD_SERVICE_TOKEN) or ""
             assert dbt_cloud_service_token != "", "A dbt cloud service token is required for using MF with dbt cloud"
 
-            semantic_model = SemanticModel(
-                build_user_configured_model_from_dbt_cloud(
+            def load_model() -> UserConfiguredModel:
+                return build_user_configured_model_from_dbt_cloud(
                     job_id=dbt_cloud_job_id, service_token=dbt_cloud_service_token
                 )
-            )
+
         else:
-            semantic_model = SemanticModel(build_user_configured_model_from_config(handler))
+
+            def load_model() -> UserConfiguredModel:
+                return build_user_configured_model_from_config(handler)
+
+        semantic_model = SemanticModel(load_model())
         system_schema = not_empty(handler.get_value(CONFIG_DWH_SCHEMA), CONFIG_DWH_SCHEMA, handler.url)
+        # An optional range for the time spine table, as ISO 8601 dates.
+        time_spine_start = handler.get_value(CONFIG_TIME_SPINE_START)
+        time_spine_end = handler.get_value(CONFIG_TIME_SPINE_END)
+        # An optional snapshot written by save_model_snapshot() to avoid deriving the objects for the model again.
+        model_snapshot_path = handler.get_value(CONFIG_MODEL_SNAPSHOT_PATH)
         return MetricFlowEngine(
             semantic_model=semantic_model,
             sql_client=sql_client,
             system_schema=system_schema,
+            time_spine_source=TimeSpineSource(
+                schema_name=system_schema,
+                start_time=datetime.datetime.fromisoformat(time_spine_start) if time_spine_start else None,
+                end_time=datetime.datetime.fromisoformat(time_spine_end) if time_spine_end else None,
+            ),
+            model_loader=load_model,
+            model_snapshot=read_model_snapshot(model_snapshot_path) if model_snapshot_path else None,
         )
 
     def __init__(
@@ -321,6 +650,13 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         time_source: TimeSource = ServerTimeSource(),
         column_association_resolver: Optional[ColumnAssociationResolver] = None,
         time_spine_source: Optional[TimeSpineSource] = None,
+        plan_cache_size: int = DEFAULT_PLAN_CACHE_SIZE,
+        result_cache: Optional[ResultCache] = None,
+        model_loader: Optional[Callable[[], UserConfiguredModel]] = None,
+        model_snapshot: Optional[ModelSnapshot] = None,
+        dimension_values_cache_size: int = DEFAULT_DIMENSION_VALUES_CACHE_SIZE,
+        dimension_values_cache_ttl_seconds: float = DEFAULT_DIMENSION_VALUES_CACHE_TTL_SECONDS,
+        table_statistics_ttl_seconds: Optional[float] = None,
     ) -> None:
         """Initializer for MetricFlowEngine
 
@@ -329,13 +665,21 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         - column_association_resolver
         - time_spine_source
         These parameters are mainly there to be overridden during tests.
+
+        plan_cache_size is the number of query plans that are cached for repeated requests. Set to 0 to disable.
+        result_cache, if specified, is used to return the results of repeated queries without running them.
+        model_loader, if specified, is called by reload_model() to read the latest version of the model.
+        model_snapshot, if specified, provides the derived objects for data sources that are the same as in the
+        semantic model, instead of deriving them again.
+        dimension_values_cache_size is the number of results of get_dimension_values() that are cached, for up to
+        dimension_values_cache_ttl_seconds. Set the size to 0 to disable.
+        table_statistics_ttl_seconds, if specified, enables choosing between data sources using the row counts of their
+        tables. The row counts are collected in the background through the SQL client and stored in the system schema,
+        and they're collected again after this many seconds.
         """
 
-        self._semantic_model = semantic_model
         self._sql_client = sql_client
-        self._column_association_resolver = column_association_resolver or (
-            DefaultColumnAssociationResolver(semantic_model)
-        )
+        self._custom_column_association_resolver = column_association_resolver
         self._time_source = time_source
         self._time_spine_source = time_spine_source or TimeSpineSource(schema_name=system_schema)
         self._time_spine_table_builder = TimeSpineTableBuilder(
@@ -343,16 +687,91 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         )
 
         self._schema = system_schema
-
-        self._source_data_sets: List[DataSourceDataSet] = []
-        converter = DataSourceToDataSetConverter(column_association_resolver=self._column_association_resolver)
-        for data_source in self._semantic_model.user_configured_model.data_sources:
+        self._materialization_state_store = MaterializationStateStore(sql_client=sql_client, schema_name=system_schema)
+        self._table_statistics_store = (
+            TableStatisticsStore(
+                sql_client=sql_client,
+                schema_name=system_schema,
+                ttl_seconds=table_statistics_ttl_seconds,
+                time_source=time_source,
+                # Plans that were built with the previous row counts might not be the cheapest anymore.
+                on_row_count_change=self.clear_plan_cache,
+            )
+            if table_statistics_ttl_seconds is not None
+            else None
+        )
+        self._executor = ParallelPlanExecutor(sql_client=sql_client)
+        self._plan_cache_size = plan_cache_size
+        self._dimension_values_cache_size = dimension_values_cache_size
+        self._dimension_values_cache_ttl_seconds = dimension_values_cache_ttl_seconds
+        self._result_cache = result_cache
+        self._result_cache_scope = result_cache_scope(sql_client) if result_cache is not None else ""
+        self._model_loader = model_loader
+
+        # Serializes reloads. Requests don't take the lock - they read self._model_state once and use that.
+        self._reload_lock = threading.Lock()
+        self._model_state = self._build_model_state(semantic_model=semantic_model, reusable_snapshot=model_snapshot)
+        self._collect_table_statistics_in_background(self._model_state)
+
+    def _collect_table_statistics_in_background(self, model_state: _ModelState) -> None:
+        """Starts collecting the row counts of the tables of the data sources, so that they're known when planning."""
+        if self._table_statistics_store is None:
+            return
+        sql_tables = []
+        for data_set in model_state.data_source_to_data_set.values():
+            from_source = data_set.sql_select_node.from_source
+            if isinstance(from_source, SqlTableFromClauseNode):
+                sql_tables.append(from_source.sql_table)
+        self._table_statistics_store.collect_in_background(sql_tables)
+
+    def _build_model_state(
+        self, semantic_model: SemanticModel, reusable_snapshot: Optional[ModelSnapshot]
+    ) -> _ModelState:
+        """Creates the objects needed for handling requests with the given model.
+
+        If a snapshot of a previous state is given, data sets and source nodes for data sources that are not affected by
+        the changes in the model are reused.
+        """
+        column_association_resolver = self._custom_column_association_resolver or (
+            DefaultColumnAssociationResolver(semantic_model)
+        )
+        user_configured_model = semantic_model.user_configured_model
+
+        reusable_data_sources: Dict[str, DataSource] = {}
+        if reusable_snapshot is not None and self._custom_column_association_resolver is None:
+            previous_model = reusable_snapshot.user_configured_model
+            if previous_model == user_configured_model:
+                # The linkable elements depend on the whole model, so they can only be reused if nothing has changed.
+                semantic_model.linkable_spec_resolver.add_indexed_element_sets(reusable_snapshot.linkable_element_sets)
+            previous_data_sources = {data_source.name: data_source for data_source in previous_model.data_sources}
+            # The column names for identifiers depend on how composite identifiers are defined elsewhere in the model.
+            previous_composite_identifiers = _composite_identifier_definitions(previous_model)
+            composite_identifiers = _composite_identifier_definitions(user_configured_model)
+            for data_source in user_configured_model.data_sources:
+                if previous_data_sources.get(data_source.name) == data_source and all(
+                    previous_composite_identifiers.get(x.reference.element_name)
+                    == composite_identifiers.get(x.reference.element_name)
+                    for x in data_source.identifiers
+                ):
+                    reusable_data_sources[data_source.name] = data_source
+
+        converter = DataSourceToDataSetConverter(column_association_resolver=column_association_resolver)
+        source_node_builder = SourceNodeBuilder(semantic_model)
+        data_source_to_data_set: Dict[str, DataSourceDataSet] = {}
+        data_source_to_source_nodes: Dict[str, Sequence[BaseOutput[DataSourceDataSet]]] = {}
+        for data_source in user_configured_model.data_sources:
+            if reusable_snapshot is not None and data_source.name in reusable_data_sources:
+                data_source_to_data_set[data_source.name] = reusable_snapshot.data_source_to_data_set[data_source.name]
+                data_source_to_source_nodes[data_source.name] = reusable_snapshot.data_source_to_source_nodes[
+                    data_source.name
+                ]
+                continue
             data_set = converter.create_sql_source_data_set(data_source)
-            self._source_data_sets.append(data_set)
+            data_source_to_data_set[data_source.name] = data_set
+            data_source_to_source_nodes[data_source.name] = source_node_builder.create_from_data_sets([data_set])
             logger.info(f"Created source dataset from data source '{data_source.name}'")
 
-        source_node_builder = SourceNodeBuilder(self._semantic_model)
-        source_nodes = source_node_builder.create_from_data_sets(self._source_data_sets)
+        source_nodes = [node for nodes in data_source_to_source_nodes.values() for node in nodes]
 
         node_output_resolver = DataflowPlanNodeOutputDataSetResolver[DataSourceDataSet](
             column_association_resolver=DefaultColumnAssociationResolver(semantic_model),
@@ -360,29 +779,146 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             time_spine_source=self._time_spine_source,
         )
 
-        self._dataflow_plan_builder = DataflowPlanBuilder[DataSourceDataSet](
+        cost_function: DataflowPlanNodeCostFunction = DefaultCostFunction[DataSourceDataSet]()
+        if self._table_statistics_store is not None:
+            cost_function = StatisticsCostFunction[DataSourceDataSet](row_count_source=self._table_statistics_store)
+        dataflow_plan_builder = DataflowPlanBuilder[DataSourceDataSet](
             source_nodes=source_nodes,
-            semantic_model=self._semantic_model,
+            semantic_model=semantic_model,
             time_spine_source=self._time_spine_source,
+            cost_function=cost_function,
         )
-        self._to_sql_query_plan_converter = DataflowToSqlQueryPlanConverter[DataSourceDataSet](
-            column_association_resolver=self._column_association_resolver,
-            semantic_model=self._semantic_model,
+        to_sql_query_plan_converter = DataflowToSqlQueryPlanConverter[DataSourceDataSet](
+            column_association_resolver=column_association_resolver,
+            semantic_model=semantic_model,
             time_spine_source=self._time_spine_source,
         )
-        self._to_execution_plan_converter = DataflowToExecutionPlanConverter[DataSourceDataSet](
-            sql_plan_converter=self._to_sql_query_plan_converter,
+        to_execution_plan_converter = DataflowToExecutionPlanConverter[DataSourceDataSet](
+            sql_plan_converter=to_sql_query_plan_converter,
             sql_plan_renderer=self._sql_client.sql_engine_attributes.sql_query_plan_renderer,
-            sql_client=sql_client,
+            sql_client=self._sql_client,
+            # Requests can opt into running a query per metric, but by default explain() renders one executable query
+            # and the results are combined in the SQL engine.
+            combine_metrics_mode=CombineMetricsExecutionMode.SINGLE_QUERY,
         )
-        self._executor = SequentialPlanExecutor()
 
-        self._query_parser = MetricFlowQueryParser(
-            model=self._semantic_model,
+        query_parser = MetricFlowQueryParser(
+            model=semantic_model,
             source_nodes=source_nodes,
             node_output_resolver=node_output_resolver,
         )
 
+        return _ModelState(
+            semantic_model=semantic_model,
+            column_association_resolver=column_association_resolver,
+            data_source_to_data_set=data_source_to_data_set,
+            data_source_to_source_nodes=data_source_to_source_nodes,
+            dataflow_plan_builder=dataflow_plan_builder,
+            to_execution_plan_converter=to_execution_plan_converter,
+            query_parser=query_parser,
+            # Plans are cached with the state, so plans for the previous model can't be returned after a reload.
+            plan_cache=LruCache(max_size=self._plan_cache_size),
+            dimension_values_cache=LruCache(
+                max_size=self._dimension_values_cache_size, ttl_seconds=self._dimension_values_cache_ttl_seconds
+            ),
+        )
+
+    def reload_model(self, user_configured_model: Optional[UserConfiguredModel] = None) -> ModelReloadResult:
+        """See AbstractMetricFlowEngine.reload_model().
+
+        When the engine is created with from_config(), model files are read through the parsed-model cache, so only
+        files that changed are parsed again.
+        """
+        with self._reload_lock:
+            start_time = time.time()
+            if user_configured_model is None:
+                if self._model_loader is None:
+                    raise ValueError(
+                        "A model must be specified as this engine wasn't created with a way to load the model"
+                    )
+                user_configured_model = self._model_loader()
+
+            previous_state = self._model_state
+            new_state = self._build_model_state(
+                semantic_model=SemanticModel(user_configured_model), reusable_snapshot=previous_state.to_snapshot()
+            )
+            reload_result = MetricFlowEngine._diff_model_states(previous_state, new_state)
+            self._model_state = new_state
+            self._collect_table_statistics_in_background(new_state)
+            logger.info(
+                f"Reloaded the model in {time.time() - start_time:.2f}s. Rebuilt data sources: "
+                f"{list(reload_result.added_data_sources + reload_result.rebuilt_data_sources)}"
+            )
+            return reload_result
+
+    def save_model_snapshot(self, file_path: str) -> None:
+        """Writes the objects derived from the current model to a file, for creating engines via model_snapshot.
+
+        The linkable elements for all metrics are computed before writing, so engines using the snapshot don't need to
+        compute them for any metric.
+        """
+        if self._custom_column_association_resolver is not None:
+            raise ValueError("Snapshots can't be saved for engines using a custom column association resolver")
+        model_state = self._model_state
+        model_state.semantic_model.linkable_spec_resolver.build_index()
+        write_model_snapshot(model_state.to_snapshot(), file_path)
+
+    @staticmethod
+    def _diff_model_states(previous_state: _ModelState, new_state: _ModelState) -> ModelReloadResult:
+        previous_data_sets = previous_state.data_source_to_data_set
+        new_data_sets = new_state.data_source_to_data_set
+        previous_metrics = {
+            metric.name: metric for metric in previous_state.semantic_model.user_configured_model.metrics
+        }
+        new_metrics = {metric.name: metric for metric in new_state.semantic_model.user_configured_model.metrics}
+        return ModelReloadResult(
+            added_data_sources=tuple(name for name in new_data_sets if name not in previous_data_sets),
+            removed_data_sources=tuple(name for name in previous_data_sets if name not in new_data_sets),
+            rebuilt_data_sources=tuple(
+                name
+                for name, data_set in new_data_sets.items()
+                if name in previous_data_sets and data_set is not previous_data_sets[name]
+            ),
+            reused_data_sources=tuple(
+                name for name, data_set in new_data_sets.items() if data_set is previous_data_sets.get(name)
+            ),
+            added_metrics=tuple(name for name in new_metrics if name not in previous_metrics),
+            removed_metrics=tuple(name for name in previous_metrics if name not in new_metrics),
+            changed_metrics=tuple(
+                name
+                for name, metric in new_metrics.items()
+                if name in previous_metrics and previous_metrics[name] != metric
+            ),
+        )
+
+    @property
+    def semantic_model(self) -> SemanticModel:
+        """The semantic model that queries are resolved against."""
+        return self._model_state.semantic_model
+
+    @property
+    def sql_client(self) -> AsyncSqlClient:
+        """The client used to run queries against the data warehouse."""
+        return self._sql_client
+
+    @property
+    def plan_cache_stats(self) -> CacheStats:
+        """Hit / miss counters for the cache of query plans since the model was last loaded."""
+        return self._model_state.plan_cache.stats
+
+    def clear_plan_cache(self) -> None:
+        """Remove all cached query plans."""
+        self._model_state.plan_cache.clear()
+
+    @property
+    def dimension_values_cache_stats(self) -> CacheStats:
+        """Hit / miss counters for the cache of dimension values since the model was last loaded."""
+        return self._model_state.dimension_values_cache.stats
+
+    def clear_dimension_values_cache(self) -> None:
+        """Remove all cached dimension values, e.g. after loading data that adds new values."""
+        self._model_state.dimension_values_cache.clear()
+
     def _get_materialization_by_name(self, materialization_name: str) -> Optional[Materialization]:
         materializations = self.list_materializations()
         for mat in materializations:
@@ -396,25 +932,103 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def query(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:  # noqa: D
         logger.info(f"Starting query request:\n" f"{indent_log_line(pformat_big_objects(mf_request))}")
-        explain_result = self._create_execution_plan(mf_request)
+        explain_result = self.create_execution_plan(mf_request)
+        cached_query_result = self.get_cached_query_result(mf_request, explain_result)
+        if cached_query_result is not None:
+            return cached_query_result
+
         execution_plan = explain_result.execution_plan
+        logger.info(f"Running tasks in:\n" f"{execution_plan_to_text(execution_plan)}")
+        execution_results = self._executor.execute_plan(execution_plan)
+        logger.info("Finished running tasks in execution plan")
+        return self.create_query_result(mf_request, explain_result, execution_results)
 
-        if len(execution_plan.tasks) != 1:
-            raise NotImplementedError("Multiple tasks not yet supported.")
+    # create_execution_plan(), get_cached_query_result(), and create_query_result() are the steps of query() apart
+    # from running the execution plan. They're public so that wrappers that run the plan differently (e.g.
+    # AsyncMetricFlowEngine) share the plan and result caches, and how results are created.
 
-        task = execution_plan.tasks[0]
+    def create_execution_plan(self, mf_query_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
+        """Returns the plans for the request, re-using the plans for an equivalent earlier request if possible.
 
-        logger.info(f"Sequentially running tasks in:\n" f"{execution_plan_to_text(execution_plan)}")
-        execution_results = self._executor.execute_plan(execution_plan)
-        logger.info("Finished running tasks in execution plan")
+        This is the same as explain(), without the telemetry for the call.
+        """
+        model_state = self._model_state
+        cache_key = QueryPlanCacheKey.create_from_request(mf_query_request)
+        explain_result = model_state.plan_cache.get(cache_key)
+        if explain_result is not None:
+            logger.info(f"Using cached plans for request: {mf_query_request.request_id}")
+            # The cached plans may read from the time spine table, which is only created when it's first needed.
+            if MetricFlowEngine._query_uses_time_spine(model_state, explain_result.query_spec):
+                self._time_spine_table_builder.create_if_necessary()
+            return explain_result
+
+        explain_result = self._build_execution_plan(model_state, mf_query_request)
+        model_state.plan_cache.put(cache_key, explain_result)
+        return explain_result
+
+    def get_cached_query_result(
+        self, mf_request: MetricFlowQueryRequest, explain_result: MetricFlowExplainResult
+    ) -> Optional[MetricFlowQueryResult]:
+        """Returns the result for the request from the result cache, if there is one.
+
+        Args:
+            mf_request: The request that the plans were created for.
+            explain_result: The plans from create_execution_plan().
+        """
+        if len(explain_result.execution_plan.sink_nodes) != 1:
+            raise NotImplementedError("Multiple leaf tasks not yet supported.")
+
+        if self._result_cache is None or explain_result.output_table is not None:
+            return None
+
+        sql_query = explain_result.rendered_sql
+        cached_df = self._result_cache.get(sql_query.sql_query, sql_query.bind_parameters, self._result_cache_scope)
+        if cached_df is None:
+            return None
+
+        logger.info(f"Finished query request: {mf_request.request_id} using a cached result")
+        return MetricFlowQueryResult(
+            query_spec=explain_result.query_spec,
+            dataflow_plan=explain_result.dataflow_plan,
+            sql=sql_query.sql_query,
+            result_df=cached_df,
+        )
+
+    def create_query_result(
+        self,
+        mf_request: MetricFlowQueryRequest,
+        explain_result: MetricFlowExplainResult,
+        execution_results: ExecutionResults,
+    ) -> MetricFlowQueryResult:
+        """Returns the result for the request after the execution plan has run, adding it to the result cache.
 
+        Args:
+            mf_request: The request that the plans were created for.
+            explain_result: The plans from create_execution_plan().
+            execution_results: The results of running explain_result.execution_plan.
+        """
+        task = explain_result.execution_plan.sink_nodes[0]
         if execution_results.contains_task_errors:
-            raise ExecutionException(f"Got errors while executing tasks:\n{execution_results.get_result(task.task_id)}")
+            task_errors = [result for result in execution_results.all_results().values() if result.errors]
+            raise ExecutionException(f"Got errors while executing tasks:\n{pformat_big_objects(task_errors)}")
 
         task_execution_result = execution_results.get_result(task.task_id)
 
         assert task_execution_result.sql, "Task execution should have returned SQL that was run"
 
+        cacheable = explain_result.output_table is None and task_execution_result.df is not None
+        if self._result_cache is not None and cacheable:
+            cacheable_sql_query = explain_result.rendered_sql
+            self._result_cache.put(
+                sql=cacheable_sql_query.sql_query,
+                bind_parameters=cacheable_sql_query.bind_parameters,
+                df=task_execution_result.df,
+                metric_names=mf_request.metric_names,
+                time_constraint_end=mf_request.time_constraint_end,
+                time_source=self._time_source,
+                scope=self._result_cache_scope,
+            )
+
         logger.info(f"Finished query request: {mf_request.request_id}")
         return MetricFlowQueryResult(
             query_spec=explain_result.query_spec,
@@ -424,8 +1038,199 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             result_table=explain_result.output_table,
         )
 
-    def _create_execution_plan(self, mf_query_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
-        query_spec = self._query_parser.parse_and_validate_query(
+    def query_chunks(  # noqa: D
+        self,
+        mf_request: MetricFlowQueryRequest,
+        chunk_size: int = DEFAULT_QUERY_CHUNK_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        logger.info(f"Starting chunked query request:\n" f"{indent_log_line(pformat_big_objects(mf_request))}")
+        if mf_request.output_table is not None:
+            raise ValueError("Results can't be returned in chunks for a request that outputs to a table")
+
+        # To be fetched incrementally, the result needs to come from a single query rather than being combined from
+        # several. The result cache is also not used as these results are expected to be large.
+        explain_result = self.create_execution_plan(
+            dataclasses.replace(mf_request, combine_metrics_mode=CombineMetricsExecutionMode.SINGLE_QUERY)
+        )
+        sql_query = explain_result.rendered_sql
+        return self._sql_client.query_chunks(
+            sql_query.sql_query, bind_parameters=sql_query.bind_parameters, chunk_size=chunk_size
+        )
+
+    @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+    def query_batch(self, mf_requests: Sequence[MetricFlowQueryRequest]) -> List[MetricFlowQueryResult]:  # noqa: D
+        logger.info(f"Starting batch of {len(mf_requests)} query requests")
+        explain_results = [self.create_execution_plan(mf_request) for mf_request in mf_requests]
+        batches = self._group_requests_into_batches(mf_requests, explain_results)
+
+        batch_results: Dict[int, Tuple[str, Optional[pd.DataFrame]]] = {}
+        batch_index_to_sink_task: Dict[int, ExecutionPlanTask] = {}
+        for batch_index, batch in enumerate(batches):
+            if self._result_cache is not None and batch.mf_request.output_table is None:
+                sql_query = batch.explain_result.rendered_sql
+                cached_df = self._result_cache.get(
+                    sql_query.sql_query, sql_query.bind_parameters, self._result_cache_scope
+                )
+                if cached_df is not None:
+                    batch_results[batch_index] = (sql_query.sql_query, cached_df)
+                    continue
+
+            execution_plan = batch.explain_result.execution_plan
+            if len(execution_plan.sink_nodes) != 1:
+                raise NotImplementedError("Multiple leaf tasks not yet supported.")
+            batch_index_to_sink_task[batch_index] = execution_plan.sink_nodes[0]
+
+        if batch_index_to_sink_task:
+            # Run the plans for all batches together so that the queries run concurrently.
+            execution_plan = ExecutionPlan(
+                plan_id=IdGeneratorRegistry.for_class(self.__class__).create_id(EXEC_PLAN_PREFIX),
+                leaf_tasks=list(batch_index_to_sink_task.values()),
+            )
+            logger.info(f"Running {len(batch_index_to_sink_task)} queries for {len(mf_requests)} requests")
+            execution_results = self._executor.execute_plan(execution_plan)
+            if execution_results.contains_task_errors:
+                task_errors = [result for result in execution_results.all_results().values() if result.errors]
+                raise ExecutionException(f"Got errors while executing tasks:\n{pformat_big_objects(task_errors)}")
+
+            for batch_index, sink_task in batch_index_to_sink_task.items():
+                batch = batches[batch_index]
+                task_execution_result = execution_results.get_result(sink_task.task_id)
+                assert task_execution_result.sql, "Task execution should have returned SQL that was run"
+                batch_results[batch_index] = (task_execution_result.sql, task_execution_result.df)
+                if self._result_cache is not None and task_execution_result.df is not None:
+                    sql_query = batch.explain_result.rendered_sql
+                    self._result_cache.put(
+                        sql=sql_query.sql_query,
+                        bind_parameters=sql_query.bind_parameters,
+                        df=task_execution_result.df,
+                        metric_names=batch.mf_request.metric_names,
+                        time_constraint_end=batch.mf_request.time_constraint_end,
+                        time_source=self._time_source,
+                        scope=self._result_cache_scope,
+                    )
+
+        request_index_to_result: Dict[int, MetricFlowQueryResult] = {}
+        for batch_index, batch in enumerate(batches):
+            sql, result_df = batch_results[batch_index]
+            for request_index in batch.request_indexes:
+                explain_result = explain_results[request_index]
+                request_result_df = result_df
+                if request_result_df is not None and len(batch.request_indexes) > 1:
+                    request_result_df = self._select_request_columns(
+                        request_result_df, batch.metric_column_names, explain_result
+                    )
+                request_index_to_result[request_index] = MetricFlowQueryResult(
+                    query_spec=explain_result.query_spec,
+                    dataflow_plan=explain_result.dataflow_plan,
+                    sql=sql,
+                    result_df=request_result_df,
+                    result_table=explain_result.output_table,
+                )
+
+        logger.info(f"Finished batch of {len(mf_requests)} query requests using {len(batches)} queries")
+        return [request_index_to_result[request_index] for request_index in range(len(mf_requests))]
+
+    def _group_requests_into_batches(
+        self, mf_requests: Sequence[MetricFlowQueryRequest], explain_results: Sequence[MetricFlowExplainResult]
+    ) -> List[_QueryBatch]:
+        """Groups requests that can be answered by a single query.
+
+        Requests are combined if they only differ in the metrics, and the metrics for the combined request are computed
+        from a single aggregation (i.e. the measures for all metrics come from the same source and the branches are
+        combined by the SourceScanOptimizer). In that case, the rows for each metric are the same as when querying the
+        metric by itself. Metrics that are computed from different sources are joined with an outer join, which could
+        add rows, so those requests are not combined.
+        """
+        batches: List[_QueryBatch] = []
+        open_batches: Dict[QueryPlanCacheKey, List[_QueryBatch]] = {}
+        column_association_resolver = self._model_state.column_association_resolver
+        for request_index, (mf_request, explain_result) in enumerate(zip(mf_requests, explain_results)):
+            metric_column_names = tuple(
+                column_association_resolver.resolve_metric_spec(metric_spec).column_name
+                for metric_spec in explain_result.query_spec.metric_specs
+            )
+            batch = _QueryBatch(
+                request_indexes=(request_index,),
+                mf_request=mf_request,
+                explain_result=explain_result,
+                metric_column_names=metric_column_names,
+            )
+            if mf_request.output_table is not None or _contains_combine_metrics_node(explain_result.dataflow_plan):
+                batches.append(batch)
+                continue
+
+            batch_key = QueryPlanCacheKey.create_from_request(dataclasses.replace(mf_request, metric_names=()))
+            candidate_batches = open_batches.setdefault(batch_key, [])
+            for candidate_index, candidate_batch in enumerate(candidate_batches):
+                combined_batch = self._combine_batches(candidate_batch, batch)
+                if combined_batch is not None:
+                    candidate_batches[candidate_index] = combined_batch
+                    break
+            else:
+                candidate_batches.append(batch)
+
+        for candidate_batches in open_batches.values():
+            batches.extend(candidate_batches)
+        return batches
+
+    def _combine_batches(self, batch: _QueryBatch, other_batch: _QueryBatch) -> Optional[_QueryBatch]:
+        """Returns a batch that computes the metrics for both batches in one query, if it has the same rows."""
+        metric_names = list(batch.mf_request.metric_names)
+        metric_names.extend(
+            metric_name for metric_name in other_batch.mf_request.metric_names if metric_name not in metric_names
+        )
+        combined_request = dataclasses.replace(
+            batch.mf_request,
+            request_id=MetricFlowRequestId(mf_rid=f"{random_id()}"),
+            metric_names=metric_names,
+        )
+        try:
+            explain_result = self.create_execution_plan(combined_request)
+        except Exception:
+            logger.info(
+                f"Not combining requests as the plan couldn't be created for:\n{combined_request}", exc_info=True
+            )
+            return None
+
+        if _contains_combine_metrics_node(explain_result.dataflow_plan):
+            return None
+
+        metric_column_names = list(batch.metric_column_names)
+        metric_column_names.extend(
+            column_name for column_name in other_batch.metric_column_names if column_name not in metric_column_names
+        )
+        return _QueryBatch(
+            request_indexes=batch.request_indexes + other_batch.request_indexes,
+            mf_request=combined_request,
+            explain_result=explain_result,
+            metric_column_names=tuple(metric_column_names),
+        )
+
+    def _select_request_columns(
+        self, result_df: pd.DataFrame, batch_metric_column_names: Sequence[str], explain_result: MetricFlowExplainResult
+    ) -> pd.DataFrame:
+        """Returns the columns from the result of a combined query that would be in the result of the request."""
+        column_association_resolver = self._model_state.column_association_resolver
+        request_metric_column_names = [
+            column_association_resolver.resolve_metric_spec(metric_spec).column_name
+            for metric_spec in explain_result.query_spec.metric_specs
+        ]
+        column_names = [
+            column_name for column_name in result_df.columns if column_name not in batch_metric_column_names
+        ] + request_metric_column_names
+        return result_df[column_names]
+
+    @staticmethod
+    def _query_uses_time_spine(model_state: _ModelState, query_spec: MetricFlowQuerySpec) -> bool:
+        """Returns true if the plans for the query join to the time spine table."""
+        return model_state.semantic_model.metric_semantics.contains_cumulative_or_time_offset_metric(
+            tuple(m.as_reference for m in query_spec.metric_specs)
+        )
+
+    def _build_execution_plan(
+        self, model_state: _ModelState, mf_query_request: MetricFlowQueryRequest
+    ) -> MetricFlowExplainResult:
+        query_spec = model_state.query_parser.parse_and_validate_query(
             metric_names=mf_query_request.metric_names,
             group_by_names=mf_query_request.group_by_names,
             limit=mf_query_request.limit,
@@ -436,9 +1241,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         )
         logger.info(f"Query spec is:\n{pformat_big_objects(query_spec)}")
 
-        if self._semantic_model.metric_semantics.contains_cumulative_or_time_offset_metric(
-            tuple(m.as_reference for m in query_spec.metric_specs)
-        ):
+        if MetricFlowEngine._query_uses_time_spine(model_state, query_spec):
             self._time_spine_table_builder.create_if_necessary()
             time_constraint_updated = False
             if not mf_query_request.time_constraint_start:
@@ -456,7 +1259,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
                 )
                 time_constraint_updated = True
             if time_constraint_updated:
-                query_spec = self._query_parser.parse_and_validate_query(
+                query_spec = model_state.query_parser.parse_and_validate_query(
                     metric_names=mf_query_request.metric_names,
                     group_by_names=mf_query_request.group_by_names,
                     limit=mf_query_request.limit,
@@ -471,8 +1274,13 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         if mf_query_request.output_table is not None:
             output_table = SqlTable.from_string(mf_query_request.output_table)
 
-        dataflow_plan = self._dataflow_plan_builder.build_plan(
-            query_spec=query_spec, output_sql_table=output_table, optimizers=(SourceScanOptimizer[DataSourceDataSet](),)
+        dataflow_plan = model_state.dataflow_plan_builder.build_plan(
+            query_spec=query_spec,
+            output_sql_table=output_table,
+            optimizers=(
+                SourceScanOptimizer[DataSourceDataSet](),
+                PredicatePushdownOptimizer[DataSourceDataSet](),
+            ),
         )
 
         if len(dataflow_plan.sink_output_nodes) > 1:
@@ -481,7 +1289,11 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
                 f"Got tasks: {dataflow_plan.sink_output_nodes}"
             )
 
-        execution_plan = self._to_execution_plan_converter.convert_to_execution_plan(dataflow_plan)
+        execution_plan = model_state.to_execution_plan_converter.convert_to_execution_plan(
+            dataflow_plan,
+            combine_metrics_mode=mf_query_request.combine_metrics_mode,
+            sql_optimization_level=mf_query_request.sql_optimization_level,
+        )
 
         return MetricFlowExplainResult(
             query_spec=query_spec,
@@ -492,11 +1304,12 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
 
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def explain(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:  # noqa: D
-        return self._create_execution_plan(mf_request)
+        return self.create_execution_plan(mf_request)
 
     def simple_dimensions_for_metrics(self, metric_names: List[str]) -> List[Dimension]:  # noqa: D
+        semantic_model = self._model_state.semantic_model
         result = []
-        for dim in self._semantic_model.metric_semantics.element_specs_for_metrics(
+        for dim in semantic_model.metric_semantics.element_specs_for_metrics(
             metric_references=[MetricReference(element_name=mname) for mname in metric_names],
             without_any_property=frozenset(
                 {
@@ -510,7 +1323,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             description = None
             try:
                 dim_ref = DimensionReference(element_name=dim.element_name)
-                original_dim = self._semantic_model.data_source_semantics.get_dimension(dim_ref)
+                original_dim = semantic_model.data_source_semantics.get_dimension(dim_ref)
                 description = original_dim.description
             except (ValueError, KeyError):
                 # Dimension not found in data source semantics, leave description as None
@@ -524,13 +1337,13 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             Materialization(
                 name=mat.name, metrics=mat.metrics, dimensions=mat.dimensions, destination_table=mat.destination_table
             )
-            for mat in self._semantic_model.user_configured_model.materializations
+            for mat in self._model_state.semantic_model.user_configured_model.materializations
         ]
 
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def list_metrics(self) -> List[Metric]:  # noqa: D
-        metric_references = self._semantic_model.metric_semantics.metric_references
-        metrics = self._semantic_model.metric_semantics.get_metrics(metric_references)
+        metric_semantics = self._model_state.semantic_model.metric_semantics
+        metrics = metric_semantics.get_metrics(metric_semantics.metric_references)
         return [
             Metric(
                 name=metric.name,
@@ -540,39 +1353,233 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         ]
 
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
-    def get_dimension_values(  # noqa: D
+    def get_dimension_values(
         self,
         metric_name: str,
         get_group_by_values: str,
         time_constraint_start: Optional[datetime.datetime] = None,
         time_constraint_end: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+        prefix: Optional[str] = None,
     ) -> List[str]:
+        """See AbstractMetricFlowEngine.get_dimension_values().
 
-        # Run query
-        query_result = self.query(
-            MetricFlowQueryRequest.create_with_random_request_id(
-                metric_names=[metric_name],
-                group_by_names=[get_group_by_values],
-                time_constraint_start=time_constraint_start,
-                time_constraint_end=time_constraint_end,
+        Without a time constraint, the values are read from the data source that defines the dimension, so the metric
+        doesn't need to be computed. The values are then sorted, and they may include values that don't have any rows
+        for the metric. Results are cached for a short time as they're requested repeatedly e.g. for autocompletion.
+        """
+        plan = self.plan_dimension_values(
+            metric_name=metric_name,
+            get_group_by_values=get_group_by_values,
+            time_constraint_start=time_constraint_start,
+            time_constraint_end=time_constraint_end,
+            limit=limit,
+            prefix=prefix,
+        )
+        if plan.cached_values is not None:
+            return list(plan.cached_values)
+        if plan.execution_plan is not None:
+            return self.dimension_values_from_execution_results(plan, self._executor.execute_plan(plan.execution_plan))
+        assert plan.metric_request is not None
+        return self.dimension_values_from_query_result(plan, self.query(plan.metric_request))
+
+    # plan_dimension_values(), dimension_values_from_execution_results(), and dimension_values_from_query_result() are
+    # the steps of get_dimension_values() apart from running the queries, for wrappers like AsyncMetricFlowEngine.
+
+    def plan_dimension_values(
+        self,
+        metric_name: str,
+        get_group_by_values: str,
+        time_constraint_start: Optional[datetime.datetime] = None,
+        time_constraint_end: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+        prefix: Optional[str] = None,
+    ) -> DimensionValuesPlan:
+        """Returns the cached values for a call to get_dimension_values(), or the query for reading them.
+
+        The arguments are the same as for get_dimension_values().
+        """
+        model_state = self._model_state
+        cache_key = _DimensionValuesCacheKey(
+            metric_name=metric_name,
+            group_by_name=get_group_by_values,
+            time_constraint_start=time_constraint_start,
+            time_constraint_end=time_constraint_end,
+            limit=limit,
+            prefix=prefix,
+        )
+        cached_values = model_state.dimension_values_cache.get(cache_key)
+        if cached_values is not None:
+            return DimensionValuesPlan(model_state=model_state, cache_key=cache_key, cached_values=cached_values)
+        return DimensionValuesPlan(
+            model_state=model_state,
+            cache_key=cache_key,
+            values_query=self._create_dimension_values_query(model_state, cache_key),
+        )
+
+    def dimension_values_from_execution_results(
+        self, plan: DimensionValuesPlan, execution_results: ExecutionResults
+    ) -> List[str]:
+        """Returns the values from the results of running plan.execution_plan, adding them to the cache."""
+        assert plan.values_query is not None, "The values should be read from the result of plan.metric_request"
+        dimension_values = MetricFlowEngine._dimension_values_from_values_query_result(
+            plan.values_query, execution_results
+        )
+        plan.model_state.dimension_values_cache.put(plan.cache_key, tuple(dimension_values))
+        return dimension_values
+
+    def dimension_values_from_query_result(
+        self, plan: DimensionValuesPlan, query_result: MetricFlowQueryResult
+    ) -> List[str]:
+        """Returns the values from the result of the query for plan.metric_request, adding them to the cache."""
+        dimension_values = MetricFlowEngine._dimension_values_from_result(query_result, plan.cache_key)
+        plan.model_state.dimension_values_cache.put(plan.cache_key, tuple(dimension_values))
+        return dimension_values
+
+    def _create_dimension_values_query(
+        self, model_state: _ModelState, cache_key: _DimensionValuesCacheKey
+    ) -> Optional[_DimensionValuesQuery]:
+        """Returns the query for reading the values from the data source of the dimension, if possible.
+
+        Otherwise, None is returned and the values should be read from the result of a metric query. This is the case
+        when there's a time constraint, as it applies to the rows of the metric.
+        """
+        if cache_key.time_constraint_start is not None or cache_key.time_constraint_end is not None:
+            return None
+
+        # Parsing validates that the dimension can be queried with the metric.
+        query_spec = model_state.query_parser.parse_and_validate_query(
+            metric_names=[cache_key.metric_name], group_by_names=[cache_key.group_by_name]
+        )
+        linkable_specs = query_spec.linkable_specs.as_tuple
+        if len(linkable_specs) != 1 or len(query_spec.time_dimension_specs) > 0:
+            return None
+        linkable_spec = linkable_specs[0]
+        column_associations = linkable_spec.column_associations(model_state.column_association_resolver)
+        if len(column_associations) != 1:
+            return None
+        column_name = column_associations[0].column_name
+
+        where_condition = f"{column_name} IS NOT NULL"
+        execution_parameters = SqlBindParameters()
+        # The values are only exact in the query if the prefix is used as-is in the LIKE pattern.
+        prefix_exact_in_query = True
+        if cache_key.prefix:
+            # Wildcard and escape characters are handled by filtering the values after the query instead.
+            pattern_prefix = re.split(r"[%_\\]", cache_key.prefix)[0]
+            if len(pattern_prefix) > 0:
+                # Time dimensions are handled above, so this is a categorical dimension or an identifier. Those can be
+                # defined by any expression, so the values are cast to strings since LIKE only works with strings.
+                string_data_type_name = self._sql_client.sql_engine_attributes.string_data_type_name
+                parameter_key = MetricFlowEngine.DIMENSION_VALUE_PATTERN_PARAMETER_KEY
+                rendered_parameter_key = self._sql_client.render_execution_param_key(parameter_key)
+                where_condition += (
+                    f" AND CAST({column_name} AS {string_data_type_name}) LIKE {rendered_parameter_key}"
+                )
+                execution_parameters = SqlBindParameters.create_from_dict({parameter_key: f"{pattern_prefix}%"})
+            prefix_exact_in_query = pattern_prefix == cache_key.prefix
+
+        measure_specs = tuple(
+            input_measure_spec.measure_spec
+            for metric_spec in query_spec.metric_specs
+            for input_measure_spec in model_state.semantic_model.metric_semantics.measures_for_metric(
+                metric_spec.as_reference
             )
         )
+        try:
+            dataflow_plan = model_state.dataflow_plan_builder.build_plan_for_linkable_values(
+                linkable_spec=linkable_spec,
+                measure_specs=measure_specs,
+                where_constraint=SpecWhereClauseConstraint(
+                    where_condition=where_condition,
+                    linkable_names=(column_name,),
+                    linkable_spec_set=LinkableSpecSet(
+                        dimension_specs=query_spec.dimension_specs, identifier_specs=query_spec.identifier_specs
+                    ),
+                    execution_parameters=execution_parameters,
+                ),
+                limit=cache_key.limit if prefix_exact_in_query else None,
+            )
+        except UnableToSatisfyQueryError as e:
+            logger.info(f"Reading the values of {linkable_spec} using a metric query as: {e}")
+            return None
+
+        return _DimensionValuesQuery(
+            linkable_spec=linkable_spec,
+            execution_plan=model_state.to_execution_plan_converter.convert_to_execution_plan(dataflow_plan),
+            column_name=column_name,
+            # Filtering the values again could drop values that the engine's LIKE matched (e.g. case-insensitively),
+            # which would return fewer values than the limit that was applied in the query.
+            prefix=None if prefix_exact_in_query else cache_key.prefix,
+            limit=cache_key.limit,
+        )
+
+    @staticmethod
+    def _dimension_values_from_values_query_result(
+        values_query: _DimensionValuesQuery, execution_results: ExecutionResults
+    ) -> List[str]:
+        if execution_results.contains_task_errors:
+            task_errors = [result for result in execution_results.all_results().values() if result.errors]
+            raise ExecutionException(f"Got errors while executing tasks:\n{pformat_big_objects(task_errors)}")
+        result_df = execution_results.get_result(values_query.execution_plan.sink_nodes[0].task_id).df
+        if result_df is None:
+            return []
+
+        return MetricFlowEngine._filter_dimension_values(
+            [str(value) for value in result_df[values_query.column_name]],
+            prefix=values_query.prefix,
+            limit=values_query.limit,
+        )
+
+    @staticmethod
+    def _filter_dimension_values(dimension_values: List[str], prefix: Optional[str], limit: Optional[int]) -> List[str]:
+        if prefix:
+            dimension_values = [value for value in dimension_values if value.startswith(prefix)]
+        return dimension_values[:limit] if limit is not None else dimension_values
+
+    @staticmethod
+    def _dimension_values_request(cache_key: _DimensionValuesCacheKey) -> MetricFlowQueryRequest:
+        return MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=[cache_key.metric_name],
+            group_by_names=[cache_key.group_by_name],
+            time_constraint_start=cache_key.time_constraint_start,
+            time_constraint_end=cache_key.time_constraint_end,
+            # With a prefix, the values are filtered after the query, so the limit can't be applied in the query.
+            limit=cache_key.limit if not cache_key.prefix else None,
+        )
+
+    @staticmethod
+    def _dimension_values_from_result(
+        query_result: MetricFlowQueryResult, cache_key: _DimensionValuesCacheKey
+    ) -> List[str]:
         result_dataframe = query_result.result_df
         if result_dataframe is None:
             return []
 
         # Process the dimension values
         result_dataframe.dropna(inplace=True)
-        dimension_values = [str(val) for val in result_dataframe[get_group_by_values]]
-        return dimension_values
+        dimension_values = [str(val) for val in result_dataframe[cache_key.group_by_name]]
+        return MetricFlowEngine._filter_dimension_values(
+            dimension_values, prefix=cache_key.prefix, limit=cache_key.limit
+        )
 
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
-    def materialize(  # noqa: D
+    def materialize(
         self,
         materialization_name: str,
         time_constraint_start: Optional[datetime.datetime] = None,
         time_constraint_end: Optional[datetime.datetime] = None,
+        incremental: bool = False,
+        lookback: Optional[datetime.timedelta] = None,
     ) -> SqlTable:
+        """See AbstractMetricFlowEngine.materialize().
+
+        When the dimensions include metric_time, the latest value in the table is stored as the watermark for
+        incremental builds. An incremental build computes the rows from the start of the watermark's period (less the
+        lookback) into a staging table, then deletes those rows from the table and inserts the new ones. The query
+        for the new rows reads earlier data as needed for cumulative and offset metrics, and late data can only change
+        rows at or after its own time, so the replaced range doesn't need to be widened for those metrics.
+        """
         materialization = self._get_materialization_by_name(materialization_name)
         if materialization is None:
             raise MaterializationNotFoundError(
@@ -581,20 +1588,154 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
 
         # Use destination_table if exists else materialization_name
         output_table = materialization.destination_table or self._generate_sql_table(materialization_name)
-        self._sql_client.drop_table(output_table)
+        metric_time_column_name = self._metric_time_column_name(materialization)
+        if incremental and metric_time_column_name is None:
+            raise ValueError(
+                f"Materialization `{materialization_name}` can't be built incrementally as metric_time is not one of "
+                f"its dimensions"
+            )
+
+        watermark = self.materialization_watermark(materialization_name) if incremental else None
 
-        # Executes the query with output_table
+        if watermark is None or metric_time_column_name is None:
+            self._sql_client.drop_table(output_table)
+
+            # Executes the query with output_table
+            query_result = self.query(
+                MetricFlowQueryRequest.create_with_random_request_id(
+                    metric_names=materialization.metrics,
+                    group_by_names=materialization.dimensions,
+                    time_constraint_start=time_constraint_start,
+                    time_constraint_end=time_constraint_end,
+                    output_table=output_table.sql,
+                )
+            )
+        else:
+            increment_start = watermark - (lookback or datetime.timedelta(0))
+            if time_constraint_start is not None and time_constraint_start > increment_start:
+                increment_start = time_constraint_start
+            query_result = self._materialize_increment(
+                materialization=materialization,
+                output_table=output_table,
+                metric_time_column_name=metric_time_column_name,
+                time_constraint_start=increment_start,
+                time_constraint_end=time_constraint_end,
+            )
+
+        if metric_time_column_name is not None:
+            self._update_materialization_watermark(materialization_name, output_table, metric_time_column_name)
+        assert query_result.result_table
+        return query_result.result_table
+
+    def materialization_watermark(self, materialization_name: str) -> Optional[datetime.datetime]:  # noqa: D
+        materialization = self._get_materialization_by_name(materialization_name)
+        if materialization is None:
+            raise MaterializationNotFoundError(
+                f"Unable to find materialization `{materialization_name}`. Perhaps it has not been registered"
+            )
+
+        output_table = materialization.destination_table or self._generate_sql_table(materialization_name)
+        if self._metric_time_column_name(materialization) is None or not self._sql_client.table_exists(output_table):
+            return None
+        return self._materialization_state_store.get_watermark(materialization_name)
+
+    def _metric_time_column_name(self, materialization: Materialization) -> Optional[str]:
+        """Returns the name of the column for metric_time in the materialized table, if it's one of the dimensions."""
+        model_state = self._model_state
+        query_spec = model_state.query_parser.parse_and_validate_query(
+            metric_names=materialization.metrics, group_by_names=materialization.dimensions
+        )
+        for time_dimension_spec in query_spec.time_dimension_specs:
+            if (
+                time_dimension_spec.element_name == DataSet.metric_time_dimension_name()
+                and len(time_dimension_spec.identifier_links) == 0
+            ):
+                return model_state.column_association_resolver.resolve_time_dimension_spec(
+                    time_dimension_spec
+                ).column_name
+        return None
+
+    def _materialize_increment(
+        self,
+        materialization: Materialization,
+        output_table: SqlTable,
+        metric_time_column_name: str,
+        time_constraint_start: datetime.datetime,
+        time_constraint_end: Optional[datetime.datetime],
+    ) -> MetricFlowQueryResult:
+        """Replaces the rows in the time range in the materialized table with newly computed rows."""
+        staging_table = SqlTable(
+            schema_name=self._schema,
+            table_name=f"{output_table.table_name}{MetricFlowEngine.MATERIALIZATION_STAGING_TABLE_SUFFIX}",
+        )
+        self._sql_client.drop_table(staging_table)
         query_result = self.query(
             MetricFlowQueryRequest.create_with_random_request_id(
                 metric_names=materialization.metrics,
                 group_by_names=materialization.dimensions,
                 time_constraint_start=time_constraint_start,
                 time_constraint_end=time_constraint_end,
-                output_table=output_table.sql,
+                output_table=staging_table.sql,
             )
         )
-        assert query_result.result_table
-        return query_result.result_table
+        # The query parser adjusts the time range to the granularity of metric_time, so the adjusted range is used to
+        # find the rows that were recomputed.
+        time_range_constraint = query_result.query_spec.time_range_constraint
+        assert time_range_constraint is not None
+        start_key = self._sql_client.render_execution_param_key("increment_start")
+        end_key = self._sql_client.render_execution_param_key("increment_end")
+        logger.info(
+            f"Replacing rows in {output_table.sql} from {time_range_constraint.start_time.isoformat()} to "
+            f"{time_range_constraint.end_time.isoformat()}"
+        )
+        delete_statement = (
+            f"DELETE FROM {output_table.sql} "
+            f"WHERE {metric_time_column_name} >= {start_key} AND {metric_time_column_name} <= {end_key}",
+            SqlBindParameters.create_from_dict(
+                {
+                    "increment_start": time_range_constraint.start_time,
+                    "increment_end": time_range_constraint.end_time,
+                }
+            ),
+        )
+        insert_statement = (f"INSERT INTO {output_table.sql} SELECT * FROM {staging_table.sql}", SqlBindParameters())
+
+        if self._sql_client.sql_engine_attributes.transactions_supported:
+            # If either statement fails, the table is unchanged and the build can simply be run again.
+            try:
+                self._sql_client.execute_in_transaction((delete_statement, insert_statement))
+            finally:
+                self._sql_client.drop_table(staging_table)
+            return dataclasses.replace(query_result, result_table=output_table)
+
+        try:
+            for statement, sql_bind_parameters in (delete_statement, insert_statement):
+                self._sql_client.execute(statement, sql_bind_parameters=sql_bind_parameters)
+        except Exception:
+            # The rows might have been deleted without inserting the new ones, so the staging table is kept as it has
+            # the rows that are missing.
+            logger.exception(
+                f"Unable to replace the rows in {output_table.sql}. The new rows are in {staging_table.sql}. To "
+                f"recover, delete the rows where {metric_time_column_name} is between "
+                f"{time_range_constraint.start_time.isoformat()} and {time_range_constraint.end_time.isoformat()} "
+                f"from {output_table.sql}, insert the rows from {staging_table.sql}, and then drop "
+                f"{staging_table.sql}. Alternatively, run a full build of the materialization."
+            )
+            raise
+        self._sql_client.drop_table(staging_table)
+        return dataclasses.replace(query_result, result_table=output_table)
+
+    def _update_materialization_watermark(
+        self, materialization_name: str, output_table: SqlTable, metric_time_column_name: str
+    ) -> None:
+        df = self._sql_client.query(f"SELECT MAX({metric_time_column_name}) AS watermark FROM {output_table.sql}")
+        watermarks = df["watermark"].dropna()
+        if len(watermarks) == 0:
+            self._materialization_state_store.remove_watermark(materialization_name)
+            return
+        self._materialization_state_store.set_watermark(
+            materialization_name, pd.Timestamp(watermarks.iloc[0]).to_pydatetime()
+        )
 
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def drop_materialization(self, materialization_name: str) -> bool:  # noqa: D
@@ -605,8 +1746,77 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             )
 
         table = materialization.destination_table or self._generate_sql_table(materialization_name)
+        self._materialization_state_store.remove_watermark(materialization_name)
 
         if self._sql_client.table_exists(table):
             self._sql_client.drop_table(table)
             return True
         return False
+
+
+class AsyncMetricFlowEngine:
+    """Provides methods for querying a MetricFlowEngine from asyncio code.
+
+    Planning is run in an executor as it's CPU-bound, while queries to the data warehouse are awaited without using a
+    thread to wait for each one. Cancelling a call cancels the queries that it's running in the data warehouse, if the
+    SQL client supports it.
+    """
+
+    def __init__(self, engine: MetricFlowEngine, planning_executor: Optional[Executor] = None) -> None:
+        """Constructor.
+
+        Args:
+            engine: The engine to query.
+            planning_executor: The executor for creating query plans. Defaults to the default executor of the loop.
+        """
+        self._engine = engine
+        self._planning_executor = planning_executor
+        self._plan_executor = AsyncPlanExecutor(sql_client=engine.sql_client)
+
+    @property
+    def engine(self) -> MetricFlowEngine:  # noqa: D
+        return self._engine
+
+    async def explain(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:  # noqa: D
+        return await asyncio.get_running_loop().run_in_executor(
+            self._planning_executor, self._engine.create_execution_plan, mf_request
+        )
+
+    async def query(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:  # noqa: D
+        logger.info(f"Starting async query request:\n" f"{indent_log_line(pformat_big_objects(mf_request))}")
+        explain_result = await self.explain(mf_request)
+        cached_query_result = self._engine.get_cached_query_result(mf_request, explain_result)
+        if cached_query_result is not None:
+            return cached_query_result
+
+        execution_results = await self._plan_executor.execute_plan(explain_result.execution_plan)
+        return self._engine.create_query_result(mf_request, explain_result, execution_results)
+
+    async def get_dimension_values(  # noqa: D
+        self,
+        metric_name: str,
+        get_group_by_values: str,
+        time_constraint_start: Optional[datetime.datetime] = None,
+        time_constraint_end: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+        prefix: Optional[str] = None,
+    ) -> List[str]:
+        plan = await asyncio.get_running_loop().run_in_executor(
+            self._planning_executor,
+            functools.partial(
+                self._engine.plan_dimension_values,
+                metric_name=metric_name,
+                get_group_by_values=get_group_by_values,
+                time_constraint_start=time_constraint_start,
+                time_constraint_end=time_constraint_end,
+                limit=limit,
+                prefix=prefix,
+            ),
+        )
+        if plan.cached_values is not None:
+            return list(plan.cached_values)
+        if plan.execution_plan is not None:
+            execution_results = await self._plan_executor.execute_plan(plan.execution_plan)
+            return self._engine.dimension_values_from_execution_results(plan, execution_results)
+        assert plan.metric_request is not None
+        return self._engine.dimension_values_from_query_result(plan, await self.query(plan.metric_request))
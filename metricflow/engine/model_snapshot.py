@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import pickle
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+from metricflow.dag.id_generation import IdGeneratorRegistry
+from metricflow.dataflow.dataflow_plan import BaseOutput
+from metricflow.dataset.data_source_adapter import DataSourceDataSet
+from metricflow.model.objects.user_configured_model import UserConfiguredModel
+from metricflow.model.parsing.parsed_model_cache import metricflow_version, model_schema_fingerprint
+from metricflow.model.semantics.linkable_spec_resolver import LinkableElementSet
+
+logger = logging.getLogger(__name__)
+
+# Bump when the format of the snapshot changes in a way that isn't reflected in the package version or in the schema of
+# the model classes (see model_schema_fingerprint()).
+_SNAPSHOT_FORMAT_VERSION = "2"
+
+
+@dataclass(frozen=True)
+class ModelSnapshot:
+    """The objects derived from a model that are expensive to compute, so that they can be reused by other engines.
+
+    Attributes:
+        user_configured_model: The model that the objects were derived from.
+        data_source_to_data_set: The data set for each data source, keyed by the name of the data source.
+        data_source_to_source_nodes: The source nodes for each data source, keyed by the name of the data source.
+        linkable_element_sets: The linkable elements for measures in each data source, keyed by the name of the data
+        source.
+        next_ids: The state of the ID generators when the snapshot was taken, so that nodes created after loading
+        the snapshot don't have the same IDs as the nodes in the snapshot.
+    """
+
+    user_configured_model: UserConfiguredModel
+    data_source_to_data_set: Dict[str, DataSourceDataSet]
+    data_source_to_source_nodes: Dict[str, Sequence[BaseOutput[DataSourceDataSet]]]
+    linkable_element_sets: Dict[str, LinkableElementSet]
+    next_ids: Dict[str, int]
+
+
+def _snapshot_version() -> str:
+    return f"{metricflow_version()}/{_SNAPSHOT_FORMAT_VERSION}/{model_schema_fingerprint()}"
+
+
+def write_model_snapshot(snapshot: ModelSnapshot, file_path: str) -> None:
+    """Writes the snapshot to the given file, replacing it atomically if it already exists."""
+    start_time = time.time()
+    dir_path = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(dir_path, exist_ok=True)
+    # Write to a temporary file and then rename so that readers never see a partially written snapshot.
+    fd, temp_path = tempfile.mkstemp(dir=dir_path, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((_snapshot_version(), snapshot), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    logger.info(f"Writing the model snapshot to {file_path} took: {time.time() - start_time:.2f}s")
+
+
+def read_model_snapshot(file_path: str) -> Optional[ModelSnapshot]:
+    """Reads a snapshot written by write_model_snapshot(), or returns None if it's missing or can't be used.
+
+    The file is memory-mapped, so the pages are read from the OS page cache that is shared by all processes on the host
+    instead of being copied into each process first. When using a pre-forking server, loading the snapshot before
+    forking workers additionally lets the workers share the loaded objects until they're modified.
+    """
+    start_time = time.time()
+    try:
+        with open(file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                version, snapshot = pickle.loads(mapped_file)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning(f"Unable to read the model snapshot at {file_path}", exc_info=True)
+        return None
+
+    if version != _snapshot_version() or not isinstance(snapshot, ModelSnapshot):
+        logger.warning(f"Ignoring the model snapshot at {file_path} as it was written by version {version}")
+        return None
+
+    IdGeneratorRegistry.advance_to(snapshot.next_ids)
+    logger.info(f"Reading the model snapshot from {file_path} took: {time.time() - start_time:.2f}s")
+    return snapshot
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+import logging
+import os
+import sqlite3
+import stat
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Mapping, Optional, Sequence
+
+import pandas as pd
+
+from metricflow.protocols.sql_client import SqlClient
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.time.time_source import TimeSource
+
+logger = logging.getLogger(__name__)
+
+
+def result_cache_scope(sql_client: SqlClient) -> str:
+    """Returns a string that identifies the engine type and the connection of the SQL client, without credentials.
+
+    Results are only shared between clients with the same scope, as the same SQL can return different rows when it's
+    run against a different warehouse, database, or user.
+    """
+    return f"{sql_client.sql_engine_attributes.sql_engine_type.value}\n{sql_client.connection_identity}"
+
+
+def result_cache_key(sql: str, bind_parameters: SqlBindParameters, scope: str = "") -> str:
+    """Returns a key that identifies the result of running the given SQL with the given parameters in the scope."""
+    hasher = hashlib.sha256(scope.encode("utf-8"))
+    hasher.update(b"\0")
+    hasher.update(sql.encode("utf-8"))
+    for param_key, param_value in sorted(bind_parameters.param_dict.items()):
+        hasher.update(f"\n{param_key}={type(param_value).__name__}:{param_value!r}".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _dataframe_num_bytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class ResultCacheBackend(ABC):
+    """Stores query results (dataframes) by key, with an optional expiration time for each entry."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """Return the stored result for the key, or None if there isn't one or if it has expired."""
+        pass
+
+    @abstractmethod
+    def put(self, key: str, df: pd.DataFrame, expires_at: Optional[float]) -> None:
+        """Store the result for the key.
+
+        Args:
+            key: Identifies the result.
+            df: The result to store.
+            expires_at: The epoch time when the entry should expire, or None if it should not expire.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all stored results."""
+        pass
+
+    @property
+    @abstractmethod
+    def num_bytes(self) -> int:
+        """The number of bytes used by the stored results."""
+        pass
+
+
+@dataclass
+class _InMemoryEntry:
+    df: pd.DataFrame
+    num_bytes: int
+    expires_at: Optional[float]
+
+
+class InMemoryResultCacheBackend(ResultCacheBackend):
+    """Keeps results in process memory, evicting the least recently used results when over the byte budget."""
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:  # noqa: D
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, _InMemoryEntry] = OrderedDict()
+        self._num_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:  # noqa: D
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at is not None and entry.expires_at <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.df.copy()
+
+    def put(self, key: str, df: pd.DataFrame, expires_at: Optional[float]) -> None:  # noqa: D
+        num_bytes = _dataframe_num_bytes(df)
+        if num_bytes > self._max_bytes:
+            logger.info(f"Not caching result {key} as its size ({num_bytes} bytes) is over the budget")
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _InMemoryEntry(df=df.copy(), num_bytes=num_bytes, expires_at=expires_at)
+            self._num_bytes += num_bytes
+            while self._num_bytes > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._num_bytes -= entry.num_bytes
+
+    def clear(self) -> None:  # noqa: D
+        with self._lock:
+            self._entries.clear()
+            self._num_bytes = 0
+
+    @property
+    def num_bytes(self) -> int:  # noqa: D
+        with self._lock:
+            return self._num_bytes
+
+
+class DiskResultCacheBackend(ResultCacheBackend):
+    """Keeps results as files in a directory, with a SQLite index for tracking expiration and recency of use.
+
+    Results persist across processes, and the least recently used results are evicted when over the byte budget.
+
+    The results are stored as pickles, and unpickling a file can run arbitrary code, so the directory must only be
+    writable by trusted users. On POSIX systems, the directory is created with owner-only permissions, and an existing
+    directory is rejected if it is owned by another user or if it is writable by the group or others.
+    """
+
+    DEFAULT_MAX_BYTES = 4 * 1024 * 1024 * 1024
+    _INDEX_FILE_NAME = "index.sqlite"
+    _RESULT_FILE_SUFFIX = ".pkl"
+
+    def __init__(self, dir_path: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:  # noqa: D
+        self._dir_path = dir_path
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(dir_path, mode=0o700, exist_ok=True)
+        DiskResultCacheBackend._check_dir_permissions(dir_path)
+        self._connection = sqlite3.connect(
+            os.path.join(dir_path, DiskResultCacheBackend._INDEX_FILE_NAME), check_same_thread=False
+        )
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, num_bytes INTEGER NOT NULL, expires_at REAL, last_accessed_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def _check_dir_permissions(dir_path: str) -> None:
+        """Raise a ValueError if users other than the owner could have written files to the directory."""
+        if os.name != "posix":
+            return
+        dir_stat = os.stat(dir_path)
+        if dir_stat.st_uid != os.getuid():
+            raise ValueError(f"The result cache directory {dir_path} is not owned by the current user")
+        if dir_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise ValueError(
+                f"The result cache directory {dir_path} is writable by other users. Since the cached results are "
+                f"unpickled when they are read, the directory should only be writable by the owner (e.g. mode 0700)."
+            )
+
+    def _result_file_path(self, key: str) -> str:
+        return os.path.join(self._dir_path, key + DiskResultCacheBackend._RESULT_FILE_SUFFIX)
+
+    def _remove(self, key: str) -> None:
+        self._connection.execute("DELETE FROM results WHERE key = ?", (key,))
+        try:
+            os.remove(self._result_file_path(key))
+        except FileNotFoundError:
+            pass
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:  # noqa: D
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT expires_at FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            expires_at = row[0]
+            if expires_at is not None and expires_at <= time.time():
+                self._remove(key)
+                return None
+            try:
+                df = pd.read_pickle(self._result_file_path(key))
+            except Exception:
+                logger.exception(f"Unable to read the cached result for {key}. Removing it from the cache.")
+                self._remove(key)
+                return None
+            self._connection.execute("UPDATE results SET last_accessed_at = ? WHERE key = ?", (time.time(), key))
+            return df
+
+    def put(self, key: str, df: pd.DataFrame, expires_at: Optional[float]) -> None:  # noqa: D
+        with self._lock, self._connection:
+            self._remove(key)
+            file_path = self._result_file_path(key)
+            df.to_pickle(file_path)
+            num_bytes = os.path.getsize(file_path)
+            if num_bytes > self._max_bytes:
+                logger.info(f"Not caching result {key} as its size ({num_bytes} bytes) is over the budget")
+                os.remove(file_path)
+                return
+
+            self._connection.execute(
+                "INSERT INTO results (key, num_bytes, expires_at, last_accessed_at) VALUES (?, ?, ?, ?)",
+                (key, num_bytes, expires_at, time.time()),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove expired results, then the least recently used ones until the total size is within the budget."""
+        expired_rows = self._connection.execute(
+            "SELECT key FROM results WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+        ).fetchall()
+        for (key,) in expired_rows:
+            self._remove(key)
+
+        total_bytes = self._connection.execute("SELECT COALESCE(SUM(num_bytes), 0) FROM results").fetchone()[0]
+        if total_bytes <= self._max_bytes:
+            return
+        rows = self._connection.execute("SELECT key, num_bytes FROM results ORDER BY last_accessed_at").fetchall()
+        for key, num_bytes in rows:
+            if total_bytes <= self._max_bytes:
+                break
+            self._remove(key)
+            total_bytes -= num_bytes
+
+    def clear(self) -> None:  # noqa: D
+        with self._lock, self._connection:
+            for (key,) in self._connection.execute("SELECT key FROM results").fetchall():
+                self._remove(key)
+
+    @property
+    def num_bytes(self) -> int:  # noqa: D
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(num_bytes), 0) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection to the index."""
+        self._connection.close()
+
+
+@dataclass(frozen=True)
+class ResultCachePolicy:
+    """Describes how long query results can be cached.
+
+    Results for a time range that ended before the start of the current day won't change (barring late-arriving
+    data), so they are cached without expiration unless cache_closed_windows_indefinitely is unset. Other results expire
+    after the TTL of the queried metrics, which is capped by open_window_ttl for results that include the current day
+    as those change as new data arrives.
+
+    default_ttl: The TTL in seconds for metrics that are not in metric_ttls.
+    open_window_ttl: The maximum TTL in seconds for results that include the current day.
+    metric_ttls: A dict from the metric name to the TTL in seconds for results with that metric.
+    cache_closed_windows_indefinitely: Whether results for time ranges ending before the current day should expire.
+    """
+
+    default_ttl: float = 3600
+    open_window_ttl: float = 300
+    metric_ttls: Mapping[str, float] = field(default_factory=dict)
+    cache_closed_windows_indefinitely: bool = True
+
+    def ttl(
+        self,
+        metric_names: Sequence[str],
+        time_constraint_end: Optional[datetime.datetime],
+        current_time: datetime.datetime,
+    ) -> Optional[float]:
+        """Return the TTL in seconds for the result of a query, or None if the result should not expire."""
+        start_of_today = datetime.datetime.combine(current_time.date(), datetime.time.min)
+        includes_today = time_constraint_end is None or time_constraint_end >= start_of_today
+        if not includes_today and self.cache_closed_windows_indefinitely:
+            return None
+
+        ttls = [self.metric_ttls.get(metric_name.lower(), self.default_ttl) for metric_name in metric_names]
+        if includes_today:
+            ttls.append(self.open_window_ttl)
+        return min(ttls)
+
+
+@dataclass(frozen=True)
+class ResultCacheStats:
+    """Counters describing the usage of the result cache."""
+
+    hits: int
+    misses: int
+    num_bytes: int
+
+
+class ResultCache:
+    """Caches the results of queries, keyed by the SQL that was run along with its bind parameters.
+
+    The key also includes a scope that identifies the connection the SQL was run through (see result_cache_scope), so a
+    cache or a backend can be shared between engines that connect to different warehouses.
+    """
+
+    def __init__(  # noqa: D
+        self,
+        backend: Optional[ResultCacheBackend] = None,
+        policy: ResultCachePolicy = ResultCachePolicy(),
+    ) -> None:
+        self._backend = backend or InMemoryResultCacheBackend()
+        self._policy = ResultCachePolicy(
+            default_ttl=policy.default_ttl,
+            open_window_ttl=policy.open_window_ttl,
+            metric_ttls={name.lower(): ttl for name, ttl in policy.metric_ttls.items()},
+            cache_closed_windows_indefinitely=policy.cache_closed_windows_indefinitely,
+        )
+        self._counter_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, sql: str, bind_parameters: SqlBindParameters, scope: str = "") -> Optional[pd.DataFrame]:
+        """Return the cached result of running the SQL in the scope, or None if it's not available."""
+        df = self._backend.get(result_cache_key(sql, bind_parameters, scope))
+        with self._counter_lock:
+            if df is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return df
+
+    def put(
+        self,
+        sql: str,
+        bind_parameters: SqlBindParameters,
+        df: pd.DataFrame,
+        metric_names: Sequence[str],
+        time_constraint_end: Optional[datetime.datetime],
+        time_source: TimeSource,
+        scope: str = "",
+    ) -> None:
+        """Cache the result of running the SQL in the scope with the TTL from the policy."""
+        ttl = self._policy.ttl(
+            metric_names=metric_names, time_constraint_end=time_constraint_end, current_time=time_source.get_time()
+        )
+        if ttl is not None and ttl <= 0:
+            return
+        self._backend.put(
+            key=result_cache_key(sql, bind_parameters, scope),
+            df=df,
+            expires_at=time.time() + ttl if ttl is not None else None,
+        )
+
+    def clear(self) -> None:  # noqa: D
+        self._backend.clear()
+
+    @property
+    def stats(self) -> ResultCacheStats:  # noqa: D
+        with self._counter_lock:
+            return ResultCacheStats(hits=self._hits, misses=self._misses, num_bytes=self._backend.num_bytes)
+
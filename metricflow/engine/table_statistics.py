@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional
+
+import pandas as pd
+
+from metricflow.dataflow.builder.costing import TableRowCountSource
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.engine.time_source import ServerTimeSource
+from metricflow.protocols.sql_client import SqlClient, SqlEngine
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.time.time_source import TimeSource
+
+logger = logging.getLogger(__name__)
+
+# Queries that read the (possibly approximate) number of rows in a table from the metadata of the SQL engine, which is
+# much cheaper than counting the rows. The placeholders are filled in with the SQL for the schema and the keys of the
+# bind parameters for the schema and table names.
+_METADATA_ROW_COUNT_QUERIES: Dict[SqlEngine, str] = {
+    SqlEngine.DUCKDB: (
+        "SELECT estimated_size AS num_rows FROM duckdb_tables() "
+        "WHERE schema_name = {schema_name_key} AND table_name = {table_name_key}"
+    ),
+    SqlEngine.POSTGRES: (
+        "SELECT c.reltuples AS num_rows FROM pg_catalog.pg_class c "
+        "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE n.nspname = {schema_name_key} AND c.relname = {table_name_key} AND c.relkind IN ('r', 'p')"
+    ),
+    SqlEngine.GREENPLUM: (
+        "SELECT c.reltuples AS num_rows FROM pg_catalog.pg_class c "
+        "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE n.nspname = {schema_name_key} AND c.relname = {table_name_key} AND c.relkind IN ('r', 'p')"
+    ),
+    SqlEngine.REDSHIFT: (
+        'SELECT tbl_rows AS num_rows FROM svv_table_info '
+        'WHERE "schema" = {schema_name_key} AND "table" = {table_name_key}'
+    ),
+    SqlEngine.SNOWFLAKE: (
+        "SELECT row_count AS num_rows FROM information_schema.tables "
+        "WHERE table_schema = UPPER({schema_name_key}) AND table_name = UPPER({table_name_key})"
+    ),
+    SqlEngine.BIGQUERY: (
+        "SELECT row_count AS num_rows FROM {schema_sql}.__TABLES__ WHERE table_id = {table_name_key} AND type = 1"
+    ),
+    SqlEngine.CLICKHOUSE: (
+        "SELECT total_rows AS num_rows FROM system.tables "
+        "WHERE database = {schema_name_key} AND name = {table_name_key}"
+    ),
+    SqlEngine.STARROCKS: (
+        "SELECT table_rows AS num_rows FROM information_schema.tables "
+        "WHERE table_schema = {schema_name_key} AND table_name = {table_name_key}"
+    ),
+}
+
+
+@dataclass(frozen=True)
+class TableStatistics:
+    """Statistics about a table in the data warehouse, and when they were collected."""
+
+    row_count: Optional[int]
+    collected_at: datetime.datetime
+
+
+class TableStatisticsStore(TableRowCountSource):
+    """Collects the number of rows in tables for costing dataflow plans, and caches them in the system schema.
+
+    Row counts are collected in a background thread so that planning doesn't wait for queries to the data warehouse.
+    get_row_count() returns the last known row count of a table and schedules a collection if there is none within the
+    TTL, so tables without a known row count are costed with a default until the collection completes. A row count is
+    read from the metadata of the SQL engine where possible, and the rows are only counted with COUNT(*) as a last
+    resort. Collected row counts are stored in a table in the system schema so that they're shared with other engines.
+    The table is created when the first row count is stored.
+    """
+
+    TABLE_NAME = "mf_table_statistics"
+    TABLE_NAME_COLUMN_NAME = "table_name"
+    ROW_COUNT_COLUMN_NAME = "num_rows"
+    COLLECTED_AT_COLUMN_NAME = "collected_at"
+    SCHEMA_NAME_PARAMETER_NAME = "schema_name"
+
+    def __init__(
+        self,
+        sql_client: SqlClient,
+        schema_name: str,
+        ttl_seconds: float,
+        time_source: TimeSource = ServerTimeSource(),
+        on_row_count_change: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            sql_client: The client used to collect and store the row counts.
+            schema_name: The schema where the row counts are stored.
+            ttl_seconds: The number of seconds after which a row count is collected again.
+            time_source: Provides the time at which row counts are collected.
+            on_row_count_change: Called in the background thread when a collection changes the row count of a table,
+            e.g. to clear plans that were built with the previous row counts.
+        """
+        self._sql_client = sql_client
+        self._statistics_table = SqlTable(schema_name=schema_name, table_name=TableStatisticsStore.TABLE_NAME)
+        self._ttl = datetime.timedelta(seconds=ttl_seconds)
+        self._time_source = time_source
+        self._on_row_count_change = on_row_count_change
+        # Statistics that were read or collected by this store, keyed by the SQL for the table.
+        self._statistics: Dict[str, TableStatistics] = {}
+        # Collections that are scheduled or running, keyed by the SQL for the table.
+        self._pending_collections: Dict[str, Future] = {}
+        # Guards the dictionaries above. It's never held while running queries.
+        self._lock = threading.Lock()
+        self._collection_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mf_table_statistics")
+
+    @property
+    def statistics_table(self) -> SqlTable:  # noqa: D
+        return self._statistics_table
+
+    def get_row_count(self, sql_table: SqlTable) -> Optional[int]:
+        """Returns the last known number of rows in the table, scheduling a collection if it's not within the TTL.
+
+        This doesn't run any queries, so it returns None until the first collection for the table completes.
+        """
+        with self._lock:
+            statistics = self._statistics.get(sql_table.sql)
+        if statistics is None or self._is_expired(statistics):
+            self._schedule_collection(sql_table)
+        return statistics.row_count if statistics is not None else None
+
+    def collect_in_background(self, sql_tables: Iterable[SqlTable]) -> None:
+        """Schedules collections for the tables that don't have a row count within the TTL."""
+        for sql_table in sql_tables:
+            with self._lock:
+                statistics = self._statistics.get(sql_table.sql)
+            if statistics is None or self._is_expired(statistics):
+                self._schedule_collection(sql_table)
+
+    def wait_for_collections(self, timeout: Optional[float] = None) -> None:
+        """Waits until the collections that are scheduled or running complete."""
+        with self._lock:
+            pending_collections = list(self._pending_collections.values())
+        wait(pending_collections, timeout=timeout)
+
+    def collect_row_count(self, sql_table: SqlTable) -> Optional[int]:
+        """Returns the number of rows in the table, reading or collecting it if it's not known within the TTL.
+
+        Unlike get_row_count(), this runs queries in the calling thread.
+        """
+        with self._lock:
+            previous_statistics = self._statistics.get(sql_table.sql)
+        statistics = previous_statistics
+        if statistics is None or self._is_expired(statistics):
+            statistics = self._read_statistics(sql_table)
+        if statistics is None or self._is_expired(statistics):
+            statistics = self._collect_statistics(sql_table)
+
+        with self._lock:
+            self._statistics[sql_table.sql] = statistics
+        row_count_changed = previous_statistics is None or previous_statistics.row_count != statistics.row_count
+        if row_count_changed and self._on_row_count_change is not None:
+            self._on_row_count_change()
+        return statistics.row_count
+
+    def _schedule_collection(self, sql_table: SqlTable) -> None:
+        with self._lock:
+            if sql_table.sql not in self._pending_collections:
+                self._pending_collections[sql_table.sql] = self._collection_pool.submit(
+                    self._collect_in_background, sql_table
+                )
+
+    def _collect_in_background(self, sql_table: SqlTable) -> None:
+        try:
+            self.collect_row_count(sql_table)
+        except Exception:
+            logger.exception(f"Unable to collect the row count of {sql_table.sql}")
+        finally:
+            with self._lock:
+                self._pending_collections.pop(sql_table.sql, None)
+
+    def _is_expired(self, statistics: TableStatistics) -> bool:
+        return self._time_source.get_time() - statistics.collected_at > self._ttl
+
+    def _table_name_condition(self) -> str:
+        table_name_key = self._sql_client.render_execution_param_key(TableStatisticsStore.TABLE_NAME_COLUMN_NAME)
+        return f"{TableStatisticsStore.TABLE_NAME_COLUMN_NAME} = {table_name_key}"
+
+    def _read_statistics(self, sql_table: SqlTable) -> Optional[TableStatistics]:
+        """Returns the statistics for the table that are stored in the system schema, if there are any."""
+        if not self._sql_client.table_exists(self._statistics_table):
+            return None
+        df = self._sql_client.query(
+            f"SELECT {TableStatisticsStore.ROW_COUNT_COLUMN_NAME}, {TableStatisticsStore.COLLECTED_AT_COLUMN_NAME} "
+            f"FROM {self._statistics_table.sql} WHERE {self._table_name_condition()}",
+            sql_bind_parameters=SqlBindParameters.create_from_dict(
+                {TableStatisticsStore.TABLE_NAME_COLUMN_NAME: sql_table.sql}
+            ),
+        )
+        if len(df) == 0:
+            return None
+        row = df.sort_values(TableStatisticsStore.COLLECTED_AT_COLUMN_NAME).iloc[-1]
+        return TableStatistics(
+            row_count=int(row[TableStatisticsStore.ROW_COUNT_COLUMN_NAME]),
+            collected_at=pd.Timestamp(row[TableStatisticsStore.COLLECTED_AT_COLUMN_NAME]).to_pydatetime(),
+        )
+
+    def _read_metadata_row_count(self, sql_table: SqlTable) -> Optional[int]:
+        """Returns the number of rows in the table according to the metadata of the SQL engine, if it's available."""
+        query_template = _METADATA_ROW_COUNT_QUERIES.get(self._sql_client.sql_engine_attributes.sql_engine_type)
+        if query_template is None:
+            return None
+        try:
+            df = self._sql_client.query(
+                query_template.format(
+                    schema_sql=(
+                        f"{sql_table.db_name}.{sql_table.schema_name}" if sql_table.db_name else sql_table.schema_name
+                    ),
+                    schema_name_key=self._sql_client.render_execution_param_key(
+                        TableStatisticsStore.SCHEMA_NAME_PARAMETER_NAME
+                    ),
+                    table_name_key=self._sql_client.render_execution_param_key(
+                        TableStatisticsStore.TABLE_NAME_COLUMN_NAME
+                    ),
+                ),
+                sql_bind_parameters=SqlBindParameters.create_from_dict(
+                    {
+                        TableStatisticsStore.SCHEMA_NAME_PARAMETER_NAME: sql_table.schema_name,
+                        TableStatisticsStore.TABLE_NAME_COLUMN_NAME: sql_table.table_name,
+                    }
+                ),
+            )
+        except Exception:
+            logger.warning(f"Unable to read the row count of {sql_table.sql} from the metadata", exc_info=True)
+            return None
+        if len(df) == 0 or pd.isna(df[TableStatisticsStore.ROW_COUNT_COLUMN_NAME].iloc[0]):
+            return None
+        row_count = int(df[TableStatisticsStore.ROW_COUNT_COLUMN_NAME].iloc[0])
+        # e.g. Postgres reports -1 for tables that have never been analyzed.
+        return row_count if row_count >= 0 else None
+
+    def _collect_statistics(self, sql_table: SqlTable) -> TableStatistics:
+        """Collects the number of rows in the table and stores it in the system schema.
+
+        The rows are counted with COUNT(*) if the row count isn't available from the metadata of the SQL engine. If the
+        rows can't be counted (e.g. the table doesn't exist), the row count is unknown until the TTL expires.
+        """
+        collected_at = self._time_source.get_time()
+        try:
+            row_count = self._read_metadata_row_count(sql_table)
+            if row_count is None:
+                df = self._sql_client.query(
+                    f"SELECT COUNT(*) AS {TableStatisticsStore.ROW_COUNT_COLUMN_NAME} FROM {sql_table.sql}"
+                )
+                row_count = int(df[TableStatisticsStore.ROW_COUNT_COLUMN_NAME].iloc[0])
+        except Exception:
+            logger.exception(f"Unable to count the rows in {sql_table.sql}")
+            return TableStatistics(row_count=None, collected_at=collected_at)
+        logger.info(f"Collected the row count of {sql_table.sql}: {row_count}")
+
+        self._store_row_count(sql_table=sql_table, row_count=row_count, collected_at=collected_at)
+        return TableStatistics(row_count=row_count, collected_at=collected_at)
+
+    def _store_row_count(self, sql_table: SqlTable, row_count: int, collected_at: datetime.datetime) -> None:
+        if not self._sql_client.table_exists(self._statistics_table):
+            self._sql_client.create_table_from_dataframe(
+                sql_table=self._statistics_table,
+                df=pd.DataFrame(
+                    {
+                        TableStatisticsStore.TABLE_NAME_COLUMN_NAME: [sql_table.sql],
+                        TableStatisticsStore.ROW_COUNT_COLUMN_NAME: [row_count],
+                        TableStatisticsStore.COLLECTED_AT_COLUMN_NAME: [pd.Timestamp(collected_at)],
+                    }
+                ),
+            )
+            return
+
+        self._sql_client.execute(
+            f"DELETE FROM {self._statistics_table.sql} WHERE {self._table_name_condition()}",
+            sql_bind_parameters=SqlBindParameters.create_from_dict(
+                {TableStatisticsStore.TABLE_NAME_COLUMN_NAME: sql_table.sql}
+            ),
+        )
+        row_count_key = self._sql_client.render_execution_param_key(TableStatisticsStore.ROW_COUNT_COLUMN_NAME)
+        collected_at_key = self._sql_client.render_execution_param_key(TableStatisticsStore.COLLECTED_AT_COLUMN_NAME)
+        table_name_key = self._sql_client.render_execution_param_key(TableStatisticsStore.TABLE_NAME_COLUMN_NAME)
+        self._sql_client.execute(
+            f"INSERT INTO {self._statistics_table.sql} "
+            f"({TableStatisticsStore.TABLE_NAME_COLUMN_NAME}, {TableStatisticsStore.ROW_COUNT_COLUMN_NAME}, "
+            f"{TableStatisticsStore.COLLECTED_AT_COLUMN_NAME}) "
+            f"VALUES ({table_name_key}, {row_count_key}, {collected_at_key})",
+            sql_bind_parameters=SqlBindParameters.create_from_dict(
+                {
+                    TableStatisticsStore.TABLE_NAME_COLUMN_NAME: sql_table.sql,
+                    TableStatisticsStore.ROW_COUNT_COLUMN_NAME: row_count,
+                    TableStatisticsStore.COLLECTED_AT_COLUMN_NAME: collected_at,
+                }
+            ),
+        )
@@ -1,13 +1,15 @@
 import datetime as dt
+import os
 
 from dateutil.parser import parse
 from typing import Optional
 
-from metricflow.configuration.constants import CONFIG_MODEL_PATH
+from metricflow.configuration.constants import CONFIG_MODEL_CACHE_DIR, CONFIG_MODEL_PATH
 from metricflow.configuration.yaml_handler import YamlFileHandler
 from metricflow.errors.errors import ModelCreationException
 from metricflow.model.objects.user_configured_model import UserConfiguredModel
 from metricflow.model.parsing.dir_to_model import ModelBuildResult, parse_directory_of_yaml_files_to_model
+from metricflow.model.parsing.parsed_model_cache import ParsedModelCache
 from metricflow.sql_clients.common_client import not_empty
 
 
@@ -16,14 +18,25 @@ def path_to_models(handler: YamlFileHandler) -> str:
     return not_empty(handler.get_value(CONFIG_MODEL_PATH), CONFIG_MODEL_PATH, handler.url)
 
 
+def path_to_model_cache(handler: YamlFileHandler) -> str:
+    """Given a YamlFileHandler, return the path to the directory for caching parsed models.
+
+    Defaults to a directory next to the config file.
+    """
+    return handler.get_value(CONFIG_MODEL_CACHE_DIR) or os.path.join(
+        os.path.dirname(os.path.abspath(handler.yaml_file_path)), "model_cache"
+    )
+
+
 def model_build_result_from_config(
-    handler: YamlFileHandler, raise_issues_as_exceptions: bool = True
+    handler: YamlFileHandler, raise_issues_as_exceptions: bool = True, use_cache: bool = True
 ) -> ModelBuildResult:
     """Given a yaml file, creates a ModelBuildResult.
 
     Args:
         handler: a file handler for loading the configs from
         raise_issues_as_exceptions: determines if issues should be raised, or returned as issues
+        use_cache: whether to reuse the results of parsing model files that haven't changed since the last run
 
     Returns:
         ModelBuildResult that contains the UserConfigureModel and any associated ValidationIssues
@@ -31,7 +44,9 @@ def model_build_result_from_config(
     models_path = path_to_models(handler=handler)
     try:
         return parse_directory_of_yaml_files_to_model(
-            models_path, raise_issues_as_exceptions=raise_issues_as_exceptions
+            models_path,
+            raise_issues_as_exceptions=raise_issues_as_exceptions,
+            cache=ParsedModelCache(path_to_model_cache(handler=handler)) if use_cache else None,
         )
     except Exception as e:
         raise ModelCreationException from e
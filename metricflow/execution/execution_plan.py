@@ -1,24 +1,32 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import textwrap
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Sequence, Optional, Tuple
+from typing import TYPE_CHECKING, List, Sequence, Optional, Tuple
 
 import jinja2
 import pandas as pd
 
-from metricflow.dag.id_generation import EXEC_NODE_READ_SQL_QUERY, EXEC_NODE_WRITE_TO_TABLE
+from metricflow.dag.id_generation import (
+    EXEC_NODE_COMBINE_DATAFRAMES,
+    EXEC_NODE_READ_SQL_QUERY,
+    EXEC_NODE_WRITE_TO_TABLE,
+)
 from metricflow.dag.mf_dag import DagNode, MetricFlowDag, NodeId, DisplayedProperty
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.protocols.async_sql_client import AsyncSqlClient
 from metricflow.protocols.sql_request import SqlJsonTag
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
-from metricflow.sql_clients.sql_utils import sync_execute, sync_query
+from metricflow.sql_clients.sql_utils import async_query_result, sync_execute, sync_query_result
 from metricflow.visitor import Visitable
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +56,22 @@ class ExecutionPlanTask(DagNode, Visitable, ABC):
     def execute(self) -> TaskExecutionResult:
         """Execute the actions of this node."""
 
+    def execute_with_parent_results(self, parent_results: Sequence[TaskExecutionResult]) -> TaskExecutionResult:
+        """Execute the actions of this node given the results of the parent nodes, in the order of parent_nodes.
+
+        This is what executors call. Most tasks only need the parent tasks to have run, so by default, this is the
+        same as execute().
+        """
+        return self.execute()
+
+    async def execute_async(self, parent_results: Sequence[TaskExecutionResult]) -> TaskExecutionResult:
+        """Like execute_with_parent_results(), but for running from an event loop.
+
+        By default, this runs the task in the default executor of the loop. Tasks that wait on SQL requests override
+        this to wait without using a thread.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.execute_with_parent_results, parent_results)
+
     @property
     def task_id(self) -> NodeId:
         """Alias for node ID since the nodes represent a task"""
@@ -88,6 +112,8 @@ class TaskExecutionResult:
     bind_params: Optional[SqlBindParameters] = None
     # If the task produces a dataframe as a result, it's stored here.
     df: Optional[pd.DataFrame] = None
+    # If the SQL client fetched the result in Arrow format, the table that the dataframe was converted from.
+    arrow_table: Optional[pa.Table] = None
 
 
 class SelectSqlQueryToDataFrameTask(ExecutionPlanTask):
@@ -127,7 +153,27 @@ class SelectSqlQueryToDataFrameTask(ExecutionPlanTask):
     def execute(self) -> TaskExecutionResult:  # noqa: D
         start_time = time.time()
 
-        df = sync_query(
+        result = sync_query_result(
+            self._sql_client,
+            self._sql_query,
+            bind_parameters=self.execution_parameters,
+            extra_sql_tags=self._extra_sql_tags,
+        )
+
+        end_time = time.time()
+        return TaskExecutionResult(
+            start_time=start_time,
+            end_time=end_time,
+            sql=self._sql_query,
+            bind_params=self.execution_parameters,
+            df=result.df,
+            arrow_table=result.arrow_table,
+        )
+
+    async def execute_async(self, parent_results: Sequence[TaskExecutionResult]) -> TaskExecutionResult:  # noqa: D
+        start_time = time.time()
+
+        result = await async_query_result(
             self._sql_client,
             self._sql_query,
             bind_parameters=self.execution_parameters,
@@ -136,7 +182,12 @@ class SelectSqlQueryToDataFrameTask(ExecutionPlanTask):
 
         end_time = time.time()
         return TaskExecutionResult(
-            start_time=start_time, end_time=end_time, sql=self._sql_query, bind_params=self.execution_parameters, df=df
+            start_time=start_time,
+            end_time=end_time,
+            sql=self._sql_query,
+            bind_params=self.execution_parameters,
+            df=result.df,
+            arrow_table=result.arrow_table,
         )
 
     @property
@@ -224,6 +275,97 @@ class SelectSqlQueryToTableTask(ExecutionPlanTask):
         return f"{self.__class__.__name__}(sql_query='{self._sql_query}', output_table={self._output_table})"
 
 
+@dataclass(frozen=True)
+class DataFrameOrderBy:
+    """Describes how to order the rows of a dataframe by a column."""
+
+    column_name: str
+    descending: bool = False
+
+
+class CombineDataFramesTask(ExecutionPlanTask):
+    """A task that joins the dataframes produced by the parent tasks into a single dataframe.
+
+    This is the client-side equivalent of the FULL OUTER JOIN that's rendered for a CombineMetricsNode. Each parent
+    task computes a different set of metrics, grouped by the same dimensions / identifiers, so the dataframes are
+    joined on the columns that they all have in common. Unlike in SQL, null values in the join columns match, so the
+    post-join aggregation done in SQL is not needed.
+    """
+
+    def __init__(  # noqa: D
+        self,
+        parent_nodes: List[ExecutionPlanTask],
+        order_bys: Sequence[DataFrameOrderBy] = (),
+        limit: Optional[int] = None,
+    ) -> None:
+        assert len(parent_nodes) > 1, "Combining dataframes requires at least 2 parent tasks"
+        self._order_bys = tuple(order_bys)
+        self._limit = limit
+        super().__init__(task_id=self.create_unique_id(), parent_nodes=parent_nodes)
+
+    @classmethod
+    def id_prefix(cls) -> str:  # noqa: D
+        return EXEC_NODE_COMBINE_DATAFRAMES
+
+    @property
+    def description(self) -> str:  # noqa: D
+        return "Join the dataframes from the parent tasks on the common columns"
+
+    @property
+    def displayed_properties(self) -> List[DisplayedProperty]:  # noqa: D
+        return (
+            super().displayed_properties
+            + [DisplayedProperty(key="order_by", value=order_by) for order_by in self._order_bys]
+            + [DisplayedProperty(key="limit", value=str(self._limit))]
+        )
+
+    def execute(self) -> TaskExecutionResult:  # noqa: D
+        raise RuntimeError(f"{self.__class__.__name__} needs the results of the parent tasks to execute.")
+
+    def execute_with_parent_results(  # noqa: D
+        self, parent_results: Sequence[TaskExecutionResult]
+    ) -> TaskExecutionResult:
+        start_time = time.time()
+        parent_dfs = []
+        for parent_result in parent_results:
+            assert parent_result.df is not None, "Parent tasks should have produced a dataframe"
+            parent_dfs.append(parent_result.df)
+
+        join_columns = [
+            column for column in parent_dfs[0].columns if all(column in df.columns for df in parent_dfs[1:])
+        ]
+        combined_df = parent_dfs[0]
+        for df in parent_dfs[1:]:
+            if join_columns:
+                combined_df = combined_df.merge(df, on=join_columns, how="outer")
+            else:
+                combined_df = combined_df.merge(df, how="cross")
+
+        if self._order_bys:
+            combined_df = combined_df.sort_values(
+                by=[order_by.column_name for order_by in self._order_bys],
+                ascending=[not order_by.descending for order_by in self._order_bys],
+                kind="stable",
+            )
+        if self._limit is not None:
+            combined_df = combined_df.head(self._limit)
+
+        end_time = time.time()
+        return TaskExecutionResult(
+            start_time=start_time,
+            end_time=end_time,
+            sql=";\n\n".join(parent_result.sql for parent_result in parent_results if parent_result.sql),
+            df=combined_df.reset_index(drop=True),
+        )
+
+    @property
+    def sql_query(self) -> Optional[SqlQuery]:  # noqa: D
+        return None
+
+    def __repr__(self) -> str:  # noqa: D
+        return f"{self.__class__.__name__}(order_bys={self._order_bys}, limit={self._limit})"
+
+
 class ExecutionPlan(MetricFlowDag[ExecutionPlanTask]):
     """A DAG where the nodes are tasks, and parents represent prerequisite tasks."""
 
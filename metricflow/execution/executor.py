@@ -1,10 +1,18 @@
+import asyncio
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Dict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence, Set
 
 from metricflow.dag.mf_dag import NodeId
 from metricflow.execution.execution_plan import ExecutionPlan, ExecutionPlanTask, TaskExecutionResult
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.protocols.sql_client import SqlClient
+from metricflow.protocols.sql_request import SqlRequestId
+from metricflow.sql_clients.sql_utils import cancel_requests, sql_request_listener
 
 logger = logging.getLogger(__name__)
 
@@ -15,11 +23,17 @@ class ExecutionResults:
     def __init__(self) -> None:  # noqa: D
         # Dict from the task to the result.
         self._results: OrderedDict[NodeId, TaskExecutionResult] = OrderedDict()
+        # Dict from the task to the wall time (in seconds) the executor spent running it.
+        self._wall_times: OrderedDict[NodeId, float] = OrderedDict()
 
-    def add_result(self, task_id: NodeId, result: TaskExecutionResult) -> None:
-        """Adds the results of executing a task to this."""
+    def add_result(self, task_id: NodeId, result: TaskExecutionResult, wall_time: Optional[float] = None) -> None:
+        """Adds the results of executing a task to this.
+
+        If wall_time is not given, it's derived from the start / end times in the result.
+        """
         assert task_id not in self._results, f"Task ID: {task_id} already in results as {self._results[task_id]}"
         self._results[task_id] = result
+        self._wall_times[task_id] = wall_time if wall_time is not None else result.end_time - result.start_time
 
     @property
     def contains_task_errors(self) -> bool:
@@ -33,6 +47,14 @@ class ExecutionResults:
     def all_results(self) -> Dict[NodeId, TaskExecutionResult]:  # noqa: D
         return self._results
 
+    def get_wall_time(self, task_id: NodeId) -> float:
+        """Returns the number of seconds that it took to run the given task."""
+        assert task_id in self._wall_times
+        return self._wall_times[task_id]
+
+    def all_wall_times(self) -> Dict[NodeId, float]:  # noqa: D
+        return self._wall_times
+
 
 class ExecutionPlanExecutor(ABC):
     """Runs the tasks in an execution plan."""
@@ -57,9 +79,12 @@ class SequentialPlanExecutor(ExecutionPlanExecutor):
 
         result = None
         logger.info(f"Started task ID: {current_task.node_id}")
+        start_time = time.time()
         try:
-            result = current_task.execute()
-            results.add_result(current_task.task_id, result)
+            result = current_task.execute_with_parent_results(
+                tuple(results.get_result(parent_node.task_id) for parent_node in current_task.parent_nodes)
+            )
+            results.add_result(current_task.task_id, result, wall_time=time.time() - start_time)
         finally:
 
             if result:
@@ -78,3 +103,248 @@ class SequentialPlanExecutor(ExecutionPlanExecutor):
             self._execute_dfs(leaf_node, results)
 
         return results
+
+
+class _RunningSqlRequests:
+    """Keeps track of the SQL requests sent by the tasks that a ParallelPlanExecutor is running.
+
+    Called from the worker threads, so access is synchronized. Once cancel_all() is called, requests that are sent
+    afterwards (e.g. by a task that was between two queries) are cancelled as soon as they are sent.
+    """
+
+    def __init__(self, sql_client: AsyncSqlClient) -> None:  # noqa: D
+        self._sql_client = sql_client
+        self._lock = threading.Lock()
+        self._request_ids: Set[SqlRequestId] = set()
+        self._cancelled = False
+
+    def add(self, request_id: SqlRequestId) -> None:  # noqa: D
+        with self._lock:
+            self._request_ids.add(request_id)
+            cancelled = self._cancelled
+        if cancelled:
+            cancel_requests(self._sql_client, (request_id,))
+
+    def cancel_all(self) -> None:
+        """Cancels the requests that are still active in the client (best-effort)."""
+        with self._lock:
+            self._cancelled = True
+            request_ids = set(self._request_ids)
+        active_request_ids = [
+            request_id for request_id in self._sql_client.active_requests() if request_id in request_ids
+        ]
+        cancel_requests(self._sql_client, active_request_ids)
+
+
+class ParallelPlanExecutor(ExecutionPlanExecutor):
+    """Execute tasks in the plan concurrently, running a task as soon as all of its parents have finished.
+
+    Tasks run on a bounded pool of worker threads. Tasks that issue SQL go through the async handles of the SQL
+    client, so independent tasks result in concurrent requests to the SQL engine. If the SQL engine does not support
+    multi-threading, the pool is limited to a single worker and the tasks run one by one.
+
+    Once a task returns errors (or raises an exception), no further tasks are started, and the SQL requests of the tasks
+    that are still running are cancelled where the client supports it (as AsyncPlanExecutor does). The executor then
+    waits for the running tasks to exit, and re-raises the exception (if any) of the task that failed first. Errors or
+    exceptions of the tasks that were cancelled are logged instead. If no SQL client was given, the requests can't be
+    cancelled and the running tasks are allowed to finish.
+    """
+
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, sql_client: Optional[AsyncSqlClient] = None) -> None:
+        """Constructor.
+
+        Args:
+            max_workers: The maximum number of tasks to run at the same time.
+            sql_client: If specified, the client used by the tasks. Used to check whether concurrent requests are
+            supported, and to cancel the requests of the running tasks if a task fails.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers should be >= 1, but got {max_workers}")
+
+        if sql_client is not None and not sql_client.sql_engine_attributes.multi_threading_supported:
+            logger.info(
+                f"{sql_client.sql_engine_attributes.sql_engine_type.value} does not support multi-threading, so tasks "
+                f"will be run one at a time"
+            )
+            max_workers = 1
+        self._max_workers = max_workers
+        self._sql_client = sql_client
+
+    @property
+    def max_workers(self) -> int:  # noqa: D
+        return self._max_workers
+
+    @staticmethod
+    def _run_task(
+        task: ExecutionPlanTask,
+        parent_results: Sequence[TaskExecutionResult],
+        running_sql_requests: Optional[_RunningSqlRequests],
+    ) -> TaskExecutionResult:
+        logger.info(f"Started task ID: {task.node_id}")
+        if running_sql_requests is None:
+            return task.execute_with_parent_results(parent_results)
+        with sql_request_listener(running_sql_requests.add):
+            return task.execute_with_parent_results(parent_results)
+
+    def execute_plan(self, plan: ExecutionPlan) -> ExecutionResults:  # noqa: D
+        results = ExecutionResults()
+
+        # Collect all tasks in the plan and figure out the dependents of each task.
+        tasks: Dict[NodeId, ExecutionPlanTask] = OrderedDict()
+        child_task_ids: Dict[NodeId, List[NodeId]] = {}
+        tasks_to_visit: List[ExecutionPlanTask] = list(plan.sink_nodes)
+        while tasks_to_visit:
+            task = tasks_to_visit.pop()
+            if task.task_id in tasks:
+                continue
+            tasks[task.task_id] = task
+            for parent_task in task.parent_nodes:
+                child_task_ids.setdefault(parent_task.task_id, []).append(task.task_id)
+                tasks_to_visit.append(parent_task)
+
+        num_unfinished_parents: Dict[NodeId, int] = {
+            task_id: len({parent_task.task_id for parent_task in task.parent_nodes}) for task_id, task in tasks.items()
+        }
+        ready_task_ids: List[NodeId] = [task_id for task_id, count in num_unfinished_parents.items() if count == 0]
+
+        running: Dict[Future[TaskExecutionResult], NodeId] = {}
+        start_times: Dict[NodeId, float] = {}
+        failed = False
+        exception: Optional[BaseException] = None
+        running_sql_requests = _RunningSqlRequests(self._sql_client) if self._sql_client is not None else None
+        # IDs of the tasks that were running when a task failed, and so had their SQL requests cancelled.
+        cancelled_task_ids: Set[NodeId] = set()
+
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="mf_plan_executor") as pool:
+            while ready_task_ids or running:
+                while ready_task_ids and not failed:
+                    task_id = ready_task_ids.pop(0)
+                    start_times[task_id] = time.time()
+                    task = tasks[task_id]
+                    parent_results = tuple(results.get_result(parent.task_id) for parent in task.parent_nodes)
+                    future = pool.submit(ParallelPlanExecutor._run_task, task, parent_results, running_sql_requests)
+                    running[future] = task_id
+
+                if not running:
+                    break
+
+                finished_futures: Set[Future[TaskExecutionResult]]
+                finished_futures, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                failed_before_wait = failed
+                for future in finished_futures:
+                    task_id = running.pop(future)
+                    wall_time = time.time() - start_times[task_id]
+                    future_exception = future.exception()
+                    if future_exception is not None:
+                        if task_id in cancelled_task_ids:
+                            logger.info(
+                                f"Task ID: {task_id} exited after its SQL requests were cancelled: {future_exception!r}"
+                            )
+                            continue
+                        logger.info(f"Task ID: {task_id} exited unexpectedly after {wall_time:.2f}s")
+                        failed = True
+                        exception = exception or future_exception
+                        continue
+
+                    result = future.result()
+                    results.add_result(task_id, result, wall_time=wall_time)
+                    if result.errors:
+                        logger.info(f"Finished task ID: {task_id} with errors: {result.errors} in {wall_time:.2f}s")
+                        failed = True
+                        continue
+                    logger.info(f"Finished task ID: {task_id} successfully in {wall_time:.2f}s")
+
+                    for child_task_id in child_task_ids.get(task_id, []):
+                        num_unfinished_parents[child_task_id] -= 1
+                        if num_unfinished_parents[child_task_id] == 0:
+                            ready_task_ids.append(child_task_id)
+
+                if failed and not failed_before_wait and running and running_sql_requests is not None:
+                    # The results of the running tasks won't be used, so don't wait for their queries to complete.
+                    cancelled_task_ids.update(running.values())
+                    logger.info(f"Cancelling the SQL requests of the running task(s): {list(running.values())}")
+                    running_sql_requests.cancel_all()
+
+        if failed:
+            num_skipped_tasks = len(tasks) - len(results.all_results())
+            if num_skipped_tasks > 0:
+                logger.info(f"Skipped {num_skipped_tasks} task(s) in the plan due to an earlier failure")
+        if exception is not None:
+            raise exception
+
+        return results
+
+
+class AsyncPlanExecutor:
+    """Execute the tasks in a plan from an event loop, running a task as soon as all of its parents have finished.
+
+    Tasks that run SQL queries wait for the SQL engine without blocking the loop or a thread (see
+    ExecutionPlanTask.execute_async()). If the coroutine is cancelled, the tasks that are running are cancelled, which
+    cancels their requests in the SQL engine where the client supports it.
+
+    As with ParallelPlanExecutor, no further tasks are started once a task returns errors.
+    """
+
+    DEFAULT_MAX_CONCURRENT_TASKS = ParallelPlanExecutor.DEFAULT_MAX_WORKERS
+
+    def __init__(
+        self, max_concurrent_tasks: int = DEFAULT_MAX_CONCURRENT_TASKS, sql_client: Optional[SqlClient] = None
+    ) -> None:
+        """Constructor.
+
+        Args:
+            max_concurrent_tasks: The maximum number of tasks in a plan to run at the same time.
+            sql_client: If specified, the client used by the tasks. Used to check whether concurrent requests are
+            supported.
+        """
+        if max_concurrent_tasks < 1:
+            raise ValueError(f"max_concurrent_tasks should be >= 1, but got {max_concurrent_tasks}")
+        if sql_client is not None and not sql_client.sql_engine_attributes.multi_threading_supported:
+            max_concurrent_tasks = 1
+        self._max_concurrent_tasks = max_concurrent_tasks
+
+    async def execute_plan(self, plan: ExecutionPlan) -> ExecutionResults:  # noqa: D
+        results = ExecutionResults()
+        semaphore = asyncio.Semaphore(self._max_concurrent_tasks)
+        scheduled_tasks: Dict[NodeId, asyncio.Future[Optional[TaskExecutionResult]]] = {}
+
+        async def run_task(
+            task: ExecutionPlanTask, parent_futures: Sequence[asyncio.Future[Optional[TaskExecutionResult]]]
+        ) -> Optional[TaskExecutionResult]:
+            parent_results = await asyncio.gather(*parent_futures)
+            if results.contains_task_errors:
+                return None
+            async with semaphore:
+                logger.info(f"Started task ID: {task.node_id}")
+                start_time = time.time()
+                result = await task.execute_async([x for x in parent_results if x is not None])
+                wall_time = time.time() - start_time
+            results.add_result(task.task_id, result, wall_time=wall_time)
+            if result.errors:
+                logger.info(f"Finished task ID: {task.task_id} with errors: {result.errors} in {wall_time:.2f}s")
+            else:
+                logger.info(f"Finished task ID: {task.task_id} successfully in {wall_time:.2f}s")
+            return result
+
+        def schedule(task: ExecutionPlanTask) -> asyncio.Future[Optional[TaskExecutionResult]]:
+            if task.task_id not in scheduled_tasks:
+                parent_futures = [schedule(parent_task) for parent_task in task.parent_nodes]
+                scheduled_tasks[task.task_id] = asyncio.ensure_future(run_task(task, parent_futures))
+            return scheduled_tasks[task.task_id]
+
+        sink_futures = [schedule(task) for task in plan.sink_nodes]
+        try:
+            await asyncio.gather(*sink_futures)
+        except BaseException:
+            # Stop the tasks that are still running e.g. on cancellation or if a task raised an exception.
+            for future in scheduled_tasks.values():
+                future.cancel()
+            await asyncio.gather(*scheduled_tasks.values(), return_exceptions=True)
+            raise
+
+        num_skipped_tasks = len(scheduled_tasks) - len(results.all_results())
+        if num_skipped_tasks > 0:
+            logger.info(f"Skipped {num_skipped_tasks} task(s) in the plan due to an earlier failure")
+        return results
@@ -1,13 +1,14 @@
 from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from copy import deepcopy
 
 import collections
+import logging
 from dataclasses import dataclass, field
 from functools import partial
-from math import floor
 from time import perf_counter
 import traceback
-from typing import Callable, DefaultDict, Dict, List, Optional, Sequence, Tuple, TypeVar
+from typing import Callable, DefaultDict, Dict, List, Optional, Sequence, Set, Tuple, TypeVar
 from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
 from metricflow.dataflow.builder.source_node import SourceNodeBuilder
 from metricflow.dataflow.dataflow_plan import BaseOutput, FilterElementsNode
@@ -42,6 +43,8 @@ from metricflow.protocols.sql_client import SqlClient
 from metricflow.specs import DimensionSpec, LinkableInstanceSpec, MeasureSpec, InstanceSpecSet
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class QueryRenderingTools:
@@ -485,15 +488,30 @@ class DataWarehouseModelValidator:
     them (assuming the model has passed these validations before use).
     """
 
-    def __init__(self, sql_client: AsyncSqlClient, system_schema: str) -> None:  # noqa: D
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(  # noqa: D
+        self, sql_client: AsyncSqlClient, system_schema: str, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers should be >= 1, but got {max_workers}")
+        if not sql_client.sql_engine_attributes.multi_threading_supported:
+            max_workers = 1
         self._sql_client = sql_client
         self._sql_schema = system_schema
+        self._max_workers = max_workers
+
+    def _dry_run(self, query_string: str, query_params: SqlBindParameters) -> None:
+        self._sql_client.dry_run(stmt=query_string, sql_bind_parameters=query_params)
 
     def run_tasks(
         self, tasks: List[DataWarehouseValidationTask], timeout: Optional[int] = None
     ) -> ModelValidationResults:
         """Runs the list of tasks as queries agains the data warehouse, returning any found issues
 
+        The queries are dry-run concurrently on a bounded pool of threads. When a task fails, its on_fail_subtasks are
+        run on the same pool. Queries are rendered in the calling thread as the rendering tools are shared by the tasks.
+
         Args:
             tasks: A list of tasks to run against the data warehouse
             timeout: An optional timeout. Default is None. When the timeout is hit, function will return early.
@@ -505,31 +523,76 @@ class DataWarehouseModelValidator:
         # Used for keeping track if we go past the max time
         start_time = perf_counter()
 
-        issues: List[ValidationIssue] = []
-        # TODO: Asyncio implementation
-        for index, task in enumerate(tasks):
-            if timeout is not None and perf_counter() - start_time > timeout:
-                issues.append(
-                    ValidationWarning(
-                        context=None,
-                        message=f"Hit timeout before completing all tasks. Completed {index}/{len(tasks)} tasks.",
-                    )
-                )
-                break
-            try:
-                (query_string, query_params) = task.query_and_params_callable()
-                self._sql_client.dry_run(stmt=query_string, sql_bind_parameters=query_params)
-            except Exception as e:
-                issues.append(
-                    ValidationError(
-                        context=task.context,
-                        message=task.error_message + f"\nRecieved following error from data warehouse:\n{e}",
-                        extra_detail="".join(traceback.format_tb(e.__traceback__)),
-                    )
+        # The error for each task that failed, and the tasks that finished, keyed by the ID of the task object.
+        errors: Dict[int, ValidationError] = {}
+        finished_task_ids: Set[int] = set()
+        timed_out = False
+
+        def error_for_task(task: DataWarehouseValidationTask, e: BaseException) -> ValidationError:
+            return ValidationError(
+                context=task.context,
+                message=task.error_message + f"\nRecieved following error from data warehouse:\n{e}",
+                extra_detail="".join(traceback.format_tb(e.__traceback__)),
+            )
+
+        pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="mf_dw_validator")
+        try:
+            pending_tasks: List[DataWarehouseValidationTask] = list(tasks)
+            running: Dict[Future[None], DataWarehouseValidationTask] = {}
+            while pending_tasks or running:
+                remaining_time = timeout - (perf_counter() - start_time) if timeout is not None else None
+                if remaining_time is not None and remaining_time <= 0:
+                    timed_out = True
+                    break
+
+                # Keep a few more requests queued than there are workers, so that the workers don't sit idle while
+                # queries are rendered.
+                while pending_tasks and len(running) < 2 * self._max_workers:
+                    task = pending_tasks.pop(0)
+                    try:
+                        (query_string, query_params) = task.query_and_params_callable()
+                    except Exception as e:
+                        errors[id(task)] = error_for_task(task, e)
+                        finished_task_ids.add(id(task))
+                        pending_tasks[0:0] = task.on_fail_subtasks
+                        continue
+                    running[pool.submit(self._dry_run, query_string, query_params)] = task
+
+                if not running:
+                    continue
+
+                finished_futures, _ = wait(running.keys(), timeout=remaining_time, return_when=FIRST_COMPLETED)
+                for future in finished_futures:
+                    task = running.pop(future)
+                    finished_task_ids.add(id(task))
+                    exception = future.exception()
+                    if exception is not None:
+                        errors[id(task)] = error_for_task(task, exception)
+                        pending_tasks[0:0] = task.on_fail_subtasks
+        finally:
+            # When the timeout is hit, queries that have already been sent can't be stopped, so don't wait for them.
+            pool.shutdown(wait=not timed_out, cancel_futures=True)
+
+        def collect_issues(tasks_to_collect: Sequence[DataWarehouseValidationTask]) -> List[ValidationIssue]:
+            # Ordered so that a task's error is followed by the issues found by its subtasks.
+            collected: List[ValidationIssue] = []
+            for task in tasks_to_collect:
+                error = errors.get(id(task))
+                if error is not None:
+                    collected.append(error)
+                    collected += collect_issues(task.on_fail_subtasks)
+            return collected
+
+        issues = collect_issues(tasks)
+        if timed_out:
+            num_completed = sum(1 for task in tasks if id(task) in finished_task_ids)
+            logger.warning(f"Data warehouse validation timed out after completing {num_completed}/{len(tasks)} tasks")
+            issues.append(
+                ValidationWarning(
+                    context=None,
+                    message=f"Hit timeout before completing all tasks. Completed {num_completed}/{len(tasks)} tasks.",
                 )
-                if task.on_fail_subtasks:
-                    sub_task_timeout = floor(timeout - (perf_counter() - start_time)) if timeout else None
-                    issues += self.run_tasks(tasks=task.on_fail_subtasks, timeout=sub_task_timeout).all_issues
+            )
 
         return ModelValidationResults.from_issues_sequence(issues)
 
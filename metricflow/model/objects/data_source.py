@@ -9,7 +9,12 @@ from metricflow.model.objects.elements.identifier import Identifier
 from metricflow.model.objects.elements.measure import Measure
 from metricflow.model.objects.base import ModelWithMetadataParsing, HashableBaseModel
 from metricflow.object_utils import ExtendedEnum
-from metricflow.references import LinkableElementReference, MeasureReference
+from metricflow.references import (
+    DimensionReference,
+    LinkableElementReference,
+    MeasureReference,
+    TimeDimensionReference,
+)
 
 
 class DataSourceOrigin(ExtendedEnum):
@@ -141,6 +146,18 @@ class DataSource(HashableBaseModel, ModelWithMetadataParsing):
             raise ValueError(f"too many partitions for data source {self.name}")
         return partitions[0]
 
+    def get_partition_dimension(self, time_dimension_reference: TimeDimensionReference) -> Optional[Dimension]:
+        """Returns the partition dimension that is derived from the given time dimension, if there is one.
+
+        This is the time dimension itself if it's a partition, or the dimension named by its partition_dimension.
+        """
+        time_dimension = self.get_dimension(DimensionReference(element_name=time_dimension_reference.element_name))
+        if time_dimension.is_partition:
+            return time_dimension
+        if time_dimension.type_params is None or time_dimension.type_params.partition_dimension is None:
+            return None
+        return self.get_dimension(DimensionReference(element_name=time_dimension.type_params.partition_dimension))
+
     @property
     def reference(self) -> DataSourceReference:  # noqa: D
         return DataSourceReference(data_source_name=self.name)
@@ -40,10 +40,14 @@ class DimensionTypeParams(HashableBaseModel):
     """Dimension type params add additional context to some types (time) of dimensions"""
 
     is_primary: bool = False
-    # For legacy support. This is not used.
+    # For legacy support. Only used for partition dimensions, where a format other than the default indicates that the
+    # column stores times as strings in that format.
     time_format: str = ISO8601_FMT
     time_granularity: Optional[TimeGranularity] = None
     validity_params: Optional[DimensionValidityParams] = None
+    # The name of a partition time dimension in the same data source with values that are derived from this dimension
+    # (e.g. the date partition of an event timestamp). Used to prune partitions when this dimension is constrained.
+    partition_dimension: Optional[str] = None
 
 
 class Dimension(HashableBaseModel, ModelWithMetadataParsing):
@@ -19,6 +19,7 @@ from metricflow.model.parsing.schemas_internal import (
     materialization_validator,
 )
 from metricflow.model.objects.user_configured_model import UserConfiguredModel
+from metricflow.model.parsing.parsed_model_cache import ParsedModelCache
 from metricflow.model.parsing.yaml_loader import (
     ParsingContext,
     YamlConfigLoader,
@@ -92,10 +93,12 @@ def parse_directory_of_yaml_files_to_model(
     template_mapping: Optional[Dict[str, str]] = None,
     apply_transformations: Optional[bool] = True,
     raise_issues_as_exceptions: bool = True,
+    cache: Optional[ParsedModelCache] = None,
 ) -> ModelBuildResult:
     """Parse files in the given directory to a UserConfiguredModel.
 
     Strings in the file following the Python string template format are replaced according to the template_mapping dict.
+    If a cache is given, results for files that haven't changed since they were cached are reused.
     """
     file_paths = collect_yaml_config_file_paths(directory=directory)
     return parse_yaml_file_paths_to_model(
@@ -103,6 +106,7 @@ def parse_directory_of_yaml_files_to_model(
         template_mapping=template_mapping,
         apply_transformations=apply_transformations,
         raise_issues_as_exceptions=raise_issues_as_exceptions,
+        cache=cache,
     )
 
 
@@ -111,6 +115,7 @@ def parse_yaml_file_paths_to_model(
     template_mapping: Optional[Dict[str, str]] = None,
     apply_transformations: Optional[bool] = True,
     raise_issues_as_exceptions: bool = True,
+    cache: Optional[ParsedModelCache] = None,
 ) -> ModelBuildResult:
     """Parse files the given list of file paths to a UserConfiguredModel.
 
@@ -142,6 +147,7 @@ def parse_yaml_file_paths_to_model(
         yaml_config_files=yaml_config_files,
         apply_transformations=apply_transformations,
         raise_issues_as_exceptions=raise_issues_as_exceptions,
+        cache=cache,
     )
 
 
@@ -149,6 +155,7 @@ def parse_yaml_files_to_validation_ready_model(
     yaml_config_files: List[YamlConfigFile],
     apply_transformations: Optional[bool] = True,
     raise_issues_as_exceptions: bool = True,
+    cache: Optional[ParsedModelCache] = None,
 ) -> ModelBuildResult:
     """Parse and transform the given set of in-memory YamlConfigFiles to a UserConfigured model
 
@@ -157,7 +164,20 @@ def parse_yaml_files_to_validation_ready_model(
 
     TODO: Restructure this module and provide an improved API for managing these different input types
     """
-    build_result = parse_yaml_files_to_model(yaml_config_files)
+    model_key: Optional[str] = None
+    if cache is not None:
+        model_key = cache.model_key(
+            file_keys=[cache.file_key(config_file) for config_file in yaml_config_files],
+            apply_transformations=bool(apply_transformations),
+        )
+        cached_result = cache.get_model_result(model_key)
+        if cached_result is not None:
+            logger.info(f"Loaded the model for {len(yaml_config_files)} file(s) from the cache in {cache.dir_path}")
+            if raise_issues_as_exceptions and cached_result.issues.has_blocking_issues:
+                raise ModelValidationException(cached_result.issues.all_issues)
+            return cached_result
+
+    build_result = parse_yaml_files_to_model(yaml_config_files, cache=cache)
     model = build_result.model
     assert model
 
@@ -169,10 +189,14 @@ def parse_yaml_files_to_validation_ready_model(
         transformation_issue_results = ModelValidationResults(errors=[ValidationError(message=str(e))])
         build_issues = ModelValidationResults.merge([build_issues, transformation_issue_results])
 
+    result = ModelBuildResult(model=model, issues=build_issues)
+    if cache and model_key:
+        cache.put_model_result(model_key, result)
+
     if raise_issues_as_exceptions and build_issues.has_blocking_issues:
         raise ModelValidationException(build_issues.all_issues)
 
-    return ModelBuildResult(model=model, issues=build_issues)
+    return result
 
 
 def parse_yaml_files_to_model(
@@ -180,11 +204,13 @@ def parse_yaml_files_to_model(
     data_source_class: Type[DataSource] = DataSource,
     metric_class: Type[Metric] = Metric,
     materialization_class: Type[Materialization] = Materialization,
+    cache: Optional[ParsedModelCache] = None,
 ) -> ModelBuildResult:
     """Builds UserConfiguredModel from list of config files (as strings).
 
     Persistent storage connection may be passed to write parsed objects=
-    to storage and populate object metadata
+    to storage and populate object metadata. If a cache is given, the parsing results for files are read from and
+    written to it.
 
     Note: this function does not finalize the model
     """
@@ -194,13 +220,24 @@ def parse_yaml_files_to_model(
     valid_object_classes = [data_source_class.__name__, metric_class.__name__, materialization_class.__name__]
     issues: List[ValidationIssueType] = []
 
+    parser_args = tuple(
+        f"{object_class.__module__}.{object_class.__qualname__}"
+        for object_class in (data_source_class, metric_class, materialization_class)
+    )
     for config_file in files:
-        parsing_result = parse_config_yaml(  # parse config file
-            config_file,
-            data_source_class=data_source_class,
-            metric_class=metric_class,
-            materialization_class=materialization_class,
-        )
+        file_key = cache.file_key(config_file, *parser_args) if cache is not None else None
+        cached_parsing_result = cache.get_file_result(file_key) if cache and file_key else None
+        if cached_parsing_result is not None:
+            parsing_result = cached_parsing_result
+        else:
+            parsing_result = parse_config_yaml(  # parse config file
+                config_file,
+                data_source_class=data_source_class,
+                metric_class=metric_class,
+                materialization_class=materialization_class,
+            )
+            if cache and file_key:
+                cache.put_file_result(file_key, parsing_result)
         file_issues = parsing_result.issues
         for obj in parsing_result.elements:
             if isinstance(obj, data_source_class):
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from importlib.metadata import PackageNotFoundError, version as pkg_version
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Type
+
+from metricflow.cli import PACKAGE_NAME
+from metricflow.model.objects.common import YamlConfigFile
+from metricflow.model.objects.user_configured_model import UserConfiguredModel
+
+if TYPE_CHECKING:
+    from metricflow.model.parsing.dir_to_model import FileParsingResult, ModelBuildResult
+
+logger = logging.getLogger(__name__)
+
+# Bump when the format of the cached objects changes in a way that isn't reflected in the package version or in the
+# schema of the model classes (see model_schema_fingerprint()).
+_CACHE_FORMAT_VERSION = "2"
+
+
+def metricflow_version() -> str:
+    """Returns the installed version of MetricFlow, or 'unknown' when running from a source checkout."""
+    try:
+        return pkg_version(PACKAGE_NAME)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+@functools.lru_cache(maxsize=None)
+def model_schema_fingerprint() -> str:
+    """Returns a hash of the JSON schema of UserConfiguredModel, including the schemas of the classes that it contains.
+
+    Pickled model objects can only be used by code where the model classes have the same fields, and the package
+    version doesn't change between source checkouts, so this is included in the version of pickled entries.
+    """
+    schema = json.dumps(UserConfiguredModel.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()
+
+
+class ParsedModelCache:
+    """Stores the results of parsing model files in a directory, so that unchanged files don't need to be re-parsed.
+
+    Two kinds of entries are stored, both keyed by content hashes along with the MetricFlow version and the fingerprint
+    of the model schema:
+
+    * The parsing result for each file, keyed by the path and the (templated) contents of the file. When a file
+      changes, only that file is re-parsed.
+    * The transformed model, keyed by the keys of all files used to build it. When no files have changed, the model
+      is loaded without parsing or transforming anything.
+
+    Entries are pickled to files in the directory. Entries that can't be unpickled or that aren't of the expected type
+    are treated as misses, and the least recently used entries are removed when there are more than the configured
+    limit.
+    """
+
+    DEFAULT_MAX_FILE_ENTRIES = 10000
+    DEFAULT_MAX_MODEL_ENTRIES = 16
+
+    _FILE_ENTRY_DIR = "files"
+    _MODEL_ENTRY_DIR = "models"
+    _ENTRY_SUFFIX = ".pkl"
+
+    def __init__(  # noqa: D
+        self,
+        dir_path: str,
+        version: Optional[str] = None,
+        max_file_entries: int = DEFAULT_MAX_FILE_ENTRIES,
+        max_model_entries: int = DEFAULT_MAX_MODEL_ENTRIES,
+    ) -> None:
+        self._dir_path = dir_path
+        self._version = "/".join(
+            (
+                version if version is not None else metricflow_version(),
+                _CACHE_FORMAT_VERSION,
+                model_schema_fingerprint(),
+            )
+        )
+        self._max_file_entries = max_file_entries
+        self._max_model_entries = max_model_entries
+
+    @property
+    def dir_path(self) -> str:  # noqa: D
+        return self._dir_path
+
+    def _hash(self, *parts: str) -> str:
+        hasher = hashlib.sha256(self._version.encode("utf-8"))
+        for part in parts:
+            hasher.update(b"\0")
+            hasher.update(part.encode("utf-8"))
+        return hasher.hexdigest()
+
+    def file_key(self, config_file: YamlConfigFile, *parser_args: str) -> str:
+        """Returns the key for the parsing result of the file.
+
+        Args:
+            config_file: The file, with templates substituted.
+            parser_args: Strings describing any other inputs that affect the result, e.g. the classes used.
+        """
+        return self._hash(config_file.filepath, config_file.contents, *parser_args)
+
+    def model_key(self, file_keys: Sequence[str], apply_transformations: bool) -> str:
+        """Returns the key for the model built from the files with the given keys, in order."""
+        return self._hash(f"apply_transformations={apply_transformations}", *file_keys)
+
+    def _entry_path(self, entry_dir: str, key: str) -> str:
+        return os.path.join(self._dir_path, entry_dir, key + ParsedModelCache._ENTRY_SUFFIX)
+
+    def _get(self, entry_dir: str, key: str, expected_type: Type) -> Optional[Any]:  # type: ignore[misc]
+        entry_path = self._entry_path(entry_dir, key)
+        try:
+            with open(entry_path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning(f"Unable to read the cached model entry at {entry_path}. Removing it.", exc_info=True)
+            self._remove(entry_path)
+            return None
+        if not isinstance(value, expected_type):
+            logger.warning(f"Ignoring the cached model entry at {entry_path} as it's a {type(value)}. Removing it.")
+            self._remove(entry_path)
+            return None
+
+        # Update the modification time so that recently used entries aren't evicted.
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return value
+
+    def _put(self, entry_dir: str, key: str, value: Any, max_entries: int) -> None:  # type: ignore[misc]
+        dir_path = os.path.join(self._dir_path, entry_dir)
+        try:
+            os.makedirs(dir_path, exist_ok=True)
+            # Write to a temporary file and then rename so that readers never see a partially written entry.
+            fd, temp_path = tempfile.mkstemp(dir=dir_path, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self._entry_path(entry_dir, key))
+            except BaseException:
+                self._remove(temp_path)
+                raise
+            self._evict(dir_path, max_entries)
+        except Exception:
+            logger.warning(f"Unable to write the model cache entry {key} to {dir_path}", exc_info=True)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _evict(dir_path: str, max_entries: int) -> None:
+        """Removes the least recently used entries in the directory until there are at most max_entries."""
+        entries = [entry for entry in os.scandir(dir_path) if entry.name.endswith(ParsedModelCache._ENTRY_SUFFIX)]
+        if len(entries) <= max_entries:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[: len(entries) - max_entries]:
+            ParsedModelCache._remove(entry.path)
+
+    def get_file_result(self, key: str) -> Optional[FileParsingResult]:
+        """Returns the cached parsing result for the file with the given key, if there is one."""
+        from metricflow.model.parsing.dir_to_model import FileParsingResult
+
+        return self._get(ParsedModelCache._FILE_ENTRY_DIR, key, FileParsingResult)
+
+    def put_file_result(self, key: str, result: FileParsingResult) -> None:  # noqa: D
+        self._put(ParsedModelCache._FILE_ENTRY_DIR, key, result, self._max_file_entries)
+
+    def get_model_result(self, key: str) -> Optional[ModelBuildResult]:
+        """Returns the cached result of building the model with the given key, if there is one."""
+        from metricflow.model.parsing.dir_to_model import ModelBuildResult
+
+        return self._get(ParsedModelCache._MODEL_ENTRY_DIR, key, ModelBuildResult)
+
+    def put_model_result(self, key: str, result: ModelBuildResult) -> None:  # noqa: D
+        self._put(ParsedModelCache._MODEL_ENTRY_DIR, key, result, self._max_model_entries)
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        for entry_dir in (ParsedModelCache._FILE_ENTRY_DIR, ParsedModelCache._MODEL_ENTRY_DIR):
+            dir_path = os.path.join(self._dir_path, entry_dir)
+            if not os.path.isdir(dir_path):
+                continue
+            for entry in os.scandir(dir_path):
+                ParsedModelCache._remove(entry.path)
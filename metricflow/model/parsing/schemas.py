@@ -183,6 +183,7 @@ dimension_type_params_schema = {
         "time_format": {"type": "string"},
         "time_granularity": {"enum": time_granularity_values},
         "validity_params": {"$ref": "validity_params_schema"},
+        "partition_dimension": {"type": "string"},
     },
     "additionalProperties": False,
     "required": ["time_granularity"],
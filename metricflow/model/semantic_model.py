@@ -1,8 +1,10 @@
 from metricflow.model.objects.user_configured_model import UserConfiguredModel
 from metricflow.model.semantics.data_source_container import PydanticDataSourceContainer
 from metricflow.model.semantics.data_source_semantics import DataSourceSemantics
+from metricflow.model.semantics.linkable_spec_resolver import ValidLinkableSpecResolver
 from metricflow.model.semantics.metric_semantics import MetricSemantics
 from metricflow.protocols.semantics import DataSourceSemanticsAccessor, MetricSemanticsAccessor
+from metricflow.spec_registry import SpecRegistry
 
 
 class SemanticModel:
@@ -14,6 +16,7 @@ class SemanticModel:
             user_configured_model, PydanticDataSourceContainer(user_configured_model.data_sources)
         )
         self._metric_semantics = MetricSemantics(self._user_configured_model, self._data_source_semantics)
+        self._spec_registry = SpecRegistry()
 
     @property
     def user_configured_model(self) -> UserConfiguredModel:  # noqa: D
@@ -26,3 +29,13 @@ class SemanticModel:
     @property
     def metric_semantics(self) -> MetricSemanticsAccessor:  # noqa: D
         return self._metric_semantics
+
+    @property
+    def spec_registry(self) -> SpecRegistry:
+        """Assigns IDs to specs used with this model, for representing sets of specs as bitsets during planning."""
+        return self._spec_registry
+
+    @property
+    def linkable_spec_resolver(self) -> ValidLinkableSpecResolver:
+        """Resolves the linkable elements that can be queried with the metrics in the model."""
+        return self._metric_semantics.linkable_spec_resolver
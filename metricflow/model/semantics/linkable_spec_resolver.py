@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import logging
-import time
+import threading
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import Tuple, Sequence, Dict, List, Optional, FrozenSet
 
+from metricflow.caching import LruCache
 from metricflow.instances import DataSourceReference
 from metricflow.model.objects.data_source import DataSource
 from metricflow.model.objects.elements.dimension import DimensionType, Dimension
@@ -392,11 +393,14 @@ class ValidLinkableSpecResolver:
     e.g. Can you query the metric "bookings" by "listing__country_latest"?
     """
 
+    DEFAULT_FILTERED_ELEMENT_SET_CACHE_SIZE = 4096
+
     def __init__(
         self,
         user_configured_model: UserConfiguredModel,
         data_source_semantics: DataSourceSemanticsAccessor,
         max_identifier_links: int,
+        filtered_element_set_cache_size: int = DEFAULT_FILTERED_ELEMENT_SET_CACHE_SIZE,
     ) -> None:
         """Constructor.
 
@@ -404,6 +408,7 @@ class ValidLinkableSpecResolver:
             user_configured_model: the model to use.
             data_source_semantics: used to look up identifiers for a data source.
             max_identifier_links: the maximum number of joins to do when computing valid elements.
+            filtered_element_set_cache_size: the number of filtered element sets to keep for each metric / filter.
         """
         self._user_configured_model = user_configured_model
         # Sort data sources by name for consistency in building derived objects.
@@ -420,23 +425,29 @@ class ValidLinkableSpecResolver:
         for data_source in self._data_sources:
             for identifier in data_source.identifiers:
                 self._identifier_to_data_source[identifier.reference.element_name].append(data_source)
-
+            for measure in data_source.measures:
+                self._measure_to_data_source[measure.reference.element_name].append(data_source)
+
+        self._metric_name_to_measure_references: Dict[str, Tuple[MeasureReference, ...]] = {
+            metric.name: tuple(metric.measure_references) for metric in self._user_configured_model.metrics
+        }
+
+        # The indexes below are populated on demand, as computing the elements for every metric up front is slow in
+        # large models, and callers usually only query a small subset of the metrics.
+        # (name of the data source, name of the identifier) -> data sources that can be joined on that identifier.
+        self._join_targets: Dict[Tuple[str, str], Tuple[DataSource, ...]] = {}
+        # Name of the data source containing the measure -> linkable elements. Measures in the same data source have
+        # the same join paths, so the elements are computed once for all of them.
+        self._data_source_to_linkable_element_set: Dict[str, LinkableElementSet] = {}
         self._metric_to_linkable_element_sets: Dict[str, List[LinkableElementSet]] = {}
-
-        start_time = time.time()
-        for metric in self._user_configured_model.metrics:
-            linkable_sets_for_measure = []
-            for measure in metric.measure_references:
-                linkable_sets_for_measure.append(self._get_linkable_element_set_for_measure(measure))
-
-            self._metric_to_linkable_element_sets[metric.name] = linkable_sets_for_measure
-        logger.info(f"Building the [metric -> valid linkable element] index took: {time.time() - start_time:.2f}s")
+        self._index_lock = threading.RLock()
+        # (name of the metric, with_any_of, without_any_of) -> the filtered elements for the metric.
+        self._filtered_element_set_cache: LruCache[
+            Tuple[str, FrozenSet[LinkableElementProperties], FrozenSet[LinkableElementProperties]], LinkableElementSet
+        ] = LruCache(max_size=filtered_element_set_cache_size)
 
     def _get_data_source_for_measure(self, measure_reference: MeasureReference) -> DataSource:  # noqa: D
-        data_sources_where_measure_was_found = []
-        for data_source in self._data_sources:
-            if any([x.reference.element_name == measure_reference.element_name for x in data_source.measures]):
-                data_sources_where_measure_was_found.append(data_source)
+        data_sources_where_measure_was_found = self._measure_to_data_source.get(measure_reference.element_name, [])
 
         if len(data_sources_where_measure_was_found) == 0:
             raise ValueError(f"No data sources were found with {measure_reference} in the model")
@@ -509,22 +520,32 @@ class ValidLinkableSpecResolver:
         left_data_source_reference: DataSourceReference,
         identifier_reference: IdentifierReference,
     ) -> Sequence[DataSource]:
-        # May switch to non-cached implementation.
-        data_sources = self._identifier_to_data_source[identifier_reference.element_name]
-        valid_data_sources = []
-        for data_source in data_sources:
-            if self._join_evaluator.is_valid_data_source_join(
-                left_data_source_reference=left_data_source_reference,
-                right_data_source_reference=data_source.reference,
-                on_identifier_reference=identifier_reference,
-            ):
-                valid_data_sources.append(data_source)
+        key = (left_data_source_reference.data_source_name, identifier_reference.element_name)
+        valid_data_sources = self._join_targets.get(key)
+        if valid_data_sources is None:
+            valid_data_sources = tuple(
+                data_source
+                for data_source in self._identifier_to_data_source[identifier_reference.element_name]
+                if self._join_evaluator.is_valid_data_source_join(
+                    left_data_source_reference=left_data_source_reference,
+                    right_data_source_reference=data_source.reference,
+                    on_identifier_reference=identifier_reference,
+                )
+            )
+            self._join_targets[key] = valid_data_sources
         return valid_data_sources
 
     def _get_linkable_element_set_for_measure(self, measure_reference: MeasureReference) -> LinkableElementSet:
         """Get the valid linkable elements for the given measure."""
         measure_data_source = self._get_data_source_for_measure(measure_reference)
-
+        linkable_element_set = self._data_source_to_linkable_element_set.get(measure_data_source.name)
+        if linkable_element_set is None:
+            linkable_element_set = self._get_linkable_element_set_for_data_source(measure_data_source)
+            self._data_source_to_linkable_element_set[measure_data_source.name] = linkable_element_set
+        return linkable_element_set
+
+    def _get_linkable_element_set_for_data_source(self, measure_data_source: DataSource) -> LinkableElementSet:
+        """Get the valid linkable elements for measures in the given data source."""
         # Create local elements
         local_linkable_elements = self._get_local_set(measure_data_source)
         join_paths = []
@@ -587,6 +608,45 @@ class ValidLinkableSpecResolver:
             join_paths = new_join_paths
         return all_linkable_elements
 
+    def _get_linkable_element_sets_for_metric(
+        self, metric_reference: MetricReference
+    ) -> Optional[List[LinkableElementSet]]:
+        """Returns the linkable elements for each measure in the metric, adding them to the index if necessary."""
+        element_sets = self._metric_to_linkable_element_sets.get(metric_reference.element_name)
+        if element_sets is not None:
+            return element_sets
+
+        measure_references = self._metric_name_to_measure_references.get(metric_reference.element_name)
+        if measure_references is None:
+            return None
+
+        with self._index_lock:
+            element_sets = self._metric_to_linkable_element_sets.get(metric_reference.element_name)
+            if element_sets is None:
+                element_sets = [self._get_linkable_element_set_for_measure(x) for x in measure_references]
+                self._metric_to_linkable_element_sets[metric_reference.element_name] = element_sets
+        return element_sets
+
+    def build_index(self) -> None:
+        """Computes the linkable elements for all metrics, instead of when each metric is first queried."""
+        for metric_name in self._metric_name_to_measure_references:
+            self._get_linkable_element_sets_for_metric(MetricReference(element_name=metric_name))
+
+    @property
+    def indexed_element_sets(self) -> Dict[str, LinkableElementSet]:
+        """The linkable elements that have been computed so far, keyed by the name of the measure data source."""
+        with self._index_lock:
+            return dict(self._data_source_to_linkable_element_set)
+
+    def add_indexed_element_sets(self, indexed_element_sets: Dict[str, LinkableElementSet]) -> None:
+        """Adds linkable elements that were computed elsewhere e.g. by a resolver for the same model in a snapshot.
+
+        The elements are only valid if they were computed for a model that is identical to the one for this resolver.
+        """
+        with self._index_lock:
+            for data_source_name, linkable_element_set in indexed_element_sets.items():
+                self._data_source_to_linkable_element_set.setdefault(data_source_name, linkable_element_set)
+
     def get_linkable_elements_for_metrics(
         self,
         metric_references: Sequence[MetricReference],
@@ -596,12 +656,16 @@ class ValidLinkableSpecResolver:
         """Gets the valid linkable elements that are common to all requested metrics."""
         linkable_element_sets = []
         for metric_reference in metric_references:
-            element_sets = self._metric_to_linkable_element_sets.get(metric_reference.element_name)
-            if not element_sets:
-                raise ValueError(f"Unknown metric: {metric_reference} in element set")
-            metric_result = LinkableElementSet.intersection(
-                [x.filter(with_any_of=with_any_of, without_any_of=without_any_of) for x in element_sets]
-            )
+            cache_key = (metric_reference.element_name, with_any_of, without_any_of)
+            metric_result = self._filtered_element_set_cache.get(cache_key)
+            if metric_result is None:
+                element_sets = self._get_linkable_element_sets_for_metric(metric_reference)
+                if not element_sets:
+                    raise ValueError(f"Unknown metric: {metric_reference} in element set")
+                metric_result = LinkableElementSet.intersection(
+                    [x.filter(with_any_of=with_any_of, without_any_of=without_any_of) for x in element_sets]
+                )
+                self._filtered_element_set_cache.put(cache_key, metric_result)
             linkable_element_sets.append(metric_result)
 
         return LinkableElementSet.intersection(linkable_element_sets)
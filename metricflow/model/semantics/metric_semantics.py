@@ -2,6 +2,7 @@ import logging
 
 from typing import Dict, List, FrozenSet, Set, Tuple, Sequence
 
+from metricflow.caching import LruCache
 from metricflow.errors.errors import MetricNotFoundError, DuplicateMetricError, NonExistentMeasureError
 from metricflow.model.objects.metric import Metric, MetricType
 from metricflow.model.objects.user_configured_model import UserConfiguredModel
@@ -17,8 +18,14 @@ logger = logging.getLogger(__name__)
 
 
 class MetricSemantics:  # noqa: D
+    # The number of results from element_specs_for_metrics() to keep for repeated calls.
+    DEFAULT_ELEMENT_SPEC_CACHE_SIZE = 1024
+
     def __init__(  # noqa: D
-        self, user_configured_model: UserConfiguredModel, data_source_semantics: DataSourceSemantics
+        self,
+        user_configured_model: UserConfiguredModel,
+        data_source_semantics: DataSourceSemantics,
+        element_spec_cache_size: int = DEFAULT_ELEMENT_SPEC_CACHE_SIZE,
     ) -> None:
         self._user_configured_model = user_configured_model
         self._metrics: Dict[MetricReference, Metric] = {}
@@ -30,7 +37,7 @@ class MetricSemantics:  # noqa: D
         for metric in self._user_configured_model.metrics:
             self.add_metric(metric)
 
-        # Eager path expansion can grow combinatorially in connected models, so keep the default bounded.
+        # Join paths can't be longer than the number of other data sources, so there's no point in allowing more hops.
         max_identifier_links = min(DEFAULT_MAX_JOIN_HOPS, max(0, len(self._user_configured_model.data_sources) - 1))
 
         self._linkable_spec_resolver = ValidLinkableSpecResolver(
@@ -38,6 +45,16 @@ class MetricSemantics:  # noqa: D
             data_source_semantics=data_source_semantics,
             max_identifier_links=max_identifier_links,
         )
+        self._element_spec_cache: LruCache[
+            Tuple[
+                FrozenSet[MetricReference], FrozenSet[LinkableElementProperties], FrozenSet[LinkableElementProperties]
+            ],
+            Tuple[LinkableInstanceSpec, ...],
+        ] = LruCache(max_size=element_spec_cache_size)
+
+    @property
+    def linkable_spec_resolver(self) -> ValidLinkableSpecResolver:  # noqa: D
+        return self._linkable_spec_resolver
 
     def element_specs_for_metrics(
         self,
@@ -46,14 +63,19 @@ class MetricSemantics:  # noqa: D
         without_any_property: FrozenSet[LinkableElementProperties] = frozenset(),
     ) -> List[LinkableInstanceSpec]:
         """Dimensions common to all metrics requested (intersection)"""
-
-        all_linkable_specs = self._linkable_spec_resolver.get_linkable_elements_for_metrics(
-            metric_references=metric_references,
-            with_any_of=with_any_property,
-            without_any_of=without_any_property,
-        ).as_spec_set
-
-        return sorted(all_linkable_specs.as_tuple, key=lambda x: x.qualified_name)
+        # The result doesn't depend on the order of the metrics, so the sorted specs are cached by the set of metrics.
+        cache_key = (frozenset(metric_references), with_any_property, without_any_property)
+        sorted_specs = self._element_spec_cache.get(cache_key)
+        if sorted_specs is None:
+            all_linkable_specs = self._linkable_spec_resolver.get_linkable_elements_for_metrics(
+                metric_references=metric_references,
+                with_any_of=with_any_property,
+                without_any_of=without_any_property,
+            ).as_spec_set
+            sorted_specs = tuple(sorted(all_linkable_specs.as_tuple, key=lambda x: x.qualified_name))
+            self._element_spec_cache.put(cache_key, sorted_specs)
+
+        return list(sorted_specs)
 
     def get_metrics(self, metric_references: List[MetricReference]) -> List[Metric]:  # noqa: D
         res = []
@@ -223,3 +223,55 @@ class DataSourceValidityWindowRule(ModelValidationRule):
             issues.append(error)
 
         return issues
+
+
+class DataSourcePartitionDimensionRule(ModelValidationRule):
+    """Checks that the partition dimensions of time dimensions refer to partition time dimensions"""
+
+    @staticmethod
+    @validate_safely(whats_being_done="checking the partition dimensions of time dimensions in the model")
+    def validate_model(model: UserConfiguredModel) -> List[ValidationIssueType]:  # noqa: D
+        issues: List[ValidationIssueType] = []
+
+        for data_source in model.data_sources:
+            issues.extend(DataSourcePartitionDimensionRule._validate_data_source(data_source=data_source))
+
+        return issues
+
+    @staticmethod
+    @validate_safely(whats_being_done="checking the partition dimensions of the data source's time dimensions")
+    def _validate_data_source(data_source: DataSource) -> List[ValidationIssueType]:
+        issues: List[ValidationIssueType] = []
+        dimensions_by_name = {dim.name: dim for dim in data_source.dimensions}
+
+        for dim in data_source.dimensions:
+            if dim.type_params is None or dim.type_params.partition_dimension is None:
+                continue
+
+            context = DataSourceElementContext(
+                file_context=FileContext.from_metadata(metadata=data_source.metadata),
+                data_source_element=DataSourceElementReference(
+                    data_source_name=data_source.name, element_name=dim.name
+                ),
+                element_type=DataSourceElementType.DIMENSION,
+            )
+            partition_dimension = dimensions_by_name.get(dim.type_params.partition_dimension)
+            if partition_dimension is None:
+                issues.append(
+                    ValidationError(
+                        context=context,
+                        message=f"Time dimension {dim.name} in data source {data_source.name} has partition dimension "
+                        f"`{dim.type_params.partition_dimension}`, but there is no dimension with that name in the "
+                        f"data source.",
+                    )
+                )
+            elif partition_dimension.type != DimensionType.TIME or not partition_dimension.is_partition:
+                issues.append(
+                    ValidationError(
+                        context=context,
+                        message=f"Time dimension {dim.name} in data source {data_source.name} has partition dimension "
+                        f"`{partition_dimension.name}`, but it's not a time dimension with `is_partition` set.",
+                    )
+                )
+
+        return issues
@@ -1,5 +1,7 @@
+import copy
 import logging
-from typing import Generic, Tuple, Optional, Union
+from enum import Enum
+from typing import Generic, List, Tuple, Optional, Union
 
 from metricflow.dag.id_generation import IdGeneratorRegistry, SQL_QUERY_PLAN_PREFIX, EXEC_PLAN_PREFIX
 from metricflow.dataflow.dataflow_plan import (
@@ -10,9 +12,13 @@ from metricflow.dataflow.dataflow_plan import (
     WriteToResultTableNode,
     ComputedMetricsOutput,
     BaseOutput,
+    CombineMetricsNode,
+    OrderByLimitNode,
 )
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.execution.execution_plan import (
+    CombineDataFramesTask,
+    DataFrameOrderBy,
     ExecutionPlan,
     SelectSqlQueryToDataFrameTask,
     ExecutionPlanTask,
@@ -21,14 +27,33 @@ from metricflow.execution.execution_plan import (
 from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter, SqlDataSetT
 from metricflow.protocols.async_sql_client import AsyncSqlClient
 from metricflow.protocols.sql_request import SqlJsonTag
+from metricflow.sql.optimizer.optimization_levels import SqlQueryOptimizationLevel
 from metricflow.specs import OutputColumnNameOverride
-from metricflow.sql.render.sql_plan_renderer import SqlQueryPlanRenderer
-from metricflow.sql.sql_plan import SqlSelectStatementNode, SqlSelectColumn, SqlQueryPlan
+from metricflow.sql.render.sql_plan_renderer import SqlPlanRenderResult, SqlQueryPlanRenderer
+from metricflow.sql.sql_plan import SqlSelectStatementNode, SqlSelectColumn, SqlQueryPlan, SqlJoinType
 from metricflow.sql.sql_plan_to_text import sql_query_plan_as_text
 
 logger = logging.getLogger(__name__)
 
 
+class CombineMetricsExecutionMode(Enum):
+    """Describes how metrics that are computed separately and then combined for the output should be executed.
+
+    SINGLE_QUERY: Combine the metrics in the SQL engine with a join, so that there is a single query.
+    QUERY_PER_METRIC: Run a query to compute each metric, and join the results client-side. The queries can run
+    concurrently, and engines that plan large joins poorly only have to handle the smaller queries.
+    AUTO: Use QUERY_PER_METRIC if the engine can run queries concurrently and there are many metrics to combine.
+
+    With QUERY_PER_METRIC, the rendered SQL of the plan consists of several statements, so it can't be run as one
+    query. The results are also merged with pandas, so integer columns with missing values become floats, and NULLs
+    are sorted last regardless of the engine's ordering of NULLs.
+    """
+
+    SINGLE_QUERY = "single_query"
+    QUERY_PER_METRIC = "query_per_metric"
+    AUTO = "auto"
+
+
 class DataflowToExecutionPlanConverter(Generic[SqlDataSetT], SinkNodeVisitor[SqlDataSetT, ExecutionPlan]):
     """Converts a dataflow plan to an execution plan"""
 
@@ -39,6 +64,9 @@ class DataflowToExecutionPlanConverter(Generic[SqlDataSetT], SinkNodeVisitor[Sql
         sql_client: AsyncSqlClient,
         extra_sql_tags: SqlJsonTag = SqlJsonTag(),
         output_column_name_overrides: Tuple[OutputColumnNameOverride, ...] = (),
+        combine_metrics_mode: CombineMetricsExecutionMode = CombineMetricsExecutionMode.SINGLE_QUERY,
+        min_metrics_for_query_per_metric: int = 10,
+        sql_optimization_level: SqlQueryOptimizationLevel = SqlQueryOptimizationLevel.O4,
     ) -> None:
         """Constructor.
 
@@ -48,12 +76,19 @@ class DataflowToExecutionPlanConverter(Generic[SqlDataSetT], SinkNodeVisitor[Sql
             sql_client: The client to use for running queries.
             extra_sql_tags: Tags to supply to the SQL client when running statements.
             output_column_name_overrides: In the output dataframe / table, name output columns in a specific way.
+            combine_metrics_mode: The default mode for executing plans that combine metrics for the output.
+            min_metrics_for_query_per_metric: In AUTO mode, the number of metric branches in the combine step at which
+            a query per metric is used.
+            sql_optimization_level: The default level of optimization for the generated SQL.
         """
         self._sql_plan_converter = sql_plan_converter
         self._sql_plan_renderer = sql_plan_renderer
         self._sql_client = sql_client
         self._sql_tags = extra_sql_tags
         self._output_column_name_overrides = output_column_name_overrides
+        self._combine_metrics_mode = combine_metrics_mode
+        self._min_metrics_for_query_per_metric = min_metrics_for_query_per_metric
+        self._sql_optimization_level = sql_optimization_level
 
     @staticmethod
     def override_output_column_names(
@@ -94,18 +129,18 @@ class DataflowToExecutionPlanConverter(Generic[SqlDataSetT], SinkNodeVisitor[Sql
             order_bys=select_node.order_bys,
             where=select_node.where,
             limit=select_node.limit,
+            cte_descs=select_node.cte_descs,
         )
 
-    def _build_execution_plan(  # noqa: D
-        self,
-        node: Union[BaseOutput[SourceDataSetT], ComputedMetricsOutput[SourceDataSetT]],
-        output_table: Optional[SqlTable] = None,
-    ) -> ExecutionPlan:
-
+    def _render_sql(
+        self, node: Union[BaseOutput[SourceDataSetT], ComputedMetricsOutput[SourceDataSetT]]
+    ) -> SqlPlanRenderResult:
+        """Render the SQL for the computation up to the given node."""
         sql_plan = self._sql_plan_converter.convert_to_sql_query_plan(
             sql_engine_attributes=self._sql_client.sql_engine_attributes,
             sql_query_plan_id=IdGeneratorRegistry.for_class(SqlQueryPlan).create_id(SQL_QUERY_PLAN_PREFIX),
             dataflow_plan_node=node,
+            optimization_level=self._sql_optimization_level,
         )
 
         if self._output_column_name_overrides:
@@ -123,7 +158,14 @@ class DataflowToExecutionPlanConverter(Generic[SqlDataSetT], SinkNodeVisitor[Sql
 
         logger.debug(f"Generated SQL query plan is:\n{sql_query_plan_as_text(sql_plan)}")
 
-        render_result = self._sql_plan_renderer.render_sql_query_plan(sql_plan)
+        return self._sql_plan_renderer.render_sql_query_plan(sql_plan)
+
+    def _build_execution_plan(  # noqa: D
+        self,
+        node: Union[BaseOutput[SourceDataSetT], ComputedMetricsOutput[SourceDataSetT]],
+        output_table: Optional[SqlTable] = None,
+    ) -> ExecutionPlan:
+        render_result = self._render_sql(node)
 
         leaf_task: ExecutionPlanTask
 
@@ -159,8 +201,95 @@ class DataflowToExecutionPlanConverter(Generic[SqlDataSetT], SinkNodeVisitor[Sql
         logger.info(f"Generating SQL query plan from {node.node_id} -> {node.parent_node.node_id}")
         return self._build_execution_plan(node.parent_node, node.output_sql_table)
 
-    def convert_to_execution_plan(self, dataflow_plan: DataflowPlan) -> ExecutionPlan:
-        """Convert the dataflow plan to an execution plan."""
+    def _use_query_per_metric(
+        self, combine_metrics_node: CombineMetricsNode[SourceDataSetT], combine_metrics_mode: CombineMetricsExecutionMode
+    ) -> bool:
+        if combine_metrics_node.join_type is not SqlJoinType.FULL_OUTER:
+            return False
+        if combine_metrics_mode is CombineMetricsExecutionMode.QUERY_PER_METRIC:
+            return True
+        if combine_metrics_mode is CombineMetricsExecutionMode.AUTO:
+            return (
+                self._sql_client.sql_engine_attributes.multi_threading_supported
+                and len(combine_metrics_node.parent_nodes) >= self._min_metrics_for_query_per_metric
+            )
+        return False
+
+    def _build_query_per_metric_execution_plan(
+        self,
+        combine_metrics_node: CombineMetricsNode[SourceDataSetT],
+        order_by_limit_node: Optional[OrderByLimitNode[SourceDataSetT]],
+    ) -> ExecutionPlan:
+        """Build a plan that runs a query for each parent of the combine node and joins the results client-side."""
+        metric_tasks: List[ExecutionPlanTask] = []
+        for parent_node in combine_metrics_node.parent_nodes:
+            render_result = self._render_sql(parent_node)
+            metric_tasks.append(
+                SelectSqlQueryToDataFrameTask(
+                    sql_client=self._sql_client,
+                    sql_query=render_result.sql,
+                    execution_parameters=render_result.execution_parameters,
+                    extra_sql_tags=self._sql_tags,
+                )
+            )
+
+        order_bys: List[DataFrameOrderBy] = []
+        if order_by_limit_node is not None:
+            for order_by_spec in order_by_limit_node.order_by_specs:
+                for column_association in order_by_spec.item.column_associations(
+                    self._sql_plan_converter.column_association_resolver
+                ):
+                    order_bys.append(
+                        DataFrameOrderBy(column_name=column_association.column_name, descending=order_by_spec.descending)
+                    )
+
+        leaf_task = CombineDataFramesTask(
+            parent_nodes=metric_tasks,
+            order_bys=order_bys,
+            limit=order_by_limit_node.limit if order_by_limit_node is not None else None,
+        )
+        return ExecutionPlan(
+            plan_id=IdGeneratorRegistry.for_class(self.__class__).create_id(EXEC_PLAN_PREFIX), leaf_tasks=[leaf_task]
+        )
+
+    def convert_to_execution_plan(
+        self,
+        dataflow_plan: DataflowPlan,
+        combine_metrics_mode: Optional[CombineMetricsExecutionMode] = None,
+        sql_optimization_level: Optional[SqlQueryOptimizationLevel] = None,
+    ) -> ExecutionPlan:
+        """Convert the dataflow plan to an execution plan.
+
+        Args:
+            dataflow_plan: The plan to convert.
+            combine_metrics_mode: Overrides the default mode for executing plans that combine metrics for the output.
+            sql_optimization_level: Overrides the default level of optimization for the generated SQL.
+        """
+        if sql_optimization_level is not None and sql_optimization_level is not self._sql_optimization_level:
+            # The converter may be shared between threads, so use a copy instead of changing the level of this one.
+            converter = copy.copy(self)
+            converter._sql_optimization_level = sql_optimization_level
+            return converter.convert_to_execution_plan(dataflow_plan, combine_metrics_mode=combine_metrics_mode)
 
         assert len(dataflow_plan.sink_output_nodes) == 1, "Only 1 sink node in the plan is currently supported."
-        return dataflow_plan.sink_output_nodes[0].accept_sink_node_visitor(self)
+        sink_node = dataflow_plan.sink_output_nodes[0]
+
+        # The order-by columns in the client-side join don't account for renamed output columns, so plans with
+        # overrides always use a single query.
+        if isinstance(sink_node, WriteToResultDataframeNode) and not self._output_column_name_overrides:
+            order_by_limit_node: Optional[OrderByLimitNode[SourceDataSetT]] = None
+            metrics_output_node = sink_node.parent_node
+            if isinstance(metrics_output_node, OrderByLimitNode):
+                order_by_limit_node = metrics_output_node
+                metrics_output_node = order_by_limit_node.parent_node
+
+            if isinstance(metrics_output_node, CombineMetricsNode) and self._use_query_per_metric(
+                metrics_output_node, combine_metrics_mode or self._combine_metrics_mode
+            ):
+                logger.info(
+                    f"Generating a SQL query plan for each of the {len(metrics_output_node.parent_nodes)} parents of "
+                    f"{metrics_output_node.node_id}"
+                )
+                return self._build_query_per_metric_execution_plan(metrics_output_node, order_by_limit_node)
+
+        return sink_node.accept_sink_node_visitor(self)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
+import re
 from collections import OrderedDict
-from typing import Generic, List, Optional, Sequence, TypeVar, Union
+from typing import Callable, Generic, List, Optional, Sequence, TypeVar, Union
+
+import pandas as pd
 
 from metricflow.aggregation_properties import AggregationState, AggregationType
 from metricflow.column_assoc import ColumnAssociation, SingleColumnCorrelationKey
@@ -30,6 +33,7 @@ from metricflow.dataflow.dataflow_plan import (
     MetricTimeDimensionTransformNode,
     JoinToTimeSpineNode,
 )
+from metricflow.dataflow.sql_table import SqlTable
 from metricflow.dataset.dataset import DataSet
 from metricflow.instances import (
     InstanceSet,
@@ -37,6 +41,7 @@ from metricflow.instances import (
     MetricModelReference,
     TimeDimensionInstance,
 )
+from metricflow.model.objects.elements.dimension import ISO8601_FMT
 from metricflow.model.objects.metric import MetricType
 from metricflow.model.semantic_model import SemanticModel
 from metricflow.object_utils import assert_values_exhausted
@@ -69,6 +74,7 @@ from metricflow.plan_conversion.sql_join_builder import (
 )
 from metricflow.plan_conversion.time_spine import TimeSpineSource
 from metricflow.protocols.sql_client import SqlEngineAttributes, SqlEngine
+from metricflow.references import TimeDimensionReference
 from metricflow.specs import (
     ColumnAssociationResolver,
     MetricSpec,
@@ -90,6 +96,8 @@ from metricflow.sql.sql_exprs import (
     SqlStringLiteralExpression,
     SqlBetweenExpression,
     SqlFunctionExpression,
+    SqlLogicalExpression,
+    SqlLogicalOperator,
 )
 from metricflow.sql.sql_plan import (
     SqlQueryPlan,
@@ -102,6 +110,7 @@ from metricflow.sql.sql_plan import (
     SqlTableFromClauseNode,
 )
 from metricflow.time.time_constants import ISO8601_PYTHON_FORMAT
+from metricflow.time.time_granularity import TimeGranularity
 
 logger = logging.getLogger(__name__)
 
@@ -135,6 +144,104 @@ def _make_time_range_comparison_expr(
     )
 
 
+def _partition_time_format_to_python_format(time_format: str) -> Optional[str]:
+    """Returns the strftime format of a partition column that stores times as strings in the given format.
+
+    The format can use strftime directives (e.g. "%Y%m%d") or the YYYY / MM / DD tokens (e.g. "YYYYMMDD"). None is
+    returned if comparing strings in the format wouldn't be the same as comparing the times, i.e. unless the format
+    consists of the zero-padded year, month, and day in that order, with any other characters being constant.
+    """
+    python_format = time_format
+    if "%" not in python_format:
+        python_format = python_format.replace("YYYY", "%Y").replace("MM", "%m").replace("DD", "%d")
+    directives = re.findall(r"%.", python_format)
+    if directives not in (["%Y"], ["%Y", "%m"], ["%Y", "%m", "%d"]):
+        return None
+    if re.search(r"[A-Za-z0-9]", re.sub(r"%.", "", python_format)):
+        return None
+    return python_format
+
+
+def _make_formatted_time_range_comparison_expr(
+    table_alias: str, column_alias: str, time_range_constraint: TimeRangeConstraint, python_format: str
+) -> SqlExpressionNode:
+    """Build an expression like "ds BETWEEN '20200101' AND '20200102'" for a column that stores times as strings."""
+    return SqlBetweenExpression(
+        column_arg=SqlColumnReferenceExpression(
+            SqlColumnReference(
+                table_alias=table_alias,
+                column_name=column_alias,
+            )
+        ),
+        start_expr=SqlStringLiteralExpression(literal_value=time_range_constraint.start_time.strftime(python_format)),
+        end_expr=SqlStringLiteralExpression(literal_value=time_range_constraint.end_time.strftime(python_format)),
+    )
+
+
+def _contains_function_expr(expr: SqlExpressionNode) -> bool:
+    """Returns true if the expression contains a function (e.g. an aggregate or a window function)."""
+    return isinstance(expr, SqlFunctionExpression) or any(_contains_function_expr(x) for x in expr.parent_nodes)
+
+
+def _add_where_to_table_scan(
+    select_node: SqlSelectStatementNode,
+    sql_table: SqlTable,
+    make_where_expr: Callable[[str], SqlExpressionNode],
+) -> Optional[SqlSelectStatementNode]:
+    """Add a condition to the statement that reads from the given table, following the FROM sources of select_node.
+
+    The statements between select_node and the one that reads from the table can't join, group, limit, or use
+    functions, so the condition only removes rows that would have been removed from the output of select_node.
+
+    Args:
+        select_node: The statement to start from.
+        sql_table: The table that should be read by the statement that gets the condition.
+        make_where_expr: Creates the condition, given the alias of the table in the statement.
+
+    Returns:
+        A copy of select_node with the condition added, or None if there is no statement where it can be added.
+    """
+    if (
+        select_node.join_descs
+        or select_node.group_bys
+        or select_node.limit is not None
+        or select_node.cte_descs
+        or any(_contains_function_expr(x.expr) for x in select_node.select_columns)
+    ):
+        return None
+
+    from_source = select_node.from_source
+    where = select_node.where
+    if isinstance(from_source, SqlTableFromClauseNode):
+        if from_source.sql_table.sql != sql_table.sql:
+            return None
+        where_expr = make_where_expr(select_node.from_source_alias)
+        if where is not None:
+            where_expr = SqlLogicalExpression(operator=SqlLogicalOperator.AND, args=(where, where_expr))
+        where = where_expr
+    else:
+        from_select_node = from_source.as_select_node
+        if from_select_node is None:
+            return None
+        from_select_node = _add_where_to_table_scan(from_select_node, sql_table, make_where_expr)
+        if from_select_node is None:
+            return None
+        from_source = from_select_node
+
+    return SqlSelectStatementNode(
+        description=select_node.description,
+        select_columns=select_node.select_columns,
+        from_source=from_source,
+        from_source_alias=select_node.from_source_alias,
+        joins_descs=select_node.join_descs,
+        group_bys=select_node.group_bys,
+        order_bys=select_node.order_bys,
+        where=where,
+        limit=select_node.limit,
+        cte_descs=select_node.cte_descs,
+    )
+
+
 class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisitor[SqlDataSetT, SqlDataSet]):
     """Generates an SQL query plan from a node in the a metric dataflow plan."""
 
@@ -809,18 +916,21 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
         # Also, the output columns should always follow the resolver format.
         output_instance_set = output_instance_set.transform(ChangeAssociatedColumns(self._column_association_resolver))
 
+        # This creates select expressions for all columns referenced in the instance set.
+        select_columns = output_instance_set.transform(
+            CreateSelectColumnsForInstances(from_data_set_alias, self._column_association_resolver)
+        ).as_tuple()
+
         return SqlDataSet(
             instance_set=output_instance_set,
             sql_select_node=SqlSelectStatementNode(
                 description=node.description,
-                # This creates select expressions for all columns referenced in the instance set.
-                select_columns=output_instance_set.transform(
-                    CreateSelectColumnsForInstances(from_data_set_alias, self._column_association_resolver)
-                ).as_tuple(),
+                select_columns=select_columns,
                 from_source=from_data_set.sql_select_node,
                 from_source_alias=from_data_set_alias,
                 joins_descs=(),
-                group_bys=(),
+                # Grouping by all columns removes duplicate rows, like SELECT DISTINCT.
+                group_bys=select_columns if node.distinct else (),
                 where=None,
                 order_bys=(),
             ),
@@ -1039,6 +1149,11 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
             column_alias=time_dimension_instance_for_metric_time.associated_column.column_name,
             time_range_constraint=node.time_range_constraint,
         )
+        from_select_node = self._add_partition_pruning_condition(
+            select_node=from_data_set.sql_select_node,
+            metric_time_dimension_instance=time_dimension_instance_for_metric_time,
+            time_range_constraint=node.time_range_constraint,
+        )
 
         output_instance_set = from_data_set.instance_set
         # Output columns should always follow the resolver format.
@@ -1052,7 +1167,7 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
                 select_columns=output_instance_set.transform(
                     CreateSelectColumnsForInstances(from_data_set_alias, self._column_association_resolver)
                 ).as_tuple(),
-                from_source=from_data_set.sql_select_node,
+                from_source=from_select_node,
                 from_source_alias=from_data_set_alias,
                 joins_descs=(),
                 group_bys=(),
@@ -1061,6 +1176,99 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
             ),
         )
 
+    def _add_partition_pruning_condition(
+        self,
+        select_node: SqlSelectStatementNode,
+        metric_time_dimension_instance: TimeDimensionInstance,
+        time_range_constraint: TimeRangeConstraint,
+    ) -> SqlSelectStatementNode:
+        """Add a condition on the partition column to the scan of the data source table, if there is one.
+
+        The constraint on metric time is applied to the expression of the time dimension, which engines generally
+        can't use to skip partitions. If the time dimension has a partition dimension, the range is also applied to the
+        raw partition column in the statement that reads the table, e.g.
+
+            ds_partitioned BETWEEN CAST('2020-01-01' AS TIMESTAMP) AND CAST('2020-01-02' AS TIMESTAMP)
+
+        If the partition dimension sets a time_format other than the default, the column is assumed to store times as
+        strings in that format, and the bounds are rendered as strings in the same format, e.g.
+
+            ds_partitioned BETWEEN '20200101' AND '20200102'
+
+        The start of the range is moved to the start of the partition period, so no partitions that contain rows in
+        the range are skipped. The original select_node is returned if the condition can't be added, including when
+        string comparisons in the time_format wouldn't be ordered by time.
+        """
+        if len(metric_time_dimension_instance.defined_from) != 1:
+            return select_node
+        element_reference = metric_time_dimension_instance.defined_from[0]
+        data_source = self._data_source_semantics.get_by_reference(element_reference.data_source_reference)
+        if data_source is None or data_source.sql_table is None:
+            return select_node
+        time_dimension_reference = TimeDimensionReference(element_name=element_reference.element_name)
+        time_dimension = next((x for x in data_source.dimensions if x.name == element_reference.element_name), None)
+        # A constraint on a coarser granularity doesn't bound the end of the range of the time dimension.
+        if (
+            time_dimension is None
+            or time_dimension.type_params is None
+            or time_dimension.type_params.time_granularity != metric_time_dimension_instance.spec.time_granularity
+        ):
+            return select_node
+
+        partition_dimension = data_source.get_partition_dimension(time_dimension_reference)
+        if partition_dimension is None:
+            return select_node
+        # Only raw columns can be used to prune partitions.
+        partition_column = partition_dimension.expr or partition_dimension.name
+        if not re.fullmatch(r"\w+", partition_column):
+            return select_node
+
+        partition_granularity = TimeGranularity.DAY
+        partition_python_format: Optional[str] = None
+        if partition_dimension.type_params is not None:
+            if partition_dimension.type_params.time_granularity:
+                partition_granularity = partition_dimension.type_params.time_granularity
+            if partition_dimension.type_params.time_format != ISO8601_FMT:
+                partition_python_format = _partition_time_format_to_python_format(
+                    partition_dimension.type_params.time_format
+                )
+                if partition_python_format is None:
+                    logger.warning(
+                        f"Not pruning partitions of {data_source.sql_table} as values of the partition dimension "
+                        f"{partition_dimension.name} in the format {partition_dimension.type_params.time_format} "
+                        f"can't be compared as strings"
+                    )
+                    return select_node
+        start_time = pd.Timestamp(time_range_constraint.start_time).normalize()
+        if partition_granularity is not TimeGranularity.DAY:
+            start_time = partition_granularity.adjust_to_start_of_period(start_time)
+        partition_time_range_constraint = TimeRangeConstraint(
+            start_time=start_time.to_pydatetime(), end_time=time_range_constraint.end_time
+        )
+
+        def _make_where_expr(table_alias: str) -> SqlExpressionNode:
+            if partition_python_format is not None:
+                return _make_formatted_time_range_comparison_expr(
+                    table_alias=table_alias,
+                    column_alias=partition_column,
+                    time_range_constraint=partition_time_range_constraint,
+                    python_format=partition_python_format,
+                )
+            return _make_time_range_comparison_expr(
+                table_alias=table_alias,
+                column_alias=partition_column,
+                time_range_constraint=partition_time_range_constraint,
+            )
+
+        return (
+            _add_where_to_table_scan(
+                select_node=select_node,
+                sql_table=SqlTable.from_string(data_source.sql_table),
+                make_where_expr=_make_where_expr,
+            )
+            or select_node
+        )
+
     def convert_to_sql_query_plan(
         self,
         sql_engine_attributes: SqlEngineAttributes,
@@ -1077,7 +1285,9 @@ class DataflowToSqlQueryPlanConverter(Generic[SqlDataSetT], DataflowPlanNodeVisi
         use_column_alias_in_group_by = sql_engine_attributes.sql_engine_type is SqlEngine.BIGQUERY
 
         for optimizer in SqlQueryOptimizerConfiguration.optimizers_for_level(
-            optimization_level, use_column_alias_in_group_by=use_column_alias_in_group_by
+            optimization_level,
+            use_column_alias_in_group_by=use_column_alias_in_group_by,
+            materialize_ctes=sql_engine_attributes.materialized_ctes_supported,
         ):
             logger.info(f"Applying optimizer: {optimizer.__class__.__name__}")
             sql_select_node = optimizer.optimize(sql_select_node)
@@ -1,10 +1,12 @@
 import logging
 from dataclasses import dataclass
-from typing import Generic, Sequence, List, TypeVar, Optional, Set, Tuple
+from typing import FrozenSet, Generic, Sequence, List, TypeVar, Optional, Set, Tuple
 
+from metricflow.caching import LruCache
 from metricflow.constraints.time_constraint import TimeRangeConstraint
 from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
 from metricflow.dataflow.builder.partitions import PartitionJoinResolver
+from metricflow.dataflow.builder.source_node_index import SourceNodeIndex
 from metricflow.dataflow.dataflow_plan import (
     ConstrainTimeRangeNode,
     BaseOutput,
@@ -61,6 +63,10 @@ class MultiHopJoinCandidate(Generic[SqlDataSetT]):
     lineage: MultiHopJoinCandidateLineage[SqlDataSetT]
 
 
+# (IDs of the nodes used to build the candidates, names of the identifier links, element name) -> the candidates.
+MultiHopJoinCandidateCacheKey = Tuple[Tuple[str, ...], Tuple[str, ...], str]
+
+
 class PreDimensionJoinNodeProcessor(Generic[SqlDataSetT]):
     """Processes source nodes before measures are joined to dimensions.
 
@@ -80,15 +86,30 @@ class PreDimensionJoinNodeProcessor(Generic[SqlDataSetT]):
 
     """
 
-    def __init__(  # noqa: D
+    def __init__(
         self,
         data_source_semantics: DataSourceSemanticsAccessor,
         node_data_set_resolver: DataflowPlanNodeOutputDataSetResolver[SqlDataSetT],
+        source_node_index: Optional[SourceNodeIndex[SqlDataSetT]] = None,
+        multi_hop_candidate_cache: Optional[
+            LruCache[MultiHopJoinCandidateCacheKey, Sequence[MultiHopJoinCandidate[SqlDataSetT]]]
+        ] = None,
     ):
+        """Constructor.
+
+        Args:
+            data_source_semantics: used to look up elements in data sources.
+            node_data_set_resolver: figures out what data set is output by a node.
+            source_node_index: if given, used to look up the contents of nodes instead of examining the output data set.
+            multi_hop_candidate_cache: if given, multi-hop join candidates are stored here so that they can be reused
+            by later queries with the same identifier path.
+        """
         self._node_data_set_resolver = node_data_set_resolver
         self._partition_resolver = PartitionJoinResolver(data_source_semantics)
         self._data_source_semantics = data_source_semantics
         self._join_evaluator = DataSourceJoinEvaluator(data_source_semantics)
+        self._source_node_index = source_node_index
+        self._multi_hop_candidate_cache = multi_hop_candidate_cache
 
     def add_time_range_constraint(
         self,
@@ -127,6 +148,9 @@ class PreDimensionJoinNodeProcessor(Generic[SqlDataSetT]):
         identifier_reference: IdentifierReference,
     ) -> bool:
         """Returns true if the output of the node contains an identifier of the given types."""
+        if self._source_node_index is not None:
+            return self._source_node_index.contains_identifier(node=node, identifier_reference=identifier_reference)
+
         data_set = self._node_data_set_resolver.get_output_data_set(node)
 
         for identifier_instance_in_first_node in data_set.instance_set.identifier_instances:
@@ -214,9 +238,7 @@ class PreDimensionJoinNodeProcessor(Generic[SqlDataSetT]):
             if not self._node_contains_identifier(node=node, identifier_reference=last_link_ref):
                 continue
 
-            data_set = self._node_data_set_resolver.get_output_data_set(node)
-            element_names_in_data_set = ToElementNameSet().transform(data_set.instance_set.spec_set)
-            if desired_linkable_spec.element_name not in element_names_in_data_set:
+            if desired_linkable_spec.element_name not in self._element_names(node):
                 continue
 
             current_candidates.append((node, (node,), ()))
@@ -328,6 +350,28 @@ class PreDimensionJoinNodeProcessor(Generic[SqlDataSetT]):
 
         return multi_hop_join_candidates
 
+    def _get_cached_candidates_nodes_for_multi_hop(
+        self,
+        desired_linkable_spec: LinkableInstanceSpec,
+        nodes: Sequence[BaseOutput[SqlDataSetT]],
+        node_ids: Tuple[str, ...],
+    ) -> Sequence[MultiHopJoinCandidate]:
+        """Same as _get_candidates_nodes_for_multi_hop, but uses the cache if one was provided."""
+        if self._multi_hop_candidate_cache is None or len(desired_linkable_spec.identifier_links) < 2:
+            return self._get_candidates_nodes_for_multi_hop(desired_linkable_spec=desired_linkable_spec, nodes=nodes)
+
+        cache_key = (
+            node_ids,
+            tuple(x.element_name for x in desired_linkable_spec.identifier_links),
+            desired_linkable_spec.element_name,
+        )
+        return self._multi_hop_candidate_cache.get_or_create(
+            cache_key,
+            lambda: tuple(
+                self._get_candidates_nodes_for_multi_hop(desired_linkable_spec=desired_linkable_spec, nodes=nodes)
+            ),
+        )
+
     def add_multi_hop_joins(
         self, desired_linkable_specs: Sequence[LinkableInstanceSpec], nodes: Sequence[BaseOutput[SqlDataSetT]]
     ) -> Sequence[BaseOutput[SqlDataSetT]]:
@@ -336,10 +380,12 @@ class PreDimensionJoinNodeProcessor(Generic[SqlDataSetT]):
         all_multi_hop_join_candidates: List[MultiHopJoinCandidate[SqlDataSetT]] = []
         lineage_for_all_multi_hop_join_candidates: Set[MultiHopJoinCandidateLineage[SqlDataSetT]] = set()
 
+        node_ids = tuple(node.node_id for node in nodes)
         for desired_linkable_spec in desired_linkable_specs:
-            for multi_hop_join_candidate in self._get_candidates_nodes_for_multi_hop(
+            for multi_hop_join_candidate in self._get_cached_candidates_nodes_for_multi_hop(
                 desired_linkable_spec=desired_linkable_spec,
                 nodes=nodes,
+                node_ids=node_ids,
             ):
                 # Dedupe candidates that are the same join.
                 if multi_hop_join_candidate.lineage not in lineage_for_all_multi_hop_join_candidates:
@@ -359,6 +405,25 @@ class PreDimensionJoinNodeProcessor(Generic[SqlDataSetT]):
         A simple filter is to remove any nodes that don't share a common element with the query. Having a common element
         doesn't mean that the node will be useful, but not having common elements definitely means it's not useful.
         """
+        relevant_element_names = self.relevant_element_names(
+            desired_linkable_specs=desired_linkable_specs,
+            metric_time_dimension_reference=metric_time_dimension_reference,
+        )
+
+        relevant_nodes = []
+
+        for node in nodes:
+            if len(self._element_names(node).intersection(relevant_element_names)) > 0:
+                relevant_nodes.append(node)
+
+        return relevant_nodes
+
+    @staticmethod
+    def relevant_element_names(
+        desired_linkable_specs: Sequence[LinkableInstanceSpec],
+        metric_time_dimension_reference: TimeDimensionReference,
+    ) -> Set[str]:
+        """Returns the element names that a node needs to contain one of to be useful for joins."""
         relevant_element_names = {x.element_name for x in desired_linkable_specs}.union(
             {y.element_name for x in desired_linkable_specs for y in x.identifier_links}
         )
@@ -380,14 +445,10 @@ class PreDimensionJoinNodeProcessor(Generic[SqlDataSetT]):
             relevant_element_names.remove(metric_time_dimension_reference.element_name)
 
         logger.info(f"Relevant names are: {relevant_element_names}")
+        return relevant_element_names
 
-        relevant_nodes = []
-
-        for node in nodes:
-            data_set = self._node_data_set_resolver.get_output_data_set(node)
-            element_names_in_data_set = ToElementNameSet().transform(data_set.instance_set.spec_set)
-
-            if len(element_names_in_data_set.intersection(relevant_element_names)) > 0:
-                relevant_nodes.append(node)
-
-        return relevant_nodes
+    def _element_names(self, node: BaseOutput[SqlDataSetT]) -> FrozenSet[str]:
+        if self._source_node_index is not None:
+            return self._source_node_index.element_names(node)
+        data_set = self._node_data_set_resolver.get_output_data_set(node)
+        return frozenset(ToElementNameSet().transform(data_set.instance_set.spec_set))
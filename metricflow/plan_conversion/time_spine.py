@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import datetime
 import logging
+import math
+import textwrap
 import threading
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Optional, Tuple
 
 import pandas as pd
 
-from metricflow.protocols.sql_client import SqlClient
+from metricflow.object_utils import assert_values_exhausted
+from metricflow.protocols.sql_client import SqlClient, SqlEngine, SqlEngineAttributes
 from metricflow.constraints.time_constraint import TimeRangeConstraint
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.time.time_constants import ISO8601_PYTHON_FORMAT
@@ -27,12 +30,141 @@ class TimeSpineSource:
     time_column_name: str = "ds"
     # The time granularity of the dates in the spine table.
     time_column_granularity: TimeGranularity = TimeGranularity.DAY
+    # The range of dates to include when creating the spine table. Defaults to the range of all supported times.
+    start_time: Optional[datetime.datetime] = None
+    end_time: Optional[datetime.datetime] = None
 
     @property
     def spine_table(self) -> SqlTable:
         """Table containing all dates"""
         return SqlTable(schema_name=self.schema_name, table_name=self.table_name)
 
+    @property
+    def spine_range(self) -> Tuple[datetime.datetime, int]:
+        """Returns the first time in the spine and the number of rows, with one row for each granularity period.
+
+        The first time is adjusted to the start of the period that contains the configured start time.
+        """
+        start_time = pd.Timestamp(self.start_time or TimeRangeConstraint.ALL_TIME_BEGIN()).normalize()
+        end_time = pd.Timestamp(self.end_time or TimeRangeConstraint.ALL_TIME_END()).normalize()
+        granularity = self.time_column_granularity
+        if granularity is not TimeGranularity.DAY:
+            start_time = granularity.adjust_to_start_of_period(start_time)
+        if end_time < start_time:
+            raise ValueError(f"The end of the time spine range ({end_time}) is before the start ({start_time})")
+
+        num_months = (end_time.year - start_time.year) * 12 + end_time.month - start_time.month
+        if granularity is TimeGranularity.DAY:
+            num_periods = (end_time - start_time).days
+        elif granularity is TimeGranularity.WEEK:
+            num_periods = (end_time - start_time).days // 7
+        elif granularity is TimeGranularity.MONTH:
+            num_periods = num_months
+        elif granularity is TimeGranularity.QUARTER:
+            num_periods = num_months // 3
+        elif granularity is TimeGranularity.YEAR:
+            num_periods = end_time.year - start_time.year
+        else:
+            assert_values_exhausted(granularity)
+        return start_time.to_pydatetime(), num_periods + 1
+
+
+def _granularity_interval(granularity: TimeGranularity) -> Tuple[int, str]:
+    """Returns the step between rows in a spine with the given granularity as a count and a unit (DAY/MONTH/YEAR)."""
+    if granularity is TimeGranularity.DAY:
+        return 1, "DAY"
+    elif granularity is TimeGranularity.WEEK:
+        return 7, "DAY"
+    elif granularity is TimeGranularity.MONTH:
+        return 1, "MONTH"
+    elif granularity is TimeGranularity.QUARTER:
+        return 3, "MONTH"
+    elif granularity is TimeGranularity.YEAR:
+        return 1, "YEAR"
+    else:
+        assert_values_exhausted(granularity)
+
+
+def time_spine_select_sql(sql_engine_attributes: SqlEngineAttributes, time_spine_source: TimeSpineSource) -> str:
+    """Returns a SELECT that generates the rows of the time spine in the warehouse.
+
+    Engines with a function for generating a series of values use it. Otherwise, a recursive CTE is used.
+    """
+    start_time, num_rows = time_spine_source.spine_range
+    step_count, step_unit = _granularity_interval(time_spine_source.time_column_granularity)
+    last_time = pd.Timestamp(start_time) + time_spine_source.time_column_granularity.offset_period * (num_rows - 1)
+    start = start_time.strftime(ISO8601_PYTHON_FORMAT)
+    end = last_time.strftime(ISO8601_PYTHON_FORMAT)
+    column_name = time_spine_source.time_column_name
+    sql_engine_type = sql_engine_attributes.sql_engine_type
+
+    if sql_engine_type in (SqlEngine.POSTGRES, SqlEngine.GREENPLUM, SqlEngine.DUCKDB):
+        return (
+            f"SELECT CAST(ts AS TIMESTAMP) AS {column_name} FROM generate_series("
+            f"CAST('{start}' AS TIMESTAMP), CAST('{end}' AS TIMESTAMP), INTERVAL '{step_count} {step_unit}'"
+            f") AS spine(ts)"
+        )
+    elif sql_engine_type is SqlEngine.SNOWFLAKE:
+        # SEQ4() can have gaps, so ROW_NUMBER() is used for the offsets.
+        return (
+            f"SELECT DATEADD({step_unit}, {step_count} * i, CAST('{start}' AS TIMESTAMP_NTZ)) AS {column_name} "
+            f"FROM (SELECT ROW_NUMBER() OVER (ORDER BY SEQ4()) - 1 AS i FROM TABLE(GENERATOR(ROWCOUNT => {num_rows})))"
+        )
+    elif sql_engine_type is SqlEngine.BIGQUERY:
+        return (
+            f"SELECT CAST(d AS DATETIME) AS {column_name} "
+            f"FROM UNNEST(GENERATE_DATE_ARRAY('{start}', '{end}', INTERVAL {step_count} {step_unit})) AS d"
+        )
+    elif sql_engine_type is SqlEngine.CLICKHOUSE:
+        # DateTime64 is used as DateTime can't represent times before 1970.
+        add_function = {"DAY": "addDays", "MONTH": "addMonths", "YEAR": "addYears"}[step_unit]
+        return (
+            f"SELECT {add_function}(toDateTime64('{start} 00:00:00', 0), {step_count} * number) AS {column_name} "
+            f"FROM numbers({num_rows})"
+        )
+    elif sql_engine_type is SqlEngine.DATABRICKS:
+        return (
+            f"SELECT CAST(d AS TIMESTAMP) AS {column_name} "
+            f"FROM (SELECT explode(sequence(DATE'{start}', DATE'{end}', INTERVAL {step_count} {step_unit})) AS d)"
+        )
+    elif sql_engine_type is SqlEngine.TRINO:
+        # sequence() is limited to 10,000 elements, so offsets are generated by crossing two smaller sequences.
+        side = max(math.ceil(math.sqrt(num_rows)), 1)
+        return (
+            f"SELECT date_add('{step_unit.lower()}', {step_count} * (a.i * {side} + b.j), TIMESTAMP '{start} 00:00:00') "
+            f"AS {column_name} "
+            f"FROM UNNEST(sequence(0, {side - 1})) AS a(i) CROSS JOIN UNNEST(sequence(0, {side - 1})) AS b(j) "
+            f"WHERE a.i * {side} + b.j < {num_rows}"
+        )
+    elif sql_engine_type is SqlEngine.SQLITE:
+        # Matches the format that SQLAlchemy uses for storing datetimes in SQLite.
+        return textwrap.dedent(
+            f"""\
+            WITH RECURSIVE spine({column_name}) AS (
+              SELECT '{start} 00:00:00.000000'
+              UNION ALL
+              SELECT strftime('%Y-%m-%d %H:%M:%S', {column_name}, '+{step_count} {step_unit.lower()}') || '.000000'
+              FROM spine
+              WHERE {column_name} < '{end} 00:00:00.000000'
+            )
+            SELECT {column_name} FROM spine
+            """
+        )
+    else:
+        timestamp_type_name = sql_engine_attributes.timestamp_type_name or "TIMESTAMP"
+        return textwrap.dedent(
+            f"""\
+            WITH RECURSIVE spine ({column_name}) AS (
+              SELECT CAST('{start} 00:00:00' AS {timestamp_type_name})
+              UNION ALL
+              SELECT CAST({column_name} + INTERVAL '{step_count}' {step_unit} AS {timestamp_type_name})
+              FROM spine
+              WHERE {column_name} < CAST('{end} 00:00:00' AS {timestamp_type_name})
+            )
+            SELECT {column_name} FROM spine
+            """
+        )
+
 
 class TimeSpineTableBuilder:
     """Helps to build the time spine table based on the definition in a TimeSpineSource."""
@@ -66,44 +198,48 @@ class TimeSpineTableBuilder:
                 self._verified_spine_table_exists = True
                 return
             logger.info(f"Spine table {spine_table.sql} does not exist")
-            start_date = TimeRangeConstraint.ALL_TIME_BEGIN()
-            end_date = TimeRangeConstraint.ALL_TIME_END()
-
-            current_date = start_date
-            # Using a union type throws a type error for some reason, so going with this approach
-            date_spine_table_datetime_data: List[Tuple[datetime.datetime]] = []
-            date_spine_table_str_data: List[Tuple[str]] = []
-
-            if self.time_spine_source.time_column_granularity != TimeGranularity.DAY:
-                raise RuntimeError(
-                    f"A time spine source with a granularity {self.time_spine_source.time_column_granularity} is not "
-                    f"yet supported."
-                )
-
-            if self._sql_client.sql_engine_attributes.timestamp_type_supported:
-                while current_date <= end_date:
-                    date_spine_table_datetime_data.append((current_date,))
-                    current_date = current_date + datetime.timedelta(days=1)
-            else:
-                while current_date <= end_date:
-                    date_spine_table_str_data.append((current_date.strftime(ISO8601_PYTHON_FORMAT),))
-                    current_date = current_date + datetime.timedelta(days=1)
 
             self._sql_client.drop_table(spine_table)
-            num_rows = (
-                len(date_spine_table_datetime_data)
-                if date_spine_table_datetime_data
-                else len(date_spine_table_str_data)
-            )
-
-            logger.info(f"Creating date spine table {spine_table.sql} with {num_rows} rows")
-            self._sql_client.create_table_from_dataframe(
-                sql_table=spine_table,
-                df=pd.DataFrame(
-                    columns=[self._time_spine_source.time_column_name],
-                    data=date_spine_table_datetime_data or date_spine_table_str_data,
-                ),
-                chunk_size=1000,
-            )
+            try:
+                self._create_in_warehouse()
+            except Exception:
+                logger.warning(
+                    f"Unable to generate the spine table {spine_table.sql} in the warehouse. Creating it from a "
+                    f"dataframe instead.",
+                    exc_info=True,
+                )
+                self._sql_client.drop_table(spine_table)
+                self._create_from_dataframe()
             logger.info(f"Created date spine table {spine_table.sql}")
             self._verified_spine_table_exists = True
+
+    def _create_in_warehouse(self) -> None:
+        """Create the spine table with a query that generates the rows, so that they don't need to be uploaded."""
+        spine_table = self.time_spine_source.spine_table
+        _, num_rows = self.time_spine_source.spine_range
+        logger.info(f"Generating date spine table {spine_table.sql} with {num_rows} rows in the warehouse")
+        self._sql_client.create_table_as_select(
+            sql_table=spine_table,
+            select_query=time_spine_select_sql(
+                sql_engine_attributes=self._sql_client.sql_engine_attributes,
+                time_spine_source=self.time_spine_source,
+            ),
+        )
+
+    def _create_from_dataframe(self) -> None:
+        spine_table = self.time_spine_source.spine_table
+        start_time, num_rows = self.time_spine_source.spine_range
+        spine_times = pd.date_range(
+            start=start_time, periods=num_rows, freq=self.time_spine_source.time_column_granularity.offset_period
+        )
+        if self._sql_client.sql_engine_attributes.timestamp_type_supported:
+            data = [(spine_time.to_pydatetime(),) for spine_time in spine_times]
+        else:
+            data = [(spine_time.strftime(ISO8601_PYTHON_FORMAT),) for spine_time in spine_times]
+
+        logger.info(f"Creating date spine table {spine_table.sql} with {num_rows} rows")
+        self._sql_client.create_table_from_dataframe(
+            sql_table=spine_table,
+            df=pd.DataFrame(columns=[self._time_spine_source.time_column_name], data=data),
+            chunk_size=1000,
+        )
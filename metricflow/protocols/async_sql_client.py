@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import Protocol, Sequence, Optional, Callable
+from typing import TYPE_CHECKING, Protocol, Sequence, Optional, Callable, Iterator
+
+from pandas import DataFrame
 
 from metricflow.protocols.sql_client import SqlClient, SqlIsolationLevel
 from metricflow.protocols.sql_request import SqlRequestId, SqlRequestResult, SqlJsonTag
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.sql_clients.async_request import CombinedSqlTags
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# The default number of rows in each chunk returned by AsyncSqlClient.query_chunks().
+DEFAULT_QUERY_CHUNK_SIZE = 100000
+
 
 class AsyncSqlClient(SqlClient, Protocol):
     """Defines methods for executing SQL statements asynchronously."""
@@ -27,6 +35,16 @@ class AsyncSqlClient(SqlClient, Protocol):
         """Wait until a async query has finished, and then return the result"""
         raise NotImplementedError
 
+    @abstractmethod
+    def add_done_callback(self, request_id: SqlRequestId, callback: Callable[[SqlRequestId], None]) -> None:
+        """Call the function with the request ID once the request has finished.
+
+        The function is called from the thread that ran the request, or right away if the request has already finished.
+        Once called, async_request_result() returns without waiting, so this can be used to wait for requests without
+        blocking a thread (e.g. from an event loop).
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def async_execute(
         self,
@@ -38,6 +56,36 @@ class AsyncSqlClient(SqlClient, Protocol):
         """Execute a statement that does not return values asynchronously."""
         raise NotImplementedError
 
+    @abstractmethod
+    def query_chunks(
+        self,
+        statement: str,
+        bind_parameters: SqlBindParameters = SqlBindParameters(),
+        chunk_size: int = DEFAULT_QUERY_CHUNK_SIZE,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+    ) -> Iterator[DataFrame]:
+        """Run a query, returning the results as a series of dataframes with up to chunk_size rows each.
+
+        Where the engine supports it, rows are fetched from the engine as the chunks are consumed, so the full result
+        is never held in memory at once. The query is run when the first chunk is requested, and a query that returns
+        no rows produces a single empty dataframe with the result columns.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def query_arrow(
+        self,
+        statement: str,
+        bind_parameters: SqlBindParameters = SqlBindParameters(),
+        isolation_level: Optional[SqlIsolationLevel] = None,
+    ) -> pa.Table:
+        """Run a query, returning the results as an Arrow table. This requires pyarrow to be installed.
+
+        Engines with a native Arrow fetch path return the table without going through row objects. For other engines,
+        the table is converted from the dataframe that query() would return.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def cancel_request(self, match_function: Callable[[CombinedSqlTags], bool]) -> int:
         """Make a best-effort at canceling requests with tags that match the supplied function.
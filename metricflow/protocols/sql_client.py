@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from enum import Enum
-from typing import ClassVar, Dict, Optional, Protocol, Sequence
+from typing import ClassVar, Dict, Optional, Protocol, Sequence, Tuple
 
 from pandas import DataFrame
 
@@ -59,6 +59,16 @@ class SqlClient(Protocol):
         """
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def connection_identity(self) -> str:
+        """Return a description of the warehouse, database and user that the client connects to.
+
+        This is used to tell apart results from different connections (e.g. in the result cache), so it must not
+        include passwords or other credentials.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def create_table_as_select(
         self,
@@ -109,6 +119,17 @@ class SqlClient(Protocol):
         """Base execute method."""
         raise NotImplementedError
 
+    @abstractmethod
+    def execute_in_transaction(self, statements: Sequence[Tuple[str, SqlBindParameters]]) -> None:
+        """Execute the statements in a single transaction, so that either all or none of their changes are applied.
+
+        Only supported when sql_engine_attributes.transactions_supported is set.
+
+        Args:
+            statements: The statements to execute, with the parameters for each statement.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def dry_run(
         self,
@@ -206,10 +227,14 @@ class SqlEngineAttributes(Protocol):
     discrete_percentile_aggregation_supported: ClassVar[bool]
     approximate_continuous_percentile_aggregation_supported: ClassVar[bool]
     approximate_discrete_percentile_aggregation_supported: ClassVar[bool]
+    materialized_ctes_supported: ClassVar[bool]
+    transactions_supported: ClassVar[bool]
 
     # SQL Dialect replacement strings
     double_data_type_name: ClassVar[str]
     timestamp_type_name: ClassVar[Optional[str]]
+    # The type for casting values of any type to strings.
+    string_data_type_name: ClassVar[str]
     random_function_name: ClassVar[str]
 
     # MetricFlow attributes
@@ -6,7 +6,7 @@ from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 from operator import itemgetter
-from typing import Optional, Sequence, Dict, Any
+from typing import TYPE_CHECKING, Optional, Sequence, Dict, Any
 
 import pandas as pd
 from pydantic import Field
@@ -14,6 +14,8 @@ from pydantic import Field
 from metricflow.model.objects.base import FrozenBaseModel
 from metricflow.object_utils import assert_exactly_one_arg_set
 
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +36,8 @@ class SqlRequestResult:
 
     df: Optional[pd.DataFrame] = None
     exception: Optional[Exception] = None
+    # If the result was fetched in Arrow format, the table that df was converted from.
+    arrow_table: Optional[pa.Table] = None
 
     def __post_init__(self) -> None:  # noqa: D
         assert_exactly_one_arg_set(df=self.df, exception=self.exception)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from metricflow.specs import (
+    DimensionSpec,
+    IdentifierSpec,
+    InstanceSpec,
+    InstanceSpecSet,
+    LinkableInstanceSpec,
+    LinkableSpecSet,
+    MeasureSpec,
+    MetadataSpec,
+    MetricSpec,
+    TimeDimensionSpec,
+)
+
+
+class SpecRegistry:
+    """Assigns a dense integer ID to each spec so that collections of specs can be represented as bitsets.
+
+    Hashing and comparing specs is relatively expensive as the identifier links are included, so during planning, it's
+    faster to look up the ID of a spec once and then use integer operations for set algebra. IDs are assigned in the
+    order that specs are registered, and are never reused.
+    """
+
+    def __init__(self) -> None:  # noqa: D
+        self._spec_to_id: Dict[InstanceSpec, int] = {}
+        self._id_to_spec: List[InstanceSpec] = []
+        self._lock = threading.Lock()
+
+    def id_of(self, spec: InstanceSpec) -> int:
+        """Returns the ID of the spec, registering it if it hasn't been seen before."""
+        spec_id = self._spec_to_id.get(spec)
+        if spec_id is not None:
+            return spec_id
+        with self._lock:
+            spec_id = self._spec_to_id.get(spec)
+            if spec_id is None:
+                spec_id = len(self._id_to_spec)
+                self._id_to_spec.append(spec)
+                self._spec_to_id[spec] = spec_id
+            return spec_id
+
+    def find_id(self, spec: InstanceSpec) -> Optional[int]:
+        """Returns the ID of the spec, or None if it hasn't been registered."""
+        return self._spec_to_id.get(spec)
+
+    def spec_for_id(self, spec_id: int) -> InstanceSpec:  # noqa: D
+        return self._id_to_spec[spec_id]
+
+    def bitset(self, specs: Iterable[InstanceSpec]) -> SpecBitSet:
+        """Returns a bitset containing the given specs, registering any that haven't been seen before."""
+        bits = 0
+        for spec in specs:
+            bits |= 1 << self.id_of(spec)
+        return SpecBitSet(registry=self, bits=bits)
+
+    def empty_bitset(self) -> SpecBitSet:  # noqa: D
+        return SpecBitSet(registry=self, bits=0)
+
+    def __len__(self) -> int:  # noqa: D
+        return len(self._id_to_spec)
+
+
+@dataclass(frozen=True)
+class SpecBitSet:
+    """An immutable set of specs from a SpecRegistry, where bit N is set if the spec with ID N is in the set.
+
+    Iteration returns the specs in the order of their IDs.
+    """
+
+    registry: SpecRegistry
+    bits: int
+
+    def _check_registry(self, other: SpecBitSet) -> None:
+        if other.registry is not self.registry:
+            raise ValueError("Can't combine bitsets from different spec registries")
+
+    def contains_id(self, spec_id: int) -> bool:
+        """Returns true if the spec with the given ID is in this set.
+
+        Membership is tested on IDs rather than specs so that callers can look up the ID of a spec once and reuse it
+        across many sets instead of hashing the spec for each check.
+        """
+        return (self.bits >> spec_id) & 1 == 1
+
+    def __or__(self, other: SpecBitSet) -> SpecBitSet:  # noqa: D
+        self._check_registry(other)
+        return SpecBitSet(registry=self.registry, bits=self.bits | other.bits)
+
+    def __and__(self, other: SpecBitSet) -> SpecBitSet:  # noqa: D
+        self._check_registry(other)
+        return SpecBitSet(registry=self.registry, bits=self.bits & other.bits)
+
+    def __sub__(self, other: SpecBitSet) -> SpecBitSet:  # noqa: D
+        self._check_registry(other)
+        return SpecBitSet(registry=self.registry, bits=self.bits & ~other.bits)
+
+    def is_subset_of(self, other: SpecBitSet) -> bool:  # noqa: D
+        self._check_registry(other)
+        return self.bits & ~other.bits == 0
+
+    def __len__(self) -> int:  # noqa: D
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:  # noqa: D
+        return self.bits != 0
+
+    def _ids(self) -> Iterator[int]:
+        bits = self.bits
+        while bits:
+            lowest_bit = bits & -bits
+            yield lowest_bit.bit_length() - 1
+            bits ^= lowest_bit
+
+    def __iter__(self) -> Iterator[InstanceSpec]:  # noqa: D
+        return (self.registry.spec_for_id(spec_id) for spec_id in self._ids())
+
+    @property
+    def specs(self) -> Tuple[InstanceSpec, ...]:  # noqa: D
+        return tuple(self)
+
+    @property
+    def as_instance_spec_set(self) -> InstanceSpecSet:
+        """Groups the specs in this set by type."""
+        metric_specs: List[MetricSpec] = []
+        measure_specs: List[MeasureSpec] = []
+        dimension_specs: List[DimensionSpec] = []
+        identifier_specs: List[IdentifierSpec] = []
+        time_dimension_specs: List[TimeDimensionSpec] = []
+        metadata_specs: List[MetadataSpec] = []
+
+        for spec in self:
+            # TimeDimensionSpec is a subclass of DimensionSpec, so it needs to be checked first.
+            if isinstance(spec, TimeDimensionSpec):
+                time_dimension_specs.append(spec)
+            elif isinstance(spec, DimensionSpec):
+                dimension_specs.append(spec)
+            elif isinstance(spec, IdentifierSpec):
+                identifier_specs.append(spec)
+            elif isinstance(spec, MeasureSpec):
+                measure_specs.append(spec)
+            elif isinstance(spec, MetricSpec):
+                metric_specs.append(spec)
+            elif isinstance(spec, MetadataSpec):
+                metadata_specs.append(spec)
+            else:
+                raise RuntimeError(f"Unhandled spec type: {spec}")
+
+        return InstanceSpecSet(
+            metric_specs=tuple(metric_specs),
+            measure_specs=tuple(measure_specs),
+            dimension_specs=tuple(dimension_specs),
+            identifier_specs=tuple(identifier_specs),
+            time_dimension_specs=tuple(time_dimension_specs),
+            metadata_specs=tuple(metadata_specs),
+        )
+
+    @property
+    def as_linkable_spec_set(self) -> LinkableSpecSet:
+        """Returns the linkable specs in this set."""
+        instance_spec_set = self.as_instance_spec_set
+        return LinkableSpecSet(
+            dimension_specs=instance_spec_set.dimension_specs,
+            time_dimension_specs=instance_spec_set.time_dimension_specs,
+            identifier_specs=instance_spec_set.identifier_specs,
+        )
+
+    @property
+    def linkable_specs(self) -> Tuple[LinkableInstanceSpec, ...]:  # noqa: D
+        return tuple(spec for spec in self if isinstance(spec, LinkableInstanceSpec))
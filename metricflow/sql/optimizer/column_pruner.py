@@ -9,6 +9,7 @@ from metricflow.sql.sql_exprs import (
     SqlExpressionTreeLineage,
 )
 from metricflow.sql.sql_plan import (
+    SqlCteReferenceNode,
     SqlQueryPlanNode,
     SqlQueryPlanNodeVisitor,
     SqlTableFromClauseNode,
@@ -194,6 +195,10 @@ class SqlColumnPrunerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
         """Pruning cannot be done here since this is an arbitrary user-provided SQL query."""
         return node
 
+    def visit_cte_reference_node(self, node: SqlCteReferenceNode) -> SqlQueryPlanNode:  # noqa: D
+        """Pruning cannot be done here since the CTE is defined elsewhere."""
+        return node
+
 
 class SqlColumnPrunerOptimizer(SqlQueryPlanOptimizer):
     """Removes unnecessary columns in the SELECT clauses."""
@@ -0,0 +1,256 @@
+import itertools
+import logging
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from metricflow.dag.mf_dag import NodeId
+from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlQueryPlanOptimizer
+from metricflow.sql.render.expr_renderer import DefaultSqlExpressionRenderer
+from metricflow.sql.sql_exprs import SqlExpressionNode
+from metricflow.sql.sql_plan import (
+    SqlCteDescription,
+    SqlCteReferenceNode,
+    SqlJoinDescription,
+    SqlQueryPlanNode,
+    SqlQueryPlanNodeVisitor,
+    SqlSelectQueryFromClauseNode,
+    SqlSelectStatementNode,
+    SqlTableFromClauseNode,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SqlSubQueryGroupingVisitor(SqlQueryPlanNodeVisitor[Hashable]):
+    """Groups select statements in the plan that are structurally identical.
+
+    Each node is mapped to a hashable key that identifies the output of the node. For select statements, the key
+    includes the keys of the sources, so the keys of all nodes in the plan are computed in a single pass. Expressions
+    are compared using the types of the expression nodes and the rendered SQL, so expressions that are built
+    differently but render to the same SQL (e.g. a string expression and the equivalent column reference) are not
+    considered identical.
+
+    Table aliases are part of the key, so statements that only differ in the aliases of their sources are not grouped.
+    The alias of the statement itself is set by the parent, so it's not part of the key.
+    """
+
+    def __init__(self) -> None:  # noqa: D
+        self._expr_renderer = DefaultSqlExpressionRenderer()
+        self._key_for_node_id: Dict[NodeId, Hashable] = {}
+        self._representative_for_hash: Dict[Hashable, SqlSelectStatementNode] = {}
+        self._representative_for_node_id: Dict[NodeId, SqlSelectStatementNode] = {}
+
+    def representative(self, node: SqlSelectStatementNode) -> SqlSelectStatementNode:
+        """Return the first visited statement that is identical to the given one."""
+        if node.node_id not in self._representative_for_node_id:
+            node.accept(self)
+        return self._representative_for_node_id[node.node_id]
+
+    @staticmethod
+    def _expr_types(expr: SqlExpressionNode) -> Tuple[str, ...]:
+        """Return the types of the nodes in the expression, in depth-first order."""
+        return (expr.__class__.__name__,) + tuple(
+            itertools.chain.from_iterable(SqlSubQueryGroupingVisitor._expr_types(x) for x in expr.parent_nodes)
+        )
+
+    def _expr_key(self, expr: Optional[SqlExpressionNode]) -> Hashable:
+        if expr is None:
+            return None
+        render_result = self._expr_renderer.render_sql_expr(expr)
+        return self._expr_types(expr), render_result.sql, render_result.execution_parameters.param_items
+
+    def _statement_hash(self, node: SqlSelectStatementNode) -> Hashable:
+        # Statements that already define CTEs are not grouped since the CTE aliases are only valid within them.
+        if node.cte_descs:
+            return node.node_id
+        return (
+            tuple((self._expr_key(x.expr), x.column_alias) for x in node.select_columns),
+            node.from_source.accept(self),
+            node.from_source_alias,
+            tuple(
+                (x.right_source.accept(self), x.right_source_alias, x.join_type, self._expr_key(x.on_condition))
+                for x in node.join_descs
+            ),
+            tuple((self._expr_key(x.expr), x.column_alias) for x in node.group_bys),
+            self._expr_key(node.where),
+            tuple((self._expr_key(x.expr), x.desc) for x in node.order_bys),
+            node.limit,
+        )
+
+    def visit_select_statement_node(self, node: SqlSelectStatementNode) -> Hashable:  # noqa: D
+        if node.node_id in self._key_for_node_id:
+            return self._key_for_node_id[node.node_id]
+
+        statement_hash = self._statement_hash(node)
+        representative = self._representative_for_hash.setdefault(statement_hash, node)
+
+        key = ("select", representative.node_id)
+        self._key_for_node_id[node.node_id] = key
+        self._representative_for_node_id[node.node_id] = representative
+        return key
+
+    def visit_table_from_clause_node(self, node: SqlTableFromClauseNode) -> Hashable:  # noqa: D
+        return "table", node.sql_table.sql
+
+    def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> Hashable:  # noqa: D
+        return "query", node.select_query
+
+    def visit_cte_reference_node(self, node: SqlCteReferenceNode) -> Hashable:  # noqa: D
+        return "cte", node.cte_alias
+
+
+class SqlCteHoister(SqlQueryPlanOptimizer):
+    """Moves select statements that appear more than once in the plan into CTEs in the WITH clause of the root.
+
+    e.g. from
+
+    SELECT a.bookings, b.bookings_2_weeks_ago
+    FROM (
+      SELECT ds, SUM(bookings) AS bookings FROM fct_bookings GROUP BY ds
+    ) a
+    JOIN (
+      SELECT ds, SUM(bookings) AS bookings FROM fct_bookings GROUP BY ds
+    ) b
+    ON ...
+
+    to
+
+    WITH mf_cte_0 AS (
+      SELECT ds, SUM(bookings) AS bookings FROM fct_bookings GROUP BY ds
+    )
+    SELECT a.bookings, b.bookings_2_weeks_ago
+    FROM mf_cte_0 a
+    JOIN mf_cte_0 b
+    ON ...
+
+    This makes the SQL shorter, and engines that materialize CTEs only compute the statement once. Statements are only
+    counted outside of other repeated statements, so a statement that only appears within copies of a repeated
+    statement is not moved into its own CTE. CTEs are ordered so that a CTE is defined before the CTEs that use it.
+
+    This should be the last optimizer that is applied, as the other optimizers don't handle CTEs.
+    """
+
+    CTE_ALIAS_PREFIX = "mf_cte_"
+
+    def __init__(self, materialize_ctes: bool = False) -> None:
+        """Constructor.
+
+        Args:
+            materialize_ctes: Whether the CTEs should be marked to be materialized by the engine. This should only be
+            set for engines that support "AS MATERIALIZED".
+        """
+        self._materialize_ctes = materialize_ctes
+
+    @staticmethod
+    def _count_sub_queries(
+        node: SqlSelectStatementNode,
+        grouping_visitor: SqlSubQueryGroupingVisitor,
+        counts: Dict[NodeId, int],
+    ) -> None:
+        """Count how many times each group of identical statements is used as a source, starting from the node.
+
+        The sources of a repeated statement are only counted once, since the statement will be moved into a CTE.
+        """
+        sources = [node.from_source] + [x.right_source for x in node.join_descs]
+        for source in sources:
+            source_select_node = source.as_select_node
+            if source_select_node is None:
+                continue
+            representative = grouping_visitor.representative(source_select_node)
+            counts[representative.node_id] = counts.get(representative.node_id, 0) + 1
+            if counts[representative.node_id] == 1:
+                SqlCteHoister._count_sub_queries(source_select_node, grouping_visitor, counts)
+
+    def _replace_sources(
+        self,
+        node: SqlSelectStatementNode,
+        grouping_visitor: SqlSubQueryGroupingVisitor,
+        counts: Dict[NodeId, int],
+        cte_alias_for_node_id: Dict[NodeId, str],
+        cte_descs: List[SqlCteDescription],
+    ) -> SqlSelectStatementNode:
+        """Return the statement with repeated sources replaced by references to CTEs that are added to cte_descs."""
+
+        def _replace_source(source: SqlQueryPlanNode) -> SqlQueryPlanNode:
+            source_select_node = source.as_select_node
+            if source_select_node is None:
+                return source
+
+            representative = grouping_visitor.representative(source_select_node)
+            if counts.get(representative.node_id, 0) < 2:
+                return self._replace_sources(
+                    source_select_node, grouping_visitor, counts, cte_alias_for_node_id, cte_descs
+                )
+
+            if representative.node_id not in cte_alias_for_node_id:
+                # Replace the sources of the CTE first so that the CTEs that it uses are defined before it.
+                cte_select_statement = self._replace_sources(
+                    representative, grouping_visitor, counts, cte_alias_for_node_id, cte_descs
+                )
+                cte_alias = f"{SqlCteHoister.CTE_ALIAS_PREFIX}{len(cte_descs)}"
+                cte_descs.append(
+                    SqlCteDescription(
+                        cte_alias=cte_alias,
+                        select_statement=cte_select_statement,
+                        materialized=self._materialize_ctes,
+                    )
+                )
+                cte_alias_for_node_id[representative.node_id] = cte_alias
+            return SqlCteReferenceNode(cte_alias=cte_alias_for_node_id[representative.node_id])
+
+        from_source = _replace_source(node.from_source)
+        join_descs = tuple(
+            SqlJoinDescription(
+                right_source=_replace_source(x.right_source),
+                right_source_alias=x.right_source_alias,
+                join_type=x.join_type,
+                on_condition=x.on_condition,
+            )
+            for x in node.join_descs
+        )
+        if from_source is node.from_source and all(
+            x.right_source is y.right_source for x, y in zip(join_descs, node.join_descs)
+        ):
+            return node
+
+        return SqlSelectStatementNode(
+            description=node.description,
+            select_columns=node.select_columns,
+            from_source=from_source,
+            from_source_alias=node.from_source_alias,
+            joins_descs=join_descs,
+            group_bys=node.group_bys,
+            order_bys=node.order_bys,
+            where=node.where,
+            limit=node.limit,
+            cte_descs=node.cte_descs,
+        )
+
+    def optimize(self, node: SqlQueryPlanNode) -> SqlQueryPlanNode:  # noqa: D
+        select_node = node.as_select_node
+        if select_node is None or select_node.cte_descs:
+            return node
+
+        grouping_visitor = SqlSubQueryGroupingVisitor()
+        counts: Dict[NodeId, int] = {}
+        SqlCteHoister._count_sub_queries(select_node, grouping_visitor, counts)
+        if all(count < 2 for count in counts.values()):
+            return node
+
+        cte_descs: List[SqlCteDescription] = []
+        select_node = self._replace_sources(
+            select_node, grouping_visitor, counts, cte_alias_for_node_id={}, cte_descs=cte_descs
+        )
+        logger.info(f"Moved {len(cte_descs)} repeated sub-queries into CTEs")
+
+        return SqlSelectStatementNode(
+            description=select_node.description,
+            select_columns=select_node.select_columns,
+            from_source=select_node.from_source,
+            from_source_alias=select_node.from_source_alias,
+            joins_descs=select_node.join_descs,
+            group_bys=select_node.group_bys,
+            order_bys=select_node.order_bys,
+            where=select_node.where,
+            limit=select_node.limit,
+            cte_descs=tuple(cte_descs),
+        )
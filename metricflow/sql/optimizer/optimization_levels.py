@@ -2,6 +2,7 @@ from enum import Enum
 from typing import Sequence
 
 from metricflow.sql.optimizer.column_pruner import SqlColumnPrunerOptimizer
+from metricflow.sql.optimizer.cte_hoister import SqlCteHoister
 from metricflow.sql.optimizer.rewriting_sub_query_reducer import SqlRewritingSubQueryReducer
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlQueryPlanOptimizer
 from metricflow.sql.optimizer.sub_query_reducer import SqlSubQueryReducer
@@ -16,6 +17,8 @@ class SqlQueryOptimizationLevel(Enum):
     O2 = "O2"
     O3 = "O3"
     O4 = "O4"
+    # Same as O4, but repeated sub-queries are moved into CTEs.
+    O5 = "O5"
 
 
 class SqlQueryOptimizerConfiguration:
@@ -23,9 +26,13 @@ class SqlQueryOptimizerConfiguration:
 
     @staticmethod
     def optimizers_for_level(
-        level: SqlQueryOptimizationLevel, use_column_alias_in_group_by: bool
+        level: SqlQueryOptimizationLevel, use_column_alias_in_group_by: bool, materialize_ctes: bool = False
     ) -> Sequence[SqlQueryPlanOptimizer]:
-        """Return the optimizers that should be applied (in order) for each level"""
+        """Return the optimizers that should be applied (in order) for each level
+
+        materialize_ctes is only used by levels that create CTEs, and should be set if the engine supports materializing
+        them.
+        """
         if level is SqlQueryOptimizationLevel.O0:
             return ()
         elif level is SqlQueryOptimizationLevel.O1:
@@ -40,3 +47,10 @@ class SqlQueryOptimizerConfiguration:
                 SqlRewritingSubQueryReducer(use_column_alias_in_group_bys=use_column_alias_in_group_by),
                 SqlTableAliasSimplifier(),
             )
+        elif level is SqlQueryOptimizationLevel.O5:
+            return (
+                SqlColumnPrunerOptimizer(),
+                SqlRewritingSubQueryReducer(use_column_alias_in_group_bys=use_column_alias_in_group_by),
+                SqlTableAliasSimplifier(),
+                SqlCteHoister(materialize_ctes=materialize_ctes),
+            )
@@ -15,6 +15,7 @@ from metricflow.sql.sql_exprs import (
     SqlColumnAliasReferenceExpression,
 )
 from metricflow.sql.sql_plan import (
+    SqlCteReferenceNode,
     SqlQueryPlanNode,
     SqlQueryPlanNodeVisitor,
     SqlSelectQueryFromClauseNode,
@@ -651,6 +652,9 @@ class SqlRewritingSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNod
     def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
         return node
 
+    def visit_cte_reference_node(self, node: SqlCteReferenceNode) -> SqlQueryPlanNode:  # noqa: D
+        return node
+
 
 class SqlGroupByRewritingVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
     """Re-writes the GROUP BY to use a SqlColumnAliasReferenceExpression."""
@@ -708,6 +712,9 @@ class SqlGroupByRewritingVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
     def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
         return node
 
+    def visit_cte_reference_node(self, node: SqlCteReferenceNode) -> SqlQueryPlanNode:  # noqa: D
+        return node
+
 
 class SqlRewritingSubQueryReducer(SqlQueryPlanOptimizer):
     """Simplify queries by eliminating sub-queries when possible by rewriting expressions.
@@ -4,6 +4,7 @@ from typing import List, Optional
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlQueryPlanOptimizer
 from metricflow.sql.sql_exprs import SqlColumnReferenceExpression, SqlColumnReference
 from metricflow.sql.sql_plan import (
+    SqlCteReferenceNode,
     SqlQueryPlanNode,
     SqlQueryPlanNodeVisitor,
     SqlSelectQueryFromClauseNode,
@@ -186,6 +187,9 @@ class SqlSubQueryReducerVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
     def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
         return node
 
+    def visit_cte_reference_node(self, node: SqlCteReferenceNode) -> SqlQueryPlanNode:  # noqa: D
+        return node
+
 
 class SqlSubQueryReducer(SqlQueryPlanOptimizer):
     """Simplify queries by eliminating sub-queries when possible.
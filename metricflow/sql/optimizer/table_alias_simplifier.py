@@ -2,6 +2,7 @@ import logging
 
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlQueryPlanOptimizer
 from metricflow.sql.sql_plan import (
+    SqlCteReferenceNode,
     SqlQueryPlanNode,
     SqlQueryPlanNodeVisitor,
     SqlSelectQueryFromClauseNode,
@@ -70,6 +71,9 @@ class SqlTableAliasSimplifierVisitor(SqlQueryPlanNodeVisitor[SqlQueryPlanNode]):
     def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> SqlQueryPlanNode:  # noqa: D
         return node
 
+    def visit_cte_reference_node(self, node: SqlCteReferenceNode) -> SqlQueryPlanNode:  # noqa: D
+        return node
+
 
 class SqlTableAliasSimplifier(SqlQueryPlanOptimizer):
     """Simplify queries by eliminating table aliases when possible.
@@ -3,16 +3,19 @@ from __future__ import annotations
 import logging
 import textwrap
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Sequence
+from typing import Iterator, List, Optional, Tuple, Sequence
 
 from metricflow.sql.render.expr_renderer import (
     DefaultSqlExpressionRenderer,
     SqlExpressionRenderer,
     SqlExpressionRenderResult,
 )
-from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.sql.sql_bind_parameters import SqlBindParameters, SqlBindParametersBuilder
 from metricflow.sql.sql_plan import (
+    SqlCteDescription,
+    SqlCteReferenceNode,
     SqlQueryPlanNodeVisitor,
     SqlTableFromClauseNode,
     SqlSelectStatementNode,
@@ -21,7 +24,9 @@ from metricflow.sql.sql_plan import (
     SqlSelectQueryFromClauseNode,
     SqlSelectColumn,
     SqlJoinDescription,
+    SqlOrderByDescription,
 )
+from metricflow.sql.sql_exprs import SqlExpressionNode
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +65,39 @@ class StringJoinDescription:
     on_condition_str: str
 
 
+class SqlRenderBuffer:
+    """Indentation-aware buffer that the SQL for a plan is written to in a single pass.
+
+    Text is indented by the current depth following the same rules as textwrap.indent() (lines that only have
+    whitespace are not indented), so the output is the same as rendering each subquery to a string and indenting that
+    string at every level of nesting. As each piece of text is indented only once, rendering takes time linear in the
+    size of the output instead of growing with the depth of the subqueries.
+    """
+
+    def __init__(self, indent: str) -> None:  # noqa: D
+        self._indent = indent
+        self._prefix = ""
+        self._lines: List[str] = []
+
+    def write(self, text: str) -> None:
+        """Write the text on new line(s) at the current indentation."""
+        self._lines.append(textwrap.indent(text, prefix=self._prefix) if self._prefix else text)
+
+    @contextmanager
+    def indented(self) -> Iterator[None]:
+        """Indent the text written in this context by one more level."""
+        previous_prefix = self._prefix
+        self._prefix = previous_prefix + self._indent
+        try:
+            yield
+        finally:
+            self._prefix = previous_prefix
+
+    def getvalue(self) -> str:
+        """Return the text written to the buffer."""
+        return "\n".join(self._lines)
+
+
 class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
     """Renders an SQL plan following ANSI SQL"""
 
@@ -68,6 +106,24 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
     # The amount to indent when formatting SQL
     INDENT = "  "
 
+    def __init__(self, use_render_buffer: bool = True) -> None:
+        """Constructor.
+
+        Args:
+            use_render_buffer: If set, the plan is written into a single SqlRenderBuffer and the bind parameters are
+            collected in a single SqlBindParametersBuilder. Otherwise, each node is rendered to a string that is
+            indented and included in the string for the parent node. Both produce the same SQL.
+        """
+        self._use_render_buffer = use_render_buffer
+
+    def render_sql_query_plan(self, sql_query_plan: SqlQueryPlan) -> SqlPlanRenderResult:  # noqa: D
+        if not self._use_render_buffer:
+            return super().render_sql_query_plan(sql_query_plan)
+
+        writer = _SqlPlanBufferWriter(self)
+        sql_query_plan.render_node.accept(writer)
+        return SqlPlanRenderResult(sql=writer.buffer.getvalue(), execution_parameters=writer.params.build())
+
     def _render_select_columns_section(
         self,
         select_columns: Sequence[SqlSelectColumn],
@@ -209,15 +265,172 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
 
         return "\n".join(group_by_section_lines), params
 
+    def _render_cte_header(self, cte_desc: SqlCteDescription, first: bool) -> str:
+        """Return the line that starts the definition of the CTE e.g. 'WITH cte_0 AS (' or ', cte_1 AS ('."""
+        return (
+            f"{'WITH' if first else ','} {cte_desc.cte_alias} AS {'MATERIALIZED ' if cte_desc.materialized else ''}("
+        )
+
+    def _render_cte_section(self, cte_descs: Sequence[SqlCteDescription]) -> Tuple[str, SqlBindParameters]:
+        """Convert the CTE descriptions into a "WITH" section.
+
+        e.g.
+        WITH cte_0 AS (
+          SELECT
+            1 AS bookings
+            ...
+        )
+        , cte_1 AS (
+          ...
+        )
+
+        Returns a tuple of the "WITH" section as a string and the associated execution parameters.
+        """
+        params = SqlBindParameters()
+        cte_section_lines = []
+        for i, cte_desc in enumerate(cte_descs):
+            cte_render_result = self._render_node(cte_desc.select_statement)
+            params = params.combine(cte_render_result.execution_parameters)
+            cte_section_lines.append(self._render_cte_header(cte_desc, first=i == 0))
+            cte_section_lines.append(textwrap.indent(cte_render_result.sql, prefix=self.INDENT))
+            cte_section_lines.append(")")
+
+        return "\n".join(cte_section_lines), params
+
+    def _render_description_section(self, description: str) -> str:
+        """Convert the description of the node into SQL comments."""
+        return "\n".join([f"-- {x}" for x in description.split("\n")])
+
+    def _render_where_section(self, where: Optional[SqlExpressionNode]) -> Tuple[Optional[str], SqlBindParameters]:
+        """Convert the where expression into a "WHERE" section, or None if there isn't one."""
+        if not where:
+            return None, SqlBindParameters()
+        where_render_result = self.EXPR_RENDERER.render_sql_expr(where)
+        return f"WHERE {where_render_result.sql}", where_render_result.execution_parameters
+
+    def _render_order_by_section(
+        self, order_bys: Sequence[SqlOrderByDescription]
+    ) -> Tuple[Optional[str], SqlBindParameters]:
+        """Convert the order by descriptions into an "ORDER BY" section, or None if there isn't one."""
+        if not order_bys:
+            return None, SqlBindParameters()
+        params = SqlBindParameters()
+        order_by_items: List[str] = []
+        for order_by in order_bys:
+            order_by_render_result = self.EXPR_RENDERER.render_sql_expr(order_by.expr)
+            order_by_items.append(order_by_render_result.sql + (" DESC" if order_by.desc else ""))
+            params = params.combine(order_by_render_result.execution_parameters)
+
+        return "ORDER BY " + ", ".join(order_by_items), params
+
+    def _render_limit_section(self, limit: Optional[int]) -> Optional[str]:
+        """Convert the limit into a "LIMIT" section, or None if there isn't one."""
+        if not limit:
+            return None
+        return f"LIMIT {limit}"
+
+    def _write_cte_section(self, cte_descs: Sequence[SqlCteDescription], writer: _SqlPlanBufferWriter) -> None:
+        """Write the "WITH" section in the same format as _render_cte_section()."""
+        for i, cte_desc in enumerate(cte_descs):
+            writer.buffer.write(self._render_cte_header(cte_desc, first=i == 0))
+            with writer.buffer.indented():
+                cte_desc.select_statement.accept(writer)
+            writer.buffer.write(")")
+
+    def _write_from_section(
+        self, from_source: SqlQueryPlanNode, from_source_alias: str, writer: _SqlPlanBufferWriter
+    ) -> None:
+        """Write the "FROM" section in the same format as _render_from_section()."""
+        if from_source.is_table:
+            from_render_result = self._render_node(from_source)
+            writer.params.add(from_render_result.execution_parameters)
+            writer.buffer.write(f"FROM {from_render_result.sql} {from_source_alias}")
+            return
+
+        writer.buffer.write("FROM (")
+        with writer.buffer.indented():
+            from_source.accept(writer)
+        writer.buffer.write(f") {from_source_alias}")
+
+    def _write_joins_section(
+        self, join_descriptions: Sequence[SqlJoinDescription], writer: _SqlPlanBufferWriter
+    ) -> None:
+        """Write the "JOIN" section in the same format as _render_joins_section()."""
+        for join_description in join_descriptions:
+            if join_description.right_source.is_table:
+                right_source_rendered = self._render_node(join_description.right_source)
+                writer.params.add(right_source_rendered.execution_parameters)
+                writer.buffer.write(join_description.join_type.value)
+                with writer.buffer.indented():
+                    writer.buffer.write(f"{right_source_rendered.sql} {join_description.right_source_alias}")
+            else:
+                writer.buffer.write(f"{join_description.join_type.value} (")
+                with writer.buffer.indented():
+                    join_description.right_source.accept(writer)
+                writer.buffer.write(f") {join_description.right_source_alias}")
+
+            if join_description.on_condition:
+                on_condition_rendered = self.EXPR_RENDERER.render_sql_expr(join_description.on_condition)
+                writer.params.add(on_condition_rendered.execution_parameters)
+                writer.buffer.write("ON")
+                with writer.buffer.indented():
+                    writer.buffer.write(on_condition_rendered.sql)
+
+    def _write_select_statement(self, node: SqlSelectStatementNode, writer: _SqlPlanBufferWriter) -> None:
+        """Write the select statement in the same format as visit_select_statement_node()."""
+        self._write_cte_section(node.cte_descs, writer)
+
+        description_section = self._render_description_section(node.description)
+        if description_section:
+            writer.buffer.write(description_section)
+
+        # The CTEs are also parents of the node, but they aren't sources in the FROM clause.
+        select_section, select_params = self._render_select_columns_section(
+            node.select_columns, num_parents=1 + len(node.join_descs)
+        )
+        writer.params.add(select_params)
+        writer.buffer.write(select_section)
+
+        self._write_from_section(node.from_source, node.from_source_alias, writer)
+        self._write_joins_section(node.join_descs, writer)
+
+        # The "GROUP BY" section is rendered before the "WHERE" section so that the parameters are in the same order.
+        group_by_section, group_by_params = self._render_group_by_section(node.group_bys)
+        writer.params.add(group_by_params)
+
+        where_section, where_params = self._render_where_section(node.where)
+        writer.params.add(where_params)
+        if where_section:
+            writer.buffer.write(where_section)
+
+        if group_by_section:
+            writer.buffer.write(group_by_section)
+
+        order_by_section, order_by_params = self._render_order_by_section(node.order_bys)
+        writer.params.add(order_by_params)
+        if order_by_section:
+            writer.buffer.write(order_by_section)
+
+        limit_section = self._render_limit_section(node.limit)
+        if limit_section:
+            writer.buffer.write(limit_section)
+
     def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlPlanRenderResult:  # noqa: D
         # Keep track of all execution parameters for all expressions
         combined_params = SqlBindParameters()
 
+        # Render "WITH" section
+        cte_section, cte_params = self._render_cte_section(node.cte_descs)
+        combined_params = combined_params.combine(cte_params)
+
         # Render description section
-        description_section = "\n".join([f"-- {x}" for x in node.description.split("\n")])
+        description_section = self._render_description_section(node.description)
 
         # Render "SELECT" column section
-        select_section, select_params = self._render_select_columns_section(node.select_columns, len(node.parent_nodes))
+        # The CTEs are also parents of the node, but they aren't sources in the FROM clause.
+        select_section, select_params = self._render_select_columns_section(
+            node.select_columns, num_parents=1 + len(node.join_descs)
+        )
         combined_params = combined_params.combine(select_params)
 
         # Render "FROM" section
@@ -233,31 +446,22 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
         combined_params = combined_params.combine(group_by_params)
 
         # Render "WHERE" section
-        where_section = None
-        if node.where:
-            where_render_result = self.EXPR_RENDERER.render_sql_expr(node.where)
-            combined_params = combined_params.combine(where_render_result.execution_parameters)
-            where_section = f"WHERE {where_render_result.sql}"
+        where_section, where_params = self._render_where_section(node.where)
+        combined_params = combined_params.combine(where_params)
 
         # Render "ORDER BY" section
-        order_by_section = None
-        if node.order_bys:
-            order_by_items: List[str] = []
-            for order_by in node.order_bys:
-                order_by_render_result = self.EXPR_RENDERER.render_sql_expr(order_by.expr)
-                order_by_items.append(order_by_render_result.sql + (" DESC" if order_by.desc else ""))
-                combined_params = combined_params.combine(order_by_render_result.execution_parameters)
-
-            order_by_section = "ORDER BY " + ", ".join(order_by_items)
+        order_by_section, order_by_params = self._render_order_by_section(node.order_bys)
+        combined_params = combined_params.combine(order_by_params)
 
         # Render "LIMIT" section
-        limit_section = None
-        if node.limit:
-            limit_section = f"LIMIT {node.limit}"
+        limit_section = self._render_limit_section(node.limit)
 
         # Combine the sections into a single string.
         sections_to_render = []
 
+        if cte_section:
+            sections_to_render.append(cte_section)
+
         if description_section:
             sections_to_render.append(description_section)
 
@@ -296,6 +500,37 @@ class DefaultSqlQueryPlanRenderer(SqlQueryPlanRenderer):
             execution_parameters=SqlBindParameters(),
         )
 
+    def visit_cte_reference_node(self, node: SqlCteReferenceNode) -> SqlPlanRenderResult:  # noqa: D
+        return SqlPlanRenderResult(
+            sql=node.cte_alias,
+            execution_parameters=SqlBindParameters(),
+        )
+
     @property
     def expr_renderer(self) -> SqlExpressionRenderer:  # noqa :D
         return self.EXPR_RENDERER
+
+
+class _SqlPlanBufferWriter(SqlQueryPlanNodeVisitor[None]):
+    """Writes the SQL for the nodes in a plan to a shared buffer, using the sections rendered by the renderer."""
+
+    def __init__(self, renderer: DefaultSqlQueryPlanRenderer) -> None:  # noqa: D
+        self._renderer = renderer
+        self.buffer = SqlRenderBuffer(indent=renderer.INDENT)
+        self.params = SqlBindParametersBuilder()
+
+    def _write_render_result(self, render_result: SqlPlanRenderResult) -> None:
+        self.params.add(render_result.execution_parameters)
+        self.buffer.write(render_result.sql)
+
+    def visit_select_statement_node(self, node: SqlSelectStatementNode) -> None:  # noqa: D
+        self._renderer._write_select_statement(node, self)
+
+    def visit_table_from_clause_node(self, node: SqlTableFromClauseNode) -> None:  # noqa: D
+        self._write_render_result(self._renderer.visit_table_from_clause_node(node))
+
+    def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> None:  # noqa: D
+        self._write_render_result(self._renderer.visit_query_from_clause_node(node))
+
+    def visit_cte_reference_node(self, node: SqlCteReferenceNode) -> None:  # noqa: D
+        self._write_render_result(self._renderer.visit_cte_reference_node(node))
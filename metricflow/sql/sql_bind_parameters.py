@@ -3,7 +3,7 @@ from __future__ import annotations
 import datetime
 from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Optional, Tuple, Mapping
+from typing import Any, Dict, List, Optional, Tuple, Mapping
 
 from metricflow.dataclass_serialization import SerializableDataclass
 from metricflow.object_utils import SqlColumnType, assert_exactly_one_arg_set
@@ -128,3 +128,33 @@ class SqlBindParameters(SerializableDataclass):
 
     def __eq__(self, other: Any) -> bool:  # type: ignore  # noqa: D
         return isinstance(other, SqlBindParameters) and self.param_dict == other.param_dict
+
+
+class SqlBindParametersBuilder:
+    """Mutable collector of bind parameters for building SqlBindParameters in one pass.
+
+    Adding parameters has the same semantics as SqlBindParameters.combine(), but it doesn't create intermediate
+    objects, so collecting the parameters of N nodes takes O(N) instead of O(N^2).
+    """
+
+    def __init__(self) -> None:  # noqa: D
+        self._items: List[SqlBindParameter] = []
+        self._values_by_key: Dict[str, SqlBindParameterValue] = {}
+
+    def add(self, params: SqlBindParameters) -> None:
+        """Add the given parameters, ignoring keys that were already added with the same value."""
+        for item in params.param_items:
+            existing_value = self._values_by_key.get(item.key)
+            if existing_value is None:
+                self._items.append(item)
+                self._values_by_key[item.key] = item.value
+            elif existing_value != item.value:
+                other_dict = {param.key: param.value for param in params.param_items}
+                raise RuntimeError(
+                    f"Conflict with key {item.key} in combining parameters. "
+                    f"Existing params: {self._values_by_key} Additional params: {other_dict}"
+                )
+
+    def build(self) -> SqlBindParameters:
+        """Return the parameters collected so far."""
+        return SqlBindParameters(param_items=tuple(self._items))
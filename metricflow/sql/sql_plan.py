@@ -10,6 +10,7 @@ from typing import Optional, List, Generic, Sequence, Tuple
 
 from metricflow.dag.mf_dag import DagNode, DisplayedProperty, MetricFlowDag, NodeId
 from metricflow.dag.id_generation import (
+    SQL_PLAN_CTE_REFERENCE_ID_PREFIX,
     SQL_PLAN_SELECT_STATEMENT_ID_PREFIX,
     SQL_PLAN_TABLE_FROM_CLAUSE_ID_PREFIX,
 )
@@ -78,6 +79,10 @@ class SqlQueryPlanNodeVisitor(Generic[VisitorOutputT], ABC):
     def visit_query_from_clause_node(self, node: SqlSelectQueryFromClauseNode) -> VisitorOutputT:  # noqa: D
         pass
 
+    @abstractmethod
+    def visit_cte_reference_node(self, node: SqlCteReferenceNode) -> VisitorOutputT:  # noqa: D
+        pass
+
 
 @dataclass(frozen=True)
 class SqlSelectColumn:
@@ -120,6 +125,16 @@ class SqlOrderByDescription:  # noqa: D
     desc: bool
 
 
+@dataclass(frozen=True)
+class SqlCteDescription:
+    """Describes a common table expression in the WITH clause of a select statement."""
+
+    cte_alias: str
+    select_statement: SqlSelectStatementNode
+    # Whether the engine should be asked to compute the CTE once e.g. "cte_alias AS MATERIALIZED (...)".
+    materialized: bool = False
+
+
 class SqlSelectStatementNode(SqlQueryPlanNode):
     """Represents an SQL Select statement."""
 
@@ -134,11 +149,12 @@ class SqlSelectStatementNode(SqlQueryPlanNode):
         order_bys: Tuple[SqlOrderByDescription, ...],
         where: Optional[SqlExpressionNode] = None,
         limit: Optional[int] = None,
+        cte_descs: Tuple[SqlCteDescription, ...] = (),
     ) -> None:
         self._description = description
         assert select_columns
         self._select_columns = select_columns
-        # Sources that belong in a from clause. CTEs could be captured in a separate field.
+        # Sources that belong in a from clause. CTEs are captured in cte_descs and referenced with SqlCteReferenceNode.
         self._from_source = from_source
         self._from_source_alias = from_source_alias
         self._join_descs = joins_descs
@@ -149,10 +165,13 @@ class SqlSelectStatementNode(SqlQueryPlanNode):
         if limit is not None:
             assert limit >= 0
         self._limit = limit
+        self._cte_descs = cte_descs
 
         super().__init__(
             node_id=self.create_unique_id(),
-            parent_nodes=[self._from_source] + [x.right_source for x in self._join_descs],
+            parent_nodes=[x.select_statement for x in self._cte_descs]
+            + [self._from_source]
+            + [x.right_source for x in self._join_descs],
         )
 
     @classmethod
@@ -173,6 +192,7 @@ class SqlSelectStatementNode(SqlQueryPlanNode):
             + [DisplayedProperty(f"group_by{i}", group_by) for i, group_by in enumerate(self._group_bys)]
             + [DisplayedProperty("where", self._where)]
             + [DisplayedProperty(f"order_by{i}", order_by) for i, order_by in enumerate(self._order_bys)]
+            + [DisplayedProperty(f"cte{i}", cte_desc.cte_alias) for i, cte_desc in enumerate(self._cte_descs)]
         )
 
     @property
@@ -218,6 +238,11 @@ class SqlSelectStatementNode(SqlQueryPlanNode):
     def as_select_node(self) -> Optional[SqlSelectStatementNode]:  # noqa: D
         return self
 
+    @property
+    def cte_descs(self) -> Tuple[SqlCteDescription, ...]:
+        """The common table expressions that are defined in the WITH clause of this statement."""
+        return self._cte_descs
+
 
 class SqlTableFromClauseNode(SqlQueryPlanNode):
     """An SQL table that can go in the FROM clause."""
@@ -287,6 +312,45 @@ class SqlSelectQueryFromClauseNode(SqlQueryPlanNode):
         return None
 
 
+class SqlCteReferenceNode(SqlQueryPlanNode):
+    """A reference to a common table expression that can go in the FROM clause.
+
+    The CTE needs to be defined in the WITH clause of the statement that contains this node.
+    """
+
+    def __init__(self, cte_alias: str) -> None:  # noqa: D
+        self._cte_alias = cte_alias
+        super().__init__(node_id=self.create_unique_id(), parent_nodes=[])
+
+    @classmethod
+    def id_prefix(cls) -> str:  # noqa: D
+        return SQL_PLAN_CTE_REFERENCE_ID_PREFIX
+
+    @property
+    def description(self) -> str:  # noqa: D
+        return f"Read from CTE {self._cte_alias}"
+
+    @property
+    def displayed_properties(self) -> List[DisplayedProperty]:  # noqa: D
+        return super().displayed_properties + [DisplayedProperty("cte_alias", self._cte_alias)]
+
+    def accept(self, visitor: SqlQueryPlanNodeVisitor[VisitorOutputT]) -> VisitorOutputT:  # noqa: D
+        return visitor.visit_cte_reference_node(self)
+
+    @property
+    def cte_alias(self) -> str:  # noqa: D
+        return self._cte_alias
+
+    @property
+    def is_table(self) -> bool:  # noqa: D
+        # A CTE is referenced by name like a table.
+        return True
+
+    @property
+    def as_select_node(self) -> Optional[SqlSelectStatementNode]:  # noqa: D
+        return None
+
+
 class SqlQueryPlan(MetricFlowDag[SqlQueryPlanNode]):  # noqa: D
     """Model for an SQL Query as a DAG."""
 
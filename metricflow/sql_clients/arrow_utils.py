@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import functools
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+@functools.lru_cache(maxsize=None)
+def pyarrow_installed() -> bool:
+    """Returns true if pyarrow, which is an optional dependency for fetching results in Arrow format, is usable."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def import_pyarrow() -> ModuleType:
+    """Import pyarrow, raising an error that explains how to install it if it's missing."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for returning results in Arrow format. Install it with `pip install pyarrow`."
+        ) from e
+    return pyarrow
+
+
+def arrow_table_to_df(table: pa.Table) -> pd.DataFrame:
+    """Convert an Arrow table to a DataFrame, avoiding copies where possible.
+
+    Columns are not consolidated into blocks, so numeric columns without nulls can share memory with the table.
+    Integral decimal columns (e.g. a SUM() of integers in DuckDB) are converted to int64 when the values fit, as
+    otherwise they would become Python Decimal objects rather than the integers produced by fetching rows.
+    """
+    pa = import_pyarrow()
+    for column_index, field in enumerate(table.schema):
+        if pa.types.is_decimal(field.type) and field.type.scale == 0:
+            try:
+                table = table.set_column(column_index, field.name, table.column(column_index).cast(pa.int64()))
+            except pa.ArrowInvalid:
+                pass
+    return table.to_pandas(split_blocks=True)
@@ -5,7 +5,7 @@ import textwrap
 import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Tuple, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Tuple, Sequence
 from typing import Optional, List, Dict
 
 import jinja2
@@ -14,16 +14,20 @@ import pandas as pd
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.logging.formatting import indent_log_line
 from metricflow.object_utils import random_id, pformat_big_objects
-from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.protocols.async_sql_client import AsyncSqlClient, DEFAULT_QUERY_CHUNK_SIZE
 from metricflow.protocols.sql_client import (
     SqlEngineAttributes,
 )
 from metricflow.protocols.sql_client import SqlIsolationLevel
 from metricflow.protocols.sql_request import SqlRequestId, SqlRequestResult, SqlRequestTagSet, SqlJsonTag
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.sql_clients.arrow_utils import arrow_table_to_df, import_pyarrow, pyarrow_installed
 from metricflow.sql_clients.async_request import SqlStatementCommentMetadata, CombinedSqlTags
 from metricflow.sql_clients.common_client import check_isolation_level
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,7 +40,16 @@ class SqlClientException(Exception):
 class BaseSqlClientImplementation(ABC, AsyncSqlClient):
     """Abstract implementation that other SQL clients are based on."""
 
-    def __init__(self) -> None:  # noqa: D
+    def __init__(self, arrow_results: bool = False) -> None:
+        """Initializer.
+
+        Args:
+            arrow_results: Whether queries that return a DataFrame should fetch the result through the native Arrow
+                path, if the client has one. This avoids converting the result row by row, but the DataFrame can have
+                different dtypes than one built from rows (e.g. int32 columns or microsecond timestamps), so it's off
+                by default. query_arrow() always uses the Arrow path.
+        """
+        self._arrow_results = arrow_results
         self._request_id_to_thread: Dict[SqlRequestId, BaseSqlClientImplementation.SqlRequestExecutorThread] = {}
         self._state_lock = threading.Lock()
 
@@ -109,13 +122,104 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
 
         start = time.time()
         logger.info(BaseSqlClientImplementation._format_run_query_log_message(stmt, sql_bind_parameters))
-        df = self._engine_specific_query_implementation(stmt, sql_bind_parameters)
+        df = self._run_query(stmt, sql_bind_parameters).df
         if not isinstance(df, pd.DataFrame):
             raise RuntimeError(f"Expected query to return a DataFrame, got {type(df)}")
         stop = time.time()
         logger.info(f"Finished running the query in {stop - start:.2f}s with {df.shape[0]} row(s) returned")
         return df
 
+    def query_arrow(  # noqa: D
+        self,
+        statement: str,
+        bind_parameters: SqlBindParameters = SqlBindParameters(),
+        isolation_level: Optional[SqlIsolationLevel] = None,
+    ) -> pa.Table:
+        pa = import_pyarrow()
+        check_isolation_level(self, isolation_level)
+        start = time.time()
+        logger.info(BaseSqlClientImplementation._format_run_query_log_message(statement, bind_parameters))
+        table = self._engine_specific_query_arrow_implementation(
+            statement, bind_params=bind_parameters, isolation_level=isolation_level
+        )
+        if table is None:
+            df = self._engine_specific_query_implementation(
+                statement, bind_params=bind_parameters, isolation_level=isolation_level
+            )
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        stop = time.time()
+        logger.info(f"Finished running the query in {stop - start:.2f}s with {table.num_rows} row(s) returned")
+        return table
+
+    def _run_query(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> SqlRequestResult:
+        """Run the query, fetching the result in Arrow format if enabled and possible, and as rows otherwise."""
+        if self._arrow_results and pyarrow_installed():
+            arrow_table = self._engine_specific_query_arrow_implementation(
+                stmt,
+                bind_params=bind_params,
+                isolation_level=isolation_level,
+                system_tags=system_tags,
+                extra_tags=extra_tags,
+            )
+            if arrow_table is not None:
+                return SqlRequestResult(df=self._arrow_table_to_df(arrow_table), arrow_table=arrow_table)
+
+        return SqlRequestResult(
+            df=self._engine_specific_query_implementation(
+                stmt,
+                bind_params=bind_params,
+                isolation_level=isolation_level,
+                system_tags=system_tags,
+                extra_tags=extra_tags,
+            )
+        )
+
+    def query_chunks(  # noqa: D
+        self,
+        statement: str,
+        bind_parameters: SqlBindParameters = SqlBindParameters(),
+        chunk_size: int = DEFAULT_QUERY_CHUNK_SIZE,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+    ) -> Iterator[pd.DataFrame]:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size should be >= 1, but got {chunk_size}")
+        check_isolation_level(self, isolation_level)
+        return self._logged_query_chunks(
+            statement=statement,
+            bind_parameters=bind_parameters,
+            chunk_size=chunk_size,
+            isolation_level=isolation_level,
+        )
+
+    def _logged_query_chunks(
+        self,
+        statement: str,
+        bind_parameters: SqlBindParameters,
+        chunk_size: int,
+        isolation_level: Optional[SqlIsolationLevel],
+    ) -> Iterator[pd.DataFrame]:
+        start = time.time()
+        logger.info(BaseSqlClientImplementation._format_run_query_log_message(statement, bind_parameters))
+        num_rows = 0
+        num_chunks = 0
+        for df in self._engine_specific_query_chunks_implementation(
+            statement, bind_params=bind_parameters, chunk_size=chunk_size, isolation_level=isolation_level
+        ):
+            num_rows += df.shape[0]
+            num_chunks += 1
+            yield df
+        stop = time.time()
+        logger.info(
+            f"Finished running the query in {stop - start:.2f}s with {num_rows} row(s) returned in {num_chunks} chunk(s)"
+        )
+
     def execute(  # noqa: D
         self,
         stmt: str,
@@ -129,6 +233,18 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
         logger.info(f"Finished running the query in {stop - start:.2f}s")
         return None
 
+    def execute_in_transaction(self, statements: Sequence[Tuple[str, SqlBindParameters]]) -> None:  # noqa: D
+        if not self.sql_engine_attributes.transactions_supported:
+            raise NotImplementedError(
+                f"Transactions are not supported for {self.sql_engine_attributes.sql_engine_type.value}"
+            )
+        start = time.time()
+        for stmt, sql_bind_parameters in statements:
+            logger.info(BaseSqlClientImplementation._format_run_query_log_message(stmt, sql_bind_parameters))
+        self._engine_specific_execute_in_transaction_implementation(statements)
+        stop = time.time()
+        logger.info(f"Finished running {len(statements)} statement(s) in a transaction in {stop - start:.2f}s")
+
     def dry_run(
         self,
         stmt: str,
@@ -173,6 +289,44 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
         """Sub-classes should implement this to query the engine."""
         pass
 
+    def _engine_specific_query_arrow_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> Optional[pa.Table]:
+        """Sub-classes with a native Arrow fetch path should override this to query the engine.
+
+        This is only called if pyarrow is installed, and for queries that return a DataFrame, only if the client was
+        created with arrow_results set. Returns None if the query can't be run this way, in which case
+        _engine_specific_query_implementation() is used instead.
+        """
+        return None
+
+    def _arrow_table_to_df(self, arrow_table: pa.Table) -> pd.DataFrame:
+        """Convert a table from _engine_specific_query_arrow_implementation() to the DataFrame for the result."""
+        return arrow_table_to_df(arrow_table)
+
+    def _engine_specific_query_chunks_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        chunk_size: int,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Sub-classes should override this to fetch results from the engine incrementally.
+
+        By default, this runs the query to completion and then splits the result, so it doesn't reduce memory usage.
+        """
+        df = self._engine_specific_query_implementation(stmt, bind_params=bind_params, isolation_level=isolation_level)
+        if df.shape[0] == 0:
+            yield df
+            return
+        for start_index in range(0, df.shape[0], chunk_size):
+            yield df.iloc[start_index : start_index + chunk_size].reset_index(drop=True)
+
     @abstractmethod
     def _engine_specific_execute_implementation(
         self,
@@ -185,6 +339,12 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
         """Sub-classes should implement this to execute a statement that doesn't return results."""
         pass
 
+    def _engine_specific_execute_in_transaction_implementation(
+        self, statements: Sequence[Tuple[str, SqlBindParameters]]
+    ) -> None:
+        """Sub-classes that support transactions should implement this to execute the statements in one transaction."""
+        raise NotImplementedError
+
     @abstractmethod
     def _engine_specific_dry_run_implementation(self, stmt: str, bind_params: SqlBindParameters) -> None:
         """Sub-classes should implement this to check a query will run successfully without actually running the query"""
@@ -295,11 +455,23 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
                     f"were already fetched."
                 )
 
-        thread.join()
+        thread.wait_until_finished()
         with self._state_lock:
             del self._request_id_to_thread[query_id]
         return thread.result
 
+    def add_done_callback(  # noqa: D
+        self, request_id: SqlRequestId, callback: Callable[[SqlRequestId], None]
+    ) -> None:
+        with self._state_lock:
+            thread = self._request_id_to_thread.get(request_id)
+            if thread is None:
+                raise RuntimeError(
+                    f"Query ID: {request_id} is not known. Either the query ID is invalid, or results for the query ID "
+                    f"were already fetched."
+                )
+        thread.add_done_callback(callback)
+
     def active_requests(self) -> Sequence[SqlRequestId]:  # noqa: D
         with self._state_lock:
             return tuple(executor_thread.request_id for executor_thread in self._request_id_to_thread.values())
@@ -336,9 +508,39 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
             self._result: Optional[SqlRequestResult] = None
             self._is_query = is_query
             self._isolation_level = isolation_level
+            # Set once the result is available. This is used instead of join() so that callbacks running in this thread
+            # can fetch the result.
+            self._finished = threading.Event()
+            self._done_callbacks: List[Callable[[SqlRequestId], None]] = []
+            self._callback_lock = threading.Lock()
             super().__init__(name=f"Async Execute SQL Request ID: {request_id}", daemon=True)
 
+        def wait_until_finished(self) -> None:  # noqa: D
+            self._finished.wait()
+
+        def add_done_callback(self, callback: Callable[[SqlRequestId], None]) -> None:
+            """Call the function once the request has finished, or right away if it has already finished."""
+            with self._callback_lock:
+                if not self._finished.is_set():
+                    self._done_callbacks.append(callback)
+                    return
+            callback(self._request_id)
+
         def run(self) -> None:  # noqa: D
+            try:
+                self._run_request()
+            finally:
+                with self._callback_lock:
+                    self._finished.set()
+                    done_callbacks = self._done_callbacks
+                    self._done_callbacks = []
+                for callback in done_callbacks:
+                    try:
+                        callback(self._request_id)
+                    except Exception:
+                        logger.exception(f"Callback for {self._request_id} raised an exception")
+
+        def _run_request(self) -> None:
             start_time = time.time()
             try:
                 combined_tags = CombinedSqlTags(
@@ -356,14 +558,13 @@ class BaseSqlClientImplementation(ABC, AsyncSqlClient):
                 )
 
                 if self._is_query:
-                    df = self._sql_client._engine_specific_query_implementation(
+                    self._result = self._sql_client._run_query(
                         statement,
                         bind_params=self._bind_parameters,
                         isolation_level=self._isolation_level,
                         system_tags=combined_tags.system_tags,
                         extra_tags=self._extra_tag,
                     )
-                    self._result = SqlRequestResult(df=df)
                 else:
                     self._sql_client._engine_specific_execute_implementation(
                         statement,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import ClassVar, Optional, Dict, Callable
+from typing import TYPE_CHECKING, ClassVar, Optional, Dict, Callable
 from typing import Sequence
 
 import google.oauth2.service_account
@@ -10,6 +10,7 @@ import sqlalchemy
 from google.cloud.bigquery import Client, QueryJob
 
 from metricflow.protocols.sql_client import SqlEngine, SqlIsolationLevel
+from metricflow.protocols.sql_request import SqlRequestTagSet, SqlJsonTag
 from metricflow.protocols.sql_client import (
     SqlEngineAttributes,
 )
@@ -17,9 +18,12 @@ from metricflow.sql.render.big_query import BigQuerySqlQueryPlanRenderer
 from metricflow.sql.render.sql_plan_renderer import SqlQueryPlanRenderer
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.sql_clients.async_request import SqlStatementCommentMetadata, CombinedSqlTags
-from metricflow.sql_clients.common_client import SqlDialect
+from metricflow.sql_clients.common_client import SqlDialect, check_isolation_level
 from metricflow.sql_clients.sqlalchemy_dialect import SqlAlchemySqlClient
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,10 +49,13 @@ class BigQueryEngineAttributes:
     discrete_percentile_aggregation_supported: ClassVar[bool] = False
     approximate_continuous_percentile_aggregation_supported: ClassVar[bool] = True
     approximate_discrete_percentile_aggregation_supported: ClassVar[bool] = False
+    materialized_ctes_supported: ClassVar[bool] = False
+    transactions_supported: ClassVar[bool] = False
 
     # SQL Dialect replacement strings
     double_data_type_name: ClassVar[str] = "FLOAT64"
     timestamp_type_name: ClassVar[Optional[str]] = "DATETIME"
+    string_data_type_name: ClassVar[str] = "STRING"
     random_function_name: ClassVar[str] = "RAND"
 
     # MetricFlow attributes
@@ -70,7 +77,7 @@ class BigQuerySqlClient(SqlAlchemySqlClient):
 
         return BigQuerySqlClient(password=password)
 
-    def __init__(self, project_id: str = "", password: Optional[str] = None) -> None:
+    def __init__(self, project_id: str = "", password: Optional[str] = None, arrow_results: bool = False) -> None:
         """Creates a new BigQueryDBClient and tags it for tracing as big query."""
         # Without pool_pre_ping, it's possible for timed-out connections to be returned to the client and cause errors.
         # However, this can cause increase latency for slow engines.
@@ -86,7 +93,13 @@ class BigQuerySqlClient(SqlAlchemySqlClient):
                 else None
             ),
         )
-        super().__init__(engine=bq_engine)
+        super().__init__(engine=bq_engine, arrow_results=arrow_results)
+
+    @property
+    def connection_identity(self) -> str:
+        """The credentials are passed to the engine separately, so the engine URL doesn't identify the account."""
+        client_email = json.loads(self._password).get("client_email", "") if self._password else ""
+        return f"{SqlDialect.BIGQUERY.value}://{self._project_id}?client_email={client_email}"
 
     def _engine_specific_dry_run_implementation(self, stmt: str, bind_params: SqlBindParameters) -> None:
         """Overrides base `_engine_specific_dry_run_implementation` function for BigQuery specifics"""
@@ -96,6 +109,24 @@ class BigQuerySqlClient(SqlAlchemySqlClient):
         with _engine.connect() as conn:
             conn.execute(sqlalchemy.text(stmt), bind_params.param_dict)
 
+    def _engine_specific_query_arrow_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> Optional[pa.Table]:
+        """Runs the query through the BigQuery client, which downloads the result with the Storage Read API.
+
+        The download falls back to the REST API if google-cloud-bigquery-storage is not installed. Queries with bind
+        parameters go through SQLAlchemy, which handles converting the parameters.
+        """
+        check_isolation_level(self, isolation_level)
+        if bind_params.param_dict:
+            return None
+        return self._bq_client.query(stmt).to_arrow(create_bqstorage_client=True)
+
     @staticmethod
     def _create_bq_engine(
         project_id: str = "", password: Optional[str] = None, query_field_values: Optional[Dict[str, str]] = None
@@ -36,10 +36,13 @@ class ClickHouseEngineAttributes:
     discrete_percentile_aggregation_supported: ClassVar[bool] = True
     approximate_continuous_percentile_aggregation_supported: ClassVar[bool] = True
     approximate_discrete_percentile_aggregation_supported: ClassVar[bool] = True
+    materialized_ctes_supported: ClassVar[bool] = False
+    transactions_supported: ClassVar[bool] = False
 
     # SQL Dialect replacement strings
     double_data_type_name: ClassVar[str] = "Float64"
     timestamp_type_name: ClassVar[Optional[str]] = "DateTime"
+    string_data_type_name: ClassVar[str] = "String"
     random_function_name: ClassVar[str] = "rand"
 
     # MetricFlow attributes
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Optional, ClassVar, Dict, Sequence, Callable
+from typing import Optional, ClassVar, Dict, Iterator, Sequence, Callable
 
 import pandas as pd
+import pyarrow as pa
 import sqlalchemy
 from databricks import sql
 
@@ -60,10 +61,13 @@ class DatabricksEngineAttributes:
     discrete_percentile_aggregation_supported: ClassVar[bool] = False
     approximate_continuous_percentile_aggregation_supported: ClassVar[bool] = False
     approximate_discrete_percentile_aggregation_supported: ClassVar[bool] = True
+    materialized_ctes_supported: ClassVar[bool] = False
+    transactions_supported: ClassVar[bool] = False
 
     # SQL Dialect replacement strings
     double_data_type_name: ClassVar[str] = "DOUBLE"
     timestamp_type_name: ClassVar[Optional[str]] = "TIMESTAMP"
+    string_data_type_name: ClassVar[str] = "STRING"
     random_function_name: ClassVar[str] = "RANDOM"
     # MetricFlow attributes
     sql_query_plan_renderer: ClassVar[SqlQueryPlanRenderer] = DatabricksSqlQueryPlanRenderer()
@@ -85,7 +89,12 @@ class DatabricksSqlClient(BaseSqlClientImplementation):
         self.access_token = access_token
         self.http_path_for_table_renames = http_path_for_table_renames
 
-        super().__init__()
+        # Results are always fetched in Arrow format, so the DataFrame is the same either way.
+        super().__init__(arrow_results=True)
+
+    @property
+    def connection_identity(self) -> str:  # noqa: D
+        return f"{SqlDialect.DATABRICKS.value}://{self.host};HttpPath={self.http_path}"
 
     @staticmethod
     def from_connection_details(url: str, password: Optional[str]) -> DatabricksSqlClient:  # noqa: D
@@ -165,22 +174,63 @@ class DatabricksSqlClient(BaseSqlClientImplementation):
         system_tags: SqlRequestTagSet = SqlRequestTagSet(),
         extra_tags: SqlJsonTag = SqlJsonTag(),
     ) -> pd.DataFrame:
+        pyarrow_df = self._engine_specific_query_arrow_implementation(
+            stmt=stmt, bind_params=bind_params, isolation_level=isolation_level
+        )
+        return self._arrow_table_to_df(pyarrow_df)
+
+    def _engine_specific_query_arrow_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> pa.Table:
         check_isolation_level(self, isolation_level)
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
                 self._execute_stmt(cursor=cursor, stmt=stmt, bind_params=bind_params)
                 logger.info("Fetching query results as PyArrow Table.")
-                pyarrow_df = cursor.fetchall_arrow()
+                return cursor.fetchall_arrow()
 
+    def _arrow_table_to_df(self, arrow_table: pa.Table) -> pd.DataFrame:
         logger.info("Beginning conversion of PyArrow Table to pandas DataFrame.")
-        pandas_df = pyarrow_df.to_pandas()
+        pandas_df = self._to_pandas_df(arrow_table)
         logger.info("Completed conversion of PyArrow Table to pandas DataFrame.")
+        return pandas_df
+
+    @staticmethod
+    def _to_pandas_df(pyarrow_table: pa.Table) -> pd.DataFrame:
+        pandas_df = pyarrow_table.to_pandas()
         # Remove tz from any datetime cols. Databricks tables add UTC by default.
         for col_name in pandas_df:
             if pd.api.types.is_datetime64_any_dtype(pandas_df[col_name]):
                 pandas_df[col_name] = pandas_df[col_name].dt.tz_localize(None)
         return pandas_df
 
+    def _engine_specific_query_chunks_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        chunk_size: int,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Fetches the results in batches of PyArrow Tables, converting each one to a pandas DataFrame."""
+        check_isolation_level(self, isolation_level)
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                self._execute_stmt(cursor=cursor, stmt=stmt, bind_params=bind_params)
+                num_chunks = 0
+                while True:
+                    pyarrow_table = cursor.fetchmany_arrow(chunk_size)
+                    if pyarrow_table.num_rows == 0 and num_chunks > 0:
+                        break
+                    num_chunks += 1
+                    yield self._to_pandas_df(pyarrow_table)
+                    if pyarrow_table.num_rows < chunk_size:
+                        break
+
     def _engine_specific_execute_implementation(
         self,
         stmt: str,
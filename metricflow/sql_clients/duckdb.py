@@ -1,7 +1,9 @@
+from __future__ import annotations
+
 import logging
 import threading
 import time
-from typing import Callable, ClassVar, Optional, Sequence
+from typing import TYPE_CHECKING, Callable, ClassVar, Iterator, Optional, Sequence, Tuple
 
 import pandas as pd
 import sqlalchemy
@@ -27,10 +29,14 @@ from metricflow.protocols.sql_request import SqlRequestTagSet, SqlJsonTag
 from metricflow.sql.render.duckdb_renderer import DuckDbSqlQueryPlanRenderer
 from metricflow.sql.render.sql_plan_renderer import SqlQueryPlanRenderer
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.sql_clients.arrow_utils import import_pyarrow
 from metricflow.sql_clients.async_request import CombinedSqlTags
 from metricflow.sql_clients.common_client import SqlDialect
 from metricflow.sql_clients.sqlalchemy_dialect import SqlAlchemySqlClient
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,10 +59,13 @@ class DuckDbEngineAttributes:
     discrete_percentile_aggregation_supported: ClassVar[bool] = True
     approximate_continuous_percentile_aggregation_supported: ClassVar[bool] = True
     approximate_discrete_percentile_aggregation_supported: ClassVar[bool] = False
+    materialized_ctes_supported: ClassVar[bool] = True
+    transactions_supported: ClassVar[bool] = True
 
     # SQL Dialect replacement strings
     double_data_type_name: ClassVar[str] = "DOUBLE"
     timestamp_type_name: ClassVar[Optional[str]] = "TIMESTAMP"
+    string_data_type_name: ClassVar[str] = "VARCHAR"
     random_function_name: ClassVar[str] = "RANDOM"
 
     # MetricFlow attributes
@@ -78,7 +87,7 @@ class DuckDbSqlClient(SqlAlchemySqlClient):
 
         return DuckDbSqlClient(file_path=parsed_url.database)
 
-    def __init__(self, file_path: Optional[str] = None) -> None:  # noqa: D
+    def __init__(self, file_path: Optional[str] = None, arrow_results: bool = False) -> None:  # noqa: D
         # DuckDB is not designed with concurrency, but in can work in multi-threaded settings with
         # check_same_thread=False, StaticPool, and serializing of queries via a lock.
         self._concurrency_lock = threading.Lock()
@@ -86,7 +95,8 @@ class DuckDbSqlClient(SqlAlchemySqlClient):
             sqlalchemy.create_engine(
                 f"duckdb:///{file_path if file_path else ':memory:'}",
                 poolclass=StaticPool,
-            )
+            ),
+            arrow_results=arrow_results,
         )
 
     @property
@@ -110,6 +120,60 @@ class DuckDbSqlClient(SqlAlchemySqlClient):
                 stmt=stmt, bind_params=bind_params, isolation_level=isolation_level
             )
 
+    def _engine_specific_query_arrow_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> Optional[pa.Table]:
+        """Fetches the result as an Arrow table from DuckDB's columnar storage, skipping row-by-row conversion.
+
+        If the cursor can't fetch the result in Arrow format, the table is built from the rows of the same result, so
+        the statement is never executed again by the caller.
+        """
+        with self._concurrency_lock:
+            with self._engine_connection(self._engine, isolation_level=isolation_level) as conn:
+                result = conn.execute(sqlalchemy.text(stmt), bind_params.param_dict)
+                try:
+                    to_arrow_table = None
+                    if result.cursor is not None:
+                        to_arrow_table = getattr(result.cursor, "to_arrow_table", None) or getattr(
+                            result.cursor, "fetch_arrow_table", None
+                        )
+                    if to_arrow_table is not None:
+                        return to_arrow_table()
+
+                    columns = list(result.keys()) if result.returns_rows else []
+                    rows = [tuple(row) for row in result.fetchall()] if result.returns_rows else []
+                    return import_pyarrow().Table.from_pandas(
+                        pd.DataFrame(rows, columns=columns), preserve_index=False
+                    )
+                finally:
+                    result.close()
+
+    def _engine_specific_query_chunks_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        chunk_size: int,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Fetches all chunks while holding the lock, then returns them.
+
+        Holding the lock while the caller consumes the chunks would block other statements for as long as the iterator
+        is alive, and indefinitely if it's abandoned without being closed. As the database is local, the result is
+        materialized instead.
+        """
+        with self._concurrency_lock:
+            chunks = list(
+                super()._engine_specific_query_chunks_implementation(
+                    stmt=stmt, bind_params=bind_params, chunk_size=chunk_size, isolation_level=isolation_level
+                )
+            )
+        return iter(chunks)
+
     def _engine_specific_execute_implementation(
         self,
         stmt: str,
@@ -123,6 +187,12 @@ class DuckDbSqlClient(SqlAlchemySqlClient):
                 stmt=stmt, bind_params=bind_params, isolation_level=isolation_level
             )
 
+    def _engine_specific_execute_in_transaction_implementation(  # noqa: D
+        self, statements: Sequence[Tuple[str, SqlBindParameters]]
+    ) -> None:
+        with self._concurrency_lock:
+            return super()._engine_specific_execute_in_transaction_implementation(statements)
+
     def _engine_specific_dry_run_implementation(self, stmt: str, bind_params: SqlBindParameters) -> None:  # noqa: D
         with self._concurrency_lock:
             return super()._engine_specific_dry_run_implementation(stmt=stmt, bind_params=bind_params)
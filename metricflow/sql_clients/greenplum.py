@@ -34,10 +34,13 @@ class GreenplumEngineAttributes:
     discrete_percentile_aggregation_supported: ClassVar[bool] = True
     approximate_continuous_percentile_aggregation_supported: ClassVar[bool] = False
     approximate_discrete_percentile_aggregation_supported: ClassVar[bool] = False
+    materialized_ctes_supported: ClassVar[bool] = False
+    transactions_supported: ClassVar[bool] = True
 
     # SQL Dialect replacement strings
     double_data_type_name: ClassVar[str] = "DOUBLE PRECISION"
     timestamp_type_name: ClassVar[Optional[str]] = "TIMESTAMP"
+    string_data_type_name: ClassVar[str] = "VARCHAR"
     random_function_name: ClassVar[str] = "RANDOM"
 
     # MetricFlow attributes
@@ -41,10 +41,13 @@ class MySQLEngineAttributes:
     discrete_percentile_aggregation_supported: ClassVar[bool] = True
     approximate_continuous_percentile_aggregation_supported: ClassVar[bool] = False
     approximate_discrete_percentile_aggregation_supported: ClassVar[bool] = False
+    materialized_ctes_supported: ClassVar[bool] = False
+    transactions_supported: ClassVar[bool] = True
 
     # SQL Dialect replacement strings
     double_data_type_name: ClassVar[str] = "DOUBLE"
     timestamp_type_name: ClassVar[Optional[str]] = "TIMESTAMP"
+    string_data_type_name: ClassVar[str] = "CHAR"
     random_function_name: ClassVar[str] = "RAND"
 
     # MetricFlow attributes
@@ -6,7 +6,7 @@ import threading
 import urllib.parse
 from collections import OrderedDict
 from contextlib import contextmanager
-from typing import ClassVar, Optional, Dict, Iterator, List, Tuple, Any, Set, Sequence, Callable
+from typing import TYPE_CHECKING, ClassVar, Optional, Dict, Iterator, List, Tuple, Any, Set, Sequence, Callable
 
 import pandas as pd
 import sqlalchemy
@@ -28,6 +28,9 @@ from metricflow.sql_clients.async_request import SqlStatementCommentMetadata, Co
 from metricflow.sql_clients.common_client import SqlDialect, not_empty, check_isolation_level
 from metricflow.sql_clients.sqlalchemy_dialect import SqlAlchemySqlClient
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 logger = logging.getLogger(__name__)
 
@@ -53,10 +56,13 @@ class SnowflakeEngineAttributes:
     discrete_percentile_aggregation_supported: ClassVar[bool] = True
     approximate_continuous_percentile_aggregation_supported: ClassVar[bool] = True
     approximate_discrete_percentile_aggregation_supported: ClassVar[bool] = False
+    materialized_ctes_supported: ClassVar[bool] = False
+    transactions_supported: ClassVar[bool] = True
 
     # SQL Dialect replacement strings
     double_data_type_name: ClassVar[str] = "DOUBLE"
     timestamp_type_name: ClassVar[Optional[str]] = "TIMESTAMP"
+    string_data_type_name: ClassVar[str] = "VARCHAR"
     random_function_name: ClassVar[str] = "RANDOM"
 
     # MetricFlow attributes
@@ -193,6 +199,7 @@ class SnowflakeSqlClient(SqlAlchemySqlClient):
         private_key: Optional[str] = None,
         private_key_file: Optional[str] = None,
         private_key_file_pwd: Optional[str] = None,
+        arrow_results: bool = False,
     ) -> SnowflakeSqlClient:  # noqa: D
         password = password or None
         parsed_url = sqlalchemy.engine.make_url(url)
@@ -221,6 +228,7 @@ class SnowflakeSqlClient(SqlAlchemySqlClient):
             private_key_file=private_key_file,
             private_key_file_pwd=private_key_file_pwd,
             url_query_params=SnowflakeSqlClient._parse_url_query_params(url),
+            arrow_results=arrow_results,
         )
 
     def __init__(  # noqa: D
@@ -235,6 +243,7 @@ class SnowflakeSqlClient(SqlAlchemySqlClient):
         private_key_file_pwd: Optional[str] = None,
         login_timeout: int = DEFAULT_LOGIN_TIMEOUT,
         client_session_keep_alive: bool = DEFAULT_CLIENT_SESSION_KEEP_ALIVE,
+        arrow_results: bool = False,
     ) -> None:
         SnowflakeSqlClient._validate_credentials(
             str(SqlAlchemySqlClient.build_engine_url(SqlDialect.SNOWFLAKE.value, database, username, None, host)),
@@ -264,7 +273,10 @@ class SnowflakeSqlClient(SqlAlchemySqlClient):
         self._known_sessions_ids_lock = threading.Lock()
         self._known_session_ids: Set[int] = set()
         super().__init__(
-            engine=self._create_engine(login_timeout=login_timeout, client_session_keep_alive=client_session_keep_alive)
+            engine=self._create_engine(
+                login_timeout=login_timeout, client_session_keep_alive=client_session_keep_alive
+            ),
+            arrow_results=arrow_results,
         )
 
     def _create_engine(
@@ -350,19 +362,57 @@ class SnowflakeSqlClient(SqlAlchemySqlClient):
             try:
                 return pd.read_sql_query(sqlalchemy.text(stmt), conn, params=bind_params.param_dict)
             except ProgrammingError as e:
-                if "Authentication token has expired" in str(e) and allow_re_auth:
-                    logger.warning(
-                        "Snowflake authentication token expired. Attempting to re-auth, then we'll re-run the query"
-                    )
-                    with self._engine_lock:
-                        self._engine.dispose()
-                        self._engine = self._create_engine()
+                if SnowflakeSqlClient._is_expired_token_error(e) and allow_re_auth:
+                    self._reset_engine()
                     # this was our one chance to re-auth
                     return self._query(
                         stmt, allow_re_auth=False, bind_params=bind_params, isolation_level=isolation_level
                     )
                 raise e
 
+    @staticmethod
+    def _is_expired_token_error(e: ProgrammingError) -> bool:
+        return "Authentication token has expired" in str(e)
+
+    def _reset_engine(self) -> None:
+        """Re-create the engine so that new connections re-authenticate."""
+        logger.warning("Snowflake authentication token expired. Attempting to re-auth, then we'll re-run the query")
+        with self._engine_lock:
+            self._engine.dispose()
+            self._engine = self._create_engine()
+
+    def _query_arrow(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters = SqlBindParameters(),
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        allow_re_auth: bool = True,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> Optional[pa.Table]:
+        """Run the query, fetching the result batches from Snowflake in Arrow format.
+
+        Returns None if the connector didn't return a table (e.g. older versions do so for empty results).
+        """
+        check_isolation_level(self, isolation_level)
+        with self._engine_connection(
+            engine=self._engine, isolation_level=isolation_level, system_tags=system_tags, extra_tags=extra_tags
+        ) as conn:
+            try:
+                result = conn.execute(sqlalchemy.text(stmt), bind_params.param_dict)
+            except ProgrammingError as e:
+                if SnowflakeSqlClient._is_expired_token_error(e) and allow_re_auth:
+                    self._reset_engine()
+                    return self._query_arrow(
+                        stmt, allow_re_auth=False, bind_params=bind_params, isolation_level=isolation_level
+                    )
+                raise e
+            try:
+                fetch_arrow_all = getattr(result.cursor, "fetch_arrow_all", None)
+                return fetch_arrow_all() if fetch_arrow_all is not None else None
+            finally:
+                result.close()
+
     def _engine_specific_query_implementation(
         self,
         stmt: str,
@@ -379,6 +429,22 @@ class SnowflakeSqlClient(SqlAlchemySqlClient):
             extra_tags=extra_tags,
         )
 
+    def _engine_specific_query_arrow_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+        system_tags: SqlRequestTagSet = SqlRequestTagSet(),
+        extra_tags: SqlJsonTag = SqlJsonTag(),
+    ) -> Optional[pa.Table]:
+        return self._query_arrow(
+            stmt,
+            bind_params=bind_params,
+            isolation_level=isolation_level,
+            system_tags=system_tags,
+            extra_tags=extra_tags,
+        )
+
     def list_tables(self, schema_name: str) -> Sequence[str]:  # noqa: D
         df = self.query(
             f"SHOW TABLES IN {schema_name}",
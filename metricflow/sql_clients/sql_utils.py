@@ -1,4 +1,8 @@
-from typing import Any, List, Optional, Set
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Set
 from urllib.parse import quote_plus
 
 import dateutil.parser
@@ -7,6 +11,7 @@ from sqlalchemy.engine import URL, make_url
 
 from metricflow.configuration.constants import (
     CONFIG_DWH_ACCOUNT,
+    CONFIG_DWH_ARROW_RESULTS,
     CONFIG_DWH_DB,
     CONFIG_DWH_DIALECT,
     CONFIG_DWH_HOST,
@@ -24,7 +29,7 @@ from metricflow.configuration.constants import (
 from metricflow.configuration.yaml_handler import YamlFileHandler
 from metricflow.protocols.async_sql_client import AsyncSqlClient
 from metricflow.protocols.sql_client import SqlClient, SqlIsolationLevel
-from metricflow.protocols.sql_request import SqlJsonTag
+from metricflow.protocols.sql_request import SqlJsonTag, SqlRequestId, SqlRequestResult
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.sql_clients.base_sql_client_implementation import SqlClientException
 from metricflow.sql_clients.clickhouse import ClickHouseSqlClient
@@ -38,6 +43,8 @@ from metricflow.sql_clients.snowflake import SnowflakeSqlClient
 from metricflow.sql_clients.starrocks import StarRocksSqlClient
 from metricflow.sql_clients.trino import TrinoSqlClient
 
+logger = logging.getLogger(__name__)
+
 
 def make_df(  # type: ignore [misc]
     sql_client: SqlClient, columns: List[str], data: Any, time_columns: Optional[Set[str]] = None
@@ -134,9 +141,11 @@ def make_sql_client_from_config(handler: YamlFileHandler) -> AsyncSqlClient:
 
     url = handler.url
     dialect = not_empty(handler.get_value(CONFIG_DWH_DIALECT), CONFIG_DWH_DIALECT, url).lower()
+    # Only used by clients with a native Arrow fetch path. See BaseSqlClientImplementation.__init__().
+    arrow_results = (handler.get_value(CONFIG_DWH_ARROW_RESULTS) or "").lower() in ["yes", "y", "true", "t", "1"]
     if dialect == SqlDialect.DUCKDB.value:
         database = not_empty(handler.get_value(CONFIG_DWH_DB), CONFIG_DWH_DB, url)
-        return DuckDbSqlClient(file_path=database)
+        return DuckDbSqlClient(file_path=database, arrow_results=arrow_results)
     elif dialect == SqlDialect.MYSQL.value:
         # For MySQL, we need to construct a connection URL from config components
         host = not_empty(handler.get_value(CONFIG_DWH_HOST), "host", url)
@@ -219,6 +228,7 @@ def make_sql_client_from_config(handler: YamlFileHandler) -> AsyncSqlClient:
             private_key=private_key,
             private_key_file=private_key_file,
             private_key_file_pwd=private_key_file_pwd,
+            arrow_results=arrow_results,
         )
     else:
         raise ValueError(
@@ -227,6 +237,31 @@ def make_sql_client_from_config(handler: YamlFileHandler) -> AsyncSqlClient:
         )
 
 
+_request_listeners = threading.local()
+
+
+@contextmanager
+def sql_request_listener(listener: Callable[[SqlRequestId], None]) -> Iterator[None]:
+    """While in the context, call the function with the ID of each request that this thread sends through sync_execute()
+    or sync_query_result().
+
+    This lets code that runs tasks in other threads (e.g. ParallelPlanExecutor) find the requests of those tasks, for
+    example to cancel them.
+    """
+    previous_listener = getattr(_request_listeners, "listener", None)
+    _request_listeners.listener = listener
+    try:
+        yield
+    finally:
+        _request_listeners.listener = previous_listener
+
+
+def _notify_request_listener(request_id: SqlRequestId) -> None:
+    listener: Optional[Callable[[SqlRequestId], None]] = getattr(_request_listeners, "listener", None)
+    if listener is not None:
+        listener(request_id)
+
+
 def sync_execute(  # noqa: D
     async_sql_client: AsyncSqlClient,
     statement: str,
@@ -240,6 +275,7 @@ def sync_execute(  # noqa: D
         extra_tags=extra_sql_tags,
         isolation_level=isolation_level,
     )
+    _notify_request_listener(request_id)
 
     result = async_sql_client.async_request_result(request_id)
     if result.exception:
@@ -249,19 +285,21 @@ def sync_execute(  # noqa: D
     return
 
 
-def sync_query(  # noqa: D
+def sync_query_result(
     async_sql_client: AsyncSqlClient,
     statement: str,
     bind_parameters: SqlBindParameters = SqlBindParameters(),
     extra_sql_tags: SqlJsonTag = SqlJsonTag(),
     isolation_level: Optional[SqlIsolationLevel] = None,
-) -> pd.DataFrame:
+) -> SqlRequestResult:
+    """Run the query and return the result, which includes the Arrow table if the client fetched one."""
     request_id = async_sql_client.async_query(
         statement=statement,
         bind_parameters=bind_parameters,
         extra_tags=extra_sql_tags,
         isolation_level=isolation_level,
     )
+    _notify_request_listener(request_id)
 
     result = async_sql_client.async_request_result(request_id)
     if result.exception:
@@ -269,4 +307,95 @@ def sync_query(  # noqa: D
             f"Got an exception when trying to execute a statement: {result.exception}"
         ) from result.exception
     assert result.df is not None, "A dataframe should have been returned if there was no error"
+    return result
+
+
+async def async_query_result(
+    async_sql_client: AsyncSqlClient,
+    statement: str,
+    bind_parameters: SqlBindParameters = SqlBindParameters(),
+    extra_sql_tags: SqlJsonTag = SqlJsonTag(),
+    isolation_level: Optional[SqlIsolationLevel] = None,
+) -> SqlRequestResult:
+    """Like sync_query_result(), but waits for the result without blocking the event loop or another thread.
+
+    If the calling task is cancelled, the request is cancelled in the SQL engine if the client supports it.
+    """
+    loop = asyncio.get_running_loop()
+    request_finished: asyncio.Future[None] = loop.create_future()
+
+    def _set_finished() -> None:
+        if not request_finished.done():
+            request_finished.set_result(None)
+
+    def _on_request_finished(_: SqlRequestId) -> None:
+        try:
+            loop.call_soon_threadsafe(_set_finished)
+        except RuntimeError:
+            # The event loop was closed while the request was running.
+            pass
+
+    request_id = async_sql_client.async_query(
+        statement=statement,
+        bind_parameters=bind_parameters,
+        extra_tags=extra_sql_tags,
+        isolation_level=isolation_level,
+    )
+    async_sql_client.add_done_callback(request_id, _on_request_finished)
+    try:
+        await request_finished
+    except asyncio.CancelledError:
+        _cancel_request(async_sql_client, request_id)
+        raise
+
+    result = async_sql_client.async_request_result(request_id)
+    if result.exception:
+        raise SqlClientException(
+            f"Got an exception when trying to execute a statement: {result.exception}"
+        ) from result.exception
+    assert result.df is not None, "A dataframe should have been returned if there was no error"
+    return result
+
+
+def cancel_requests(async_sql_client: AsyncSqlClient, request_ids: Sequence[SqlRequestId]) -> None:
+    """Cancels the requests in the SQL engine. This is best-effort, so errors are logged instead of raised."""
+    request_id_set = set(request_ids)
+    if not request_id_set:
+        return
+    try:
+        num_cancelled = async_sql_client.cancel_request(
+            lambda combined_tags: combined_tags.system_tags.request_id in request_id_set
+        )
+        logger.info(f"Sent {num_cancelled} cancellation command(s) for requests {list(request_ids)}")
+    except NotImplementedError:
+        logger.info(f"Unable to cancel requests {list(request_ids)} as the SQL client doesn't support cancellation")
+    except Exception:
+        logger.warning(f"Got an exception while cancelling requests {list(request_ids)}", exc_info=True)
+
+
+def _cancel_request(async_sql_client: AsyncSqlClient, request_id: SqlRequestId) -> None:
+    """Cancels the request in the SQL engine (best-effort), and discards the result once the request finishes."""
+    cancel_requests(async_sql_client, (request_id,))
+
+    def _discard_result(_: SqlRequestId) -> None:
+        async_sql_client.async_request_result(request_id)
+
+    async_sql_client.add_done_callback(request_id, _discard_result)
+
+
+def sync_query(  # noqa: D
+    async_sql_client: AsyncSqlClient,
+    statement: str,
+    bind_parameters: SqlBindParameters = SqlBindParameters(),
+    extra_sql_tags: SqlJsonTag = SqlJsonTag(),
+    isolation_level: Optional[SqlIsolationLevel] = None,
+) -> pd.DataFrame:
+    result = sync_query_result(
+        async_sql_client,
+        statement,
+        bind_parameters=bind_parameters,
+        extra_sql_tags=extra_sql_tags,
+        isolation_level=isolation_level,
+    )
+    assert result.df is not None
     return result.df
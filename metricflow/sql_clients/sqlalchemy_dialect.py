@@ -4,7 +4,7 @@ import logging
 import time
 from abc import ABC
 from contextlib import contextmanager
-from typing import Iterator, Optional, Mapping, Union, Sequence, Set, Callable
+from typing import Iterator, Optional, Mapping, Union, Sequence, Set, Callable, Tuple
 
 import pandas as pd
 import sqlalchemy
@@ -24,9 +24,13 @@ logger = logging.getLogger(__name__)
 class SqlAlchemySqlClient(BaseSqlClientImplementation, ABC):
     """Base class for to create DBClients for engines supported by SQLAlchemy."""
 
-    def __init__(self, engine: sqlalchemy.engine.Engine) -> None:  # noqa: D
+    def __init__(self, engine: sqlalchemy.engine.Engine, arrow_results: bool = False) -> None:  # noqa: D
         self._engine = engine
-        super().__init__()
+        super().__init__(arrow_results=arrow_results)
+
+    @property
+    def connection_identity(self) -> str:  # noqa: D
+        return self._engine.url.render_as_string(hide_password=True)
 
     @staticmethod
     def build_engine_url(  # noqa: D
@@ -125,6 +129,31 @@ class SqlAlchemySqlClient(BaseSqlClientImplementation, ABC):
 
             return pd.DataFrame(rows, columns=columns)
 
+    def _engine_specific_query_chunks_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        chunk_size: int,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Fetches rows using a server-side cursor where the driver supports it, so rows are fetched as needed."""
+        with self._engine_connection(self._engine, isolation_level=isolation_level) as conn:
+            result = conn.execute(
+                sqlalchemy.text(stmt),
+                bind_params.param_dict,
+                execution_options={"stream_results": True, "max_row_buffer": chunk_size},
+            )
+            try:
+                columns = list(result.keys())
+                num_chunks = 0
+                for rows in result.partitions(chunk_size):
+                    num_chunks += 1
+                    yield pd.DataFrame([tuple(row) for row in rows], columns=columns)
+                if num_chunks == 0:
+                    yield pd.DataFrame([], columns=columns)
+            finally:
+                result.close()
+
     def _engine_specific_execute_implementation(
         self,
         stmt: str,
@@ -139,6 +168,14 @@ class SqlAlchemySqlClient(BaseSqlClientImplementation, ABC):
             conn.execute(sqlalchemy.text(stmt), bind_params.param_dict)
             conn.commit()
 
+    def _engine_specific_execute_in_transaction_implementation(  # noqa: D
+        self, statements: Sequence[Tuple[str, SqlBindParameters]]
+    ) -> None:
+        with self._engine_connection(self._engine) as conn:
+            with conn.begin():
+                for stmt, bind_params in statements:
+                    conn.execute(sqlalchemy.text(stmt), bind_params.param_dict)
+
     def _engine_specific_dry_run_implementation(self, stmt: str, bind_params: SqlBindParameters) -> None:  # noqa: D
         with self._engine_connection(self._engine) as conn:
             s = "EXPLAIN " + stmt
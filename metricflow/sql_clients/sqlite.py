@@ -1,7 +1,7 @@
 import logging
 import threading
 import time
-from typing import ClassVar, Optional, Sequence, Callable
+from typing import ClassVar, Iterator, Optional, Sequence, Callable, Tuple
 
 import pandas as pd
 import sqlalchemy
@@ -41,10 +41,13 @@ class SqliteEngineAttributes:
     discrete_percentile_aggregation_supported: ClassVar[bool] = False
     approximate_continuous_percentile_aggregation_supported: ClassVar[bool] = False
     approximate_discrete_percentile_aggregation_supported: ClassVar[bool] = False
+    materialized_ctes_supported: ClassVar[bool] = True
+    transactions_supported: ClassVar[bool] = True
 
     # SQL Dialect replacement strings
     double_data_type_name: ClassVar[str] = "DOUBLE"
     timestamp_type_name: ClassVar[Optional[str]] = "TIMESTAMP"
+    string_data_type_name: ClassVar[str] = "TEXT"
     random_function_name: ClassVar[str] = "RANDOM"
 
     # MetricFlow attributes
@@ -99,6 +102,27 @@ class SqliteSqlClient(SqlAlchemySqlClient):
                 stmt=stmt, bind_params=bind_params, isolation_level=isolation_level
             )
 
+    def _engine_specific_query_chunks_implementation(
+        self,
+        stmt: str,
+        bind_params: SqlBindParameters,
+        chunk_size: int,
+        isolation_level: Optional[SqlIsolationLevel] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Fetches all chunks while holding the lock, then returns them.
+
+        Holding the lock while the caller consumes the chunks would block other statements for as long as the iterator
+        is alive, and indefinitely if it's abandoned without being closed. As the database is local, the result is
+        materialized instead.
+        """
+        with self._concurrency_lock:
+            chunks = list(
+                super()._engine_specific_query_chunks_implementation(
+                    stmt=stmt, bind_params=bind_params, chunk_size=chunk_size, isolation_level=isolation_level
+                )
+            )
+        return iter(chunks)
+
     def _engine_specific_execute_implementation(
         self,
         stmt: str,
@@ -112,6 +136,12 @@ class SqliteSqlClient(SqlAlchemySqlClient):
                 stmt=stmt, bind_params=bind_params, isolation_level=isolation_level
             )
 
+    def _engine_specific_execute_in_transaction_implementation(  # noqa: D
+        self, statements: Sequence[Tuple[str, SqlBindParameters]]
+    ) -> None:
+        with self._concurrency_lock:
+            return super()._engine_specific_execute_in_transaction_implementation(statements)
+
     def _engine_specific_dry_run_implementation(self, stmt: str, bind_params: SqlBindParameters) -> None:  # noqa: D
         with self._concurrency_lock:
             return super()._engine_specific_dry_run_implementation(stmt=stmt, bind_params=bind_params)
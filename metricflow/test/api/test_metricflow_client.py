@@ -1,8 +1,12 @@
+import pandas as pd
+import pytest
+
 from metricflow.api.metricflow_client import MetricFlowClient
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.engine.models import Dimension, Materialization, Metric
 from metricflow.model.validations.validator_helpers import ModelValidationResults
 from metricflow.object_utils import random_id
+from metricflow.test.compare_df import assert_dataframes_equal
 
 
 def test_query(mf_client: MetricFlowClient) -> None:  # noqa: D
@@ -102,3 +106,60 @@ def test_materializations(mf_client: MetricFlowClient) -> None:  # noqa: D
 def test_validate_configs(mf_client: MetricFlowClient) -> None:  # noqa: D
     issues = mf_client.validate_configs()
     assert isinstance(issues, ModelValidationResults)
+
+
+def test_plan_cache(mf_client: MetricFlowClient) -> None:  # noqa: D
+    mf_client.engine.clear_plan_cache()
+    misses = mf_client.engine.plan_cache_stats.misses
+    hits = mf_client.engine.plan_cache_stats.hits
+
+    first_result = mf_client.explain(["bookings"], ["ds"], start_time="2019-01-01", end_time="2024-01-01")
+    # Names are normalized, and the request ID is not a part of the key.
+    second_result = mf_client.explain(["BOOKINGS"], ["ds"], start_time="2019-01-01", end_time="2024-01-01")
+    assert second_result is first_result
+    assert mf_client.engine.plan_cache_stats.misses == misses + 1
+    assert mf_client.engine.plan_cache_stats.hits == hits + 1
+
+    different_result = mf_client.explain(["bookings"], ["ds"], start_time="2019-01-01", end_time="2023-01-01")
+    assert different_result is not first_result
+
+    result = mf_client.query(["bookings"], ["ds"], start_time="2019-01-01", end_time="2024-01-01")
+    assert result.sql == first_result.rendered_sql.sql_query
+    assert result.result_df is not None
+
+
+def test_plan_cache_creates_time_spine_table(mf_client: MetricFlowClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that the time spine table is created for cached plans that read from it."""
+    mf_client.engine.clear_plan_cache()
+    first_result = mf_client.explain(
+        ["trailing_2_months_revenue"], ["metric_time"], start_time="2019-01-01", end_time="2024-01-01"
+    )
+
+    time_spine_table_builder = mf_client.engine._time_spine_table_builder
+    create_calls = []
+    monkeypatch.setattr(time_spine_table_builder, "create_if_necessary", lambda: create_calls.append(1))
+    second_result = mf_client.explain(
+        ["trailing_2_months_revenue"], ["metric_time"], start_time="2019-01-01", end_time="2024-01-01"
+    )
+    assert second_result is first_result
+    assert len(create_calls) == 1
+
+    mf_client.explain(["bookings"], ["ds"], start_time="2019-01-01", end_time="2024-01-01")
+    mf_client.explain(["bookings"], ["ds"], start_time="2019-01-01", end_time="2024-01-01")
+    assert len(create_calls) == 1
+
+
+def test_query_chunks(mf_client: MetricFlowClient) -> None:  # noqa: D
+    expected_df = mf_client.query(
+        ["bookings"], ["ds"], order=["ds"], start_time="2019-01-01", end_time="2024-01-01"
+    ).result_df
+    assert expected_df is not None
+
+    chunks = list(
+        mf_client.query_chunks(
+            ["bookings"], ["ds"], order=["ds"], start_time="2019-01-01", end_time="2024-01-01", chunk_size=2
+        )
+    )
+    assert len(chunks) == (len(expected_df) + 1) // 2
+    assert all(len(chunk) <= 2 for chunk in chunks)
+    assert_dataframes_equal(actual=pd.concat(chunks, ignore_index=True), expected=expected_df)
@@ -1,6 +1,9 @@
+import pathlib
 from datetime import date
 from unittest.mock import patch, MagicMock
 
+import pandas as pd
+
 from metricflow.cli.cli_context import CLIContext
 from metricflow.cli.main import (
     drop_materialization,
@@ -31,6 +34,29 @@ def test_query(cli_runner: MetricFlowCliRunner) -> None:  # noqa: D
     assert resp.exit_code == 0
 
 
+def test_query_to_csv(cli_runner: MetricFlowCliRunner, tmp_path: pathlib.Path) -> None:  # noqa: D
+    csv_path = tmp_path / "result.csv"
+    resp = cli_runner.run(query, args=["--metrics", "bookings", "--dimensions", "ds", "--csv", str(csv_path)])
+    assert resp.exit_code == 0
+    assert "Successfully written query output" in resp.output
+
+    df = pd.read_csv(csv_path)
+    assert df.columns.tolist() == ["ds", "bookings"]
+    assert len(df) > 0
+
+
+def test_query_to_csv_with_empty_result(cli_runner: MetricFlowCliRunner, tmp_path: pathlib.Path) -> None:
+    """Tests that no file is written for an empty result, as before results were streamed to the file."""
+    csv_path = tmp_path / "result.csv"
+    where = "is_instant AND NOT is_instant"
+    resp = cli_runner.run(
+        query, args=["--metrics", "bookings", "--dimensions", "ds", "--where", where, "--csv", str(csv_path)]
+    )
+    assert resp.exit_code == 0
+    assert "empty result set" in resp.output
+    assert not csv_path.exists()
+
+
 def test_list_dimensions(cli_runner: MetricFlowCliRunner) -> None:  # noqa: D
     resp = cli_runner.run(list_dimensions, args=["--metric-names", "bookings"])
 
@@ -71,6 +97,23 @@ def test_materialize(cli_runner: MetricFlowCliRunner) -> None:  # noqa: D
     assert resp.exit_code == 0
 
 
+def test_incremental_materialize_confirms_full_build(cli_runner: MetricFlowCliRunner) -> None:  # noqa: D
+    cli_runner.run(drop_materialization, args=["--materialization-name", "test_materialization"])
+    # Without a previous build, an incremental build materializes from the beginning of time.
+    resp = cli_runner.invoke(
+        materialize,
+        args=["--materialization-name", "test_materialization", "--incremental", "--lookback", "3"],
+        obj=cli_runner.cli_context,
+        input="n\n",
+    )
+
+    assert "beginning of time" in resp.output
+    assert "Exiting" in resp.output
+
+    resp = cli_runner.run(materialize, args=["--materialization-name", "test_materialization", "--lookback", "3"])
+    assert resp.exit_code != 0
+
+
 def test_drop_materialization(cli_runner: MetricFlowCliRunner) -> None:  # noqa: D
     resp = cli_runner.run(drop_materialization, args=["--materialization-name", "test_materialization"])
 
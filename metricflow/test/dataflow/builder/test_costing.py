@@ -1,12 +1,20 @@
 import logging
+from typing import Dict, Optional
 
-from metricflow.dataflow.builder.costing import DefaultCostFunction, DefaultCost
+from metricflow.dataflow.builder.costing import (
+    DefaultCostFunction,
+    DefaultCost,
+    StatisticsCost,
+    StatisticsCostFunction,
+    TableRowCountSource,
+)
 from metricflow.dataflow.dataflow_plan import (
     FilterElementsNode,
     AggregateMeasuresNode,
     JoinToBaseOutputNode,
     JoinDescription,
 )
+from metricflow.dataflow.sql_table import SqlTable
 from metricflow.dataset.data_source_adapter import DataSourceDataSet
 from metricflow.specs import (
     MeasureSpec,
@@ -21,7 +29,18 @@ from metricflow.test.fixtures.model_fixtures import ConsistentIdObjectRepository
 logger = logging.getLogger(__name__)
 
 
-def test_costing(consistent_id_object_repository: ConsistentIdObjectRepository) -> None:  # noqa: D
+class _FixedRowCountSource(TableRowCountSource):
+    def __init__(self, row_counts: Dict[str, int]) -> None:
+        self._row_counts = row_counts
+
+    def get_row_count(self, sql_table: SqlTable) -> Optional[int]:
+        return self._row_counts.get(sql_table.table_name)
+
+
+def _bookings_aggregated_node(
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+) -> AggregateMeasuresNode[DataSourceDataSet]:
+    """Create a node that aggregates bookings after joining listings."""
     bookings_node = consistent_id_object_repository.simple_model_read_nodes["bookings_source"]
     listings_node = consistent_id_object_repository.simple_model_read_nodes["listings_latest"]
 
@@ -71,11 +90,31 @@ def test_costing(consistent_id_object_repository: ConsistentIdObjectRepository)
         ],
     )
 
-    bookings_aggregated = AggregateMeasuresNode[DataSourceDataSet](
+    return AggregateMeasuresNode[DataSourceDataSet](
         parent_node=join_node, metric_input_measure_specs=(MetricInputMeasureSpec(measure_spec=bookings_spec),)
     )
 
+
+def test_costing(consistent_id_object_repository: ConsistentIdObjectRepository) -> None:  # noqa: D
+    bookings_aggregated = _bookings_aggregated_node(consistent_id_object_repository)
+
     cost_function = DefaultCostFunction[DataSourceDataSet]()
     cost = cost_function.calculate_cost(bookings_aggregated)
 
     assert cost == DefaultCost(num_joins=1, num_aggregations=1)
+
+
+def test_statistics_costing(consistent_id_object_repository: ConsistentIdObjectRepository) -> None:  # noqa: D
+    bookings_aggregated = _bookings_aggregated_node(consistent_id_object_repository)
+
+    # bookings_source is defined with an SQL query, so the default row count is used.
+    cost_function = StatisticsCostFunction[DataSourceDataSet](
+        row_count_source=_FixedRowCountSource({"dim_listings_latest": 10}), default_row_count=1000
+    )
+    cost = cost_function.calculate_cost(bookings_aggregated)
+
+    # Reading the sources, joining them, and then aggregating the 1000 rows from the join.
+    assert cost == StatisticsCost(num_rows_processed=(1000 + 10) + (1000 + 10) + 1000, num_output_rows=1000)
+    assert cost_function.calculate_cost(bookings_aggregated.parent_node.parent_nodes[1]) == StatisticsCost(
+        num_rows_processed=10, num_output_rows=10
+    )
@@ -3,15 +3,19 @@ import logging
 import pytest
 from _pytest.fixtures import FixtureRequest
 
+from metricflow.dataflow.builder.costing import DefaultCostFunction
 from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
 from metricflow.dataflow.dataflow_plan_to_text import dataflow_plan_as_text
 from metricflow.dataset.data_source_adapter import DataSourceDataSet
 from metricflow.dataset.dataset import DataSet
 from metricflow.errors.errors import UnableToSatisfyQueryError
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.plan_conversion.time_spine import TimeSpineSource
 from metricflow.specs import (
     MetricFlowQuerySpec,
     MetricSpec,
     DimensionSpec,
+    MeasureSpec,
     SpecWhereClauseConstraint,
     LinkableSpecSet,
     IdentifierReference,
@@ -21,6 +25,7 @@ from metricflow.specs import (
 )
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.test.dataflow_plan_to_svg import display_graph_if_requested
+from metricflow.test.fixtures.model_fixtures import ConsistentIdObjectRepository
 from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
 from metricflow.test.plan_utils import assert_plan_snapshot_text_equal
 from metricflow.test.time.metric_time_dimension import MTD_SPEC_DAY, MTD, MTD_SPEC_MONTH
@@ -536,6 +541,38 @@ def test_distinct_values_plan(  # noqa: D
     )
 
 
+def test_linkable_values_plan(  # noqa: D
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet],
+) -> None:
+    """Tests that a plan to get the values of a dimension reads the data source of the dimension without aggregating."""
+    dataflow_plan = dataflow_plan_builder.build_plan_for_linkable_values(
+        linkable_spec=DimensionSpec(
+            element_name="country_latest",
+            identifier_links=(IdentifierReference(element_name="listing"),),
+        ),
+        measure_specs=(MeasureSpec(element_name="bookings"),),
+        limit=100,
+    )
+
+    plan_text = dataflow_plan_as_text(dataflow_plan)
+    assert "<FilterElementsNode>" in plan_text
+    assert "<AggregateMeasuresNode>" not in plan_text
+    assert "<JoinToBaseOutputNode>" not in plan_text
+    assert "listings_latest" in plan_text
+
+    with pytest.raises(UnableToSatisfyQueryError):
+        dataflow_plan_builder.build_plan_for_linkable_values(
+            linkable_spec=DimensionSpec(
+                element_name="home_state_latest",
+                identifier_links=(
+                    IdentifierReference(element_name="listing"),
+                    IdentifierReference(element_name="user"),
+                ),
+            ),
+            measure_specs=(MeasureSpec(element_name="bookings"),),
+        )
+
+
 def test_measure_constraint_plan(
     request: FixtureRequest,
     mf_test_session_state: MetricFlowTestSessionState,
@@ -620,3 +657,34 @@ def test_common_data_source(  # noqa: D
         mf_test_session_state=mf_test_session_state,
         dag_graph=dataflow_plan,
     )
+
+
+def test_spec_registry_shared_across_queries(  # noqa: D
+    simple_semantic_model: SemanticModel,
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+    time_spine_source: TimeSpineSource,
+) -> None:
+    # A new model, so that the registry isn't filled by other tests.
+    semantic_model = SemanticModel(simple_semantic_model.user_configured_model)
+    dataflow_plan_builder = DataflowPlanBuilder(
+        source_nodes=consistent_id_object_repository.simple_model_source_nodes,
+        semantic_model=semantic_model,
+        cost_function=DefaultCostFunction[DataSourceDataSet](),
+        time_spine_source=time_spine_source,
+    )
+    query_spec = MetricFlowQuerySpec(
+        metric_specs=(MetricSpec(element_name="bookings"),),
+        dimension_specs=(
+            DataSet.metric_time_dimension_spec(TimeGranularity.DAY),
+            DimensionSpec(element_name="country_latest", identifier_links=(IdentifierReference("listing"),)),
+        ),
+    )
+    assert len(semantic_model.spec_registry) == 0
+
+    dataflow_plan_builder.build_plan(query_spec)
+    num_registered_specs = len(semantic_model.spec_registry)
+    assert num_registered_specs > 0
+
+    # Planning the query again should use the IDs registered by the first query.
+    dataflow_plan_builder.build_plan(query_spec)
+    assert len(semantic_model.spec_registry) == num_registered_specs
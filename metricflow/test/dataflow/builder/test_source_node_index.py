@@ -0,0 +1,84 @@
+from metricflow.caching import LruCache
+from metricflow.dataflow.builder.costing import DefaultCostFunction
+from metricflow.dataflow.builder.node_data_set import DataflowPlanNodeOutputDataSetResolver
+from metricflow.dataflow.builder.source_node_index import SourceNodeIndex
+from metricflow.dataset.data_source_adapter import DataSourceDataSet
+from metricflow.dataset.dataset import DataSet
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.plan_conversion.column_resolver import DefaultColumnAssociationResolver
+from metricflow.plan_conversion.node_processor import PreDimensionJoinNodeProcessor
+from metricflow.plan_conversion.time_spine import TimeSpineSource
+from metricflow.references import IdentifierReference
+from metricflow.specs import DimensionSpec, MeasureSpec
+from metricflow.test.fixtures.model_fixtures import ConsistentIdObjectRepository
+
+
+def _node_data_set_resolver(
+    semantic_model: SemanticModel, time_spine_source: TimeSpineSource
+) -> DataflowPlanNodeOutputDataSetResolver[DataSourceDataSet]:
+    return DataflowPlanNodeOutputDataSetResolver[DataSourceDataSet](
+        column_association_resolver=DefaultColumnAssociationResolver(semantic_model),
+        semantic_model=semantic_model,
+        time_spine_source=time_spine_source,
+    )
+
+
+def test_source_node_index_matches_scans(  # noqa: D
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+    simple_semantic_model: SemanticModel,
+    time_spine_source: TimeSpineSource,
+) -> None:
+    node_data_set_resolver = _node_data_set_resolver(simple_semantic_model, time_spine_source)
+    source_nodes = tuple(consistent_id_object_repository.simple_model_read_nodes.values())
+    index = SourceNodeIndex[DataSourceDataSet](
+        source_nodes=source_nodes,
+        node_data_set_resolver=node_data_set_resolver,
+        cost_function=DefaultCostFunction[DataSourceDataSet](),
+    )
+
+    bookings = MeasureSpec(element_name="bookings")
+    assert index.nodes_with_measures([bookings]) == [
+        node
+        for node in source_nodes
+        if bookings in node_data_set_resolver.get_output_data_set(node).instance_set.spec_set.measure_specs
+    ]
+    assert index.nodes_with_measures([bookings, MeasureSpec(element_name="not_a_measure")]) == []
+
+    desired_linkable_specs = [DimensionSpec.from_name("listing__country_latest")]
+    node_processor = PreDimensionJoinNodeProcessor(
+        data_source_semantics=simple_semantic_model.data_source_semantics,
+        node_data_set_resolver=node_data_set_resolver,
+    )
+    metric_time_dimension_reference = DataSet.metric_time_dimension_reference()
+    assert index.nodes_with_any_element(
+        node_processor.relevant_element_names(desired_linkable_specs, metric_time_dimension_reference)
+    ) == node_processor.remove_unnecessary_nodes(desired_linkable_specs, source_nodes, metric_time_dimension_reference)
+
+    listings_latest = consistent_id_object_repository.simple_model_read_nodes["listings_latest"]
+    assert listings_latest in index.nodes_with_identifier(IdentifierReference(element_name="listing"))
+    assert index.contains_identifier(listings_latest, IdentifierReference(element_name="listing"))
+    assert index.nodes_with_linkable_spec(DimensionSpec.from_name("country_latest")) == [listings_latest]
+    assert "country_latest" in index.element_names(listings_latest)
+
+
+def test_multi_hop_candidates_are_cached(  # noqa: D
+    consistent_id_object_repository: ConsistentIdObjectRepository,
+    multi_hop_join_semantic_model: SemanticModel,
+    time_spine_source: TimeSpineSource,
+) -> None:
+    node_data_set_resolver = _node_data_set_resolver(multi_hop_join_semantic_model, time_spine_source)
+    source_nodes = tuple(consistent_id_object_repository.multihop_model_read_nodes.values())
+    cache: LruCache = LruCache(max_size=16)
+    node_processor = PreDimensionJoinNodeProcessor(
+        data_source_semantics=multi_hop_join_semantic_model.data_source_semantics,
+        node_data_set_resolver=node_data_set_resolver,
+        multi_hop_candidate_cache=cache,
+    )
+    desired_linkable_specs = [DimensionSpec.from_name("account_id__customer_id__customer_name")]
+
+    nodes = node_processor.add_multi_hop_joins(desired_linkable_specs, source_nodes)
+    assert len(nodes) > len(source_nodes)
+    assert len(cache) == 1
+
+    assert node_processor.add_multi_hop_joins(desired_linkable_specs, source_nodes) == nodes
+    assert cache.stats.hits == 1
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from typing import Dict
+
+from _pytest.fixtures import FixtureRequest
+
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.dataflow_plan import (
+    DataflowPlanNode,
+    JoinToBaseOutputNode,
+    ReadSqlSourceNode,
+    WhereConstraintNode,
+)
+from metricflow.dataflow.dataflow_plan_to_text import dataflow_plan_as_text
+from metricflow.dataflow.optimizer.predicate_pushdown.predicate_pushdown_optimizer import (
+    PredicatePushdownOptimizer,
+    split_where_constraint,
+)
+from metricflow.dataset.data_source_adapter import DataSourceDataSet
+from metricflow.dataset.dataset import DataSet
+from metricflow.specs import (
+    DimensionSpec,
+    IdentifierReference,
+    LinkableSpecSet,
+    MetricFlowQuerySpec,
+    MetricSpec,
+    SpecWhereClauseConstraint,
+)
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.test.dataflow_plan_to_svg import display_graph_if_requested
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+from metricflow.test.plan_utils import assert_plan_snapshot_text_equal
+from metricflow.time.time_granularity import TimeGranularity
+
+COUNTRY_LATEST_SPEC = DimensionSpec(element_name="country_latest", identifier_links=(IdentifierReference("listing"),))
+IS_INSTANT_SPEC = DimensionSpec(element_name="is_instant", identifier_links=())
+
+
+def _where_constraint(where_condition: str) -> SpecWhereClauseConstraint:
+    return SpecWhereClauseConstraint(
+        where_condition=where_condition,
+        linkable_names=("listing__country_latest", "is_instant"),
+        linkable_spec_set=LinkableSpecSet(dimension_specs=(COUNTRY_LATEST_SPEC, IS_INSTANT_SPEC)),
+        execution_parameters=SqlBindParameters(),
+    )
+
+
+def test_split_where_constraint() -> None:  # noqa: D
+    conjuncts = split_where_constraint(
+        _where_constraint(
+            "listing__country_latest BETWEEN 'a' AND 'z' AND (is_instant AND listing__country_latest IS NULL)"
+        )
+    )
+    assert [x.where_constraint.where_condition for x in conjuncts] == [
+        "listing__country_latest BETWEEN 'a' AND 'z'",
+        "is_instant",
+        "listing__country_latest IS NULL",
+    ]
+    assert [x.where_constraint.linkable_spec_set.dimension_specs for x in conjuncts] == [
+        (COUNTRY_LATEST_SPEC,),
+        (IS_INSTANT_SPEC,),
+        (COUNTRY_LATEST_SPEC,),
+    ]
+    assert [x.null_rejecting for x in conjuncts] == [True, True, False]
+
+    renamed_conjunct = conjuncts[0].without_first_identifier_link()
+    assert renamed_conjunct is not None
+    assert renamed_conjunct.where_constraint.where_condition == "country_latest BETWEEN 'a' AND 'z'"
+    assert renamed_conjunct.where_constraint.linkable_spec_set.dimension_specs == (
+        DimensionSpec(element_name="country_latest", identifier_links=()),
+    )
+
+    # Disjunctions can't be split.
+    assert len(split_where_constraint(_where_constraint("listing__country_latest = 'us' OR is_instant"))) == 1
+
+
+def test_push_down_where_constraint(  # noqa: D
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet],
+) -> None:
+    dataflow_plan = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(MetricSpec(element_name="bookings"),),
+            dimension_specs=(DataSet.metric_time_dimension_spec(TimeGranularity.DAY),),
+            where_constraint=_where_constraint("listing__country_latest = 'us' AND is_instant"),
+        )
+    )
+    optimized_dataflow_plan = PredicatePushdownOptimizer[DataSourceDataSet]().optimize(dataflow_plan)
+
+    assert_plan_snapshot_text_equal(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        plan=optimized_dataflow_plan,
+        plan_snapshot_text=dataflow_plan_as_text(optimized_dataflow_plan),
+    )
+
+    display_graph_if_requested(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        dag_graph=optimized_dataflow_plan,
+    )
+
+    # The country constraint is applied to the node that is joined, and it's kept after the join.
+    where_node = optimized_dataflow_plan.sink_output_node.parent_node.parent_node.parent_node.parent_node
+    assert isinstance(where_node, WhereConstraintNode)
+    assert where_node.where.where_condition == "listing__country_latest = 'us'"
+    join_node = where_node.parent_node.parent_node
+    assert isinstance(join_node, JoinToBaseOutputNode)
+    assert isinstance(join_node.left_node, WhereConstraintNode)
+    assert join_node.left_node.where.where_condition == "is_instant"
+    assert isinstance(join_node.join_targets[0].join_node, WhereConstraintNode)
+    assert join_node.join_targets[0].join_node.where.where_condition == "country_latest = 'us'"
+
+
+def test_non_null_rejecting_constraint_not_pushed_to_joined_node(  # noqa: D
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet],
+) -> None:
+    dataflow_plan = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(MetricSpec(element_name="bookings"),),
+            dimension_specs=(DataSet.metric_time_dimension_spec(TimeGranularity.DAY),),
+            where_constraint=_where_constraint("listing__country_latest IS NULL"),
+        )
+    )
+    optimized_dataflow_plan = PredicatePushdownOptimizer[DataSourceDataSet]().optimize(dataflow_plan)
+    assert dataflow_plan_as_text(optimized_dataflow_plan).count("<WhereConstraintNode>") == 1
+
+
+def test_unchanged_plan_keeps_nodes(  # noqa: D
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet],
+) -> None:
+    dataflow_plan = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(MetricSpec(element_name="bookings"), MetricSpec(element_name="booking_value")),
+            dimension_specs=(DataSet.metric_time_dimension_spec(TimeGranularity.DAY),),
+        )
+    )
+    optimized_dataflow_plan = PredicatePushdownOptimizer[DataSourceDataSet]().optimize(dataflow_plan)
+    assert optimized_dataflow_plan.sink_output_node is dataflow_plan.sink_output_node
+
+
+def _all_nodes(node: DataflowPlanNode, nodes: Dict[int, DataflowPlanNode]) -> Dict[int, DataflowPlanNode]:
+    """Returns the node and its ancestors, keyed by the Python object ID."""
+    nodes[id(node)] = node
+    for parent_node in node.parent_nodes:
+        _all_nodes(parent_node, nodes)
+    return nodes
+
+
+def test_branches_without_pushdown_are_kept(  # noqa: D
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet],
+) -> None:
+    dataflow_plan = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(MetricSpec(element_name="bookings"), MetricSpec(element_name="booking_value")),
+            dimension_specs=(DataSet.metric_time_dimension_spec(TimeGranularity.DAY),),
+            where_constraint=_where_constraint("listing__country_latest = 'us' AND is_instant"),
+        )
+    )
+    optimized_dataflow_plan = PredicatePushdownOptimizer[DataSourceDataSet]().optimize(dataflow_plan)
+    assert dataflow_plan_as_text(optimized_dataflow_plan).count("<WhereConstraintNode>") > 1
+
+    # The source nodes are shared by the branches of the plan, and nothing changes above them, so the same objects
+    # should be in the optimized plan.
+    nodes = _all_nodes(dataflow_plan.sink_output_node, {})
+    optimized_nodes = _all_nodes(optimized_dataflow_plan.sink_output_node, {})
+    source_nodes = {x for x, node in nodes.items() if isinstance(node, ReadSqlSourceNode)}
+    optimized_source_nodes = {x for x, node in optimized_nodes.items() if isinstance(node, ReadSqlSourceNode)}
+    assert optimized_source_nodes == source_nodes
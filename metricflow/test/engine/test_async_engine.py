@@ -0,0 +1,45 @@
+import asyncio
+import datetime
+
+from metricflow.engine.metricflow_engine import AsyncMetricFlowEngine, MetricFlowEngine, MetricFlowQueryRequest
+
+
+def test_async_engine(engine: MetricFlowEngine) -> None:  # noqa: D
+    async_engine = AsyncMetricFlowEngine(engine)
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings", "listings"], group_by_names=["metric_time"]
+    )
+
+    async def _query_concurrently() -> None:
+        explain_result, query_result, dimension_values = await asyncio.gather(
+            async_engine.explain(mf_request),
+            async_engine.query(mf_request),
+            async_engine.get_dimension_values(metric_name="bookings", get_group_by_values="is_instant"),
+        )
+        assert explain_result.query_spec == engine.explain(mf_request).query_spec
+
+        expected_df = engine.query(mf_request).result_df
+        assert query_result.result_df is not None and expected_df is not None
+        assert query_result.result_df.equals(expected_df)
+
+        assert sorted(dimension_values) == sorted(
+            engine.get_dimension_values(metric_name="bookings", get_group_by_values="is_instant")
+        )
+
+    asyncio.run(_query_concurrently())
+
+
+def test_async_dimension_values_from_metric_query(engine: MetricFlowEngine) -> None:
+    """Tests getting dimension values with a time constraint, which reads them from the result of a metric query."""
+    async_engine = AsyncMetricFlowEngine(engine)
+    time_constraint_start = datetime.datetime(2019, 1, 1)
+
+    dimension_values = asyncio.run(
+        async_engine.get_dimension_values(
+            metric_name="bookings", get_group_by_values="is_instant", time_constraint_start=time_constraint_start
+        )
+    )
+    engine.clear_dimension_values_cache()
+    assert dimension_values == engine.get_dimension_values(
+        metric_name="bookings", get_group_by_values="is_instant", time_constraint_start=time_constraint_start
+    )
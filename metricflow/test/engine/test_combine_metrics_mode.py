@@ -0,0 +1,33 @@
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.plan_conversion.dataflow_to_execution import CombineMetricsExecutionMode
+
+METRIC_NAMES = [
+    "bookings",
+    "instant_bookings",
+    "booking_value",
+    "max_booking_value",
+    "min_booking_value",
+    "bookers",
+    "views",
+    "listings",
+    "largest_listing",
+    "smallest_listing",
+]
+
+
+def test_many_metrics_use_single_query_by_default(engine: MetricFlowEngine) -> None:  # noqa: D
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=METRIC_NAMES, group_by_names=["metric_time"]
+    )
+
+    explain_result = engine.explain(mf_request)
+    assert len(explain_result.execution_plan.tasks) == 1
+    assert ";" not in explain_result.rendered_sql.sql_query
+
+    # Running a query per metric is opt-in per request.
+    query_per_metric_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=METRIC_NAMES,
+        group_by_names=["metric_time"],
+        combine_metrics_mode=CombineMetricsExecutionMode.QUERY_PER_METRIC,
+    )
+    assert len(engine.explain(query_per_metric_request).execution_plan.tasks) > 1
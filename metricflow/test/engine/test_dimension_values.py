@@ -0,0 +1,146 @@
+import datetime
+from typing import List
+
+import pytest
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest, _DimensionValuesCacheKey
+
+
+def _values_from_metric_query(engine: MetricFlowEngine, metric_name: str, group_by_name: str) -> List[str]:
+    result_df = engine.query(
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=[metric_name], group_by_names=[group_by_name])
+    ).result_df
+    assert result_df is not None
+    return sorted(str(value) for value in result_df[group_by_name].dropna())
+
+
+@pytest.mark.parametrize("group_by_name", ["listing__country_latest", "is_instant", "listing"])
+def test_dimension_values_without_metric(engine: MetricFlowEngine, group_by_name: str) -> None:
+    """Tests that values read from the data source of the dimension include the values from a metric query."""
+    dimension_values = engine.get_dimension_values(metric_name="bookings", get_group_by_values=group_by_name)
+
+    assert dimension_values == sorted(dimension_values)
+    assert len(dimension_values) == len(set(dimension_values))
+    # Values without any bookings are also included.
+    assert set(_values_from_metric_query(engine, "bookings", group_by_name)).issubset(dimension_values)
+
+
+def test_dimension_value_query_does_not_aggregate(engine: MetricFlowEngine) -> None:  # noqa: D
+    model_state = engine._model_state
+    values_query = engine._create_dimension_values_query(
+        model_state,
+        _DimensionValuesCacheKey(
+            metric_name="bookings",
+            group_by_name="listing__country_latest",
+            time_constraint_start=None,
+            time_constraint_end=None,
+            limit=None,
+            prefix=None,
+        ),
+    )
+    assert values_query is not None
+    sql = values_query.execution_plan.tasks[0].sql_query
+    assert sql is not None
+    assert "GROUP BY" in sql.sql_query
+    assert "bookings_source" not in sql.sql_query
+    assert "SUM(" not in sql.sql_query
+
+
+def test_dimension_values_with_prefix_and_limit(engine: MetricFlowEngine) -> None:  # noqa: D
+    all_values = engine.get_dimension_values(metric_name="bookings", get_group_by_values="listing__country_latest")
+    assert len(all_values) > 1
+    prefix = all_values[-1][:1]
+    expected_values = [value for value in all_values if value.startswith(prefix)]
+
+    values_query = engine._create_dimension_values_query(
+        engine._model_state,
+        _DimensionValuesCacheKey(
+            metric_name="bookings",
+            group_by_name="listing__country_latest",
+            time_constraint_start=None,
+            time_constraint_end=None,
+            limit=1,
+            prefix=prefix,
+        ),
+    )
+    # The prefix and the limit are applied in the query from the first lookup.
+    assert values_query is not None
+    assert values_query.prefix is None
+    sql = values_query.execution_plan.tasks[0].sql_query
+    assert sql is not None and "LIKE" in sql.sql_query and "LIMIT" in sql.sql_query
+
+    assert (
+        engine.get_dimension_values(
+            metric_name="bookings", get_group_by_values="listing__country_latest", prefix=prefix
+        )
+        == expected_values
+    )
+    assert (
+        engine.get_dimension_values(
+            metric_name="bookings", get_group_by_values="listing__country_latest", prefix=prefix, limit=1
+        )
+        == expected_values[:1]
+    )
+    # An empty prefix matches all values.
+    assert (
+        engine.get_dimension_values(
+            metric_name="bookings", get_group_by_values="listing__country_latest", prefix="", limit=1
+        )
+        == all_values[:1]
+    )
+    # Wildcards in the prefix are matched literally.
+    assert (
+        engine.get_dimension_values(metric_name="bookings", get_group_by_values="listing__country_latest", prefix="%")
+        == []
+    )
+    # Values that aren't strings are cast to strings for matching.
+    assert engine.get_dimension_values(metric_name="bookings", get_group_by_values="is_instant", prefix="1") == ["1"]
+    listing_values = engine.get_dimension_values(metric_name="bookings", get_group_by_values="listing")
+    listing_prefix = listing_values[0][:1]
+    assert engine.get_dimension_values(
+        metric_name="bookings", get_group_by_values="listing", prefix=listing_prefix
+    ) == [value for value in listing_values if value.startswith(listing_prefix)]
+
+
+def test_dimension_values_with_time_constraint(engine: MetricFlowEngine) -> None:
+    """Tests that the metric is queried to get the values when there's a time constraint."""
+    dimension_values = engine.get_dimension_values(
+        metric_name="bookings",
+        get_group_by_values="is_instant",
+        time_constraint_start=datetime.datetime(2000, 1, 1),
+        time_constraint_end=datetime.datetime(2040, 1, 1),
+        limit=1,
+    )
+    assert len(dimension_values) == 1
+    assert dimension_values[0] in _values_from_metric_query(engine, "bookings", "is_instant")
+
+
+def test_dimension_values_cache(engine: MetricFlowEngine) -> None:  # noqa: D
+    dimension_values = engine.get_dimension_values(metric_name="bookings", get_group_by_values="is_instant")
+    # Changes to the returned list shouldn't affect the cached values.
+    dimension_values.clear()
+    assert engine.get_dimension_values(metric_name="bookings", get_group_by_values="is_instant") == ["0", "1"]
+
+    stats = engine.dimension_values_cache_stats
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+
+def test_plan_dimension_values(engine: MetricFlowEngine) -> None:  # noqa: D
+    engine.clear_dimension_values_cache()
+    plan = engine.plan_dimension_values(metric_name="bookings", get_group_by_values="is_instant")
+    assert plan.cached_values is None
+    assert plan.execution_plan is not None
+    assert plan.metric_request is None
+
+    dimension_values = engine.get_dimension_values(metric_name="bookings", get_group_by_values="is_instant")
+    cached_plan = engine.plan_dimension_values(metric_name="bookings", get_group_by_values="is_instant")
+    assert cached_plan.cached_values == tuple(dimension_values)
+
+    # A time constraint applies to the rows of the metric, so the values are read from a metric query.
+    plan = engine.plan_dimension_values(
+        metric_name="bookings", get_group_by_values="is_instant", time_constraint_start=datetime.datetime(2020, 1, 1)
+    )
+    assert plan.execution_plan is None
+    assert plan.metric_request is not None
+    assert plan.metric_request.metric_names == ["bookings"]
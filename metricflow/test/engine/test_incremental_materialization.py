@@ -0,0 +1,116 @@
+import datetime
+from typing import Sequence, Tuple
+
+import pandas as pd
+import pytest
+
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.engine.materialization_state import MaterializationStateStore
+from metricflow.engine.metricflow_engine import MetricFlowEngine
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.sql_clients.duckdb import DuckDbEngineAttributes
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+
+MATERIALIZATION_NAME = "test_materialization"
+END_OF_FIRST_BUILD = datetime.datetime(2019, 12, 20)
+
+
+def _read_table(sql_client: AsyncSqlClient, table: SqlTable) -> pd.DataFrame:
+    return sql_client.query(f"SELECT * FROM {table.sql}")
+
+
+def _staging_table(mf_test_session_state: MetricFlowTestSessionState) -> SqlTable:
+    return SqlTable(
+        schema_name=mf_test_session_state.mf_system_schema,
+        table_name=MATERIALIZATION_NAME + MetricFlowEngine.MATERIALIZATION_STAGING_TABLE_SUFFIX,
+    )
+
+
+def test_incremental_materialization(  # noqa: D
+    engine: MetricFlowEngine,
+    async_sql_client: AsyncSqlClient,
+    mf_test_session_state: MetricFlowTestSessionState,
+) -> None:
+    full_table = engine.materialize(MATERIALIZATION_NAME)
+    expected_df = _read_table(async_sql_client, full_table)
+    engine.drop_materialization(MATERIALIZATION_NAME)
+
+    # The first incremental build builds the whole table, up to the given end.
+    assert engine.materialization_watermark(MATERIALIZATION_NAME) is None
+    table = engine.materialize(MATERIALIZATION_NAME, time_constraint_end=END_OF_FIRST_BUILD, incremental=True)
+    state_store = MaterializationStateStore(
+        sql_client=async_sql_client, schema_name=mf_test_session_state.mf_system_schema
+    )
+    first_watermark = state_store.get_watermark(MATERIALIZATION_NAME)
+    assert first_watermark is not None and first_watermark <= END_OF_FIRST_BUILD
+    assert engine.materialization_watermark(MATERIALIZATION_NAME) == first_watermark
+    partial_df = _read_table(async_sql_client, table)
+    assert len(partial_df) < len(expected_df)
+
+    # Later builds only add the rows from the watermark onwards, and replace the rows within the lookback.
+    engine.materialize(MATERIALIZATION_NAME, incremental=True, lookback=datetime.timedelta(days=3))
+    assert_dataframes_equal(actual=_read_table(async_sql_client, table), expected=expected_df)
+    watermark = state_store.get_watermark(MATERIALIZATION_NAME)
+    assert watermark is not None and watermark > first_watermark
+
+    # Re-running without new data doesn't change the table.
+    engine.materialize(MATERIALIZATION_NAME, incremental=True)
+    assert_dataframes_equal(actual=_read_table(async_sql_client, table), expected=expected_df)
+    assert not async_sql_client.table_exists(_staging_table(mf_test_session_state))
+
+    assert engine.drop_materialization(MATERIALIZATION_NAME)
+    assert state_store.get_watermark(MATERIALIZATION_NAME) is None
+
+
+def test_failed_increment_in_transaction(  # noqa: D
+    engine: MetricFlowEngine,
+    async_sql_client: AsyncSqlClient,
+    mf_test_session_state: MetricFlowTestSessionState,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    table = engine.materialize(MATERIALIZATION_NAME, time_constraint_end=END_OF_FIRST_BUILD, incremental=True)
+    partial_df = _read_table(async_sql_client, table)
+
+    execute_in_transaction = async_sql_client.execute_in_transaction
+
+    def _execute_and_fail(statements: Sequence[Tuple[str, SqlBindParameters]]) -> None:
+        execute_in_transaction(list(statements) + [("SELECT * FROM missing_table", SqlBindParameters())])
+
+    monkeypatch.setattr(async_sql_client, "execute_in_transaction", _execute_and_fail)
+    with pytest.raises(Exception):
+        engine.materialize(MATERIALIZATION_NAME, incremental=True, lookback=datetime.timedelta(days=3))
+
+    # The deleted rows are restored, so the build can be run again.
+    assert_dataframes_equal(actual=_read_table(async_sql_client, table), expected=partial_df)
+    assert not async_sql_client.table_exists(_staging_table(mf_test_session_state))
+    assert engine.drop_materialization(MATERIALIZATION_NAME)
+
+
+def test_failed_increment_without_transactions(  # noqa: D
+    engine: MetricFlowEngine,
+    async_sql_client: AsyncSqlClient,
+    mf_test_session_state: MetricFlowTestSessionState,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    if not isinstance(async_sql_client.sql_engine_attributes, DuckDbEngineAttributes):
+        pytest.skip("Disables transactions for the DuckDB client")
+    engine.materialize(MATERIALIZATION_NAME, time_constraint_end=END_OF_FIRST_BUILD, incremental=True)
+
+    execute = async_sql_client.execute
+
+    def _fail_inserts(stmt: str, sql_bind_parameters: SqlBindParameters = SqlBindParameters()) -> None:
+        if stmt.startswith("INSERT"):
+            raise RuntimeError("Unable to insert")
+        execute(stmt, sql_bind_parameters=sql_bind_parameters)
+
+    monkeypatch.setattr(DuckDbEngineAttributes, "transactions_supported", False)
+    monkeypatch.setattr(async_sql_client, "execute", _fail_inserts)
+    with pytest.raises(RuntimeError):
+        engine.materialize(MATERIALIZATION_NAME, incremental=True)
+
+    # The staging table has the rows that weren't inserted, for recovering.
+    assert async_sql_client.table_exists(_staging_table(mf_test_session_state))
+    async_sql_client.drop_table(_staging_table(mf_test_session_state))
+    assert engine.drop_materialization(MATERIALIZATION_NAME)
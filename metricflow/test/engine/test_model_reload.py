@@ -0,0 +1,52 @@
+import pytest
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.model.semantic_model import SemanticModel
+
+
+def test_reload_model(  # noqa: D
+    simple_semantic_model: SemanticModel,
+    engine: MetricFlowEngine,
+) -> None:
+    request = MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=["ds"])
+    engine.explain(request)
+    assert engine.plan_cache_stats.size == 1
+
+    model = simple_semantic_model.user_configured_model
+    data_sources = [
+        data_source.copy(update={"description": "Changed"}) if data_source.name == "listings_latest" else data_source
+        for data_source in model.data_sources
+    ]
+    bookings_metric = next(metric for metric in model.metrics if metric.name == "bookings")
+    metrics = [
+        metric.copy(update={"description": "Changed"}) if metric.name == "listings" else metric
+        for metric in model.metrics
+        if metric.name != "booking_value"
+    ] + [bookings_metric.copy(update={"name": "bookings_copy"})]
+    data_set_before_reload = engine._model_state.data_source_to_data_set["bookings_source"]
+
+    reload_result = engine.reload_model(model.copy(update={"data_sources": data_sources, "metrics": metrics}))
+
+    assert reload_result.has_changes
+    assert reload_result.rebuilt_data_sources == ("listings_latest",)
+    assert "bookings_source" in reload_result.reused_data_sources
+    assert reload_result.added_data_sources == ()
+    assert reload_result.removed_data_sources == ()
+    assert reload_result.added_metrics == ("bookings_copy",)
+    assert reload_result.removed_metrics == ("booking_value",)
+    assert reload_result.changed_metrics == ("listings",)
+    assert engine._model_state.data_source_to_data_set["bookings_source"] is data_set_before_reload
+
+    # Plans are cached per model, so the plan for the previous model isn't used.
+    assert engine.plan_cache_stats.size == 0
+    assert "booking_value" not in {metric.name for metric in engine.list_metrics()}
+    engine.explain(
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings_copy"], group_by_names=["ds"])
+    )
+
+    assert not engine.reload_model(engine.semantic_model.user_configured_model).has_changes
+
+
+def test_reload_model_requires_loader(engine: MetricFlowEngine) -> None:  # noqa: D
+    with pytest.raises(ValueError):
+        engine.reload_model()
@@ -0,0 +1,62 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from metricflow.engine import model_snapshot
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.engine.model_snapshot import ModelSnapshot, read_model_snapshot, write_model_snapshot
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.test.fixtures.engine_fixtures import MetricFlowEngineFactory
+
+
+def test_engine_from_snapshot(  # noqa: D
+    tmp_path: Path,
+    simple_semantic_model: SemanticModel,
+    engine: MetricFlowEngine,
+    engine_factory: MetricFlowEngineFactory,
+) -> None:
+    snapshot_path = str(tmp_path / "snapshot.pkl")
+    engine.save_model_snapshot(snapshot_path)
+
+    snapshot = read_model_snapshot(snapshot_path)
+    assert snapshot is not None
+    assert snapshot.user_configured_model == simple_semantic_model.user_configured_model
+    assert len(snapshot.linkable_element_sets) > 0
+
+    semantic_model = SemanticModel(snapshot.user_configured_model)
+    snapshot_engine = engine_factory(semantic_model, model_snapshot=snapshot)
+    assert snapshot_engine._model_state.data_source_to_data_set == snapshot.data_source_to_data_set
+    assert semantic_model.linkable_spec_resolver.indexed_element_sets == snapshot.linkable_element_sets
+
+    request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings"], group_by_names=["listing__country_latest"]
+    )
+    snapshot_result_df = snapshot_engine.query(request).result_df
+    result_df = engine.query(request).result_df
+    assert snapshot_result_df is not None and result_df is not None
+    assert snapshot_result_df.equals(result_df)
+
+
+def test_unreadable_snapshot(tmp_path: Path) -> None:  # noqa: D
+    assert read_model_snapshot(str(tmp_path / "missing.pkl")) is None
+
+    snapshot_path = tmp_path / "snapshot.pkl"
+    snapshot_path.write_bytes(b"not a pickle")
+    assert read_model_snapshot(str(snapshot_path)) is None
+
+
+def test_snapshot_from_other_model_schema(tmp_path: Path, simple_semantic_model: SemanticModel) -> None:
+    """Checks that snapshots written when the model classes had different fields aren't used."""
+    snapshot = ModelSnapshot(
+        user_configured_model=simple_semantic_model.user_configured_model,
+        data_source_to_data_set={},
+        data_source_to_source_nodes={},
+        linkable_element_sets={},
+        next_ids={},
+    )
+    snapshot_path = str(tmp_path / "snapshot.pkl")
+    write_model_snapshot(snapshot, snapshot_path)
+    assert read_model_snapshot(snapshot_path) is not None
+
+    with patch.object(model_snapshot, "model_schema_fingerprint", return_value="other_schema"):
+        write_model_snapshot(snapshot, snapshot_path)
+    assert read_model_snapshot(snapshot_path) is None
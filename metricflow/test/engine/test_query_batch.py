@@ -0,0 +1,34 @@
+import pandas as pd
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+
+
+def _sorted_df(df: pd.DataFrame) -> pd.DataFrame:
+    return df.sort_values(by=list(df.columns)).reset_index(drop=True)
+
+
+def test_query_batch(engine: MetricFlowEngine) -> None:  # noqa: D
+    mf_requests = [
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=["bookings"], group_by_names=["ds"]),
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["listings"], group_by_names=["ds"]
+        ),
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["booking_value", "bookings"], group_by_names=["ds"]
+        ),
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings"], group_by_names=["listing__country_latest"]
+        ),
+    ]
+
+    results = engine.query_batch(mf_requests)
+
+    assert len(results) == len(mf_requests)
+    # Requests for metrics from the same data source with the same group by items use the same query.
+    assert results[0].sql == results[2].sql
+    assert len({result.sql for result in results}) == 3
+    for mf_request, result in zip(mf_requests, results):
+        expected_df = engine.query(mf_request).result_df
+        assert expected_df is not None and result.result_df is not None
+        assert list(result.result_df.columns) == list(expected_df.columns)
+        assert _sorted_df(result.result_df).equals(_sorted_df(expected_df))
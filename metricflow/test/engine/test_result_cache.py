@@ -0,0 +1,165 @@
+import datetime
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+from metricflow.engine.result_cache import (
+    DiskResultCacheBackend,
+    InMemoryResultCacheBackend,
+    ResultCache,
+    ResultCachePolicy,
+    result_cache_key,
+    result_cache_scope,
+)
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.test.fixtures.engine_fixtures import MetricFlowEngineFactory
+from metricflow.test.time.configurable_time_source import ConfigurableTimeSource
+
+CURRENT_TIME = datetime.datetime(2020, 1, 15, 12)
+
+
+def test_result_cache_key() -> None:  # noqa: D
+    key = result_cache_key("SELECT 1", SqlBindParameters())
+    assert key == result_cache_key("SELECT 1", SqlBindParameters())
+    assert key != result_cache_key("SELECT 2", SqlBindParameters())
+    assert key != result_cache_key("SELECT 1", SqlBindParameters.create_from_dict({"a": 1}))
+    assert key != result_cache_key("SELECT 1", SqlBindParameters(), scope="duckdb\nduckdb:///other.db")
+
+
+def test_result_cache_scope(async_sql_client: AsyncSqlClient) -> None:  # noqa: D
+    scope = result_cache_scope(async_sql_client)
+    assert scope.startswith(async_sql_client.sql_engine_attributes.sql_engine_type.value)
+    assert async_sql_client.connection_identity in scope
+
+
+def test_policy_ttl() -> None:  # noqa: D
+    policy = ResultCachePolicy(default_ttl=600, open_window_ttl=60, metric_ttls={"bookings": 30})
+
+    # Time ranges that ended before today are cached indefinitely.
+    assert policy.ttl(["bookings"], datetime.datetime(2020, 1, 14), CURRENT_TIME) is None
+    # Time ranges that include today use the shorter of the open window TTL and metric TTLs.
+    assert policy.ttl(["bookings"], datetime.datetime(2020, 1, 15), CURRENT_TIME) == 30
+    assert policy.ttl(["listings"], None, CURRENT_TIME) == 60
+
+    assert ResultCachePolicy(default_ttl=10, open_window_ttl=60).ttl(["listings"], None, CURRENT_TIME) == 10
+
+
+def test_policy_ttl_for_closed_windows() -> None:
+    """Tests that the open window TTL doesn't apply to time ranges that ended before today."""
+    policy = ResultCachePolicy(
+        default_ttl=600, open_window_ttl=60, metric_ttls={"bookings": 30}, cache_closed_windows_indefinitely=False
+    )
+    start_of_today = datetime.datetime(2020, 1, 15)
+
+    assert policy.ttl(["listings"], start_of_today - datetime.timedelta(microseconds=1), CURRENT_TIME) == 600
+    assert policy.ttl(["bookings", "listings"], datetime.datetime(2020, 1, 14), CURRENT_TIME) == 30
+    # Time ranges ending at or after the start of today include today.
+    assert policy.ttl(["listings"], start_of_today, CURRENT_TIME) == 60
+    assert policy.ttl(["listings"], datetime.datetime(2020, 1, 16), CURRENT_TIME) == 60
+
+
+def test_in_memory_backend_eviction() -> None:  # noqa: D
+    df = pd.DataFrame({"a": list(range(100))})
+    df_num_bytes = int(df.memory_usage(index=True, deep=True).sum())
+    backend = InMemoryResultCacheBackend(max_bytes=2 * df_num_bytes)
+
+    backend.put("a", df, expires_at=None)
+    backend.put("b", df, expires_at=None)
+    assert backend.get("a") is not None
+    backend.put("c", df, expires_at=None)
+
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.get("c") is not None
+    assert backend.num_bytes == 2 * df_num_bytes
+
+
+def test_in_memory_backend_expiration() -> None:  # noqa: D
+    backend = InMemoryResultCacheBackend()
+    backend.put("a", pd.DataFrame({"a": [1]}), expires_at=time.time() - 1)
+    assert backend.get("a") is None
+    assert backend.num_bytes == 0
+
+
+def test_disk_backend(tmp_path) -> None:  # type: ignore  # noqa: D
+    df = pd.DataFrame({"a": list(range(100))})
+    backend = DiskResultCacheBackend(dir_path=str(tmp_path))
+    backend.put("a", df, expires_at=None)
+    backend.put("b", df, expires_at=time.time() - 1)
+    backend.close()
+
+    # Results should be available to another instance using the same directory.
+    backend = DiskResultCacheBackend(dir_path=str(tmp_path))
+    cached_df = backend.get("a")
+    assert cached_df is not None
+    assert cached_df.equals(df)
+    assert backend.get("b") is None
+
+    backend.clear()
+    assert backend.get("a") is None
+    assert backend.num_bytes == 0
+    backend.close()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="Permissions are only checked on POSIX systems")
+def test_disk_backend_rejects_writable_dir(tmp_path) -> None:  # type: ignore  # noqa: D
+    os.chmod(tmp_path, 0o777)
+    with pytest.raises(ValueError):
+        DiskResultCacheBackend(dir_path=str(tmp_path))
+
+
+def test_engine_result_cache(  # noqa: D
+    create_simple_model_tables: bool,
+    simple_semantic_model: SemanticModel,
+    engine_factory: MetricFlowEngineFactory,
+) -> None:
+    result_cache = ResultCache(policy=ResultCachePolicy())
+    engine = engine_factory(
+        simple_semantic_model, time_source=ConfigurableTimeSource(CURRENT_TIME), result_cache=result_cache
+    )
+
+    def _query() -> pd.DataFrame:
+        result = engine.query(
+            MetricFlowQueryRequest.create_with_random_request_id(
+                metric_names=["bookings"],
+                group_by_names=["ds"],
+                time_constraint_start=datetime.datetime(2019, 12, 1),
+                time_constraint_end=datetime.datetime(2020, 1, 1),
+            )
+        )
+        assert result.result_df is not None
+        return result.result_df
+
+    first_df = _query()
+    assert result_cache.stats.misses == 1
+    second_df = _query()
+    assert result_cache.stats.hits == 1
+    assert second_df.equals(first_df)
+
+
+def test_result_cache_scoped_to_connection() -> None:
+    """Tests that results put in one scope are not returned in another, even when the SQL is the same."""
+    result_cache = ResultCache()
+    time_source = ConfigurableTimeSource(CURRENT_TIME)
+    df = pd.DataFrame({"a": [1]})
+    scope_a = "postgres\npostgresql://user@warehouse_a/db"
+    scope_b = "postgres\npostgresql://user@warehouse_b/db"
+    result_cache.put(
+        sql="SELECT a FROM t",
+        bind_parameters=SqlBindParameters(),
+        df=df,
+        metric_names=["bookings"],
+        time_constraint_end=None,
+        time_source=time_source,
+        scope=scope_a,
+    )
+
+    assert result_cache.get("SELECT a FROM t", SqlBindParameters(), scope_b) is None
+    cached_df = result_cache.get("SELECT a FROM t", SqlBindParameters(), scope_a)
+    assert cached_df is not None
+    assert cached_df.equals(df)
@@ -0,0 +1,142 @@
+import datetime
+
+import pytest
+
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+from metricflow.engine.table_statistics import TableStatisticsStore
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.protocols.sql_client import SqlClient
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.fixtures.engine_fixtures import MetricFlowEngineFactory
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+from metricflow.test.time.configurable_time_source import ConfigurableTimeSource
+
+TTL_SECONDS = 3600
+
+
+@pytest.fixture
+def time_source() -> ConfigurableTimeSource:  # noqa: D
+    return ConfigurableTimeSource(datetime.datetime(2020, 1, 1))
+
+
+@pytest.fixture
+def statistics_store(  # noqa: D
+    sql_client: SqlClient, mf_test_session_state: MetricFlowTestSessionState, time_source: ConfigurableTimeSource
+) -> TableStatisticsStore:
+    store = TableStatisticsStore(
+        sql_client=sql_client,
+        schema_name=mf_test_session_state.mf_system_schema,
+        ttl_seconds=TTL_SECONDS,
+        time_source=time_source,
+    )
+    sql_client.drop_table(store.statistics_table)
+    return store
+
+
+def test_row_count_collection(  # noqa: D
+    create_simple_model_tables: bool,
+    statistics_store: TableStatisticsStore,
+    sql_client: SqlClient,
+    mf_test_session_state: MetricFlowTestSessionState,
+    time_source: ConfigurableTimeSource,
+) -> None:
+    sql_table = SqlTable(schema_name=mf_test_session_state.mf_source_schema, table_name="fct_id_verifications")
+    expected_row_count = len(sql_client.query(f"SELECT * FROM {sql_table.sql}"))
+
+    assert statistics_store.collect_row_count(sql_table) == expected_row_count
+    assert sql_client.table_exists(statistics_store.statistics_table)
+
+    # Other stores use the stored row count until it expires.
+    sql_client.execute(
+        f"UPDATE {statistics_store.statistics_table.sql} SET {TableStatisticsStore.ROW_COUNT_COLUMN_NAME} = 1"
+    )
+    other_store = TableStatisticsStore(
+        sql_client=sql_client,
+        schema_name=mf_test_session_state.mf_system_schema,
+        ttl_seconds=TTL_SECONDS,
+        time_source=time_source,
+    )
+    assert other_store.collect_row_count(sql_table) == 1
+
+    time_source.set_time(time_source.get_time() + datetime.timedelta(seconds=TTL_SECONDS + 1))
+    assert other_store.collect_row_count(sql_table) == expected_row_count
+    stored_df = sql_client.query(f"SELECT * FROM {statistics_store.statistics_table.sql}")
+    assert stored_df[TableStatisticsStore.ROW_COUNT_COLUMN_NAME].tolist() == [expected_row_count]
+
+
+def test_row_count_collection_in_background(  # noqa: D
+    create_simple_model_tables: bool,
+    sql_client: SqlClient,
+    mf_test_session_state: MetricFlowTestSessionState,
+    time_source: ConfigurableTimeSource,
+) -> None:
+    num_row_count_changes = 0
+
+    def _on_row_count_change() -> None:
+        nonlocal num_row_count_changes
+        num_row_count_changes += 1
+
+    statistics_store = TableStatisticsStore(
+        sql_client=sql_client,
+        schema_name=mf_test_session_state.mf_system_schema,
+        ttl_seconds=TTL_SECONDS,
+        time_source=time_source,
+        on_row_count_change=_on_row_count_change,
+    )
+    sql_table = SqlTable(schema_name=mf_test_session_state.mf_source_schema, table_name="fct_id_verifications")
+    expected_row_count = len(sql_client.query(f"SELECT * FROM {sql_table.sql}"))
+
+    # The row count isn't known until the collection that was scheduled by the lookup completes.
+    assert statistics_store.get_row_count(sql_table) is None
+    statistics_store.wait_for_collections()
+    assert statistics_store.get_row_count(sql_table) == expected_row_count
+    assert num_row_count_changes == 1
+
+
+def test_row_count_without_metadata(  # noqa: D
+    create_simple_model_tables: bool,
+    statistics_store: TableStatisticsStore,
+    sql_client: SqlClient,
+    mf_test_session_state: MetricFlowTestSessionState,
+) -> None:
+    source_table = SqlTable(schema_name=mf_test_session_state.mf_source_schema, table_name="fct_id_verifications")
+    expected_row_count = len(sql_client.query(f"SELECT * FROM {source_table.sql}"))
+    # Views don't have a row count in the metadata, so the rows are counted.
+    view = SqlTable(schema_name=mf_test_session_state.mf_system_schema, table_name="id_verifications_view")
+    sql_client.execute(f"CREATE OR REPLACE VIEW {view.sql} AS SELECT * FROM {source_table.sql}")
+    try:
+        assert statistics_store.collect_row_count(view) == expected_row_count
+    finally:
+        sql_client.execute(f"DROP VIEW {view.sql}")
+
+
+def test_row_count_of_missing_table(  # noqa: D
+    statistics_store: TableStatisticsStore, mf_test_session_state: MetricFlowTestSessionState
+) -> None:
+    sql_table = SqlTable(schema_name=mf_test_session_state.mf_source_schema, table_name="missing_table")
+    assert statistics_store.collect_row_count(sql_table) is None
+
+
+def test_query_with_table_statistics(  # noqa: D
+    create_simple_model_tables: bool,
+    statistics_store: TableStatisticsStore,
+    simple_semantic_model: SemanticModel,
+    engine_factory: MetricFlowEngineFactory,
+    sql_client: SqlClient,
+) -> None:
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings", "views"],
+        group_by_names=["metric_time", "listing__country_latest"],
+    )
+    results = []
+    for table_statistics_ttl_seconds in (None, TTL_SECONDS):
+        engine = engine_factory(simple_semantic_model, table_statistics_ttl_seconds=table_statistics_ttl_seconds)
+        if engine._table_statistics_store is not None:
+            engine._table_statistics_store.wait_for_collections()
+        results.append(engine.query(mf_request).result_df)
+
+    df_without_statistics, df_with_statistics = results
+    assert df_without_statistics is not None and df_with_statistics is not None
+    assert_dataframes_equal(actual=df_with_statistics, expected=df_without_statistics)
+    assert len(sql_client.query(f"SELECT * FROM {statistics_store.statistics_table.sql}")) > 0
@@ -0,0 +1,27 @@
+import asyncio
+
+from metricflow.execution.execution_plan import ExecutionPlan
+from metricflow.execution.executor import AsyncPlanExecutor
+from metricflow.test.execution.noop_task import NoOpExecutionPlanTask
+
+
+def test_task_with_parents() -> None:
+    """Tests that all tasks run, with parents finishing before the task."""
+    parent_tasks = [NoOpExecutionPlanTask() for _ in range(3)]
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=parent_tasks)
+    results = asyncio.run(AsyncPlanExecutor().execute_plan(ExecutionPlan("plan0", leaf_tasks=[leaf_task])))
+
+    assert not results.contains_task_errors
+    leaf_result = results.get_result(leaf_task.task_id)
+    for parent_task in parent_tasks:
+        assert results.get_result(parent_task.task_id).end_time <= leaf_result.start_time
+
+
+def test_failed_task() -> None:
+    """Tests that tasks depending on a task with errors don't run."""
+    parent_task = NoOpExecutionPlanTask(should_error=True)
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=[parent_task])
+    results = asyncio.run(AsyncPlanExecutor().execute_plan(ExecutionPlan("plan0", leaf_tasks=[leaf_task])))
+
+    assert results.contains_task_errors
+    assert list(results.all_results().keys()) == [parent_task.task_id]
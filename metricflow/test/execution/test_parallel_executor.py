@@ -0,0 +1,192 @@
+import threading
+import time
+from typing import Callable, List
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from metricflow.execution.execution_plan import (
+    ExecutionPlan,
+    ExecutionPlanTask,
+    SelectSqlQueryToDataFrameTask,
+    TaskExecutionResult,
+)
+from metricflow.execution.executor import ParallelPlanExecutor
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.protocols.sql_request import SqlRequestResult, SqlRequestTagSet
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
+from metricflow.sql_clients.async_request import CombinedSqlTags
+from metricflow.sql_clients.base_sql_client_implementation import BaseSqlClientImplementation
+from metricflow.test.execution.noop_task import NoOpExecutionPlanTask
+
+
+class _ConcurrencyTrackingTask(NoOpExecutionPlanTask):
+    """A no-op task that keeps track of the number of tasks that are running at the same time."""
+
+    _lock = threading.Lock()
+    num_running = 0
+    max_num_running = 0
+
+    @classmethod
+    def id_prefix(cls) -> str:  # noqa: D
+        return "concurrency_tracking_noop"
+
+    def execute(self) -> TaskExecutionResult:  # noqa: D
+        with _ConcurrencyTrackingTask._lock:
+            _ConcurrencyTrackingTask.num_running += 1
+            _ConcurrencyTrackingTask.max_num_running = max(
+                _ConcurrencyTrackingTask.max_num_running, _ConcurrencyTrackingTask.num_running
+            )
+        time.sleep(0.05)
+        result = super().execute()
+        with _ConcurrencyTrackingTask._lock:
+            _ConcurrencyTrackingTask.num_running -= 1
+        return result
+
+
+class _RaisingTask(NoOpExecutionPlanTask):
+    """A task that raises an exception when executed."""
+
+    @classmethod
+    def id_prefix(cls) -> str:  # noqa: D
+        return "raising_noop"
+
+    def execute(self) -> TaskExecutionResult:  # noqa: D
+        raise RuntimeError("Expected exception")
+
+
+def test_single_task() -> None:
+    """Tests running an execution plan with a single task."""
+    task = NoOpExecutionPlanTask()
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[task])
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+    assert results.get_result(task.task_id)
+    assert results.get_wall_time(task.task_id) > 0
+
+
+def test_task_with_parents() -> None:
+    """Tests that the parents of a task run concurrently and finish before the task."""
+    _ConcurrencyTrackingTask.max_num_running = 0
+    parent_tasks = [_ConcurrencyTrackingTask() for _ in range(4)]
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=parent_tasks)
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task])
+    results = ParallelPlanExecutor(max_workers=4).execute_plan(execution_plan)
+
+    assert not results.contains_task_errors
+    assert len(results.all_results()) == 5
+    assert len(results.all_wall_times()) == 5
+    leaf_result = results.get_result(leaf_task.task_id)
+    for parent_task in parent_tasks:
+        assert results.get_result(parent_task.task_id).end_time <= leaf_result.start_time
+    assert _ConcurrencyTrackingTask.max_num_running > 1
+
+
+def test_max_workers() -> None:
+    """Tests that no more than max_workers tasks run at the same time."""
+    _ConcurrencyTrackingTask.max_num_running = 0
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=[_ConcurrencyTrackingTask() for _ in range(4)])
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task])
+    results = ParallelPlanExecutor(max_workers=1).execute_plan(execution_plan)
+
+    assert not results.contains_task_errors
+    assert _ConcurrencyTrackingTask.max_num_running == 1
+
+
+def test_shared_parent_task() -> None:
+    """Tests that a task that's a parent of multiple tasks is run only once."""
+    shared_task = NoOpExecutionPlanTask()
+    leaf_task = NoOpExecutionPlanTask(
+        parent_tasks=[NoOpExecutionPlanTask(parent_tasks=[shared_task]), NoOpExecutionPlanTask([shared_task])]
+    )
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task])
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+
+    assert not results.contains_task_errors
+    assert len(results.all_results()) == 4
+
+
+def test_parent_task_error() -> None:
+    """Check that a child task is not run if a parent task fails."""
+    parent_task = NoOpExecutionPlanTask(should_error=True)
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=[parent_task])
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task])
+
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+    assert len(results.all_results()) == 1
+    assert results.get_result(parent_task.task_id).errors[0] == NoOpExecutionPlanTask.EXAMPLE_ERROR
+
+
+def test_task_exception() -> None:
+    """Check that an exception in a task is raised after the running tasks finish."""
+    parent_tasks: List[ExecutionPlanTask] = [_RaisingTask(), NoOpExecutionPlanTask()]
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=parent_tasks)
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task])
+
+    with pytest.raises(RuntimeError, match="Expected exception"):
+        ParallelPlanExecutor().execute_plan(execution_plan)
+
+
+def test_invalid_max_workers() -> None:  # noqa: D
+    with pytest.raises(ValueError):
+        ParallelPlanExecutor(max_workers=0)
+
+
+def test_sql_client_multi_threading(async_sql_client: AsyncSqlClient) -> None:
+    """Checks that the number of workers follows the multi-threading support of the engine."""
+    executor = ParallelPlanExecutor(max_workers=4, sql_client=async_sql_client)
+    if async_sql_client.sql_engine_attributes.multi_threading_supported:
+        assert executor.max_workers == 4
+    else:
+        assert executor.max_workers == 1
+
+
+def test_failure_cancels_running_sql_requests(async_sql_client: AsyncSqlClient) -> None:
+    """Checks that the SQL requests of the running tasks are cancelled when another task in the plan fails."""
+    query_started = threading.Event()
+    query_cancelled = threading.Event()
+
+    def _run_query(*args, **kwargs) -> SqlRequestResult:  # type: ignore
+        query_started.set()
+        if query_cancelled.wait(timeout=10):
+            return SqlRequestResult(exception=RuntimeError("Query was cancelled"))
+        return SqlRequestResult(df=pd.DataFrame())
+
+    def _cancel_request(match_function: Callable[[CombinedSqlTags], bool]) -> int:
+        matching_request_ids = [
+            request_id
+            for request_id in async_sql_client.active_requests()
+            if match_function(CombinedSqlTags(system_tags=SqlRequestTagSet.create_from_request_id(request_id)))
+        ]
+        if matching_request_ids:
+            query_cancelled.set()
+        return len(matching_request_ids)
+
+    class _ErrorAfterQueryStartedTask(NoOpExecutionPlanTask):
+        @classmethod
+        def id_prefix(cls) -> str:  # noqa: D
+            return "error_after_query_started_noop"
+
+        def execute(self) -> TaskExecutionResult:  # noqa: D
+            query_started.wait(timeout=10)
+            return super().execute()
+
+    sql_task = SelectSqlQueryToDataFrameTask(
+        sql_client=async_sql_client, sql_query="SELECT 1", execution_parameters=SqlBindParameters()
+    )
+    error_task = _ErrorAfterQueryStartedTask(should_error=True)
+    leaf_task = NoOpExecutionPlanTask(parent_tasks=[sql_task, error_task])
+    execution_plan = ExecutionPlan("plan0", leaf_tasks=[leaf_task])
+
+    with patch.object(BaseSqlClientImplementation, "_run_query", side_effect=_run_query), patch.object(
+        async_sql_client, "cancel_request", side_effect=_cancel_request
+    ):
+        start_time = time.time()
+        results = ParallelPlanExecutor(max_workers=4, sql_client=async_sql_client).execute_plan(execution_plan)
+        wall_time = time.time() - start_time
+
+    assert query_cancelled.is_set()
+    assert wall_time < 10
+    # The error of the task that failed is reported, not the exception from the cancelled query.
+    assert results.get_result(error_task.task_id).errors == (NoOpExecutionPlanTask.EXAMPLE_ERROR,)
+    assert len(results.all_results()) == 1
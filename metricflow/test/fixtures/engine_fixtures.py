@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+
+
+class MetricFlowEngineFactory:
+    """Creates engines that use the test SQL client and system schema.
+
+    Tests that need an engine with a different model or with other options (e.g. a result cache) should use this
+    instead of constructing a MetricFlowEngine directly, so that the setup is consistent across tests.
+    """
+
+    def __init__(  # noqa: D
+        self, sql_client: AsyncSqlClient, mf_test_session_state: MetricFlowTestSessionState
+    ) -> None:
+        self._sql_client = sql_client
+        self._mf_test_session_state = mf_test_session_state
+
+    def __call__(self, semantic_model: SemanticModel, **kwargs: Any) -> MetricFlowEngine:
+        """Creates an engine for the model. The keyword arguments are passed to the MetricFlowEngine constructor."""
+        return MetricFlowEngine(
+            semantic_model=semantic_model,
+            sql_client=self._sql_client,
+            system_schema=self._mf_test_session_state.mf_system_schema,
+            **kwargs,
+        )
+
+
+@pytest.fixture
+def engine_factory(  # noqa: D
+    async_sql_client: AsyncSqlClient, mf_test_session_state: MetricFlowTestSessionState
+) -> MetricFlowEngineFactory:
+    return MetricFlowEngineFactory(sql_client=async_sql_client, mf_test_session_state=mf_test_session_state)
+
+
+@pytest.fixture
+def engine(  # noqa: D
+    create_simple_model_tables: bool,
+    simple_semantic_model: SemanticModel,
+    engine_factory: MetricFlowEngineFactory,
+) -> MetricFlowEngine:
+    return engine_factory(simple_semantic_model)
@@ -0,0 +1,49 @@
+import os
+import shutil
+from typing import Dict
+
+import pytest
+import yaml
+
+from metricflow.configuration.constants import CONFIG_DWH_SCHEMA, CONFIG_MODEL_PATH, CONFIG_PATH_KEY
+from metricflow.configuration.yaml_handler import YamlFileHandler
+from metricflow.engine.metricflow_engine import MetricFlowEngine
+from metricflow.engine.utils import path_to_models
+from metricflow.model.objects.user_configured_model import UserConfiguredModel
+from metricflow.model.parsing.dir_to_model import parse_directory_of_yaml_files_to_model
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.test.fixtures.engine_fixtures import MetricFlowEngineFactory
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+
+SIMPLE_MODEL_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "fixtures", "model_yamls", "simple_model")
+
+
+@pytest.fixture
+def mf_config_dir(
+    tmp_path,  # type: ignore
+    monkeypatch: pytest.MonkeyPatch,
+    create_simple_model_tables: bool,
+    template_mapping: Dict[str, str],
+    mf_test_session_state: MetricFlowTestSessionState,
+    engine_factory: MetricFlowEngineFactory,
+) -> str:
+    """A MetricFlow config directory (set as $MF_CONFIG_DIR) with a copy of the simple model.
+
+    Engines created from the config use the test SQL client, as the config can't point to the test warehouse.
+    """
+    model_dir = os.path.join(tmp_path, "models")
+    shutil.copytree(SIMPLE_MODEL_DIR, model_dir)
+    with open(os.path.join(tmp_path, "config.yml"), "w") as f:
+        yaml.dump({CONFIG_MODEL_PATH: model_dir, CONFIG_DWH_SCHEMA: mf_test_session_state.mf_system_schema}, f)
+    monkeypatch.setenv(CONFIG_PATH_KEY, str(tmp_path))
+
+    def _engine_from_config(handler: YamlFileHandler) -> MetricFlowEngine:
+        def load_model() -> UserConfiguredModel:
+            return parse_directory_of_yaml_files_to_model(
+                path_to_models(handler), template_mapping=template_mapping
+            ).model
+
+        return engine_factory(SemanticModel(load_model()), model_loader=load_model)
+
+    monkeypatch.setattr(MetricFlowEngine, "from_config", staticmethod(_engine_from_config))
+    return str(tmp_path)
@@ -0,0 +1,65 @@
+import asyncio
+from typing import Any, Dict
+
+import pytest
+
+from mcp_metricflow import server
+from metricflow.cli.constants import DEFAULT_RESULT_DECIMAL_PLACES
+from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+
+
+@pytest.fixture
+def reset_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Makes get_session() create a new session for the test, instead of returning the one from an earlier test."""
+    monkeypatch.setattr(server, "_session", None)
+
+
+def _call_tool(name: str, arguments: Dict[str, Any]) -> str:
+    result = asyncio.run(server.handle_call_tool(name, arguments))
+    assert len(result) == 1
+    return result[0].text
+
+
+def test_get_session_reused(mf_config_dir: str, reset_session: None) -> None:  # noqa: D
+    session = server.get_session()
+    assert server.get_session() is session
+    assert session.handler.yaml_file_path.startswith(mf_config_dir)
+
+
+def test_list_metrics(mf_config_dir: str, reset_session: None) -> None:  # noqa: D
+    metrics = server.get_session().engine.list_metrics()
+    lines = _call_tool("list_metrics", {}).split("\n")
+
+    assert lines[0] == f"Found {len(metrics)} metrics:"
+    assert len(lines) == len(metrics) + 1
+    bookings_metric = next(metric for metric in metrics if metric.name == "bookings")
+    bookings_line = next(line for line in lines if line.startswith("• bookings:"))
+    dimension_names = bookings_line.split(": ", 1)[1].split(", ")
+    assert set(dimension_names) == {dimension.name for dimension in bookings_metric.dimensions}
+
+
+def test_query(mf_config_dir: str, reset_session: None) -> None:  # noqa: D
+    arguments = {"metrics": ["bookings"], "dimensions": ["metric_time"], "order_by": ["metric_time"], "limit": 3}
+    text = _call_tool("query_metrics", arguments)
+
+    expected_df = (
+        server.get_session()
+        .engine.query(
+            MetricFlowQueryRequest.create_with_random_request_id(
+                metric_names=["bookings"], group_by_names=["metric_time"], order_by_names=["metric_time"], limit=3
+            )
+        )
+        .result_df
+    )
+    assert expected_df is not None and len(expected_df) == 3
+    assert text == expected_df.to_markdown(index=False, floatfmt=f".{DEFAULT_RESULT_DECIMAL_PLACES}f")
+
+
+def test_explain_query(mf_config_dir: str, reset_session: None) -> None:  # noqa: D
+    text = _call_tool("query_metrics", {"metrics": ["bookings"], "dimensions": ["metric_time"], "explain": True})
+    assert text.lstrip().upper().startswith("SELECT")
+
+
+def test_query_error(mf_config_dir: str, reset_session: None) -> None:  # noqa: D
+    text = _call_tool("query_metrics", {"metrics": ["not_a_metric"]})
+    assert text.startswith("Query failed:")
@@ -0,0 +1,60 @@
+import os
+from typing import Set
+
+import yaml
+
+from mcp_metricflow.session import MetricFlowSession
+from metricflow.configuration.constants import CONFIG_DWH_SCHEMA
+
+BOOKINGS_COPY_METRIC = """---
+metric:
+  name: "bookings_copy"
+  description: "copy of the bookings metric"
+  owners:
+    - support@transformdata.io
+  type: measure_proxy
+  type_params:
+    measures:
+      - bookings
+"""
+
+
+def _metric_names(session: MetricFlowSession) -> Set[str]:
+    return {metric.name for metric in session.engine.list_metrics()}
+
+
+def test_engine_reused(mf_config_dir: str) -> None:  # noqa: D
+    session = MetricFlowSession()
+    engine = session.engine
+    assert session.engine is engine
+    assert session.sql_client is engine.sql_client
+
+
+def test_model_reloaded_when_model_files_change(mf_config_dir: str) -> None:
+    """Tests that a change to the model files reloads the model into the existing engine."""
+    session = MetricFlowSession()
+    engine = session.engine
+    assert "bookings_copy" not in _metric_names(session)
+
+    with open(os.path.join(session.model_path, "metrics.yaml"), "a") as f:
+        f.write(BOOKINGS_COPY_METRIC)
+
+    assert session.engine is engine
+    assert "bookings_copy" in _metric_names(session)
+
+
+def test_engine_rebuilt_when_config_changes(mf_config_dir: str) -> None:
+    """Tests that a change to the config file builds a new engine, as the config may point to another warehouse."""
+    session = MetricFlowSession()
+    engine = session.engine
+
+    config_file_path = session.handler.yaml_file_path
+    with open(config_file_path) as f:
+        config = yaml.safe_load(f)
+    with open(config_file_path, "w") as f:
+        yaml.dump({**config, "dwh_timeout": "30"}, f)
+
+    rebuilt_engine = session.engine
+    assert rebuilt_engine is not engine
+    assert session.engine is rebuilt_engine
+    assert session.system_schema == config[CONFIG_DWH_SCHEMA]
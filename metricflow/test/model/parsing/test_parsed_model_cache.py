@@ -0,0 +1,103 @@
+import os
+import textwrap
+from pathlib import Path
+from unittest.mock import patch
+
+from metricflow.model.objects.common import YamlConfigFile
+from metricflow.model.objects.elements.dimension import DimensionTypeParams
+from metricflow.model.parsing import dir_to_model, parsed_model_cache
+from metricflow.model.parsing.dir_to_model import FileParsingResult, parse_yaml_files_to_validation_ready_model
+from metricflow.model.parsing.parsed_model_cache import ParsedModelCache
+from metricflow.time.time_granularity import TimeGranularity
+
+
+def _metric_file(name: str, measure: str) -> YamlConfigFile:
+    return YamlConfigFile(
+        filepath=f"{name}.yaml",
+        contents=textwrap.dedent(
+            f"""\
+            metric:
+              name: {name}
+              type: measure_proxy
+              type_params:
+                measure: {measure}
+            """
+        ),
+    )
+
+
+def test_model_cache_hit(tmp_path: Path) -> None:
+    """Checks that building the model from unchanged files loads it from the cache."""
+    cache = ParsedModelCache(str(tmp_path), version="test")
+    files = [_metric_file("metric_a", "measure_a"), _metric_file("metric_b", "measure_b")]
+
+    build_result = parse_yaml_files_to_validation_ready_model(files, raise_issues_as_exceptions=False, cache=cache)
+
+    with patch.object(dir_to_model, "parse_config_yaml", side_effect=AssertionError("Should not parse")):
+        cached_result = parse_yaml_files_to_validation_ready_model(
+            files, raise_issues_as_exceptions=False, cache=cache
+        )
+
+    assert cached_result.model == build_result.model
+    assert cached_result.issues == build_result.issues
+
+
+def test_file_cache_reparses_changed_files(tmp_path: Path) -> None:
+    """Checks that only the files that changed are parsed when the model is rebuilt."""
+    cache = ParsedModelCache(str(tmp_path), version="test")
+    files = [_metric_file("metric_a", "measure_a"), _metric_file("metric_b", "measure_b")]
+    parse_yaml_files_to_validation_ready_model(files, raise_issues_as_exceptions=False, cache=cache)
+
+    changed_files = [files[0], _metric_file("metric_b", "measure_c")]
+    with patch.object(dir_to_model, "parse_config_yaml", wraps=dir_to_model.parse_config_yaml) as parse_mock:
+        build_result = parse_yaml_files_to_validation_ready_model(
+            changed_files, raise_issues_as_exceptions=False, cache=cache
+        )
+
+    assert [call.args[0].filepath for call in parse_mock.call_args_list] == ["metric_b.yaml"]
+    assert {metric.name: metric.type_params.measure.name for metric in build_result.model.metrics} == {
+        "metric_a": "measure_a",
+        "metric_b": "measure_c",
+    }
+
+
+def test_cache_ignores_unreadable_entries(tmp_path: Path) -> None:
+    """Checks that corrupt entries are treated as misses and that entries from other versions aren't used."""
+    cache = ParsedModelCache(str(tmp_path), version="test")
+    files = [_metric_file("metric_a", "measure_a")]
+    build_result = parse_yaml_files_to_validation_ready_model(files, raise_issues_as_exceptions=False, cache=cache)
+
+    for entry_dir in ("files", "models"):
+        for entry in os.scandir(tmp_path / entry_dir):
+            with open(entry.path, "wb") as f:
+                f.write(b"not a pickle")
+
+    rebuilt_result = parse_yaml_files_to_validation_ready_model(files, raise_issues_as_exceptions=False, cache=cache)
+    assert rebuilt_result.model == build_result.model
+
+    other_version_cache = ParsedModelCache(str(tmp_path), version="other")
+    assert other_version_cache.get_file_result(other_version_cache.file_key(files[0])) is None
+
+
+def test_cache_ignores_entries_from_previous_formats(tmp_path: Path) -> None:
+    """Checks that entries pickled before a field was added to the model classes aren't returned."""
+    files = [_metric_file("metric_a", "measure_a")]
+    old_params = DimensionTypeParams(time_granularity=TimeGranularity.DAY)
+    # Objects pickled before partition_dimension was added don't have the attribute.
+    del old_params.__dict__["partition_dimension"]
+    old_result = FileParsingResult(elements=[old_params], issues=[])  # type: ignore[list-item]
+    with patch.object(parsed_model_cache, "model_schema_fingerprint", return_value="old_schema"):
+        old_cache = ParsedModelCache(str(tmp_path), version="test")
+        old_cache.put_file_result(old_cache.file_key(files[0]), old_result)
+        assert old_cache.get_file_result(old_cache.file_key(files[0])) is not None
+
+    cache = ParsedModelCache(str(tmp_path), version="test")
+    assert cache.get_file_result(cache.file_key(files[0])) is None
+
+
+def test_cache_ignores_entries_of_other_types(tmp_path: Path) -> None:  # noqa: D
+    cache = ParsedModelCache(str(tmp_path), version="test")
+    key = cache.file_key(_metric_file("metric_a", "measure_a"))
+    cache.put_file_result(key, "not a parsing result")  # type: ignore[arg-type]
+    assert cache.get_file_result(key) is None
+    assert not os.listdir(tmp_path / "files")
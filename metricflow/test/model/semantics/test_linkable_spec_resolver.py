@@ -11,6 +11,7 @@ from metricflow.model.semantics.linkable_spec_resolver import (
     ValidLinkableSpecResolver,
 )
 from metricflow.model.semantics.linkable_element_properties import LinkableElementProperties
+from metricflow.model.semantics.metric_semantics import MetricSemantics
 from metricflow.model.semantics.data_source_join_evaluator import DEFAULT_MAX_JOIN_HOPS
 from metricflow.references import MetricReference
 
@@ -419,3 +420,53 @@ def test_identifier_property(simple_model_spec_resolver: ValidLinkableSpecResolv
         element_property=LinkableElementProperties.IDENTIFIER,
         expected_names=["listing", "listing__lux_listing", "user", "user__company"],
     )
+
+
+def test_linkable_elements_are_indexed_on_demand(simple_semantic_model: SemanticModel) -> None:
+    """Checks that elements are only computed for the requested metrics, and that the results are reused."""
+    spec_resolver = ValidLinkableSpecResolver(
+        user_configured_model=simple_semantic_model.user_configured_model,
+        data_source_semantics=simple_semantic_model.data_source_semantics,
+        max_identifier_links=2,
+    )
+    assert len(spec_resolver._metric_to_linkable_element_sets) == 0
+
+    def _query() -> Sequence[str]:
+        return sorted(
+            x.qualified_name
+            for x in spec_resolver.get_linkable_elements_for_metrics(
+                metric_references=[MetricReference(element_name="bookings")],
+                with_any_of=LinkableElementProperties.all_properties(),
+                without_any_of=frozenset(),
+            ).as_spec_set.as_tuple
+        )
+
+    first_result = _query()
+    assert set(spec_resolver._metric_to_linkable_element_sets) == {"bookings"}
+    assert _query() == first_result
+
+    with pytest.raises(ValueError, match="Unknown metric"):
+        spec_resolver.get_linkable_elements_for_metrics(
+            metric_references=[MetricReference(element_name="not_a_metric")],
+            with_any_of=LinkableElementProperties.all_properties(),
+            without_any_of=frozenset(),
+        )
+
+
+def test_element_specs_for_metrics_are_cached(simple_semantic_model: SemanticModel) -> None:
+    """Checks that repeated calls with the same set of metrics are served from the cache."""
+    metric_semantics = MetricSemantics(
+        user_configured_model=simple_semantic_model.user_configured_model,
+        data_source_semantics=simple_semantic_model.data_source_semantics,
+    )
+    bookings = MetricReference(element_name="bookings")
+    views = MetricReference(element_name="views")
+
+    specs = metric_semantics.element_specs_for_metrics([bookings, views])
+    assert metric_semantics._element_spec_cache.stats.hits == 0
+    # The order of the metrics shouldn't matter, and callers modifying the result shouldn't affect the cache.
+    specs_in_other_order = metric_semantics.element_specs_for_metrics([views, bookings])
+    specs_in_other_order.clear()
+    assert metric_semantics.element_specs_for_metrics([bookings, views]) == specs
+    assert metric_semantics._element_spec_cache.stats.hits == 2
+    assert specs == sorted(specs, key=lambda x: x.qualified_name)
@@ -83,6 +83,43 @@ def test_task_runner(  # noqa: D
     assert err_msg_bad in issues.errors[0].message
 
 
+def test_task_runner_with_subtasks(  # noqa: D
+    async_sql_client: AsyncSqlClient, mf_test_session_state: MetricFlowTestSessionState
+) -> None:
+    dw_validator = DataWarehouseModelValidator(
+        sql_client=async_sql_client, system_schema=mf_test_session_state.mf_system_schema, max_workers=4
+    )
+
+    def good_query() -> Tuple[str, SqlBindParameters]:
+        return ("SELECT 'foo' AS foo", SqlBindParameters())
+
+    def bad_query() -> Tuple[str, SqlBindParameters]:
+        return ("SELECT (true) AS col1 FROM doesnt_exist", SqlBindParameters())
+
+    tasks = [
+        DataWarehouseValidationTask(
+            query_and_params_callable=bad_query,
+            error_message=f"Failed task {i}",
+            on_fail_subtasks=[
+                DataWarehouseValidationTask(query_and_params_callable=good_query, error_message="Good subtask"),
+                DataWarehouseValidationTask(query_and_params_callable=bad_query, error_message=f"Failed subtask {i}"),
+            ],
+        )
+        for i in range(10)
+    ] + [DataWarehouseValidationTask(query_and_params_callable=good_query, error_message="Good task")]
+
+    issues = dw_validator.run_tasks(tasks=tasks)
+    # Each failed task is followed by the issues from its subtasks, in the order of the tasks.
+    assert [issue.message.split("\n")[0] for issue in issues.errors] == [
+        message for i in range(10) for message in (f"Failed task {i}", f"Failed subtask {i}")
+    ]
+
+    issues = dw_validator.run_tasks(tasks=tasks, timeout=0)
+    assert len(issues.errors) == 0
+    assert len(issues.warnings) == 1
+    assert "Hit timeout before completing all tasks. Completed 0/11 tasks." in issues.warnings[0].message
+
+
 def test_validate_data_sources(  # noqa: D
     dw_backed_warehouse_validation_model: UserConfiguredModel,
     async_sql_client: AsyncSqlClient,
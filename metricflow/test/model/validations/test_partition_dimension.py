@@ -0,0 +1,68 @@
+import pytest
+import textwrap
+
+from metricflow.model.objects.common import YamlConfigFile
+from metricflow.model.parsing.dir_to_model import parse_yaml_files_to_validation_ready_model
+from metricflow.model.model_validator import ModelValidator
+from metricflow.model.validations.data_sources import DataSourcePartitionDimensionRule
+from metricflow.model.validations.validator_helpers import ModelValidationException
+from metricflow.test.model.validations.helpers import base_model_file
+
+
+def _data_source_file(  # noqa: D
+    partition_dimension_config: str, partition_dimension_name: str = "ds_partition"
+) -> YamlConfigFile:
+    yaml_contents = textwrap.dedent(
+        f"""\
+        data_source:
+          name: events_source
+          sql_table: some_schema.events_table
+          identifiers:
+            - name: event_id
+              type: primary
+          dimensions:
+            - name: event_at
+              type: time
+              type_params:
+                time_granularity: day
+                partition_dimension: {partition_dimension_name}
+            - name: ds_partition
+              type: time
+        """
+    )
+    return YamlConfigFile(
+        filepath="inline_for_test", contents=yaml_contents + textwrap.indent(partition_dimension_config, " " * 6)
+    )
+
+
+def test_partition_dimension_configuration() -> None:
+    """Tests that a time dimension with a partition dimension passes validation"""
+    partition_dimension_file = _data_source_file("is_partition: true\ntype_params:\n  time_granularity: day\n")
+    model = parse_yaml_files_to_validation_ready_model([base_model_file(), partition_dimension_file])
+
+    validation_result = ModelValidator().validate_model(model.model)
+
+    assert not validation_result.issues.has_blocking_issues, (
+        f"Found blocking issues validating model with partition dimension properly configured: "
+        f"{[x.as_readable_str() for x in validation_result.issues.errors]}"
+    )
+
+
+def test_partition_dimension_must_be_a_partition() -> None:
+    """Tests validation asserting that the partition dimension is a partition time dimension"""
+    partition_dimension_file = _data_source_file("type_params:\n  time_granularity: day\n")
+    model = parse_yaml_files_to_validation_ready_model([base_model_file(), partition_dimension_file])
+
+    with pytest.raises(ModelValidationException, match="not a time dimension with `is_partition` set"):
+        ModelValidator([DataSourcePartitionDimensionRule()]).checked_validations(model.model)
+
+
+def test_partition_dimension_must_exist() -> None:
+    """Tests validation asserting that the partition dimension is defined in the data source"""
+    partition_dimension_file = _data_source_file(
+        "is_partition: true\ntype_params:\n  time_granularity: day\n", partition_dimension_name="ds_x"
+    )
+    model = parse_yaml_files_to_validation_ready_model([base_model_file(), partition_dimension_file])
+
+    with pytest.raises(ModelValidationException, match="there is no dimension with that name"):
+        ModelValidator([DataSourcePartitionDimensionRule()]).checked_validations(model.model)
@@ -4,7 +4,12 @@ from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilde
 from metricflow.dataset.data_source_adapter import DataSourceDataSet
 from metricflow.model.semantic_model import SemanticModel
 from metricflow.plan_conversion.column_resolver import DefaultColumnAssociationResolver
-from metricflow.plan_conversion.dataflow_to_execution import DataflowToExecutionPlanConverter
+from metricflow.execution.execution_plan import CombineDataFramesTask, SelectSqlQueryToDataFrameTask
+from metricflow.execution.executor import ParallelPlanExecutor
+from metricflow.plan_conversion.dataflow_to_execution import (
+    CombineMetricsExecutionMode,
+    DataflowToExecutionPlanConverter,
+)
 from metricflow.plan_conversion.dataflow_to_sql import DataflowToSqlQueryPlanConverter
 from metricflow.plan_conversion.time_spine import TimeSpineSource
 from metricflow.protocols.async_sql_client import AsyncSqlClient
@@ -14,8 +19,10 @@ from metricflow.specs import (
     DimensionSpec,
     TimeDimensionSpec,
     IdentifierReference,
+    OrderBySpec,
 )
 from metricflow.sql.render.sql_plan_renderer import DefaultSqlQueryPlanRenderer
+from metricflow.test.compare_df import assert_dataframes_equal
 from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
 from metricflow.test.plan_utils import assert_execution_plan_text_equal
 
@@ -194,3 +201,64 @@ def test_multihop_joined_plan(  # noqa: D
         sql_client=async_sql_client,
         execution_plan=execution_plan,
     )
+
+
+def test_query_per_metric_plan(  # noqa: D
+    create_simple_model_tables: bool,
+    async_sql_client: AsyncSqlClient,
+    dataflow_plan_builder: DataflowPlanBuilder[DataSourceDataSet],
+    simple_semantic_model: SemanticModel,
+    time_spine_source: TimeSpineSource,
+) -> None:
+    """Checks that running a query per metric produces the same result as the combined query."""
+    dataflow_plan = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(
+            metric_specs=(
+                MetricSpec(element_name="bookings"),
+                MetricSpec(element_name="listings"),
+            ),
+            dimension_specs=(
+                DimensionSpec(
+                    element_name="country_latest",
+                    identifier_links=(IdentifierReference("listing"),),
+                ),
+            ),
+            order_by_specs=(
+                OrderBySpec(
+                    dimension_spec=DimensionSpec(
+                        element_name="country_latest",
+                        identifier_links=(IdentifierReference("listing"),),
+                    ),
+                    descending=True,
+                ),
+            ),
+            limit=2,
+        )
+    )
+
+    to_execution_plan_converter = make_execution_plan_converter(
+        semantic_model=simple_semantic_model,
+        sql_client=async_sql_client,
+        time_spine_source=time_spine_source,
+    )
+    execution_plan = to_execution_plan_converter.convert_to_execution_plan(
+        dataflow_plan, combine_metrics_mode=CombineMetricsExecutionMode.QUERY_PER_METRIC
+    )
+    assert len(execution_plan.sink_nodes) == 1
+    leaf_task = execution_plan.sink_nodes[0]
+    assert isinstance(leaf_task, CombineDataFramesTask)
+    assert len(leaf_task.parent_nodes) == 2
+    assert all(isinstance(task, SelectSqlQueryToDataFrameTask) for task in leaf_task.parent_nodes)
+
+    query_per_metric_results = ParallelPlanExecutor().execute_plan(execution_plan)
+    assert not query_per_metric_results.contains_task_errors
+
+    single_query_plan = to_execution_plan_converter.convert_to_execution_plan(dataflow_plan)
+    assert len(single_query_plan.tasks) == 1
+    single_query_results = ParallelPlanExecutor().execute_plan(single_query_plan)
+    assert not single_query_results.contains_task_errors
+
+    query_per_metric_df = query_per_metric_results.get_result(leaf_task.task_id).df
+    single_query_df = single_query_results.get_result(single_query_plan.sink_nodes[0].task_id).df
+    assert query_per_metric_df is not None and single_query_df is not None
+    assert_dataframes_equal(actual=query_per_metric_df, expected=single_query_df, sort_columns=False)
@@ -0,0 +1,115 @@
+import copy
+import datetime
+
+import pandas as pd
+import pytest
+
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.model.objects.user_configured_model import UserConfiguredModel
+from metricflow.model.semantic_model import SemanticModel
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.references import DimensionReference
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.fixtures.engine_fixtures import MetricFlowEngineFactory
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+
+
+@pytest.fixture
+def partition_dimension_semantic_model(simple_user_configured_model: UserConfiguredModel) -> SemanticModel:
+    """The simple model with the partition dimension of id_verifications.ds set to ds_partitioned."""
+    model = copy.deepcopy(simple_user_configured_model)
+    id_verifications = next(x for x in model.data_sources if x.name == "id_verifications")
+    ds_dimension = id_verifications.get_dimension(DimensionReference(element_name="ds"))
+    assert ds_dimension.type_params is not None
+    ds_dimension.type_params.partition_dimension = "ds_partitioned"
+    return SemanticModel(model)
+
+
+def test_partition_pruning_condition(  # noqa: D
+    partition_dimension_semantic_model: SemanticModel,
+    engine: MetricFlowEngine,
+    engine_factory: MetricFlowEngineFactory,
+) -> None:
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["identity_verifications"],
+        group_by_names=["metric_time"],
+        time_constraint_start=datetime.datetime(2019, 12, 1),
+        time_constraint_end=datetime.datetime(2020, 1, 1),
+    )
+
+    partition_pruning_engine = engine_factory(partition_dimension_semantic_model)
+    sql = partition_pruning_engine.explain(mf_request).rendered_sql.sql_query
+    assert "ds_partitioned BETWEEN" in sql
+    assert "ds_partitioned BETWEEN" not in engine.explain(mf_request).rendered_sql.sql_query
+
+    df = partition_pruning_engine.query(mf_request).result_df
+    expected_df = engine.query(mf_request).result_df
+    assert df is not None and expected_df is not None
+    assert_dataframes_equal(actual=df, expected=expected_df)
+
+
+def test_partition_pruning_condition_with_string_partition(  # noqa: D
+    simple_user_configured_model: UserConfiguredModel,
+    engine: MetricFlowEngine,
+    engine_factory: MetricFlowEngineFactory,
+    async_sql_client: AsyncSqlClient,
+    mf_test_session_state: MetricFlowTestSessionState,
+) -> None:
+    # A copy of the id_verifications table where the partition column stores dates as strings like '20200101'.
+    source_table = SqlTable(schema_name=mf_test_session_state.mf_source_schema, table_name="fct_id_verifications")
+    string_partition_table = SqlTable(
+        schema_name=mf_test_session_state.mf_system_schema, table_name="fct_id_verifications_string_partition"
+    )
+    df = async_sql_client.query(f"SELECT * FROM {source_table.sql}")
+    df["ds_partitioned"] = pd.to_datetime(df["ds_partitioned"]).dt.strftime("%Y%m%d")
+    async_sql_client.drop_table(string_partition_table)
+    async_sql_client.create_table_from_dataframe(sql_table=string_partition_table, df=df)
+
+    model = copy.deepcopy(simple_user_configured_model)
+    id_verifications = next(x for x in model.data_sources if x.name == "id_verifications")
+    id_verifications.sql_table = string_partition_table.sql
+    ds_dimension = id_verifications.get_dimension(DimensionReference(element_name="ds"))
+    assert ds_dimension.type_params is not None
+    ds_dimension.type_params.partition_dimension = "ds_partitioned"
+    ds_partitioned_dimension = id_verifications.get_dimension(DimensionReference(element_name="ds_partitioned"))
+    assert ds_partitioned_dimension.type_params is not None
+    ds_partitioned_dimension.type_params.time_format = "YYYYMMDD"
+
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["identity_verifications"],
+        group_by_names=["metric_time"],
+        time_constraint_start=datetime.datetime(2019, 12, 1),
+        time_constraint_end=datetime.datetime(2020, 1, 1),
+    )
+    try:
+        partition_pruning_engine = engine_factory(SemanticModel(model))
+        sql = partition_pruning_engine.explain(mf_request).rendered_sql.sql_query
+        assert "ds_partitioned BETWEEN '20191201' AND '20200101'" in sql
+
+        df = partition_pruning_engine.query(mf_request).result_df
+        expected_df = engine.query(mf_request).result_df
+        assert df is not None and expected_df is not None
+        assert_dataframes_equal(actual=df, expected=expected_df)
+    finally:
+        async_sql_client.drop_table(string_partition_table)
+
+
+def test_partition_pruning_skipped_for_unordered_time_format(  # noqa: D
+    partition_dimension_semantic_model: SemanticModel, engine_factory: MetricFlowEngineFactory
+) -> None:
+    model = copy.deepcopy(partition_dimension_semantic_model.user_configured_model)
+    id_verifications = next(x for x in model.data_sources if x.name == "id_verifications")
+    ds_partitioned_dimension = id_verifications.get_dimension(DimensionReference(element_name="ds_partitioned"))
+    assert ds_partitioned_dimension.type_params is not None
+    # Strings in this format aren't ordered by time, so the partition column can't be compared with the bounds.
+    ds_partitioned_dimension.type_params.time_format = "%d/%m/%Y"
+
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["identity_verifications"],
+        group_by_names=["metric_time"],
+        time_constraint_start=datetime.datetime(2019, 12, 1),
+        time_constraint_end=datetime.datetime(2020, 1, 1),
+    )
+    engine = engine_factory(SemanticModel(model))
+    assert "ds_partitioned BETWEEN" not in engine.explain(mf_request).rendered_sql.sql_query
@@ -1,9 +1,16 @@
+import datetime
+
+import pandas as pd
+import pytest
 from pandas import DataFrame
 
 from metricflow.constraints.time_constraint import TimeRangeConstraint
-from metricflow.plan_conversion.time_spine import TimeSpineSource
+from metricflow.object_utils import random_id
+from metricflow.plan_conversion.time_spine import TimeSpineSource, TimeSpineTableBuilder
 from metricflow.protocols.sql_client import SqlClient
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
 from metricflow.time.time_constants import ISO8601_PYTHON_FORMAT, ISO8601_PYTHON_TS_FORMAT
+from metricflow.time.time_granularity import TimeGranularity
 
 
 def test_date_spine_date_range(sql_client: SqlClient, time_spine_source: TimeSpineSource) -> None:  # noqa: D
@@ -29,3 +36,30 @@ def test_date_spine_date_range(sql_client: SqlClient, time_spine_source: TimeSpi
             TimeRangeConstraint.ALL_TIME_BEGIN().strftime(ISO8601_PYTHON_FORMAT),
             TimeRangeConstraint.ALL_TIME_END().strftime(ISO8601_PYTHON_FORMAT),
         )
+
+
+@pytest.mark.parametrize("granularity", list(TimeGranularity))
+def test_narrow_time_spine_table(  # noqa: D
+    mf_test_session_state: MetricFlowTestSessionState, sql_client: SqlClient, granularity: TimeGranularity
+) -> None:
+    time_spine_source = TimeSpineSource(
+        schema_name=mf_test_session_state.mf_system_schema,
+        table_name=f"test_time_spine_{random_id()}",
+        time_column_granularity=granularity,
+        start_time=datetime.datetime(2020, 2, 15),
+        end_time=datetime.datetime(2021, 3, 1),
+    )
+    TimeSpineTableBuilder(time_spine_source=time_spine_source, sql_client=sql_client).create_if_necessary()
+    try:
+        spine_df = sql_client.query(
+            f"SELECT {time_spine_source.time_column_name} FROM {time_spine_source.spine_table.sql} "
+            f"ORDER BY {time_spine_source.time_column_name}"
+        )
+    finally:
+        sql_client.drop_table(time_spine_source.spine_table)
+
+    start_time, num_rows = time_spine_source.spine_range
+    expected_times = pd.date_range(start=start_time, periods=num_rows, freq=granularity.offset_period)
+    assert [pd.Timestamp(value) for value in spine_df[time_spine_source.time_column_name]] == list(expected_times)
+    assert expected_times[0] <= pd.Timestamp(2020, 2, 15) < expected_times[0] + granularity.offset_period
+    assert expected_times[-1] <= pd.Timestamp(2021, 3, 1) < expected_times[-1] + granularity.offset_period
@@ -0,0 +1,44 @@
+WITH mf_cte_0 AS (
+  -- source_0
+  SELECT
+    t.col0
+    , t.join_col
+  FROM demo.table_0 t
+)
+, mf_cte_1 AS (
+  -- joined_sources
+  SELECT
+    a.col0 AS col0
+    , b.col0 AS other_col0
+    , a.join_col AS join_col
+  FROM mf_cte_0 a
+  INNER JOIN (
+    -- source_1
+    SELECT
+      t.col0
+      , t.join_col
+    FROM demo.table_1 t
+  ) b
+  ON
+    a.join_col = b.join_col
+)
+-- test0
+SELECT
+  a.col0 AS col0
+  , b.col0 AS other_col0
+  , a.join_col AS join_col
+FROM mf_cte_1 a
+INNER JOIN (
+  -- joined_sources_with_source_0
+  SELECT
+    a.col0 AS col0
+    , b.col0 AS other_col0
+    , a.join_col AS join_col
+  FROM mf_cte_1 a
+  INNER JOIN
+    mf_cte_0 b
+  ON
+    a.join_col = b.join_col
+) b
+ON
+  a.join_col = b.join_col
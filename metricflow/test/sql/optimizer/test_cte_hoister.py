@@ -0,0 +1,161 @@
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from metricflow.dataflow.sql_table import SqlTable
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.sql.optimizer.cte_hoister import SqlCteHoister
+from metricflow.sql.optimizer.optimization_levels import SqlQueryOptimizationLevel
+from metricflow.sql.render.sql_plan_renderer import DefaultSqlQueryPlanRenderer
+from metricflow.sql.sql_exprs import (
+    SqlColumnReference,
+    SqlColumnReferenceExpression,
+    SqlComparison,
+    SqlComparisonExpression,
+)
+from metricflow.sql.sql_plan import (
+    SqlJoinDescription,
+    SqlJoinType,
+    SqlQueryPlan,
+    SqlSelectColumn,
+    SqlSelectStatementNode,
+    SqlTableFromClauseNode,
+)
+from metricflow.test.compare_df import assert_dataframes_equal
+from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
+from metricflow.test.sql.compare_sql_plan import assert_default_rendered_sql_equal
+
+
+def _source_select_statement(description: str, table_name: str) -> SqlSelectStatementNode:
+    """Creates a statement like "SELECT t.col0 AS col0, t.join_col AS join_col FROM demo.<table_name> t"."""
+    return SqlSelectStatementNode(
+        description=description,
+        select_columns=tuple(
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="t", column_name=column_name)),
+                column_alias=column_name,
+            )
+            for column_name in ("col0", "join_col")
+        ),
+        from_source=SqlTableFromClauseNode(sql_table=SqlTable(schema_name="demo", table_name=table_name)),
+        from_source_alias="t",
+        joins_descs=(),
+        group_bys=(),
+        order_bys=(),
+    )
+
+
+def _join_select_statement(
+    description: str, left_source: SqlSelectStatementNode, right_source: SqlSelectStatementNode
+) -> SqlSelectStatementNode:
+    """Creates a statement that joins the two sources on join_col."""
+    return SqlSelectStatementNode(
+        description=description,
+        select_columns=(
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="a", column_name="col0")),
+                column_alias="col0",
+            ),
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="b", column_name="col0")),
+                column_alias="other_col0",
+            ),
+            SqlSelectColumn(
+                expr=SqlColumnReferenceExpression(col_ref=SqlColumnReference(table_alias="a", column_name="join_col")),
+                column_alias="join_col",
+            ),
+        ),
+        from_source=left_source,
+        from_source_alias="a",
+        joins_descs=(
+            SqlJoinDescription(
+                right_source=right_source,
+                right_source_alias="b",
+                on_condition=SqlComparisonExpression(
+                    left_expr=SqlColumnReferenceExpression(
+                        col_ref=SqlColumnReference(table_alias="a", column_name="join_col")
+                    ),
+                    comparison=SqlComparison.EQUALS,
+                    right_expr=SqlColumnReferenceExpression(
+                        col_ref=SqlColumnReference(table_alias="b", column_name="join_col")
+                    ),
+                ),
+                join_type=SqlJoinType.INNER,
+            ),
+        ),
+        group_bys=(),
+        order_bys=(),
+    )
+
+
+def test_hoist_repeated_sub_queries(  # noqa: D
+    request: FixtureRequest,
+    mf_test_session_state: MetricFlowTestSessionState,
+) -> None:
+    # The join of the two sources is repeated, and the first source is also used outside of the repeated join, so
+    # both are moved into CTEs. The second source only appears within the repeated join, so it stays there.
+    select_statement = _join_select_statement(
+        description="test0",
+        left_source=_join_select_statement(
+            description="joined_sources",
+            left_source=_source_select_statement("source_0", "table_0"),
+            right_source=_source_select_statement("source_1", "table_1"),
+        ),
+        right_source=_join_select_statement(
+            description="joined_sources_with_source_0",
+            left_source=_join_select_statement(
+                description="joined_sources",
+                left_source=_source_select_statement("source_0", "table_0"),
+                right_source=_source_select_statement("source_1", "table_1"),
+            ),
+            right_source=_source_select_statement("source_0", "table_0"),
+        ),
+    )
+
+    assert_default_rendered_sql_equal(
+        request=request,
+        mf_test_session_state=mf_test_session_state,
+        plan_id="plan0",
+        sql_plan_node=SqlCteHoister().optimize(select_statement),
+    )
+
+
+def test_no_repeated_sub_queries() -> None:  # noqa: D
+    select_statement = _join_select_statement(
+        description="test0",
+        left_source=_source_select_statement("source_0", "table_0"),
+        right_source=_source_select_statement("source_1", "table_1"),
+    )
+    assert SqlCteHoister().optimize(select_statement) is select_statement
+
+
+def test_materialized_ctes() -> None:  # noqa: D
+    select_statement = _join_select_statement(
+        description="test0",
+        left_source=_source_select_statement("source_0", "table_0"),
+        right_source=_source_select_statement("source_0", "table_0"),
+    )
+    sql_query_plan = SqlQueryPlan(
+        plan_id="plan0", render_node=SqlCteHoister(materialize_ctes=True).optimize(select_statement)
+    )
+    sql = DefaultSqlQueryPlanRenderer().render_sql_query_plan(sql_query_plan).sql
+    assert sql.startswith("WITH mf_cte_0 AS MATERIALIZED (\n")
+    assert "FROM mf_cte_0 a\nINNER JOIN\n  mf_cte_0 b\n" in sql
+
+
+def test_query_with_ctes(engine: MetricFlowEngine) -> None:
+    """Checks that a query with repeated sub-queries returns the same results when CTEs are used."""
+    results = []
+    for optimization_level in (SqlQueryOptimizationLevel.O4, SqlQueryOptimizationLevel.O5):
+        mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=["bookings_growth_2_weeks"],
+            group_by_names=["metric_time"],
+            sql_optimization_level=optimization_level,
+        )
+        results.append((engine.explain(mf_request).rendered_sql.sql_query, engine.query(mf_request).result_df))
+
+    (sql_without_ctes, df_without_ctes), (sql_with_ctes, df_with_ctes) = results
+    assert "WITH" not in sql_without_ctes
+    assert "WITH" in sql_with_ctes
+    assert len(sql_with_ctes) < len(sql_without_ctes)
+    assert df_without_ctes is not None and df_with_ctes is not None
+    assert_dataframes_equal(actual=df_with_ctes, expected=df_without_ctes)
@@ -4,6 +4,7 @@ import pytest
 from _pytest.fixtures import FixtureRequest
 
 from metricflow.dataflow.sql_table import SqlTable
+from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.protocols.sql_client import SqlClient
 from metricflow.sql.render.sql_plan_renderer import DefaultSqlQueryPlanRenderer, SqlQueryPlanRenderer
 from metricflow.sql.sql_exprs import (
@@ -16,12 +17,15 @@ from metricflow.sql.sql_exprs import (
     SqlFunction,
 )
 from metricflow.sql.sql_plan import (
+    SqlQueryPlan,
+    SqlSelectQueryFromClauseNode,
     SqlTableFromClauseNode,
     SqlSelectStatementNode,
     SqlSelectColumn,
     SqlJoinDescription,
     SqlOrderByDescription,
     SqlJoinType,
+    SqlQueryPlanNode,
 )
 from metricflow.test.fixtures.setup_fixtures import MetricFlowTestSessionState
 from metricflow.test.sql.compare_sql_plan import assert_rendered_sql_equal
@@ -339,3 +343,55 @@ def test_render_limit(  # noqa: D
         plan_id="plan0",
         sql_client=sql_client,
     )
+
+
+def _nested_select_node(depth: int) -> SqlQueryPlanNode:
+    """Creates a select statement with subqueries nested to the given depth, each with joins and bind parameters."""
+    from_source: SqlQueryPlanNode = SqlSelectQueryFromClauseNode(select_query="SELECT\n  1 AS bookings\n\n  ")
+    for i in range(depth):
+        where_key = f"key{i % 3}"
+        from_source = SqlSelectStatementNode(
+            description=f"level {i}\nwith a multi-line description",
+            select_columns=(
+                SqlSelectColumn(
+                    expr=SqlColumnReferenceExpression(
+                        col_ref=SqlColumnReference(table_alias="a", column_name="bookings")
+                    ),
+                    column_alias="bookings",
+                ),
+            ),
+            from_source=from_source,
+            from_source_alias="a",
+            joins_descs=(
+                SqlJoinDescription(
+                    right_source=SqlTableFromClauseNode(sql_table=SqlTable(schema_name="demo", table_name="dim_users")),
+                    right_source_alias="b",
+                    on_condition=SqlStringExpression(
+                        sql_expr=f"a.user_id = b.user_id\nAND b.level = {i}",
+                        execution_parameters=SqlBindParameters.create_from_dict({f"join_key{i}": i}),
+                    ),
+                    join_type=SqlJoinType.LEFT_OUTER,
+                ),
+            ),
+            where=SqlStringExpression(
+                sql_expr=f"a.bookings > :{where_key}",
+                execution_parameters=SqlBindParameters.create_from_dict({where_key: i % 3}),
+            ),
+            group_bys=(),
+            order_bys=(),
+        )
+    return from_source
+
+
+def test_render_buffer_matches_string_rendering() -> None:
+    """Checks that rendering into a single buffer produces the same SQL and parameters as rendering each node."""
+    sql_query_plan = SqlQueryPlan(plan_id="plan0", render_node=_nested_select_node(depth=10))
+
+    buffered_result = DefaultSqlQueryPlanRenderer(use_render_buffer=True).render_sql_query_plan(sql_query_plan)
+    string_result = DefaultSqlQueryPlanRenderer(use_render_buffer=False).render_sql_query_plan(sql_query_plan)
+
+    assert buffered_result.sql == string_result.sql
+    assert list(buffered_result.execution_parameters.param_dict.items()) == list(
+        string_result.execution_parameters.param_dict.items()
+    )
+    assert "\n" + DefaultSqlQueryPlanRenderer.INDENT * 10 + "SELECT" in buffered_result.sql
@@ -0,0 +1,53 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.protocols.sql_request import SqlRequestResult
+from metricflow.sql_clients.base_sql_client_implementation import BaseSqlClientImplementation
+from metricflow.sql_clients.sql_utils import async_query_result
+
+
+def test_async_query_result(async_sql_client: AsyncSqlClient) -> None:  # noqa: D
+    result = asyncio.run(async_query_result(async_sql_client, "SELECT 1 AS foo"))
+    assert result.df is not None
+    assert list(result.df["foo"]) == [1]
+    assert len(async_sql_client.active_requests()) == 0
+
+
+def test_cancelled_async_query_result(async_sql_client: AsyncSqlClient) -> None:
+    """Tests that cancelling the coroutine cancels the request and cleans it up once it finishes."""
+    query_started = threading.Event()
+    query_cancelled = threading.Event()
+
+    def _run_query(*args, **kwargs) -> SqlRequestResult:  # type: ignore
+        query_started.set()
+        query_cancelled.wait(timeout=10)
+        return SqlRequestResult(df=pd.DataFrame())
+
+    def _cancel_request(match_function) -> int:  # type: ignore
+        query_cancelled.set()
+        return 1
+
+    async def _cancel_query() -> None:
+        task = asyncio.create_task(async_query_result(async_sql_client, "SELECT 1"))
+        while not query_started.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with patch.object(BaseSqlClientImplementation, "_run_query", side_effect=_run_query), patch.object(
+        async_sql_client, "cancel_request", side_effect=_cancel_request
+    ):
+        asyncio.run(_cancel_query())
+
+    assert query_cancelled.is_set()
+    start_time = time.time()
+    while len(async_sql_client.active_requests()) > 0 and time.time() - start_time < 10:
+        time.sleep(0.01)
+    assert len(async_sql_client.active_requests()) == 0
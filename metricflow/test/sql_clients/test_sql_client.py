@@ -9,6 +9,7 @@ from sqlalchemy.exc import ProgrammingError
 
 from metricflow.dataflow.sql_table import SqlTable
 from metricflow.object_utils import assert_values_exhausted, random_id, SqlColumnType
+from metricflow.protocols.async_sql_client import AsyncSqlClient
 from metricflow.protocols.sql_client import SqlClient, SqlEngine
 from metricflow.sql.sql_bind_parameters import SqlBindParameters
 from metricflow.sql_clients.sql_utils import make_df
@@ -257,3 +258,142 @@ def test_list_tables(mf_test_session_state: MetricFlowTestSessionState, sql_clie
     table_count_after_create = len(table_list)
     assert table_count_after_create == table_count_before_create + 1
     assert len([x for x in table_list if x == sql_table.table_name]) == 1
+
+
+def test_query_chunks(  # noqa: D
+    mf_test_session_state: MetricFlowTestSessionState, async_sql_client: AsyncSqlClient
+) -> None:
+    sql_table = SqlTable(schema_name=mf_test_session_state.mf_source_schema, table_name=_random_table())
+    expected_df = make_df(sql_client=async_sql_client, columns=["int_col"], data=[(i,) for i in range(5)])
+    async_sql_client.create_table_from_dataframe(sql_table=sql_table, df=expected_df)
+
+    chunks = list(async_sql_client.query_chunks(f"SELECT int_col FROM {sql_table.sql} ORDER BY int_col", chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert_dataframes_equal(actual=pd.concat(chunks, ignore_index=True), expected=expected_df)
+
+    # An empty result should still have the columns.
+    chunks = list(async_sql_client.query_chunks(f"SELECT int_col FROM {sql_table.sql} WHERE int_col < 0"))
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert chunks[0].columns.tolist() == ["int_col"]
+
+
+def test_query_while_chunks_are_consumed(  # noqa: D
+    mf_test_session_state: MetricFlowTestSessionState, async_sql_client: AsyncSqlClient
+) -> None:
+    sql_table = SqlTable(schema_name=mf_test_session_state.mf_source_schema, table_name=_random_table())
+    df = make_df(sql_client=async_sql_client, columns=["int_col"], data=[(i,) for i in range(5)])
+    async_sql_client.create_table_from_dataframe(sql_table=sql_table, df=df)
+
+    # Other statements shouldn't have to wait for a partially consumed iterator to be exhausted or closed.
+    chunks = async_sql_client.query_chunks(f"SELECT int_col FROM {sql_table.sql} ORDER BY int_col", chunk_size=2)
+    assert len(next(chunks)) == 2
+    results = []
+    query_thread = threading.Thread(
+        target=lambda: results.append(async_sql_client.query(_select_x_as_y())), daemon=True
+    )
+    query_thread.start()
+    query_thread.join(timeout=10)
+    assert not query_thread.is_alive()
+    _check_1col(results[0])
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+
+
+def test_query_arrow(  # noqa: D
+    mf_test_session_state: MetricFlowTestSessionState, async_sql_client: AsyncSqlClient
+) -> None:
+    pytest.importorskip("pyarrow")
+    sql_table = SqlTable(schema_name=mf_test_session_state.mf_source_schema, table_name=_random_table())
+    expected_df = make_df(
+        sql_client=async_sql_client, columns=["int_col", "str_col"], data=[(i, f"s{i}") for i in range(3)]
+    )
+    async_sql_client.create_table_from_dataframe(sql_table=sql_table, df=expected_df)
+
+    table = async_sql_client.query_arrow(f"SELECT int_col, str_col FROM {sql_table.sql} ORDER BY int_col")
+    assert table.column_names == ["int_col", "str_col"]
+    assert table.num_rows == 3
+    assert_dataframes_equal(actual=table.to_pandas(), expected=expected_df)
+
+    # The dataframe path should return the same values whether or not the result was fetched in Arrow format.
+    assert_dataframes_equal(
+        actual=async_sql_client.query(f"SELECT int_col, str_col FROM {sql_table.sql} ORDER BY int_col"),
+        expected=expected_df,
+    )
+
+
+def test_query_arrow_without_arrow_cursor(  # noqa: D
+    async_sql_client: AsyncSqlClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if async_sql_client.sql_engine_attributes.sql_engine_type is not SqlEngine.DUCKDB:
+        pytest.skip("Tests how the DuckDB client fetches results when the cursor can't return Arrow tables")
+    pytest.importorskip("pyarrow")
+    import duckdb_engine
+
+    cursor_getattr = duckdb_engine.CursorWrapper.__getattr__
+
+    def _getattr_without_arrow(cursor: duckdb_engine.CursorWrapper, name: str) -> object:
+        if name in ("to_arrow_table", "fetch_arrow_table"):
+            raise AttributeError(name)
+        return cursor_getattr(cursor, name)
+
+    def _query_rows(*args: object, **kwargs: object) -> pd.DataFrame:
+        raise AssertionError("The statement should not be executed again to fetch the rows")
+
+    monkeypatch.setattr(duckdb_engine.CursorWrapper, "__getattr__", _getattr_without_arrow)
+    monkeypatch.setattr(async_sql_client, "_engine_specific_query_implementation", _query_rows)
+
+    table = async_sql_client.query_arrow("SELECT 1 AS int_col, 'a' AS str_col")
+    assert table.column_names == ["int_col", "str_col"]
+    assert table.to_pylist() == [{"int_col": 1, "str_col": "a"}]
+
+
+_MIXED_TYPES_QUERY = """
+SELECT
+  CAST(1 AS INTEGER) AS int_col
+  , CAST(NULL AS INTEGER) AS null_int_col
+  , SUM(x) AS sum_col
+  , CAST(3.25 AS DECIMAL(10, 2)) AS decimal_col
+  , CAST(1.5 AS DOUBLE) AS double_col
+  , 'a' AS str_col
+  , TRUE AS bool_col
+  , DATE '2020-01-01' AS date_col
+  , TIMESTAMP '2020-01-01 01:02:03' AS timestamp_col
+FROM (SELECT 1 AS x UNION ALL SELECT 2) t
+"""
+
+
+def test_query_dtypes_match_row_path(async_sql_client: AsyncSqlClient) -> None:
+    """Tests that query() returns the same dtypes and values as fetching the rows, even when pyarrow is installed."""
+    if async_sql_client.sql_engine_attributes.sql_engine_type is not SqlEngine.DUCKDB:
+        pytest.skip("The query uses DuckDB types")
+
+    df = async_sql_client.query(_MIXED_TYPES_QUERY)
+    row_df = async_sql_client._engine_specific_query_implementation(  # type: ignore[attr-defined]
+        _MIXED_TYPES_QUERY, bind_params=SqlBindParameters()
+    )
+    assert list(df.columns) == list(row_df.columns)
+    for column_name in df.columns:
+        assert df[column_name].dtype == row_df[column_name].dtype, column_name
+        assert df[column_name].tolist() == row_df[column_name].tolist(), column_name
+
+
+def test_query_with_arrow_results() -> None:
+    """Tests that clients created with arrow_results fetch query() results through the Arrow path."""
+    pytest.importorskip("pyarrow")
+    from metricflow.sql_clients.duckdb import DuckDbSqlClient
+    from metricflow.sql_clients.sql_utils import sync_query_result
+
+    sql_client = DuckDbSqlClient(arrow_results=True)
+    try:
+        result = sync_query_result(sql_client, "SELECT 1 AS int_col, 'a' AS str_col")
+        assert result.arrow_table is not None
+        assert result.arrow_table.to_pylist() == [{"int_col": 1, "str_col": "a"}]
+        assert result.df is not None and result.df.to_dict("records") == [{"int_col": 1, "str_col": "a"}]
+    finally:
+        sql_client.close()
+
+    sql_client = DuckDbSqlClient()
+    try:
+        assert sync_query_result(sql_client, "SELECT 1 AS int_col").arrow_table is None
+    finally:
+        sql_client.close()
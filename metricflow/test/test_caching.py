@@ -0,0 +1,67 @@
+import pytest
+
+from metricflow.caching import LruCache
+
+
+def test_lru_eviction() -> None:  # noqa: D
+    cache: LruCache[str, int] = LruCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    # Access "a" so that "b" is the least recently used entry.
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_stats() -> None:  # noqa: D
+    cache: LruCache[str, int] = LruCache(max_size=2)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get_or_create("b", lambda: 2) == 2
+    assert cache.get_or_create("b", lambda: 3) == 2
+
+    stats = cache.stats
+    assert stats.hits == 2
+    assert stats.misses == 2
+    assert stats.size == 2
+    assert stats.max_size == 2
+    assert stats.hit_rate == 0.5
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats.hits == 2
+
+
+def test_disabled_cache() -> None:  # noqa: D
+    cache: LruCache[str, int] = LruCache(max_size=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+
+    with pytest.raises(ValueError):
+        LruCache(max_size=-1)
+
+
+def test_ttl_expiration() -> None:  # noqa: D
+    current_time = [100.0]
+    cache: LruCache[str, int] = LruCache(max_size=2, ttl_seconds=10, time_function=lambda: current_time[0])
+    cache.put("a", 1)
+    current_time[0] = 105.0
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    # "a" expires, but "b" was added later.
+    current_time[0] = 110.0
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert cache.get("b") == 2
+
+    current_time[0] = 115.0
+    assert "b" not in cache
+
+    with pytest.raises(ValueError):
+        LruCache(max_size=1, ttl_seconds=0)
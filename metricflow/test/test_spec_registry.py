@@ -0,0 +1,65 @@
+import pytest
+
+from metricflow.references import IdentifierReference
+from metricflow.spec_registry import SpecRegistry
+from metricflow.specs import (
+    DimensionSpec,
+    IdentifierSpec,
+    LinklessIdentifierSpec,
+    MeasureSpec,
+    TimeDimensionSpec,
+)
+from metricflow.time.time_granularity import TimeGranularity
+
+COUNTRY = DimensionSpec(element_name="country", identifier_links=(IdentifierReference("user"),))
+DS = TimeDimensionSpec(element_name="ds", identifier_links=(), time_granularity=TimeGranularity.MONTH)
+USER = IdentifierSpec(element_name="user", identifier_links=())
+BOOKINGS = MeasureSpec(element_name="bookings")
+
+
+def test_ids_are_stable() -> None:  # noqa: D
+    registry = SpecRegistry()
+    assert registry.id_of(COUNTRY) == 0
+    assert registry.id_of(DS) == 1
+    assert registry.id_of(DimensionSpec.from_name("user__country")) == 0
+    assert registry.find_id(USER) is None
+    assert len(registry) == 2
+    assert registry.spec_for_id(1) == DS
+
+
+def test_set_operations() -> None:  # noqa: D
+    registry = SpecRegistry()
+    left = registry.bitset([COUNTRY, DS, BOOKINGS])
+    right = registry.bitset([DS, USER])
+
+    assert (left & right).specs == (DS,)
+    assert (left | right).specs == (COUNTRY, DS, BOOKINGS, USER)
+    assert (left - right).specs == (COUNTRY, BOOKINGS)
+    assert registry.bitset([DS]).is_subset_of(left)
+    assert not right.is_subset_of(left)
+    assert len(left) == 3
+    assert not registry.empty_bitset()
+
+    assert left.contains_id(registry.id_of(COUNTRY))
+    assert not left.contains_id(registry.id_of(USER))
+    # Linkless identifiers compare equal to identifiers without links.
+    assert right.contains_id(registry.id_of(LinklessIdentifierSpec.from_element_name("user")))
+    assert not left.contains_id(registry.id_of(MeasureSpec(element_name="listings")))
+
+
+def test_conversion_to_spec_sets() -> None:  # noqa: D
+    registry = SpecRegistry()
+    bitset = registry.bitset([BOOKINGS, USER, DS, COUNTRY])
+
+    instance_spec_set = bitset.as_instance_spec_set
+    assert instance_spec_set.measure_specs == (BOOKINGS,)
+    assert instance_spec_set.identifier_specs == (USER,)
+    assert instance_spec_set.time_dimension_specs == (DS,)
+    assert instance_spec_set.dimension_specs == (COUNTRY,)
+    assert bitset.as_linkable_spec_set.as_tuple == (COUNTRY, DS, USER)
+    assert bitset.linkable_specs == (USER, DS, COUNTRY)
+
+
+def test_bitsets_from_different_registries() -> None:  # noqa: D
+    with pytest.raises(ValueError):
+        SpecRegistry().bitset([COUNTRY]) & SpecRegistry().bitset([COUNTRY])